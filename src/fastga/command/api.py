@@ -21,10 +21,12 @@ import inspect
 import importlib
 import tempfile
 from tempfile import TemporaryDirectory
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from copy import deepcopy
 from itertools import product
 from pathlib import Path
-from typing import Union, List
+from typing import Union, List, Iterator, Tuple
 from platform import system
 
 import numpy as np
@@ -514,6 +516,224 @@ def list_ivc_outputs_name(local_system: Union[ExplicitComponent, ImplicitCompone
     return ivc_outputs_names
 
 
+class BlockAnalysis:
+    """
+    Callable block analysis of an OpenMDAO component or group applying FASTOAD formalism, as
+    returned by generate_block_analysis.
+
+    The problem is set up on the first call, with an IndepVarComp built from the .xml values and
+    the provided inputs. Next calls only write the values of the provided inputs before running
+    the model, the problem is set up again only if the names, units or shapes of the inputs change.
+    Sets of inputs can be evaluated at once with the map method.
+
+    The .xml values are the ones read when the block analysis is generated, later changes of the
+    file are not taken into account, but the file must still exist when the block analysis is
+    called.
+    """
+
+    def __init__(
+        self,
+        local_system: Union[ExplicitComponent, ImplicitComponent, Group],
+        reader: Union[oad.VariableList, None],
+        outputs_units: dict,
+        xml_file_path: str = "",
+        overwrite: bool = False,
+    ):
+        """
+        :param local_system: the system the block analysis is based on, it must not have been
+        set up as each problem is built with a copy of it
+        :param reader: the variables read in the .xml file that are neither inputs of the block
+        analysis nor outputs of the system, None if there is no .xml file
+        :param outputs_units: the units of the system outputs saved with their name as key
+        :param xml_file_path: the path of the .xml file the outputs are written in if overwrite
+        :param overwrite: boolean to set whether or not the .xml file will be overwritten once
+        the block analysis runs
+        """
+
+        self.local_system = local_system
+        self.reader = reader
+        self.outputs_units = outputs_units
+        self.xml_file_path = xml_file_path
+        self.overwrite = overwrite
+
+        self.problem = None
+        self.inputs_signature = None
+
+    def __call__(self, inputs_dict: dict) -> dict:
+        """
+        Performs a run of the system.
+
+        :param inputs_dict: dictionary of input (values, units) saved with their key name,
+        as an example: inputs_dict = {'in1': (3.0, "m")}.
+        :return: dictionary of the component/group outputs saving names as keys and (value,
+        units) as tuple.
+        :raise FileNotFoundError: if the .xml file the values were read in no longer exists
+        """
+
+        if self.reader is not None and not os.path.exists(self.xml_file_path):
+            raise FileNotFoundError(
+                "Input .xml file {} of the block analysis not found".format(self.xml_file_path)
+            )
+
+        inputs_signature = {
+            name: (np.shape(value[0]), value[1]) for name, value in inputs_dict.items()
+        }
+        if self.problem is None or inputs_signature != self.inputs_signature:
+            self.setup(inputs_dict)
+            self.inputs_signature = inputs_signature
+        else:
+            for name, value in inputs_dict.items():
+                self.problem.set_val(name, value[0], units=value[1])
+
+        self.problem.run_model()
+        if self.overwrite:
+            self.problem.output_file_path = self.xml_file_path
+            self.problem.write_outputs()
+
+        # Values are copied as the problem is reused by the next calls
+        return {
+            name: (np.array(self.problem.get_val(name, units)), units)
+            for name, units in self.outputs_units.items()
+        }
+
+    def setup(self, inputs_dict: dict):
+        """
+        Builds and sets up the problem of the block analysis.
+
+        :param inputs_dict: dictionary of input (values, units) saved with their key name, the
+        names, units and shapes of the inputs are fixed by this setup.
+        """
+
+        # Construct Independent Variable Component from .xml file excluding outputs
+        if self.reader is not None:
+            self.reader.path_separator = ":"
+            ivc_local = self.reader.to_ivc()
+        else:
+            ivc_local = IndepVarComp()
+        for name, value in inputs_dict.items():
+            ivc_local.add_output(name, value[0], units=value[1])
+        group_local = AutoUnitsDefaultGroup()
+        group_local.add_subsystem("ivc", ivc_local, promotes=["*"])
+        group_local.add_subsystem("system", deepcopy(self.local_system), promotes=["*"])
+        problem_local = oad.FASTOADProblem()
+        model_local = problem_local.model
+        model_local.add_subsystem("local_system", group_local, promotes=["*"])
+        problem_local.setup()
+
+        self.problem = problem_local
+
+    def map(
+        self, inputs_dicts, vectorized: bool = False, max_workers: int = None
+    ) -> Iterator[Tuple[int, dict]]:
+        """
+        Evaluates the block analysis for a set of inputs dictionaries, for instance the points of
+        a design of experiments. Results are yielded as they are available.
+
+        :param inputs_dicts: list or array of dictionaries of input (values, units), all with the
+        same names, units and shapes for the vectorized mode
+        :param vectorized: if True, the inputs of all the dictionaries are concatenated and the
+        system is run once, each output is then split between the dictionaries. The system must
+        compute its outputs element-wise for inputs of any length: all the inputs of a dictionary
+        must have the same size and all the outputs one value per point
+        :param max_workers: number of worker processes used if not vectorized, each one holding
+        its own set-up problem, if None the number of processors of the machine is used
+        :return: iterator over the tuples (index of the inputs dictionary, outputs dictionary),
+        in the order of completion
+        :raise ValueError: if the block analysis overwrites its .xml file, as the outputs of the
+        different inputs dictionaries would be written in the same file
+        :raise ValueError: in vectorized mode, if the inputs of a dictionary have different sizes
+        or if an output has not one value per point
+        """
+
+        if self.overwrite:
+            raise ValueError(
+                "Block analysis writing its outputs in %s can't be mapped, generate it with "
+                "overwrite=False." % self.xml_file_path
+            )
+
+        inputs_dicts = list(inputs_dicts)
+        if not inputs_dicts:
+            return
+
+        if vectorized:
+            # Each inputs dictionary is a set of points, all its inputs must have one value per
+            # point
+            points_numbers = []
+            for idx, local_dict in enumerate(inputs_dicts):
+                sizes = {np.size(value) for value, _ in local_dict.values()}
+                if len(sizes) != 1:
+                    raise ValueError(
+                        "Inputs of dictionary {} have different sizes {}, they can't be "
+                        "vectorized".format(idx, sorted(sizes))
+                    )
+                points_numbers.append(sizes.pop())
+            inputs_dict = {
+                name: (
+                    np.concatenate([np.ravel(local_dict[name][0]) for local_dict in inputs_dicts]),
+                    units,
+                )
+                for name, (_, units) in inputs_dicts[0].items()
+            }
+            split_indices = np.cumsum(points_numbers)
+            outputs_dict = self(inputs_dict)
+            # Only outputs with one value per point can be split between the dictionaries
+            split_outputs = {}
+            for name, (value, units) in outputs_dict.items():
+                if np.ndim(value) == 0 or np.shape(value)[0] != split_indices[-1]:
+                    raise ValueError(
+                        "Output {} of shape {} has not one value per point, it can't be split "
+                        "between the {} inputs dictionaries".format(
+                            name, np.shape(value), len(inputs_dicts)
+                        )
+                    )
+                split_outputs[name] = (np.split(value, split_indices[:-1]), units)
+            for idx in range(len(inputs_dicts)):
+                yield idx, {
+                    name: (values[idx], units) for name, (values, units) in split_outputs.items()
+                }
+            return
+
+        if max_workers is None:
+            max_workers = os.cpu_count()
+        max_workers = max(1, min(max_workers, len(inputs_dicts)))
+
+        if max_workers == 1:
+            for idx, inputs_dict in enumerate(inputs_dicts):
+                yield idx, self(inputs_dict)
+        else:
+            with ProcessPoolExecutor(
+                max_workers=max_workers,
+                initializer=_init_block_analysis_worker,
+                initargs=(self,),
+            ) as executor:
+                futures = [
+                    executor.submit(_run_block_analysis_worker, idx, inputs_dict)
+                    for idx, inputs_dict in enumerate(inputs_dicts)
+                ]
+                for future in as_completed(futures):
+                    yield future.result()
+
+    def __getstate__(self):
+        # The set-up problem can't be pickled, workers set up their own
+        state = self.__dict__.copy()
+        state["problem"] = None
+        state["inputs_signature"] = None
+
+        return state
+
+
+_WORKER_BLOCK_ANALYSIS = None
+
+
+def _init_block_analysis_worker(block_analysis: BlockAnalysis):
+    global _WORKER_BLOCK_ANALYSIS
+    _WORKER_BLOCK_ANALYSIS = block_analysis
+
+
+def _run_block_analysis_worker(idx: int, inputs_dict: dict) -> Tuple[int, dict]:
+    return idx, _WORKER_BLOCK_ANALYSIS(inputs_dict)
+
+
 def generate_block_analysis(
     local_system: Union[ExplicitComponent, ImplicitComponent, Group, str],
     var_inputs: List,
@@ -538,8 +758,9 @@ def generate_block_analysis(
     :param overwrite: boolean to set whether or not the input XML file will be overwritten once
     the function runs
 
-    :return patched_function: the function constructed based on the provided system which takes
-    var_inputs as inputs under the form of a dictionary {"var_name": (var_value, var_units)}
+    :return patched_function: the block analysis constructed based on the provided system, it is
+    called with var_inputs as inputs under the form of a dictionary {"var_name": (var_value,
+    var_units)}, see BlockAnalysis
     """
 
     # If a valid ID or a path to a configuration file is provided, build a system based on that ID
@@ -551,6 +772,9 @@ def generate_block_analysis(
         else:
             local_system = oad.RegisterOpenMDAOSystem.get_system(local_system, options=options)
 
+    # Keep a copy of the system before it is set up to build the problems of the block analysis
+    system_template = deepcopy(local_system)
+
     # Search what are the component/group outputs
     variables = list_variables(local_system)
     inputs_names = [var.name for var in variables if var.is_input]
@@ -627,46 +851,18 @@ def generate_block_analysis(
                 raise Exception(message)
         else:
             # If all inputs addressed either by .xml or var_inputs or in an IVC, construct the
-            # function
-            def patched_function(inputs_dict: dict) -> dict:
-                """
-                The patched function perform a run of an openmdao component or group applying
-                FASTOAD formalism.
-
-                @param inputs_dict: dictionary of input (values, units) saved with their key name,
-                as an example: inputs_dict = {'in1': (3.0, "m")}.
-                @return: dictionary of the component/group outputs saving names as keys and (value,
-                units) as tuple.
-                """
-
-                # Read .xml file and construct Independent Variable Component excluding outputs
-                if os.path.exists(xml_file_path):
-                    reader.path_separator = ":"
-                    ivc_local = reader.to_ivc()
-                else:
-                    ivc_local = IndepVarComp()
-                for name, value in inputs_dict.items():
-                    ivc_local.add_output(name, value[0], units=value[1])
-                group_local = AutoUnitsDefaultGroup()
-                group_local.add_subsystem("ivc", ivc_local, promotes=["*"])
-                group_local.add_subsystem("system", local_system, promotes=["*"])
-                problem_local = oad.FASTOADProblem()
-                model_local = problem_local.model
-                model_local.add_subsystem("local_system", group_local, promotes=["*"])
-                problem_local.setup()
-                problem_local.run_model()
-                if overwrite:
-                    problem_local.output_file_path = xml_file_path
-                    problem_local.write_outputs()
-                # Get output names from component/group and construct dictionary
-                outputs_units = [var.units for var in variables if not var.is_input]
-                outputs_dict = {}
-                for idx, _ in enumerate(outputs_names):
-                    value = problem_local.get_val(outputs_names[idx], outputs_units[idx])
-                    outputs_dict[outputs_names[idx]] = (value, outputs_units[idx])
-                return outputs_dict
-
-            return patched_function
+            # block analysis
+            if not os.path.exists(xml_file_path):
+                reader = None
+            outputs_units = [var.units for var in variables if not var.is_input]
+
+            return BlockAnalysis(
+                system_template,
+                reader,
+                dict(zip(outputs_names, outputs_units)),
+                xml_file_path=xml_file_path,
+                overwrite=overwrite,
+            )
 
 
 def list_all_subsystem(model, model_address, dict_subsystems):
@@ -725,14 +921,125 @@ class VariableListLocal(oad.VariableList):
         return VariableListLocal.from_problem(problem, use_initial_values=True)
 
 
+# Results of the introspection of systems, saved with the key of the system, the least recently
+# used ones are dropped beyond VARIABLES_CACHE_SIZE systems
+VARIABLES_CACHE_SIZE = 128
+_VARIABLES_CACHE = OrderedDict()
+_INPUTS_METADATA_CACHE = OrderedDict()
+
+
+def clear_variables_cache():
+    """
+    Clears the results of the introspection of systems saved by list_variables and
+    list_inputs_metadata. Needed if a system definition changes within a session.
+    """
+    _VARIABLES_CACHE.clear()
+    _INPUTS_METADATA_CACHE.clear()
+
+
+def _get_cached(cache: OrderedDict, key):
+    """Returns the value saved with key in cache, None if there is none."""
+    if key is None or key not in cache:
+        return None
+    cache.move_to_end(key)
+
+    return cache[key]
+
+
+def _set_cached(cache: OrderedDict, key, value):
+    """Saves value with key in cache and drops the least recently used values beyond its size."""
+    if key is None:
+        return
+    cache[key] = value
+    cache.move_to_end(key)
+    while len(cache) > VARIABLES_CACHE_SIZE:
+        cache.popitem(last=False)
+
+
+def _hashable(value):
+    """
+    Converts a plain value, possibly a container or an array, to a hashable object.
+
+    :raise TypeError: if the value, or one of the items it contains, is not a plain value, since
+    it could be modified without its hash changing
+    """
+    if isinstance(value, dict):
+        return tuple((key, _hashable(value[key])) for key in sorted(value, key=str))
+    if isinstance(value, (list, tuple)):
+        return (type(value).__name__,) + tuple(_hashable(item) for item in value)
+    if isinstance(value, np.ndarray) and value.dtype != object:
+        return "ndarray", value.dtype.str, value.shape, value.tobytes()
+    if value is None or isinstance(value, (bool, int, float, complex, str, bytes, np.generic)):
+        return value
+
+    raise TypeError("%s is not a plain value" % type(value).__name__)
+
+
+def _system_key(local_system: System):
+    """
+    Identifies the structure of a system, not set up, by its class, its options and the
+    subsystems added before setup. Returns None if the system can't be identified this way.
+    """
+    # noinspection PyProtectedMember
+    if isinstance(local_system, om.Group):
+        if local_system._static_manual_connections or local_system._static_group_inputs:
+            return None
+        subsystems_key = []
+        for name, sys_info in local_system._static_subsystems_allprocs.items():
+            subsystem_key = _system_key(sys_info.system)
+            if subsystem_key is None:
+                return None
+            promotes = {
+                io_type: [promoted[0] for promoted in promotes_list]
+                for io_type, promotes_list in sys_info.system._var_promotes.items()
+            }
+            subsystems_key.append((name, subsystem_key, _hashable(promotes)))
+    elif local_system._static_var_rel2meta:
+        return None
+    else:
+        subsystems_key = []
+
+    return type(local_system), _hashable(dict(local_system.options.items())), tuple(subsystems_key)
+
+
+def _cache_key(component: Union[om.ExplicitComponent, om.Group]):
+    """
+    Key of the introspection results of a component, that also depends on the active submodels.
+    Returns None, meaning the results are not cached, if an option of the component or of its
+    subsystems is not a plain value or array, or if the component structure can't be read.
+    """
+    try:
+        system_key = _system_key(component)
+        if system_key is None:
+            return None
+
+        return system_key, _hashable(oad.RegisterSubmodel.active_models)
+    except (AttributeError, TypeError):
+        return None
+
+
 def list_variables(component: Union[om.ExplicitComponent, om.Group]) -> list:
-    """Reads all variables from a component/problem and return as a list."""
+    """
+    Reads all variables from a component/problem and return as a list. Results are cached so
+    that the introspection of a system with the same structure costs no setup.
+
+    The structure of a system is given by its class, its options and the subsystems added before
+    its setup. Systems whose setup depends on anything else, like a file or a global variable,
+    need clear_variables_cache() to be called when it changes.
+    """
+    key = _cache_key(component)
+    variables = _get_cached(_VARIABLES_CACHE, key)
+    if variables is not None:
+        return deepcopy(variables)
+
     if isinstance(component, om.Group):
         new_component = AutoUnitsDefaultGroup()
         new_component.add_subsystem("system", component, promotes=["*"])
         component = new_component
     variables = VariableListLocal.from_system(component)
 
+    _set_cached(_VARIABLES_CACHE, key, deepcopy(variables))
+
     return variables
 
 
@@ -747,9 +1054,15 @@ def list_inputs(component: Union[om.ExplicitComponent, om.Group]) -> list:
 def list_inputs_metadata(component: Union[om.ExplicitComponent, om.Group]) -> tuple:
     """
     Reads all variables from a component/problem and returns inputs name and metadata as a
-    list.
+    list. Results are cached so that the introspection of a system with the same structure costs
+    no setup, with the same limits as for list_variables.
     """
 
+    key = _cache_key(component)
+    inputs_metadata = _get_cached(_INPUTS_METADATA_CACHE, key)
+    if inputs_metadata is not None:
+        return tuple(list(metadata) for metadata in inputs_metadata)
+
     prob = oad.FASTOADProblem()
     model = prob.model
     model.add_subsystem("component", component, promotes=["*"])
@@ -797,7 +1110,10 @@ def list_inputs_metadata(component: Union[om.ExplicitComponent, om.Group]) -> tu
             var_shape_by_conn.append(variable["shape_by_conn"])
             var_copy_shape.append(variable["copy_shape"])
 
-    return var_inputs, var_units, var_shape, var_shape_by_conn, var_copy_shape
+    inputs_metadata = var_inputs, var_units, var_shape, var_shape_by_conn, var_copy_shape
+    _set_cached(_INPUTS_METADATA_CACHE, key, tuple(list(metadata) for metadata in inputs_metadata))
+
+    return inputs_metadata
 
 
 def list_outputs(component: Union[om.ExplicitComponent, om.Group]) -> list:
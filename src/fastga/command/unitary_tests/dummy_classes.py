@@ -67,3 +67,41 @@ class Disc3(om.Group):
         ivc.add_output("data:geometry:variable_1", val=self.options["ivc_value"])
         self.add_subsystem("ivc1", ivc, promotes=["*"])
         self.add_subsystem("disc1", Disc1(), promotes=["*"])
+
+
+class Disc4(om.ExplicitComponent):
+    """An OpenMDAO component to encapsulate an element-wise discipline and test"""
+
+    def setup(self):
+        self.add_input("data:geometry:variable_1", val=np.nan, shape_by_conn=True, desc="")
+        self.add_input("data:geometry:variable_3", val=1.0, desc="")
+
+        self.add_output("data:geometry:variable_5", copy_shape="data:geometry:variable_1", desc="")
+
+    def compute(self, inputs, outputs, discrete_inputs=None, discrete_outputs=None):
+        """
+        Evaluates a simple element-wise equation
+        """
+        outputs["data:geometry:variable_5"] = (
+            inputs["data:geometry:variable_1"] * inputs["data:geometry:variable_3"]
+        )
+
+
+class Disc5(om.ExplicitComponent):
+    """An OpenMDAO component with an element-wise output and a fixed-size output"""
+
+    def setup(self):
+        self.add_input("data:geometry:variable_1", val=np.nan, shape_by_conn=True, desc="")
+
+        self.add_output("data:geometry:variable_5", copy_shape="data:geometry:variable_1", desc="")
+        self.add_output("data:geometry:variable_6", shape=2, desc="")
+
+    def compute(self, inputs, outputs, discrete_inputs=None, discrete_outputs=None):
+        """
+        Evaluates an element-wise equation and the bounds of the input
+        """
+        outputs["data:geometry:variable_5"] = 2.0 * inputs["data:geometry:variable_1"]
+        outputs["data:geometry:variable_6"] = [
+            np.min(inputs["data:geometry:variable_1"]),
+            np.max(inputs["data:geometry:variable_1"]),
+        ]
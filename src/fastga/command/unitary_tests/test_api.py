@@ -14,13 +14,16 @@
 
 import os.path as pth
 import os
+import shutil
 import pytest
 import warnings
 
+import openmdao.api as om
+
 import fastoad.api as oad
 
 from fastga.command import api
-from fastga.command.unitary_tests.dummy_classes import Disc1, Disc2, Disc3
+from fastga.command.unitary_tests.dummy_classes import Disc1, Disc2, Disc3, Disc4, Disc5
 from fastga import models
 from fastga.models import (
     aerodynamics,
@@ -109,6 +112,150 @@ def test_input_vars_working():
     assert value == pytest.approx(17.0, abs=1e-3)
 
 
+def test_block_analysis_reused():
+
+    missing_input_xml_file = pth.join(pth.dirname(__file__), "data/missing_one_input.xml")
+    var_inputs = ["data:geometry:variable_1"]
+
+    test_generate_block_analysis = api.generate_block_analysis(
+        Disc1(), var_inputs, missing_input_xml_file, overwrite=False
+    )
+    output_dict = test_generate_block_analysis({"data:geometry:variable_1": (4.0, None)})
+    problem = test_generate_block_analysis.problem
+    value = output_dict.get("data:geometry:variable_4")[0]
+    assert value == pytest.approx(17.0, abs=1e-3)
+
+    # The problem is only set up once, the values of the first call are not modified
+    output_dict_2 = test_generate_block_analysis({"data:geometry:variable_1": (6.0, None)})
+    assert test_generate_block_analysis.problem is problem
+    assert output_dict_2.get("data:geometry:variable_4")[0] == pytest.approx(19.0, abs=1e-3)
+    assert output_dict.get("data:geometry:variable_4")[0] == pytest.approx(17.0, abs=1e-3)
+
+    # A change of the inputs shape or units sets up a new problem
+    output_dict = test_generate_block_analysis({"data:geometry:variable_1": ([5.0], None)})
+    assert test_generate_block_analysis.problem is not problem
+    assert output_dict.get("data:geometry:variable_4")[0] == pytest.approx(18.0, abs=1e-3)
+
+
+def test_block_analysis_xml_removed():
+
+    xml_file = pth.join(RESULTS_FOLDER, "block_analysis_xml_removed.xml")
+    os.makedirs(RESULTS_FOLDER, exist_ok=True)
+    shutil.copy(pth.join(DATA_FOLDER_PATH, "missing_one_input.xml"), xml_file)
+    var_inputs = ["data:geometry:variable_1"]
+
+    test_generate_block_analysis = api.generate_block_analysis(
+        Disc1(), var_inputs, xml_file, overwrite=False
+    )
+    output_dict = test_generate_block_analysis({"data:geometry:variable_1": (4.0, None)})
+    assert output_dict["data:geometry:variable_4"][0] == pytest.approx(17.0, abs=1e-3)
+
+    # The values read at generation can't be used once the file has been removed
+    os.remove(xml_file)
+    with pytest.raises(FileNotFoundError):
+        test_generate_block_analysis({"data:geometry:variable_1": (4.0, None)})
+
+
+def test_block_analysis_map():
+
+    missing_input_xml_file = pth.join(pth.dirname(__file__), "data/missing_one_input.xml")
+    var_inputs = ["data:geometry:variable_1"]
+    inputs_dicts = [{"data:geometry:variable_1": (float(idx), None)} for idx in range(4)]
+
+    test_generate_block_analysis = api.generate_block_analysis(
+        Disc1(), var_inputs, missing_input_xml_file, overwrite=False
+    )
+    for max_workers in [1, 2]:
+        results = dict(test_generate_block_analysis.map(inputs_dicts, max_workers=max_workers))
+        assert sorted(results.keys()) == [0, 1, 2, 3]
+        for idx, output_dict in results.items():
+            value = output_dict.get("data:geometry:variable_4")[0]
+            assert value == pytest.approx(13.0 + idx, abs=1e-3)
+
+    test_generate_block_analysis = api.generate_block_analysis(
+        Disc4(), var_inputs, missing_input_xml_file, overwrite=False
+    )
+    inputs_dicts.append({"data:geometry:variable_1": ([4.0, 5.0], None)})
+    results = list(test_generate_block_analysis.map(inputs_dicts[1:], vectorized=True))
+    assert [idx for idx, _ in results] == [0, 1, 2, 3]
+    assert results[0][1].get("data:geometry:variable_5")[0] == pytest.approx([2.0], abs=1e-3)
+    assert results[3][1].get("data:geometry:variable_5")[0] == pytest.approx([8.0, 10.0], abs=1e-3)
+
+    # Fixed-size outputs and inputs without one value per point are not split
+    test_generate_block_analysis = api.generate_block_analysis(
+        Disc5(), var_inputs, missing_input_xml_file, overwrite=False
+    )
+    with pytest.raises(ValueError, match="variable_6"):
+        list(test_generate_block_analysis.map(inputs_dicts[:3], vectorized=True))
+    with pytest.raises(ValueError, match="different sizes"):
+        list(
+            test_generate_block_analysis.map(
+                [
+                    {
+                        "data:geometry:variable_1": ([1.0, 2.0], None),
+                        "data:geometry:variable_3": (1.0, None),
+                    }
+                ],
+                vectorized=True,
+            )
+        )
+
+    # Outputs of the different inputs would all be written in the same .xml file
+    block_analysis = api.BlockAnalysis(
+        Disc1(), None, {"data:geometry:variable_4": None}, missing_input_xml_file, overwrite=True
+    )
+    with pytest.raises(ValueError):
+        list(block_analysis.map(inputs_dicts[:2]))
+    with pytest.raises(ValueError):
+        list(block_analysis.map(inputs_dicts[:2], vectorized=True))
+
+
+def test_variables_cache(monkeypatch):
+
+    api.clear_variables_cache()
+    inputs = api.list_inputs(Disc1())
+    assert sorted(inputs) == [
+        "data:geometry:variable_1",
+        "data:geometry:variable_2",
+        "data:geometry:variable_3",
+    ]
+    assert api._cache_key(Disc1()) in api._VARIABLES_CACHE
+    # Modifying the returned results does not modify the cached ones
+    api.list_variables(Disc1()).clear()
+    assert api.list_inputs(Disc1()) == inputs
+
+    # The options and the subsystems added before setup are part of the key
+    assert api._cache_key(Disc3(ivc_value=3.0)) != api._cache_key(Disc3())
+    group_1 = om.Group()
+    group_1.add_subsystem("disc", Disc1(), promotes=["*"])
+    group_2 = om.Group()
+    group_2.add_subsystem("disc", Disc4(), promotes=["*"])
+    assert api._cache_key(group_1) != api._cache_key(group_2)
+    assert api.list_outputs(group_1) == ["data:geometry:variable_4"]
+    assert api.list_outputs(group_2) == ["data:geometry:variable_5"]
+
+    metadata = api.list_inputs_metadata(Disc1())
+    assert api.list_inputs_metadata(Disc1()) == metadata
+    api.clear_variables_cache()
+    assert not api._VARIABLES_CACHE and not api._INPUTS_METADATA_CACHE
+
+    # Systems with options that are not plain values are not cached
+    disc_1 = Disc1()
+    disc_1.options.declare("solver", default=om.NewtonSolver())
+    assert api._cache_key(disc_1) is None
+    assert api.list_inputs(disc_1) == inputs
+    assert not api._VARIABLES_CACHE
+
+    # Least recently used results are dropped beyond the size of the cache
+    monkeypatch.setattr(api, "VARIABLES_CACHE_SIZE", 2)
+    api.list_inputs(Disc1())
+    api.list_inputs(Disc3())
+    api.list_inputs(Disc1())
+    api.list_inputs(Disc4())
+    assert list(api._VARIABLES_CACHE) == [api._cache_key(Disc1()), api._cache_key(Disc4())]
+    api.clear_variables_cache()
+
+
 def test_ivc_working():
     missing_input_xml_file = pth.join(pth.dirname(__file__), "data/missing_one_input.xml")
 
@@ -94,7 +94,7 @@ class ComputeDeltaElevator(FigureDigitization):
         cl_delta_theory = self.cl_delta_theory_plain_flap(
             float(htp_thickness_ratio), float(elevator_chord_ratio)
         )
-        k = self.k_prime_plain_flap(abs(float(elevator_angle)), float(elevator_chord_ratio))
+        k = self.k_prime_plain_flap(np.abs(elevator_angle), float(elevator_chord_ratio))
         k_cl_delta = self.k_cl_delta_plain_flap(
             float(htp_thickness_ratio), float(cl_alpha_airfoil_ht), float(elevator_chord_ratio)
         )
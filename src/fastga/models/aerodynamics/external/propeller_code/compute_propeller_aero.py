@@ -21,6 +21,7 @@ import openmdao.api as om
 import fastoad.api as oad
 from fastoad.module_management.constants import ModelDomain
 
+from fastga.models.aerodynamics.external.xfoil.xfoil_batch import XfoilPolarBatch
 from fastga.models.aerodynamics.external.xfoil.xfoil_polar import XfoilPolar
 
 from .propeller_core import PropellerCoreModule
@@ -49,37 +50,48 @@ class ComputePropellerPerformance(om.Group):
             types=list,
         )
         self.options.declare("elements_number", default=20, types=int)
+        self.options.declare(
+            "max_workers",
+            default=1,
+            types=int,
+            allow_none=True,
+            desc="Number of processes that compute the tables, number of CPUs if None. Tables are "
+            "computed in the current process by default",
+        )
 
     def setup(self):
         ivc = om.IndepVarComp()
         ivc.add_output("data:aerodynamics:propeller:mach", val=0.0)
         ivc.add_output("data:aerodynamics:propeller:reynolds", val=1e6)
         self.add_subsystem("propeller_efficiency_aero_conditions", ivc, promotes=["*"])
-        for profile in self.options["sections_profile_name_list"]:
-            self.add_subsystem(
-                profile + "_polar_efficiency",
-                XfoilPolar(
-                    airfoil_folder_path=self.options["airfoil_folder_path"],
-                    airfoil_file=profile + ".af",
-                    alpha_end=30.0,
-                    activate_negative_angle=True,
-                ),
-                promotes=[],
-            )
-            self.connect(
-                "data:aerodynamics:propeller:mach",
-                profile + "_polar_efficiency.xfoil:mach",
-            )
-            self.connect(
-                "data:aerodynamics:propeller:reynolds",
-                profile + "_polar_efficiency.xfoil:reynolds",
+        polar_options = {
+            profile
+            + "_polar_efficiency": dict(
+                airfoil_folder_path=self.options["airfoil_folder_path"],
+                airfoil_file=profile + ".af",
+                alpha_end=30.0,
+                activate_negative_angle=True,
             )
+            for profile in self.options["sections_profile_name_list"]
+        }
+        # Runs the missing polars concurrently before the XfoilPolar components read them
+        self.add_subsystem(
+            "polars_computation",
+            XfoilPolarBatch(polars=polar_options),
+            promotes=[],
+        )
+        for name, options in polar_options.items():
+            self.add_subsystem(name, XfoilPolar(**options), promotes=[])
+            for input_prefix in [name + ".xfoil", "polars_computation." + name + ":xfoil"]:
+                self.connect("data:aerodynamics:propeller:mach", input_prefix + ":mach")
+                self.connect("data:aerodynamics:propeller:reynolds", input_prefix + ":reynolds")
         self.add_subsystem(
             "propeller_aero",
             _ComputePropellerPerformance(
                 sections_profile_position_list=self.options["sections_profile_position_list"],
                 sections_profile_name_list=self.options["sections_profile_name_list"],
                 elements_number=self.options["elements_number"],
+                max_workers=self.options["max_workers"],
             ),
             promotes_inputs=["data:*"],
             promotes_outputs=["*"],
@@ -100,6 +112,17 @@ class ComputePropellerPerformance(om.Group):
 
 
 class _ComputePropellerPerformance(PropellerCoreModule):
+    def initialize(self):
+        super().initialize()
+        self.options.declare(
+            "max_workers",
+            default=1,
+            types=int,
+            allow_none=True,
+            desc="Number of processes that compute the tables, number of CPUs if None. Tables are "
+            "computed in the current process by default",
+        )
+
     def setup(self):
 
         super().setup()
@@ -145,34 +168,24 @@ class _ComputePropellerPerformance(PropellerCoreModule):
         v_max = inputs["data:TLAR:v_cruise"] * 1.2
         speed_interp = np.linspace(v_min, v_max, SPEED_PTS_NB)
 
-        # Construct table for init of climb
-        altitude = 0.0
-        thrust_vect, _, eta_vect = self.construct_table(inputs, speed_interp, altitude, omega)
+        # Construct tables for init of climb and for cruise, all their points are computed at once
+        cruise_altitude = float(inputs["data:mission:sizing:main_route:cruise:altitude"])
+        tables = self.construct_tables(inputs, speed_interp, [0.0, cruise_altitude], omega)
 
-        # Reformat table
-        thrust_limit, thrust_interp, efficiency_interp = self.reformat_table(thrust_vect, eta_vect)
-
-        # Save results
-        outputs["data:aerodynamics:propeller:sea_level:efficiency"] = efficiency_interp
-        outputs["data:aerodynamics:propeller:sea_level:thrust"] = thrust_interp
-        outputs["data:aerodynamics:propeller:sea_level:thrust_limit"] = thrust_limit
-        outputs["data:aerodynamics:propeller:sea_level:speed"] = speed_interp
+        for level, (thrust_vect, _, eta_vect) in zip(["sea_level", "cruise_level"], tables):
+            # Reformat table, theta_vect is not used as of now
+            thrust_limit, thrust_interp, efficiency_interp = self.reformat_table(
+                thrust_vect, eta_vect
+            )
 
-        # construct table for cruise
-        altitude = inputs["data:mission:sizing:main_route:cruise:altitude"]
-        # theta_vect can be obtained with construct table, it is the second input, not used as of
-        # now
-        thrust_vect, _, eta_vect = self.construct_table(inputs, speed_interp, altitude, omega)
-        # Reformat table
-        thrust_limit, thrust_interp, efficiency_interp = self.reformat_table(thrust_vect, eta_vect)
+            # Save results
+            outputs["data:aerodynamics:propeller:" + level + ":efficiency"] = efficiency_interp
+            outputs["data:aerodynamics:propeller:" + level + ":thrust"] = thrust_interp
+            outputs["data:aerodynamics:propeller:" + level + ":thrust_limit"] = thrust_limit
+            outputs["data:aerodynamics:propeller:" + level + ":speed"] = speed_interp
 
         _LOGGER.debug("Finishing propeller computation")
 
-        # Save results
-        outputs["data:aerodynamics:propeller:cruise_level:efficiency"] = efficiency_interp
-        outputs["data:aerodynamics:propeller:cruise_level:thrust"] = thrust_interp
-        outputs["data:aerodynamics:propeller:cruise_level:thrust_limit"] = thrust_limit
-        outputs["data:aerodynamics:propeller:cruise_level:speed"] = speed_interp
         outputs["data:aerodynamics:propeller:cruise_level:altitude"] = inputs[
             "data:mission:sizing:main_route:cruise:altitude"
         ]
@@ -188,10 +201,20 @@ class _ComputePropellerPerformance(PropellerCoreModule):
         :param altitude: the altitude for the propeller computation, in m.
         :param omega: the propeller rotation speed, in rpm.
         """
-        thrust_vect = []
-        theta_vect = []
-        eta_vect = []
+        return self.construct_tables(inputs, speed_interp, [altitude], omega)[0]
 
+    def construct_tables(self, inputs, speed_interp, altitudes, omega):
+        """
+        Same as :meth:`construct_table` for several altitudes. The points of all the altitudes,
+        speeds and pitches are spread over max_workers processes.
+
+        :param inputs: the inputs containing the propeller geometry.
+        :param speed_interp: the array containing the flight speed at which we compute the
+        propeller thrust and efficiency, in m/s.
+        :param altitudes: the altitudes for the propeller computation, in m.
+        :param omega: the propeller rotation speed, in rpm.
+        :return: the thrust, theta and efficiency vectors of each altitude.
+        """
         radius_min = inputs["data:geometry:propeller:hub_diameter"] / 2.0
         radius_max = inputs["data:geometry:propeller:diameter"] / 2.0
         length = radius_max - radius_min
@@ -229,19 +252,51 @@ class _ComputePropellerPerformance(PropellerCoreModule):
             cl_list[idx, :] = np.interp(alpha_interp, alpha_element, cl_element)
             cd_list[idx, :] = np.interp(alpha_interp, alpha_element, cd_element)
 
+        theta_interp_list = []
         for v_inf in speed_interp:
             self.compute_extreme_pitch(inputs, v_inf)
-            theta_interp = np.linspace(self.theta_min, self.theta_max, 100)
-            local_thrust_vect = []
-            local_theta_vect = []
-            local_eta_vect = []
-            for theta_75 in theta_interp:
-                thrust, eta, _ = self.compute_pitch_performance(
-                    inputs, theta_75, v_inf, altitude, omega, radius, alpha_list, cl_list, cd_list
-                )
-                local_thrust_vect.append(thrust)
-                local_theta_vect.append(theta_75)
-                local_eta_vect.append(eta)
+            theta_interp_list.append(np.linspace(self.theta_min, self.theta_max, 100).flatten())
+
+        # The performance at all the altitudes, speeds and pitches is computed at once
+        thrust_array, eta_array, _ = self.compute_pitch_performance_parallel(
+            inputs,
+            np.tile(np.concatenate(theta_interp_list), len(altitudes)),
+            np.tile(np.repeat(speed_interp, 100), len(altitudes)),
+            np.repeat(np.asarray(altitudes, dtype=float), len(theta_interp_list) * 100),
+            omega,
+            radius,
+            alpha_list,
+            cl_list,
+            cd_list,
+            max_workers=self.options["max_workers"],
+        )
+        thrust_array = np.reshape(thrust_array, (len(altitudes), len(theta_interp_list), 100))
+        eta_array = np.reshape(eta_array, (len(altitudes), len(theta_interp_list), 100))
+
+        return [
+            self.trim_table(theta_interp_list, thrust_array[idx_altitude], eta_array[idx_altitude])
+            for idx_altitude in range(len(altitudes))
+        ]
+
+    @staticmethod
+    def trim_table(theta_interp_list, thrust_array, eta_array):
+        """
+        Keeps, for each speed, the part of the thrust and efficiency curves where thrust
+        increases with pitch and efficiency is between 0 and 1.
+
+        :param theta_interp_list: the pitches of each speed, in deg.
+        :param thrust_array: the thrust at each speed and pitch, in N.
+        :param eta_array: the efficiency at each speed and pitch.
+        :return: the thrust, theta and efficiency vectors of each speed.
+        """
+        thrust_vect = []
+        theta_vect = []
+        eta_vect = []
+
+        for idx_speed, theta_interp in enumerate(theta_interp_list):
+            local_thrust_vect = thrust_array[idx_speed].tolist()
+            local_theta_vect = theta_interp.tolist()
+            local_eta_vect = eta_array[idx_speed].tolist()
 
             # Find first the "monotone" zone (10 points of increase)
             idx_in_zone = 0
@@ -22,6 +22,7 @@ import fastoad.api as oad
 from fastoad.module_management.constants import ModelDomain
 from stdatm import Atmosphere
 
+from fastga.models.aerodynamics.external.xfoil.xfoil_batch import XfoilPolarBatch
 from fastga.models.aerodynamics.external.xfoil.xfoil_polar import XfoilPolar
 from .propeller_core import PropellerCoreModule
 
@@ -57,25 +58,28 @@ class ComputePropellerCoefficientMap(om.Group):
         ivc.add_output("data:aerodynamics:propeller:coefficient_map:mach", val=0.0)
         ivc.add_output("data:aerodynamics:propeller:coefficient_map:reynolds", val=1e6)
         self.add_subsystem("propeller_coeff_map_aero_conditions", ivc, promotes=["*"])
-        for profile in self.options["sections_profile_name_list"]:
-            self.add_subsystem(
-                profile + "_polar_coeff_map",
-                XfoilPolar(
-                    airfoil_folder_path=self.options["airfoil_folder_path"],
-                    airfoil_file=profile + ".af",
-                    alpha_end=30.0,
-                    activate_negative_angle=True,
-                ),
-                promotes=[],
-            )
-            self.connect(
-                "data:aerodynamics:propeller:coefficient_map:mach",
-                profile + "_polar_coeff_map.xfoil:mach",
-            )
-            self.connect(
-                "data:aerodynamics:propeller:coefficient_map:reynolds",
-                profile + "_polar_coeff_map.xfoil:reynolds",
+        polar_options = {
+            profile
+            + "_polar_coeff_map": dict(
+                airfoil_folder_path=self.options["airfoil_folder_path"],
+                airfoil_file=profile + ".af",
+                alpha_end=30.0,
+                activate_negative_angle=True,
             )
+            for profile in self.options["sections_profile_name_list"]
+        }
+        # Runs the missing polars concurrently before the XfoilPolar components read them
+        self.add_subsystem("polars_computation", XfoilPolarBatch(polars=polar_options), promotes=[])
+        for name, options in polar_options.items():
+            self.add_subsystem(name, XfoilPolar(**options), promotes=[])
+            for input_prefix in [name + ".xfoil", "polars_computation." + name + ":xfoil"]:
+                self.connect(
+                    "data:aerodynamics:propeller:coefficient_map:mach", input_prefix + ":mach"
+                )
+                self.connect(
+                    "data:aerodynamics:propeller:coefficient_map:reynolds",
+                    input_prefix + ":reynolds",
+                )
         self.add_subsystem(
             "propeller_coeff_map",
             _ComputePropellerCoefficientMap(
@@ -148,10 +152,7 @@ class _ComputePropellerCoefficientMap(PropellerCoreModule):
         atm = Atmosphere(altitude, altitude_in_feet=False)
         v_min = inputs["data:aerodynamics:propeller:coefficient_map:min_speed"]
         v_max = inputs["data:aerodynamics:propeller:coefficient_map:max_speed"]
-        speed_interp = np.linspace(v_min, v_max, J_POINTS_NUMBER)
-        ct_list = np.zeros_like(speed_interp)
-        cp_list = np.zeros_like(speed_interp)
-        j_list = np.zeros_like(speed_interp)
+        speed_interp = np.linspace(v_min, v_max, J_POINTS_NUMBER).flatten()
         theta_75 = inputs["data:aerodynamics:propeller:coefficient_map:twist_75"]
 
         prop_diameter = inputs["data:geometry:propeller:diameter"]
@@ -193,18 +194,14 @@ class _ComputePropellerCoefficientMap(PropellerCoreModule):
             cl_list[idx, :] = np.interp(alpha_interp, alpha_element, cl_element)
             cd_list[idx, :] = np.interp(alpha_interp, alpha_element, cd_element)
 
-        for idx, v_inf in enumerate(speed_interp):
-
-            thrust, eta, _ = self.compute_pitch_performance(
-                inputs, theta_75, v_inf, altitude, omega, radius, alpha_list, cl_list, cd_list
-            )
-            ct_local = thrust / (atm.density * (omega / 60.00) ** 2.0 * prop_diameter ** 4.0)
-            ct_list[idx] = ct_local
-            shaft_power = thrust * v_inf / eta
-            cp_local = shaft_power / (atm.density * (omega / 60.0) ** 3.0 * prop_diameter ** 5.0)
-            cp_list[idx] = cp_local
-            j_local = v_inf / (omega / 60.0 * prop_diameter)
-            j_list[idx] = j_local
+        # All the speeds are computed at once
+        thrust, eta, _ = self.compute_pitch_performance(
+            inputs, theta_75, speed_interp, altitude, omega, radius, alpha_list, cl_list, cd_list
+        )
+        ct_list = thrust / (atm.density * (omega / 60.00) ** 2.0 * prop_diameter ** 4.0)
+        shaft_power = thrust * speed_interp / eta
+        cp_list = shaft_power / (atm.density * (omega / 60.0) ** 3.0 * prop_diameter ** 5.0)
+        j_list = speed_interp / (omega / 60.0 * prop_diameter)
 
         _LOGGER.debug("Finishing propeller computation")
 
@@ -13,9 +13,12 @@
 #  along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import Optional
 
 import numpy as np
-from scipy.optimize import root
 
 import openmdao.api as om
 
@@ -28,6 +31,18 @@ _LOGGER = logging.getLogger(__name__)
 THRUST_PTS_NB = 30
 SPEED_PTS_NB = 10
 
+# Inputs read by PropellerCoreModule.compute_pitch_performance
+PERFORMANCE_INPUTS = [
+    "reference_reynolds",
+    "data:geometry:propeller:diameter",
+    "data:geometry:propeller:hub_diameter",
+    "data:geometry:propeller:blades_number",
+    "data:geometry:propeller:sweep_vect",
+    "data:geometry:propeller:chord_vect",
+    "data:geometry:propeller:twist_vect",
+    "data:geometry:propeller:radius_ratio_vect",
+]
+
 
 class PropellerCoreModule(om.ExplicitComponent):
     """
@@ -108,7 +123,9 @@ class PropellerCoreModule(om.ExplicitComponent):
 
         """
         This function calculates the thrust, efficiency and power at a given flight speed,
-        altitude h and propeller angular speed.
+        altitude h and propeller angular speed. Several pitches and/or flight speeds can be
+        given as arrays, in which case the performance at each of those conditions is computed at
+        once.
 
         :param inputs: structure of data relative to the blade geometry available from setup
         :param theta_75: pitch defined at r = 0.75*R radial position [deg].
@@ -123,98 +140,187 @@ class PropellerCoreModule(om.ExplicitComponent):
         :param cd_list: cd list for aerodynamic coefficient of profile at discretized blade
         element [-].
 
-        :return: thrust [N], eta (efficiency) [-] and power [W].
+        :return: thrust [N], eta (efficiency) [-] and power [W], as floats for a single condition
+        and as arrays otherwise.
         """
 
-        blades_number = inputs["data:geometry:propeller:blades_number"]
-        radius_min = inputs["data:geometry:propeller:hub_diameter"] / 2.0
-        radius_max = inputs["data:geometry:propeller:diameter"] / 2.0
+        blades_number = float(inputs["data:geometry:propeller:blades_number"])
+        radius_min = float(inputs["data:geometry:propeller:hub_diameter"]) / 2.0
+        radius_max = float(inputs["data:geometry:propeller:diameter"]) / 2.0
         sweep_vect = inputs["data:geometry:propeller:sweep_vect"]
         chord_vect = inputs["data:geometry:propeller:chord_vect"]
         twist_vect = inputs["data:geometry:propeller:twist_vect"]
         radius_ratio_vect = inputs["data:geometry:propeller:radius_ratio_vect"]
-        reference_reynolds = inputs["reference_reynolds"]
+        reference_reynolds = float(inputs["reference_reynolds"])
         length = radius_max - radius_min
         element_length = length / self.options["elements_number"]
-        omega = omega * np.pi / 30.0
+        omega = float(omega) * np.pi / 30.0
         atm = Atmosphere(altitude, altitude_in_feet=False)
 
         theta_75_ref = np.interp(0.75, radius_ratio_vect, twist_vect)
 
-        # Initialise vectors
-        vi_vect = np.zeros_like(radius)
-        vt_vect = np.zeros_like(radius)
-        thrust_element_vector = np.zeros_like(radius)
-        torque_element_vector = np.zeros_like(radius)
-        alpha_vect = np.zeros_like(radius)
-        speed_vect = np.array([0.1 * float(v_inf), 1.0])
-
-        chord = np.interp(radius / radius_max, radius_ratio_vect, chord_vect)
-
-        theta = np.interp(radius / radius_max, radius_ratio_vect, twist_vect) + (
-            theta_75 - theta_75_ref
+        # Each blade element in each flight condition is a point of the system, the points are
+        # stored as (element, condition) arrays
+        radius = np.asarray(radius, dtype=float)
+        pitch, v_inf = np.broadcast_arrays(
+            np.atleast_1d(np.asarray(theta_75, dtype=float)).flatten(),
+            np.atleast_1d(np.asarray(v_inf, dtype=float)).flatten(),
         )
-        sweep = np.interp(radius / radius_max, radius_ratio_vect, sweep_vect)
-
-        # Loop on element number to compute equations
-        for idx, _ in enumerate(radius):
-
-            # Solve BEM vs. disk theory system of equations
-            speed_vect = root(
-                fun=self.delta,
-                x0=speed_vect,
-                args=(
-                    radius[idx],
-                    radius_min,
-                    radius_max,
-                    chord[idx],
-                    blades_number,
-                    sweep[idx],
-                    omega,
-                    v_inf,
-                    theta[idx],
-                    alpha_list[idx, :],
-                    cl_list[idx, :],
-                    cd_list[idx, :],
-                    atm,
-                    reference_reynolds,
-                ),
-                method="hybr",
-                options={"xtol": 1e-3},
-            ).x
-            vi_vect[idx] = speed_vect[0]
-            vt_vect[idx] = speed_vect[1]
-            results = self.bem_theory(
+        shape = (np.size(radius), np.size(pitch))
+        element_idx = np.repeat(np.arange(np.size(radius)), np.size(pitch))
+        point_v_inf = np.tile(v_inf, np.size(radius))
+        point_radius = radius[element_idx]
+        point_chord = np.interp(point_radius / radius_max, radius_ratio_vect, chord_vect)
+        point_theta = np.interp(point_radius / radius_max, radius_ratio_vect, twist_vect) + (
+            np.tile(pitch, np.size(radius)) - theta_75_ref
+        )
+        point_sweep = np.interp(point_radius / radius_max, radius_ratio_vect, sweep_vect)
+        point_alpha = np.asarray(alpha_list, dtype=float)[element_idx]
+        point_cl = np.asarray(cl_list, dtype=float)[element_idx]
+        point_cd = np.asarray(cd_list, dtype=float)[element_idx]
+
+        def point_delta(speed_vect, points):
+            return self.delta(
                 speed_vect,
-                radius[idx],
-                chord[idx],
+                point_radius[points],
+                radius_min,
+                radius_max,
+                point_chord[points],
                 blades_number,
-                sweep[idx],
+                point_sweep[points],
                 omega,
-                v_inf,
-                theta[idx],
-                alpha_list[idx, :],
-                cl_list[idx, :],
-                cd_list[idx, :],
+                point_v_inf[points],
+                point_theta[points],
+                point_alpha[points],
+                point_cl[points],
+                point_cd[points],
                 atm,
                 reference_reynolds,
             )
-            out_of_polars = results[3]
-            if out_of_polars:
-                thrust_element_vector[idx] = 0.0
-                torque_element_vector[idx] = 0.0
-            else:
-                thrust_element_vector[idx] = results[0] * element_length * atm.density
-                torque_element_vector[idx] = results[1] * element_length * atm.density
-            alpha_vect[idx] = results[2]
 
-        torque = np.sum(torque_element_vector)
-        thrust = float(np.sum(thrust_element_vector))
-        power = float(torque * omega)
-        eta = float(v_inf * thrust / power)
+        # Solve BEM vs. disk theory system of equations for all the conditions at once, element
+        # after element as each element starts from the solution of the previous one
+        speed_vect = np.zeros((2, np.size(element_idx)))
+        element_speed_vect = np.array([0.1 * v_inf, np.ones(np.size(v_inf))])
+        for idx in range(np.size(radius)):
+            points = np.where(element_idx == idx)[0]
+            element_speed_vect = _solve_element_speeds(
+                lambda local_speed_vect, local_points: point_delta(
+                    local_speed_vect, points[local_points]
+                ),
+                element_speed_vect,
+                xtol=1e-3,
+            )
+            speed_vect[:, points] = element_speed_vect
+
+        results = self.bem_theory(
+            speed_vect,
+            point_radius,
+            point_chord,
+            blades_number,
+            point_sweep,
+            omega,
+            point_v_inf,
+            point_theta,
+            point_alpha,
+            point_cl,
+            point_cd,
+            atm,
+            reference_reynolds,
+        )
+        out_of_polars = results[3].astype(bool)
+        thrust_element_vector = np.where(
+            out_of_polars, 0.0, results[0] * element_length * atm.density
+        ).reshape(shape)
+        torque_element_vector = np.where(
+            out_of_polars, 0.0, results[1] * element_length * atm.density
+        ).reshape(shape)
+
+        torque = np.sum(torque_element_vector, axis=0)
+        thrust = np.sum(thrust_element_vector, axis=0)
+        power = torque * omega
+        eta = v_inf * thrust / power
+
+        if np.size(pitch) == 1:
+            return float(thrust[0]), float(eta[0]), torque[0]
 
         return thrust, eta, torque
 
+    def compute_pitch_performance_parallel(
+        self,
+        inputs,
+        theta_75,
+        v_inf,
+        altitude,
+        omega,
+        radius,
+        alpha_list,
+        cl_list,
+        cd_list,
+        max_workers: Optional[int] = 1,
+    ):
+        """
+        Same as :meth:`compute_pitch_performance` but the flight conditions, which can be at
+        different altitudes, are spread over max_workers processes. The conditions of each
+        altitude are split in max_workers chunks that are computed independently.
+
+        :param inputs: structure of data relative to the blade geometry available from setup
+        :param theta_75: pitches defined at r = 0.75*R radial position [deg].
+        :param v_inf: flight speeds [m/s].
+        :param altitude: flight altitudes [m].
+        :param omega: angular velocity of the propeller [RPM].
+        :param radius: array of radius of discretized blade elements [m].
+        :param alpha_list: angle of attack list for aerodynamic coefficient of profile at
+        discretized blade element [deg].
+        :param cl_list: cl list for aerodynamic coefficient of profile at discretized blade
+        element [-].
+        :param cd_list: cd list for aerodynamic coefficient of profile at discretized blade
+        element [-].
+        :param max_workers: maximum number of processes, number of CPUs if None. Conditions are
+        computed in the current process if 1.
+
+        :return: thrust [N], eta (efficiency) [-] and torque [N.m] arrays of the conditions.
+        """
+        theta_75, v_inf, altitude = [
+            np.array(value, dtype=float).flatten()
+            for value in np.broadcast_arrays(theta_75, v_inf, altitude)
+        ]
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+        max_workers = max(min(max_workers, np.size(theta_75)), 1)
+
+        chunks = [
+            chunk
+            for local_altitude in np.unique(altitude)
+            for chunk in np.array_split(np.where(altitude == local_altitude)[0], max_workers)
+            if np.size(chunk)
+        ]
+        # OpenMDAO views are copied so that the inputs can be sent to the processes
+        performance_inputs = {name: np.array(inputs[name]) for name in PERFORMANCE_INPUTS}
+        chunk_args = (
+            repeat(self.options["elements_number"]),
+            repeat(performance_inputs),
+            [theta_75[chunk] for chunk in chunks],
+            [v_inf[chunk] for chunk in chunks],
+            [float(altitude[chunk[0]]) for chunk in chunks],
+            repeat(float(omega)),
+            repeat(np.asarray(radius, dtype=float)),
+            repeat(np.asarray(alpha_list, dtype=float)),
+            repeat(np.asarray(cl_list, dtype=float)),
+            repeat(np.asarray(cd_list, dtype=float)),
+        )
+        if max_workers == 1:
+            chunk_results = list(map(_compute_pitch_performance_chunk, *chunk_args))
+        else:
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                chunk_results = list(executor.map(_compute_pitch_performance_chunk, *chunk_args))
+
+        results = np.zeros((3, np.size(theta_75)))
+        for chunk, chunk_result in zip(chunks, chunk_results):
+            results[:, chunk] = chunk_result
+
+        return results[0], results[1], results[2]
+
     @staticmethod
     def bem_theory(
         speed_vect: np.array,
@@ -236,6 +342,10 @@ class PropellerCoreModule(om.ExplicitComponent):
         its aerodynamic polars, flight conditions and axial/tangential velocities it computes the
         thrust and the torque produced using force and momentum with BEM theory.
 
+        Several elements can be computed at once, in which case the element parameters are
+        arrays and the polars of the element i are the lines alpha_element[i], cl_element[i] and
+        cd_element[i].
+
         :param speed_vect: the vector of axial and tangential induced speed in m/s
         :param radius: radius position of the element center  [m]
         :param chord: chord at the center of element [m]
@@ -265,25 +375,24 @@ class PropellerCoreModule(om.ExplicitComponent):
         alpha = theta - phi * 180.0 / np.pi
 
         # Compute local mach
-        atm.true_airspeed = rel_fluid_speed
-        mach_local = atm.mach
+        mach_local = rel_fluid_speed / atm.speed_of_sound
 
         # Apply the compressibility corrections for cl and cd
-        out_of_polars = bool((alpha > max(alpha_element)) or (alpha < min(alpha_element)))
+        out_of_polars = (alpha > np.max(alpha_element, axis=-1)) | (
+            alpha < np.min(alpha_element, axis=-1)
+        )
 
-        c_l = np.interp(alpha, alpha_element, cl_element)
-        c_d = np.interp(alpha, alpha_element, cd_element)
+        c_l, c_d = _interp_polar(alpha, alpha_element, cl_element, cd_element)
 
-        if mach_local < 1:
-            beta = np.sqrt(1 - mach_local ** 2.0)
-            c_l = c_l / (beta + c_l * mach_local ** 2.0 / (2.0 + 2.0 * beta))
-            c_d = c_d / (beta + c_d * mach_local ** 2.0 / (2.0 + 2.0 * beta))
-        else:
-            beta = np.sqrt(mach_local ** 2.0 - 1)
-            c_l = c_l / beta
-            c_d = c_d / beta
+        beta = np.sqrt(np.abs(1 - mach_local ** 2.0))
+        c_l = np.where(
+            mach_local < 1, c_l / (beta + c_l * mach_local ** 2.0 / (2.0 + 2.0 * beta)), c_l / beta
+        )
+        c_d = np.where(
+            mach_local < 1, c_d / (beta + c_d * mach_local ** 2.0 / (2.0 + 2.0 * beta)), c_d / beta
+        )
 
-        reynolds = chord * atm.unitary_reynolds
+        reynolds = chord * rel_fluid_speed / atm.kinematic_viscosity
         f_re = (3.46 * np.log(reynolds) - 5.6) ** -2
         f_re_t = (3.46 * np.log(reference_reynolds) - 5.6) ** -2
         c_d = c_d * f_re / f_re_t
@@ -306,11 +415,9 @@ class PropellerCoreModule(om.ExplicitComponent):
         )
 
         # Store results
-        output = np.empty(4)
-        output[0] = thrust_element
-        output[1] = torque_element
-        output[2] = alpha
-        output[3] = out_of_polars
+        output = np.array(
+            np.broadcast_arrays(thrust_element, torque_element, alpha, out_of_polars), dtype=float
+        )
 
         return output
 
@@ -390,9 +497,7 @@ class PropellerCoreModule(om.ExplicitComponent):
         torque_element = 4.0 * np.pi * radius ** 2.0 * (v_inf + v_i) * v_t * f_tip * f_hub
 
         # Store results
-        output = np.empty(2)
-        output[0] = thrust_element
-        output[1] = torque_element
+        output = np.array(np.broadcast_arrays(thrust_element, torque_element), dtype=float)
 
         return output
 
@@ -476,3 +581,147 @@ class PropellerCoreModule(om.ExplicitComponent):
             c_l[idx_start : idx_end + 1],
             c_d[idx_start : idx_end + 1],
         )
+
+
+def _compute_pitch_performance_chunk(
+    elements_number: int,
+    inputs: dict,
+    theta_75,
+    v_inf,
+    altitude: float,
+    omega: float,
+    radius,
+    alpha_list,
+    cl_list,
+    cd_list,
+) -> np.ndarray:
+    """
+    Same as :meth:`PropellerCoreModule.compute_pitch_performance`, for a propeller with
+    elements_number elements.
+
+    :return: an array with the thrust, efficiency and torque of the conditions as lines
+    """
+    propeller = PropellerCoreModule(
+        sections_profile_position_list=[],
+        sections_profile_name_list=[],
+        elements_number=elements_number,
+    )
+    thrust, eta, torque = propeller.compute_pitch_performance(
+        inputs, theta_75, v_inf, altitude, omega, radius, alpha_list, cl_list, cd_list
+    )
+
+    return np.array([np.atleast_1d(thrust), np.atleast_1d(eta), np.atleast_1d(torque)])
+
+
+def _interp_polar(alpha, alpha_element, cl_element, cd_element):
+    """
+    Linearly interpolates the polar of each element at its angle of attack, same as np.interp
+    applied element by element.
+
+    :param alpha: angle of attack of the elements [deg.]
+    :param alpha_element: reference angle vector of the polar, or array with the reference angle
+    vector of each element as lines [deg.]
+    :param cl_element: cl vector of the polar, or array with the cl vector of each element as
+    lines [-]
+    :param cd_element: cd vector of the polar, or array with the cd vector of each element as
+    lines [-]
+    :return: the cl and cd of each element [-]
+    """
+    if np.ndim(alpha_element) == 1:
+        return (
+            np.interp(alpha, alpha_element, cl_element),
+            np.interp(alpha, alpha_element, cd_element),
+        )
+
+    alpha = np.clip(alpha, alpha_element[:, 0], alpha_element[:, -1])
+    idx = np.clip(
+        np.sum(alpha_element <= alpha[:, np.newaxis], axis=1) - 1, 0, alpha_element.shape[1] - 2
+    )
+    lines = np.arange(np.size(alpha))
+    alpha_low = alpha_element[lines, idx]
+    ratio = (alpha - alpha_low) / (alpha_element[lines, idx + 1] - alpha_low)
+
+    return tuple(
+        (coefficient_element[lines, idx + 1] - coefficient_element[lines, idx]) * ratio
+        + coefficient_element[lines, idx]
+        for coefficient_element in (cl_element, cd_element)
+    )
+
+
+def _solve_element_speeds(function, x_0, xtol: float, max_iter: int = 100) -> np.ndarray:
+    """
+    Solves the 2x2 system function(x) = 0 of a set of blade elements with a Newton method applied
+    to all the elements at once. The jacobian is computed by finite differences and the step of an
+    element is halved until its residuals decrease. An element has converged once a full step
+    changes its speeds by less than xtol in relative terms. The last iterate is kept for the
+    elements that do not converge.
+
+    :param function: residuals of the system, called with the speeds of a subset of elements
+    as a (2, n) array and the indices of those elements
+    :param x_0: initial axial and tangential induced speeds of each element, as a (2, n) array
+    :param xtol: relative tolerance on the speeds
+    :param max_iter: maximum number of iterations
+    :return: the induced speeds of each element, as a (2, n) array
+    """
+    x = np.array(x_0, dtype=float)
+    active_points = np.arange(np.shape(x)[1])
+    with np.errstate(all="ignore"):
+        residuals = function(x, active_points)
+        for _ in range(max_iter):
+            if active_points.size == 0:
+                break
+            local_x = x[:, active_points]
+            local_residuals = residuals[:, active_points]
+
+            # Jacobian by forward finite differences, one speed at a time for all elements
+            jacobian = np.zeros((2, 2, active_points.size))
+            for idx in range(2):
+                step = 1.49012e-8 * np.maximum(np.abs(local_x[idx]), 1.0)
+                shifted_x = local_x.copy()
+                shifted_x[idx] += step
+                jacobian[:, idx] = (function(shifted_x, active_points) - local_residuals) / step
+            determinant = jacobian[0, 0] * jacobian[1, 1] - jacobian[0, 1] * jacobian[1, 0]
+            delta = (
+                np.array(
+                    [
+                        jacobian[0, 1] * local_residuals[1] - jacobian[1, 1] * local_residuals[0],
+                        jacobian[1, 0] * local_residuals[0] - jacobian[0, 0] * local_residuals[1],
+                    ]
+                )
+                / determinant
+            )
+            is_stalled = np.logical_not(np.all(np.isfinite(delta), axis=0))
+            delta[:, is_stalled] = 0.0
+
+            # Reduce the step of the elements for which residuals do not decrease
+            norm = np.sum(local_residuals ** 2, axis=0)
+            step_factor = np.ones(active_points.size)
+            new_x = local_x + delta
+            new_residuals = function(new_x, active_points)
+            for _ in range(20):
+                not_decreasing = np.logical_not(np.sum(new_residuals ** 2, axis=0) <= norm)
+                if not np.any(not_decreasing):
+                    break
+                step_factor[not_decreasing] /= 2.0
+                new_x[:, not_decreasing] = (
+                    local_x[:, not_decreasing]
+                    + step_factor[not_decreasing] * delta[:, not_decreasing]
+                )
+                new_residuals[:, not_decreasing] = function(
+                    new_x[:, not_decreasing], active_points[not_decreasing]
+                )
+            else:
+                # Elements for which no step decreases the residuals are given up
+                is_stalled = np.logical_or(is_stalled, not_decreasing)
+                new_x[:, not_decreasing] = local_x[:, not_decreasing]
+                new_residuals[:, not_decreasing] = local_residuals[:, not_decreasing]
+            x[:, active_points] = new_x
+            residuals[:, active_points] = new_residuals
+
+            is_converged = np.logical_and(
+                step_factor == 1.0,
+                np.max(np.abs(new_x - local_x) - xtol * np.abs(new_x), axis=0) <= 0.0,
+            )
+            active_points = active_points[np.logical_not(np.logical_or(is_converged, is_stalled))]
+
+    return x
@@ -0,0 +1,213 @@
+"""Indexed storage of the results computed by the VLM and OpenVSP aerodynamic codes."""
+#  This file is part of FAST-OAD_CS23 : A framework for rapid Overall Aircraft Design
+#  Copyright (C) 2022  ONERA & ISAE-SUPAERO
+#  FAST is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import logging
+import os
+import os.path as pth
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from fastga.utils.file_lock import file_lock, get_file_stamp
+
+_LOGGER = logging.getLogger(__name__)
+
+GEOMETRY_SET_LABELS = [
+    "sweep25_wing",
+    "taper_ratio_wing",
+    "aspect_ratio_wing",
+    "dihedral_angle_wing",
+    "twist_angle_wing",
+    "sweep25_htp",
+    "taper_ratio_htp",
+    "aspect_ratio_htp",
+    "mach",
+    "area_ratio",
+]
+_GEOMETRY_ARRAY_NAME = "geometry_set"
+_STORE_FILE_SUFFIX = "_results.npz"
+
+
+class _StoreContent:
+    """Content of a store file as loaded in memory."""
+
+    def __init__(self, labels: List[str]):
+        self.file_stamp = None
+        self.geometry_sets = []
+        self.results = {label: [] for label in labels}
+        self.index = {}
+
+    def add(self, geometry_set: np.ndarray, results: Dict[str, np.ndarray]):
+        """Adds a result, results of an already stored geometry replace the older ones."""
+        key = _get_key(geometry_set)
+        if key in self.index:
+            row = self.index[key]
+            self.geometry_sets[row] = geometry_set
+            for label in self.results.keys():
+                self.results[label][row] = np.asarray(results[label], dtype=float)
+        else:
+            self.index[key] = len(self.geometry_sets)
+            self.geometry_sets.append(geometry_set)
+            for label in self.results.keys():
+                self.results[label].append(np.asarray(results[label], dtype=float))
+
+
+# Process-wide cache of the store files already loaded, so that they are read only once
+_LOADED_STORES: Dict[str, _StoreContent] = {}
+
+
+class AeroResultStore:
+    """
+    Stores the aerodynamic results of a code in a single .npz file of the result folder.
+
+    Results are indexed by the geometry set of the aircraft, except for the area ratio
+    between the HTP and the wing which is handled by scaling the results. The file is read once
+    per process and only read again if another process modified it. Writing is protected by a
+    lock so several processes can share the same result folder.
+
+    :param result_folder_path: folder where results are stored
+    :param name: name of the store, file will be named name + "_results.npz"
+    :param labels: names of the stored results
+    :param legacy_prefix: if provided and if the store file does not exist yet, results saved
+                          in the former geometry_N.csv/legacy_prefix_N.csv files of the folder
+                          are imported
+    """
+
+    def __init__(
+        self,
+        result_folder_path: str,
+        name: str,
+        labels: List[str],
+        legacy_prefix: Optional[str] = None,
+    ):
+        self.result_folder_path = result_folder_path
+        self.labels = labels
+        self.legacy_prefix = legacy_prefix
+        self.file_path = pth.join(result_folder_path, name + _STORE_FILE_SUFFIX)
+
+    def search(self, geometry_set: np.ndarray) -> Tuple[Optional[Dict[str, np.ndarray]], float]:
+        """
+        Searches if results have already been computed for the geometry.
+
+        :param geometry_set: geometry set as defined by GEOMETRY_SET_LABELS
+        :return: dictionary of the saved results (None if not found) and area ratio used for
+                 their computation
+        """
+        content = self._get_content()
+        if content.file_stamp is None and content.geometry_sets:
+            # Results have just been imported from the legacy files, save them in the store
+            with file_lock(self.file_path):
+                content = self._get_content()
+                self._write(content)
+        row = content.index.get(_get_key(geometry_set))
+        if row is None:
+            return None, 1.0
+
+        results = {label: content.results[label][row] for label in self.labels}
+        saved_area_ratio = content.geometry_sets[row][-1]
+
+        return results, saved_area_ratio
+
+    def save(self, geometry_set: np.ndarray, results: Dict[str, np.ndarray]):
+        """
+        Saves the results computed for the geometry. Results saved by other processes in the
+        meantime are kept.
+
+        :param geometry_set: geometry set as defined by GEOMETRY_SET_LABELS
+        :param results: dictionary of the results, keys must match the labels of the store
+        """
+        os.makedirs(self.result_folder_path, exist_ok=True)
+        with file_lock(self.file_path):
+            content = self._get_content()
+            content.add(np.asarray(geometry_set, dtype=float), results)
+            self._write(content)
+
+    def _get_content(self) -> _StoreContent:
+        """Returns the content of the store file, loading it only if it changed on disk."""
+        content = _LOADED_STORES.get(self.file_path)
+        file_stamp = get_file_stamp(self.file_path)
+        if content is not None and content.file_stamp == file_stamp:
+            return content
+
+        content = _StoreContent(self.labels)
+        if file_stamp is not None:
+            with np.load(self.file_path) as data:
+                for idx, geometry_set in enumerate(data[_GEOMETRY_ARRAY_NAME]):
+                    content.add(geometry_set, {label: data[label][idx] for label in self.labels})
+            content.file_stamp = file_stamp
+        elif self.legacy_prefix is not None:
+            self._import_legacy_results(content)
+        _LOADED_STORES[self.file_path] = content
+
+        return content
+
+    def _write(self, content: _StoreContent):
+        """Writes the content in the store file, file is replaced atomically."""
+        arrays = {_GEOMETRY_ARRAY_NAME: np.array(content.geometry_sets)}
+        for label in self.labels:
+            arrays[label] = np.array(content.results[label])
+        tmp_file_path = self.file_path + ".tmp.npz"
+        np.savez(tmp_file_path, **arrays)
+        os.replace(tmp_file_path, self.file_path)
+        content.file_stamp = get_file_stamp(self.file_path)
+        _LOADED_STORES[self.file_path] = content
+
+    def _import_legacy_results(self, content: _StoreContent):
+        """Imports the results saved in the former one-file-per-geometry format."""
+        if not pth.exists(pth.join(self.result_folder_path, "geometry_0.csv")):
+            return
+
+        idx = 0
+        while pth.exists(pth.join(self.result_folder_path, "geometry_" + str(idx) + ".csv")):
+            geometry_file_path = pth.join(self.result_folder_path, "geometry_" + str(idx) + ".csv")
+            result_file_path = pth.join(
+                self.result_folder_path, self.legacy_prefix + "_" + str(idx) + ".csv"
+            )
+            idx += 1
+            if not pth.exists(result_file_path):
+                continue
+            # noinspection PyBroadException
+            try:
+                geometry = _read_legacy_file(geometry_file_path)
+                geometry_set = np.array([float(geometry[label]) for label in GEOMETRY_SET_LABELS])
+                data = _read_legacy_file(result_file_path)
+                results = {
+                    label: np.array(
+                        [float(value) for value in str(data[label]).strip("[]").split(",")]
+                    )
+                    for label in self.labels
+                }
+            except Exception:
+                _LOGGER.info("Unable to import results from %s file!", result_file_path)
+                continue
+            content.add(geometry_set, results)
+
+        _LOGGER.info(
+            "%i results imported from %s folder",
+            len(content.geometry_sets),
+            self.result_folder_path,
+        )
+
+
+def _get_key(geometry_set: np.ndarray) -> tuple:
+    """Returns the key used to index a geometry set, the area ratio is not part of it."""
+    return tuple(np.around(np.asarray(geometry_set, dtype=float)[:-1], decimals=6).tolist())
+
+
+def _read_legacy_file(file_path: str) -> pd.Series:
+    """Reads a result file written in the former .csv format."""
+    data = pd.read_csv(file_path).to_numpy()
+
+    return pd.Series(data[:, 1], index=data[:, 0])
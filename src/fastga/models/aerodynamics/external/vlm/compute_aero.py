@@ -20,7 +20,8 @@ import numpy as np
 from openmdao.core.explicitcomponent import ExplicitComponent
 from openmdao.core.group import Group
 
-from .vlm import VLMSimpleGeometry
+from .vlm import VLMSimpleGeometry, DEFAULT_NX, DEFAULT_NY1, DEFAULT_NY2
+from ..xfoil.xfoil_batch import XfoilPolarBatch
 from ..xfoil.xfoil_polar import XfoilPolar
 from ...components.compute_reynolds import ComputeUnitReynolds
 from ...constants import SPAN_MESH_POINT, MACH_NB_PTS
@@ -44,6 +45,9 @@ class ComputeAEROvlm(Group):
         self.options.declare(
             "htp_airfoil_file", default=DEFAULT_HTP_AIRFOIL, types=str, allow_none=True
         )
+        self.options.declare("chordwise_panel_count", default=DEFAULT_NX, types=int, lower=1)
+        self.options.declare("inner_spanwise_panel_count", default=DEFAULT_NY1, types=int, lower=1)
+        self.options.declare("outer_spanwise_panel_count", default=DEFAULT_NY2, types=int, lower=2)
 
     def setup(self):
         self.add_subsystem(
@@ -57,47 +61,27 @@ class ComputeAEROvlm(Group):
             promotes=["*"],
         )
         if self.options["low_speed_aero"]:
-            self.add_subsystem(
-                "wing_polar_ls",
-                XfoilPolar(
-                    airfoil_folder_path=self.options["airfoil_folder_path"],
-                    airfoil_file=self.options["wing_airfoil_file"],
-                    alpha_end=20.0,
-                    activate_negative_angle=True,
-                ),
-                promotes=[],
-            )
-            self.add_subsystem(
-                "htp_polar_ls",
-                XfoilPolar(
-                    airfoil_folder_path=self.options["airfoil_folder_path"],
-                    airfoil_file=self.options["htp_airfoil_file"],
-                    alpha_end=20.0,
-                    activate_negative_angle=True,
-                ),
-                promotes=[],
-            )
+            wing_polar_name, htp_polar_name = "wing_polar_ls", "htp_polar_ls"
         else:
-            self.add_subsystem(
-                "wing_polar_hs",
-                XfoilPolar(
-                    airfoil_folder_path=self.options["airfoil_folder_path"],
-                    airfoil_file=self.options["wing_airfoil_file"],
-                    alpha_end=20.0,
-                    activate_negative_angle=True,
-                ),
-                promotes=[],
-            )
-            self.add_subsystem(
-                "htp_polar_hs",
-                XfoilPolar(
-                    airfoil_folder_path=self.options["airfoil_folder_path"],
-                    airfoil_file=self.options["htp_airfoil_file"],
-                    alpha_end=20.0,
-                    activate_negative_angle=True,
-                ),
-                promotes=[],
-            )
+            wing_polar_name, htp_polar_name = "wing_polar_hs", "htp_polar_hs"
+        polar_options = {
+            wing_polar_name: dict(
+                airfoil_folder_path=self.options["airfoil_folder_path"],
+                airfoil_file=self.options["wing_airfoil_file"],
+                alpha_end=20.0,
+                activate_negative_angle=True,
+            ),
+            htp_polar_name: dict(
+                airfoil_folder_path=self.options["airfoil_folder_path"],
+                airfoil_file=self.options["htp_airfoil_file"],
+                alpha_end=20.0,
+                activate_negative_angle=True,
+            ),
+        }
+        # Runs the missing polars concurrently before the XfoilPolar components read them
+        self.add_subsystem("polars_computation", XfoilPolarBatch(polars=polar_options), promotes=[])
+        for name, options in polar_options.items():
+            self.add_subsystem(name, XfoilPolar(**options), promotes=[])
         self.add_subsystem(
             "aero_vlm",
             _ComputeAEROvlm(
@@ -107,34 +91,54 @@ class ComputeAEROvlm(Group):
                 airfoil_folder_path=self.options["airfoil_folder_path"],
                 wing_airfoil_file=self.options["wing_airfoil_file"],
                 htp_airfoil_file=self.options["htp_airfoil_file"],
+                chordwise_panel_count=self.options["chordwise_panel_count"],
+                inner_spanwise_panel_count=self.options["inner_spanwise_panel_count"],
+                outer_spanwise_panel_count=self.options["outer_spanwise_panel_count"],
             ),
             promotes=["*"],
         )
 
         if self.options["low_speed_aero"]:
-            self.connect("data:aerodynamics:low_speed:mach", "wing_polar_ls.xfoil:mach")
             self.connect(
-                "data:aerodynamics:wing:low_speed:reynolds", "wing_polar_ls.xfoil:reynolds"
+                "data:aerodynamics:low_speed:mach",
+                ["wing_polar_ls.xfoil:mach", "polars_computation.wing_polar_ls:xfoil:mach"],
+            )
+            self.connect(
+                "data:aerodynamics:wing:low_speed:reynolds",
+                ["wing_polar_ls.xfoil:reynolds", "polars_computation.wing_polar_ls:xfoil:reynolds"],
             )
             self.connect("wing_polar_ls.xfoil:CL", "data:aerodynamics:wing:low_speed:CL")
             self.connect("wing_polar_ls.xfoil:CDp", "data:aerodynamics:wing:low_speed:CDp")
-            self.connect("data:aerodynamics:low_speed:mach", "htp_polar_ls.xfoil:mach")
+            self.connect(
+                "data:aerodynamics:low_speed:mach",
+                ["htp_polar_ls.xfoil:mach", "polars_computation.htp_polar_ls:xfoil:mach"],
+            )
             self.connect(
                 "data:aerodynamics:horizontal_tail:low_speed:reynolds",
-                "htp_polar_ls.xfoil:reynolds",
+                ["htp_polar_ls.xfoil:reynolds", "polars_computation.htp_polar_ls:xfoil:reynolds"],
             )
             self.connect("htp_polar_ls.xfoil:CL", "data:aerodynamics:horizontal_tail:low_speed:CL")
             self.connect(
                 "htp_polar_ls.xfoil:CDp", "data:aerodynamics:horizontal_tail:low_speed:CDp"
             )
         else:
-            self.connect("data:aerodynamics:cruise:mach", "wing_polar_hs.xfoil:mach")
-            self.connect("data:aerodynamics:wing:cruise:reynolds", "wing_polar_hs.xfoil:reynolds")
+            self.connect(
+                "data:aerodynamics:cruise:mach",
+                ["wing_polar_hs.xfoil:mach", "polars_computation.wing_polar_hs:xfoil:mach"],
+            )
+            self.connect(
+                "data:aerodynamics:wing:cruise:reynolds",
+                ["wing_polar_hs.xfoil:reynolds", "polars_computation.wing_polar_hs:xfoil:reynolds"],
+            )
             self.connect("wing_polar_hs.xfoil:CL", "data:aerodynamics:wing:cruise:CL")
             self.connect("wing_polar_hs.xfoil:CDp", "data:aerodynamics:wing:cruise:CDp")
-            self.connect("data:aerodynamics:cruise:mach", "htp_polar_hs.xfoil:mach")
             self.connect(
-                "data:aerodynamics:horizontal_tail:cruise:reynolds", "htp_polar_hs.xfoil:reynolds"
+                "data:aerodynamics:cruise:mach",
+                ["htp_polar_hs.xfoil:mach", "polars_computation.htp_polar_hs:xfoil:mach"],
+            )
+            self.connect(
+                "data:aerodynamics:horizontal_tail:cruise:reynolds",
+                ["htp_polar_hs.xfoil:reynolds", "polars_computation.htp_polar_hs:xfoil:reynolds"],
             )
             self.connect("htp_polar_hs.xfoil:CL", "data:aerodynamics:horizontal_tail:cruise:CL")
             self.connect("htp_polar_hs.xfoil:CDp", "data:aerodynamics:horizontal_tail:cruise:CDp")
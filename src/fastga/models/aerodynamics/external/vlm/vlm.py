@@ -14,22 +14,56 @@
 
 import copy
 import logging
-import os
-import os.path as pth
 import warnings
-from typing import Optional
+from typing import List, Optional
 
 import numpy as np
 import openmdao.api as om
-import pandas as pd
+from scipy.linalg import lu_factor, lu_solve
 from stdatm import Atmosphere
 
 from fastga.models.geometry.profiles.get_profile import get_profile
 from ...constants import SPAN_MESH_POINT, POLAR_POINT_COUNT, MACH_NB_PTS
+from ..result_store import AeroResultStore
 
 DEFAULT_NX = 19
 DEFAULT_NY1 = 3
 DEFAULT_NY2 = 14
+# Minimum number of panels in the tapered section of a kinked wing, so that the flapped and
+# un-flapped portions keep at least one panel each
+MIN_KINKED_NY2 = 7
+
+# Inputs defining the planform of the lifting surfaces and thus the aic matrices
+GEOMETRY_INPUT_NAMES = [
+    "data:geometry:wing:kink:span_ratio",
+    "data:geometry:wing:root:y",
+    "data:geometry:wing:span",
+    "data:geometry:wing:root:chord",
+    "data:geometry:wing:tip:chord",
+    "data:geometry:flap:span_ratio",
+    "data:geometry:horizontal_tail:span",
+    "data:geometry:horizontal_tail:root:chord",
+    "data:geometry:horizontal_tail:tip:chord",
+]
+
+RESULT_LABELS = [
+    "cl_0_wing",
+    "cl_X_wing",
+    "cl_alpha_wing",
+    "cm_0_wing",
+    "y_vector_wing",
+    "cl_vector_wing",
+    "chord_vector_wing",
+    "coef_k_wing",
+    "cl_0_htp",
+    "cl_X_htp",
+    "cl_alpha_htp",
+    "cl_alpha_htp_isolated",
+    "y_vector_htp",
+    "cl_vector_htp",
+    "coef_k_htp",
+    "saved_ref_area",
+]
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -48,6 +82,7 @@ class VLMSimpleGeometry(om.ExplicitComponent):
         self.ny2 = None
         self.ny3 = None
         self.n_y = None
+        self._geometry_key = None
 
     def initialize(self):
         self.options.declare("low_speed_aero", default=False, types=bool)
@@ -57,6 +92,29 @@ class VLMSimpleGeometry(om.ExplicitComponent):
             "wing_airfoil_file", default="naca23012.af", types=str, allow_none=True
         )
         self.options.declare("htp_airfoil_file", default="naca0012.af", types=str, allow_none=True)
+        self.options.declare(
+            "chordwise_panel_count",
+            default=DEFAULT_NX,
+            types=int,
+            lower=1,
+            desc="Number of panels along the chord of the lifting surfaces",
+        )
+        self.options.declare(
+            "inner_spanwise_panel_count",
+            default=DEFAULT_NY1,
+            types=int,
+            lower=1,
+            desc="Number of panels in the straight section of the wing",
+        )
+        self.options.declare(
+            "outer_spanwise_panel_count",
+            default=DEFAULT_NY2,
+            types=int,
+            lower=2,
+            desc="Number of panels in the tapered section of the wing, split between the flapped "
+            "and un-flapped portions. With a kinked wing, 5 of them are moved to the straight "
+            "section so at least %i are needed" % MIN_KINKED_NY2,
+        )
 
     def setup(self):
 
@@ -210,46 +268,40 @@ class VLMSimpleGeometry(om.ExplicitComponent):
         )
 
         # Search if results already exist:
-        result_folder_path = self.options["result_folder_path"]
-        result_file_path = None
+        result_store = None
+        saved_results = None
         saved_area_ratio = 1.0
-        if result_folder_path != "":
-            result_file_path, saved_area_ratio = self.search_results(
-                result_folder_path, geometry_set
-            )
+        if self.options["result_folder_path"] != "":
+            result_store = self._get_result_store()
+            saved_results, saved_area_ratio = result_store.search(geometry_set)
 
         # If no result saved for that geometry under this mach condition, computation is done
-        if result_file_path is None:
-
-            # Create result folder first (if it must fail, let it fail as soon as possible)
-            if result_folder_path != "":
-                if not os.path.exists(result_folder_path):
-                    os.makedirs(pth.join(result_folder_path), exist_ok=True)
-
-            # Save the geometry (result_file_path is None entering the function)
-            if self.options["result_folder_path"] != "":
-                result_file_path = self.save_geometry(result_folder_path, geometry_set)
+        if saved_results is None:
 
             # Compute wing alone @ 0°/X° angle of attack
-            wing_0 = self.compute_wing(
-                inputs, altitude, mach, 0.0, flaps_angle=0.0, use_airfoil=True
-            )
-            wing_aoa = self.compute_wing(
-                inputs, altitude, mach, aoa_angle, flaps_angle=0.0, use_airfoil=True
+            wing_0, wing_aoa = self.compute_wing_multiple_aoa(
+                inputs,
+                altitude,
+                mach,
+                np.array([0.0, aoa_angle]),
+                flaps_angle=0.0,
+                use_airfoil=True,
             )
 
-            # Compute complete aircraft @ 0°/X° angle of attack
-            _, htp_0, _ = self.compute_aircraft(
-                inputs, altitude, mach, 0.0, flaps_angle=0.0, use_airfoil=True
+            # Compute HTP in the complete aircraft (i.e. with wing downwash) and isolated HTP @
+            # 0°/X° angle of attack, since the wing is the same as the one computed above, only the
+            # HTP needs to be solved
+            downwash_angle = self._compute_downwash_angle(
+                inputs, mach, np.array([wing_0["cl"], wing_aoa["cl"]])
             )
-            _, htp_aoa, _ = self.compute_aircraft(
-                inputs, altitude, mach, aoa_angle, flaps_angle=0.0, use_airfoil=True
+            htp_0, htp_aoa, htp_0_isolated, htp_aoa_isolated = self.compute_htp_multiple_aoa(
+                inputs,
+                altitude,
+                mach,
+                np.array([0.0 - downwash_angle[0], aoa_angle - downwash_angle[1], 0.0, aoa_angle]),
+                use_airfoil=True,
             )
 
-            # Compute isolated HTP @ 0°/X° angle of attack
-            htp_0_isolated = self.compute_htp(inputs, altitude, mach, 0.0, use_airfoil=True)
-            htp_aoa_isolated = self.compute_htp(inputs, altitude, mach, aoa_angle, use_airfoil=True)
-
             # Post-process wing data ---------------------------------------------------------------
             k_fus = 1 + 0.025 * width_max / span_wing - 0.025 * (width_max / span_wing) ** 2
             beta = np.sqrt(1 - mach ** 2)  # Prandtl-Glauert
@@ -332,7 +384,7 @@ class VLMSimpleGeometry(om.ExplicitComponent):
                 cl_vector_htp.extend(additional_zeros)
 
             # Save results to defined path ---------------------------------------------------------
-            if self.options["result_folder_path"] != "":
+            if result_store is not None:
                 results = [
                     cl_0_wing,
                     cl_x_wing,
@@ -351,40 +403,30 @@ class VLMSimpleGeometry(om.ExplicitComponent):
                     coef_k_htp,
                     sref_wing,
                 ]
-                self.save_results(result_file_path, results)
+                result_store.save(geometry_set, dict(zip(RESULT_LABELS, results)))
 
         # Else retrieved results are used, eventually adapted with new area ratio
         else:
-            # Read values from result file ---------------------------------------------------------
-            data = self.read_results(result_file_path)
-            saved_area_wing = float(data.loc["saved_ref_area", 0])
-            cl_0_wing = float(data.loc["cl_0_wing", 0])
-            cl_x_wing = float(data.loc["cl_X_wing", 0])
-            cl_alpha_wing = float(data.loc["cl_alpha_wing", 0])
-            cm_0_wing = float(data.loc["cm_0_wing", 0])
-            y_vector_wing = np.array(
-                [float(i) for i in data.loc["y_vector_wing", 0][1:-2].split(",")]
-            ) * np.sqrt(sref_wing / saved_area_wing)
-            cl_vector_wing = np.array(
-                [float(i) for i in data.loc["cl_vector_wing", 0][1:-2].split(",")]
+            saved_area_wing = float(saved_results["saved_ref_area"])
+            cl_0_wing = float(saved_results["cl_0_wing"])
+            cl_x_wing = float(saved_results["cl_X_wing"])
+            cl_alpha_wing = float(saved_results["cl_alpha_wing"])
+            cm_0_wing = float(saved_results["cm_0_wing"])
+            y_vector_wing = saved_results["y_vector_wing"] * np.sqrt(sref_wing / saved_area_wing)
+            cl_vector_wing = np.copy(saved_results["cl_vector_wing"])
+            chord_vector_wing = saved_results["chord_vector_wing"] * np.sqrt(
+                sref_wing / saved_area_wing
             )
-            chord_vector_wing = np.array(
-                [float(i) for i in data.loc["chord_vector_wing", 0][1:-2].split(",")]
-            ) * np.sqrt(sref_wing / saved_area_wing)
-            coef_k_wing = float(data.loc["coef_k_wing", 0])
-            cl_0_htp = float(data.loc["cl_0_htp", 0]) * (area_ratio / saved_area_ratio)
-            cl_aoa_htp = float(data.loc["cl_X_htp", 0]) * (area_ratio / saved_area_ratio)
-            cl_alpha_htp = float(data.loc["cl_alpha_htp", 0]) * (area_ratio / saved_area_ratio)
-            cl_alpha_htp_isolated = float(data.loc["cl_alpha_htp_isolated", 0]) * (
+            coef_k_wing = float(saved_results["coef_k_wing"])
+            cl_0_htp = float(saved_results["cl_0_htp"]) * (area_ratio / saved_area_ratio)
+            cl_aoa_htp = float(saved_results["cl_X_htp"]) * (area_ratio / saved_area_ratio)
+            cl_alpha_htp = float(saved_results["cl_alpha_htp"]) * (area_ratio / saved_area_ratio)
+            cl_alpha_htp_isolated = float(saved_results["cl_alpha_htp_isolated"]) * (
                 area_ratio / saved_area_ratio
             )
-            y_vector_htp = np.array(
-                [float(i) for i in data.loc["y_vector_htp", 0][1:-2].split(",")]
-            )
-            cl_vector_htp = np.array(
-                [float(i) for i in data.loc["cl_vector_htp", 0][1:-2].split(",")]
-            )
-            coef_k_htp = float(data.loc["coef_k_htp", 0]) * (area_ratio / saved_area_ratio)
+            y_vector_htp = np.copy(saved_results["y_vector_htp"])
+            cl_vector_htp = np.copy(saved_results["cl_vector_htp"])
+            coef_k_htp = float(saved_results["coef_k_htp"]) * (area_ratio / saved_area_ratio)
 
         return (
             cl_0_wing,
@@ -426,6 +468,38 @@ class VLMSimpleGeometry(om.ExplicitComponent):
         cm_vector, cl, cdi, cm, coef_e
         """
 
+        return self.compute_wing_multiple_aoa(
+            inputs,
+            altitude,
+            mach,
+            np.array([aoa_angle]),
+            flaps_angle=flaps_angle,
+            use_airfoil=use_airfoil,
+        )[0]
+
+    def compute_wing_multiple_aoa(
+        self,
+        inputs,
+        altitude: float,
+        mach: float,
+        aoa_angles: np.ndarray,
+        flaps_angle: Optional[float] = 0.0,
+        use_airfoil: Optional[bool] = True,
+    ) -> List[dict]:
+        """
+        VLM computations for the wing alone at several angles of attack, all angles are solved at
+        once using the factorized aic matrix of the wing.
+
+        @param inputs: inputs parameters defined within FAST-OAD-GA
+        @param altitude: altitude for aerodynamic calculation in meters
+        @param mach: air speed expressed in mach
+        @param aoa_angles: air speed angles of attack with respect to aircraft (degree)
+        @param flaps_angle: flaps angle in Deg (default=0.0: i.e. no deflection)
+        @param use_airfoil: adds the camberline coordinates of the selected airfoil (default=True)
+        @return: list of wing dictionaries, one per angle of attack, including aero parameters as
+        keys: y_vector, cl_vector, chord_vector, cd_vector, cm_vector, cl, cdi, cm, coef_e
+        """
+
         # Generate geometries
         self._run(inputs)
 
@@ -438,68 +512,39 @@ class VLMSimpleGeometry(om.ExplicitComponent):
         wing_twist = float(inputs["data:geometry:wing:twist"])
 
         # Initialization
-        x_c = self.wing["x_c"]
-        panelchord = self.wing["panel_chord"]
-        panelsurf = self.wing["panel_surf"]
         if use_airfoil:
             self.generate_curvature(self.wing, self.options["wing_airfoil_file"])
         self.apply_deflection(inputs, flaps_angle)
         self.generate_twist(self.wing, wing_twist, y2_wing, semi_span)
-        panelangle_vect = self.wing["panel_angle_vect"]
-        aic = self.wing["aic"]
-        aic_inv = np.linalg.inv(aic)
-        aic_wake = self.wing["aic_wake"]
-
-        # Compute air speed
-        v_inf = max(
-            Atmosphere(altitude, altitude_in_feet=False).speed_of_sound * mach, 0.01
-        )  # avoid V=0 m/s crashes
 
         # Calculate all the aerodynamic parameters
-        aoa_angle = aoa_angle * np.pi / 180
-        alpha = np.add(panelangle_vect, aoa_angle)
-        gamma = -np.dot(aic_inv, alpha) * v_inf
-        c_p = -2 / v_inf * np.divide(gamma, panelchord)
-        for i in range(self.n_x):
-            c_p[i * self.n_y] = c_p[i * self.n_y] * 1
-        cl_wing = -np.sum(c_p * panelsurf) / np.sum(panelsurf)
-        alphaind = np.dot(aic_wake, gamma) / v_inf
-        cdind_panel = c_p * alphaind
-        cdi_wing = np.sum(cdind_panel * panelsurf) / np.sum(panelsurf)
+        cl_wing, cdi_wing, cm_wing, wing_cl_vect = self._solve_lifting_surface(
+            self.wing, altitude, mach, aoa_angles, meanchord
+        )
         wing_e = cl_wing ** 2 / (np.pi * aspect_ratio * cdi_wing) * 0.955  # !!!: manual correction?
-        cmpanel = np.multiply(c_p, (x_c[: self.n_x * self.n_y] - meanchord / 4))
-        cm_wing = np.sum(cmpanel * panelsurf) / np.sum(panelsurf)
 
         # Calculate curves
-        wing_cl_vect = []
-        wing_y_vect = []
-        wing_chord_vect = []
-        yc_wing = self.wing["yc"]
         chord_wing = self.wing["chord"]
-        for j in range(self.n_y):
-            cl_span = 0.0
-            y_local = yc_wing[j]
-            chord = (chord_wing[j] + chord_wing[j + 1]) / 2.0
-            for i in range(self.n_x):
-                cl_span += -c_p[i * self.n_y + j] * panelchord[i * self.n_y + j] / chord
-            wing_cl_vect.append(cl_span)
-            wing_y_vect.append(y_local)
-            wing_chord_vect.append(chord)
+        wing_y_vect = self.wing["yc"][: self.n_y].tolist()
+        wing_chord_vect = ((chord_wing[: self.n_y] + chord_wing[1 : self.n_y + 1]) / 2.0).tolist()
 
         # Return values
-        wing = {
-            "y_vector": wing_y_vect,
-            "cl_vector": wing_cl_vect,
-            "chord_vector": wing_chord_vect,
-            "cd_vector": [],
-            "cm_vector": [],
-            "cl": cl_wing,
-            "cdi": cdi_wing,
-            "cm": cm_wing,
-            "coef_e": wing_e,
-        }
-
-        return wing
+        wings = []
+        for idx in range(len(aoa_angles)):
+            wing = {
+                "y_vector": list(wing_y_vect),
+                "cl_vector": wing_cl_vect[:, idx].tolist(),
+                "chord_vector": list(wing_chord_vect),
+                "cd_vector": [],
+                "cm_vector": [],
+                "cl": cl_wing[idx],
+                "cdi": cdi_wing[idx],
+                "cm": cm_wing[idx],
+                "coef_e": wing_e[idx],
+            }
+            wings.append(wing)
+
+        return wings
 
     def compute_htp(
         self,
@@ -521,6 +566,31 @@ class VLMSimpleGeometry(om.ExplicitComponent):
         cm_vector, cl, cdi, cm, coef_e.
         """
 
+        return self.compute_htp_multiple_aoa(
+            inputs, altitude, mach, np.array([aoa_angle]), use_airfoil=use_airfoil
+        )[0]
+
+    def compute_htp_multiple_aoa(
+        self,
+        inputs,
+        altitude: float,
+        mach: float,
+        aoa_angles: np.ndarray,
+        use_airfoil: Optional[bool] = True,
+    ) -> List[dict]:
+        """
+        VLM computation for the horizontal tail alone at several angles of attack, all angles are
+        solved at once using the factorized aic matrix of the horizontal tail.
+
+        @param inputs: inputs parameters defined within FAST-OAD-GA.
+        @param altitude: altitude for aerodynamic calculation in meters.
+        @param mach: air speed expressed in mach.
+        @param aoa_angles: air speed angles of attack with respect to aircraft (degree).
+        @param use_airfoil: adds the camberline coordinates of the selected airfoil (default=True).
+        @return: list of htp dictionaries, one per angle of attack, including aero parameters as
+        keys: y_vector, cl_vector, cd_vector, cm_vector, cl, cdi, cm, coef_e.
+        """
+
         # Generate geometries
         self._run(inputs)
 
@@ -529,63 +599,36 @@ class VLMSimpleGeometry(om.ExplicitComponent):
         meanchord = inputs["data:geometry:horizontal_tail:MAC:length"]
 
         # Initialization
-        x_c = self.htp["x_c"]
-        panelchord = self.htp["panel_chord"]
-        panelsurf = self.htp["panel_surf"]
         if use_airfoil:
             self.generate_curvature(self.htp, self.options["htp_airfoil_file"])
-        panelangle_vect = self.htp["panel_angle_vect"]
-        aic = self.htp["aic"]
-        aic_inv = np.linalg.inv(aic)
-        aic_wake = self.htp["aic_wake"]
-
-        # Compute air speed
-        v_inf = max(
-            Atmosphere(altitude, altitude_in_feet=False).speed_of_sound * mach, 0.01
-        )  # avoid V=0 m/s crashes
 
         # Calculate all the aerodynamic parameters
-        aoa_angle = aoa_angle * np.pi / 180
-        alpha = np.add(panelangle_vect, aoa_angle)
-        gamma = -np.dot(aic_inv, alpha) * v_inf
-        c_p = -2 / v_inf * np.divide(gamma, panelchord)
-        for i in range(self.n_x):
-            c_p[i * self.n_y] = c_p[i * self.n_y] * 1
-        cl_htp = -np.sum(c_p * panelsurf) / np.sum(panelsurf)
-        alphaind = np.dot(aic_wake, gamma) / v_inf
-        cdind_panel = c_p * alphaind
-        cdi_htp = np.sum(cdind_panel * panelsurf) / np.sum(panelsurf)
-        htp_e = cl_htp ** 2 / (np.pi * aspect_ratio * max(cdi_htp, 1e-12))  # avod 0.0 division
-        cmpanel = np.multiply(c_p, (x_c[: self.n_x * self.n_y] - meanchord / 4))
-        cm_htp = np.sum(cmpanel * panelsurf) / np.sum(panelsurf)
+        cl_htp, cdi_htp, cm_htp, htp_cl_vect = self._solve_lifting_surface(
+            self.htp, altitude, mach, aoa_angles, meanchord
+        )
+        htp_e = cl_htp ** 2 / (
+            np.pi * aspect_ratio * np.maximum(cdi_htp, 1e-12)
+        )  # avoid 0.0 division
 
         # Calculate curves
-        htp_cl_vect = []
-        htp_y_vect = []
-        yc_htp = self.htp["yc"]
-        chord_htp = self.htp["chord"]
-        for j in range(self.n_y):
-            cl_span = 0.0
-            y_local = yc_htp[j]
-            chord = (chord_htp[j] + chord_htp[j + 1]) / 2.0
-            for i in range(self.n_x):
-                cl_span += -c_p[i * self.n_y + j] * panelchord[i * self.n_y + j] / chord
-            htp_cl_vect.append(cl_span)
-            htp_y_vect.append(y_local)
+        htp_y_vect = self.htp["yc"][: self.n_y].tolist()
 
         # Return values
-        htp = {
-            "y_vector": htp_y_vect,
-            "cl_vector": htp_cl_vect,
-            "cd_vector": [],
-            "cm_vector": [],
-            "cl": cl_htp,
-            "cdi": cdi_htp,
-            "cm": cm_htp,
-            "coef_e": htp_e,
-        }
-
-        return htp
+        htps = []
+        for idx in range(len(aoa_angles)):
+            htp = {
+                "y_vector": list(htp_y_vect),
+                "cl_vector": htp_cl_vect[:, idx].tolist(),
+                "cd_vector": [],
+                "cm_vector": [],
+                "cl": cl_htp[idx],
+                "cdi": cdi_htp[idx],
+                "cm": cm_htp[idx],
+                "coef_e": htp_e[idx],
+            }
+            htps.append(htp)
+
+        return htps
 
     def compute_aircraft(
         self,
@@ -609,18 +652,13 @@ class VLMSimpleGeometry(om.ExplicitComponent):
         coefficients.
         """
 
-        # Get inputs
-        aspect_ratio_wing = float(inputs["data:geometry:wing:aspect_ratio"])
-
         # Compute wing
         wing = self.compute_wing(
             inputs, altitude, mach, aoa_angle, flaps_angle=flaps_angle, use_airfoil=use_airfoil
         )
 
         # Calculate downwash angle based on Gudmundsson model (p.467)
-        cl_wing = wing["cl"]
-        beta = np.sqrt(1 - mach ** 2)  # Prandtl-Glauert
-        downwash_angle = 2.0 * np.array(cl_wing) / beta * 180.0 / (aspect_ratio_wing * np.pi ** 2)
+        downwash_angle = self._compute_downwash_angle(inputs, mach, np.array(wing["cl"]))
         aoa_angle_corrected = aoa_angle - downwash_angle
 
         # Compute htp
@@ -631,20 +669,109 @@ class VLMSimpleGeometry(om.ExplicitComponent):
 
         return wing, htp, aircraft
 
+    @staticmethod
+    def _compute_downwash_angle(inputs, mach: float, cl_wing: np.ndarray) -> np.ndarray:
+        """
+        Computes the downwash angle at the HTP based on Gudmundsson model (p.467).
+
+        @param inputs: inputs parameters defined within FAST-OAD-GA.
+        @param mach: air speed expressed in mach.
+        @param cl_wing: lift coefficient(s) of the wing.
+        @return: downwash angle(s) in Deg.
+        """
+
+        aspect_ratio_wing = float(inputs["data:geometry:wing:aspect_ratio"])
+        beta = np.sqrt(1 - mach ** 2)  # Prandtl-Glauert
+
+        return 2.0 * cl_wing / beta * 180.0 / (aspect_ratio_wing * np.pi ** 2)
+
+    def _solve_lifting_surface(
+        self,
+        dictionary,
+        altitude: float,
+        mach: float,
+        aoa_angles: np.ndarray,
+        meanchord: float,
+    ):
+        """
+        Solves the circulation of a lifting surface for several angles of attack. The aic matrix
+        being already factorized, each angle of attack is a right-hand side of the same linear
+        system and they are all solved together.
+
+        @param dictionary: dictionary which contains the point coordinates of the lifting surface.
+        @param altitude: altitude for aerodynamic calculation in meters.
+        @param mach: air speed expressed in mach.
+        @param aoa_angles: air speed angles of attack with respect to aircraft (degree).
+        @param meanchord: mean aerodynamic chord of the lifting surface in meters.
+        @return: cl, cdi and cm of the lifting surface for each angle of attack and the spanwise
+        cl distribution (one column per angle of attack).
+        """
+
+        x_c = dictionary["x_c"]
+        panelchord = dictionary["panel_chord"]
+        panelsurf = dictionary["panel_surf"]
+        panelangle_vect = dictionary["panel_angle_vect"]
+        chord = dictionary["chord"]
+
+        # Compute air speed
+        v_inf = max(
+            Atmosphere(altitude, altitude_in_feet=False).speed_of_sound * mach, 0.01
+        )  # avoid V=0 m/s crashes
+
+        aoa_angles = np.asarray(aoa_angles, dtype=float).flatten() * np.pi / 180
+        alpha = panelangle_vect[:, np.newaxis] + aoa_angles[np.newaxis, :]
+        gamma = -lu_solve(dictionary["aic_lu"], alpha) * v_inf
+        c_p = -2 / v_inf * gamma / panelchord[:, np.newaxis]
+        cl_surface = -np.sum(c_p * panelsurf[:, np.newaxis], axis=0) / np.sum(panelsurf)
+        alphaind = np.dot(dictionary["aic_wake"], gamma) / v_inf
+        cdind_panel = c_p * alphaind
+        cdi_surface = np.sum(cdind_panel * panelsurf[:, np.newaxis], axis=0) / np.sum(panelsurf)
+        cmpanel = c_p * (x_c[: self.n_x * self.n_y] - meanchord / 4)[:, np.newaxis]
+        cm_surface = np.sum(cmpanel * panelsurf[:, np.newaxis], axis=0) / np.sum(panelsurf)
+
+        # Spanwise lift distribution, panels are stored chordwise row by chordwise row
+        section_chord = (chord[: self.n_y] + chord[1 : self.n_y + 1]) / 2.0
+        cl_span = (
+            -np.sum(
+                (c_p * panelchord[:, np.newaxis]).reshape(self.n_x, self.n_y, len(aoa_angles)),
+                axis=0,
+            )
+            / section_chord[:, np.newaxis]
+        )
+
+        return cl_surface, cdi_surface, cm_surface, cl_span
+
     def _run(self, inputs):
 
+        # The aic matrices (and their factorization) only depend on the planform of the lifting
+        # surfaces, so they are only generated again if it changed since the last call
+        geometry_key = tuple(float(inputs[name]) for name in GEOMETRY_INPUT_NAMES)
+        if geometry_key == self._geometry_key:
+            # Only reset the panel angles which are modified by airfoil, flaps and twist
+            for dictionary in [self.wing, self.htp]:
+                dictionary["z"] = np.zeros(self.n_x + 1)
+                dictionary["panel_angle"] = np.zeros(self.n_x)
+                dictionary["panel_angle_vect"] = np.zeros(self.n_x * self.n_y)
+            return
+
         wing_break = float(inputs["data:geometry:wing:kink:span_ratio"])
 
         # Define mesh size
-        self.n_x = int(DEFAULT_NX)
+        n_x = self.options["chordwise_panel_count"]
+        n_y1 = self.options["inner_spanwise_panel_count"]
+        n_y2 = self.options["outer_spanwise_panel_count"]
+        self.n_x = int(n_x)
         if wing_break > 0.0:
-            self.ny1 = int(DEFAULT_NY1 + 5)  # n° of panels in the straight section of the wing
-            self.ny2 = int(
-                (DEFAULT_NY2 - 5) / 2
-            )  # n° of panels in in the flapped portion of the wing
+            if n_y2 < MIN_KINKED_NY2:
+                raise ValueError(
+                    "outer_spanwise_panel_count should be at least %i for a wing with a kink, got "
+                    "%i" % (MIN_KINKED_NY2, n_y2)
+                )
+            self.ny1 = int(n_y1 + 5)  # n° of panels in the straight section of the wing
+            self.ny2 = int((n_y2 - 5) / 2)  # n° of panels in in the flapped portion of the wing
         else:
-            self.ny1 = int(DEFAULT_NY1)  # n° of panels in the straight section of the wing
-            self.ny2 = int(DEFAULT_NY2 / 2)  # n° of panels in in the flapped portion of the wing
+            self.ny1 = int(n_y1)  # n° of panels in the straight section of the wing
+            self.ny2 = int(n_y2 / 2)  # n° of panels in in the flapped portion of the wing
         self.ny3 = self.ny2  # n° of panels in the un-flapped exterior portion of the wing
 
         self.n_y = int(self.ny1 + self.ny2 + self.ny3)
@@ -678,6 +805,8 @@ class VLMSimpleGeometry(om.ExplicitComponent):
         # Generate HTP
         self._generate_htp(inputs)
 
+        self._geometry_key = geometry_key
+
     def _generate_wing(self, inputs):
         """Generates the coordinates for VLM calculations and aic matrix of the wing."""
         y2_wing = inputs["data:geometry:wing:root:y"]
@@ -857,48 +986,27 @@ class VLMSimpleGeometry(om.ExplicitComponent):
         x_c[self.n_x * self.n_y :] = x_c[: self.n_x * self.n_y]
         y_c[self.n_x * self.n_y :] = -y_c[: self.n_x * self.n_y]
 
-        # Aerodynamic coefficients computation (Right side)
-        for i in range(self.n_x * self.n_y):
-            for j in range(self.n_x * self.n_y):
-                # Right wing
-                coeff_1 = x_c[i] - x_1[j]
-                coeff_2 = y_c[i] - y_1[j]
-                coeff_3 = x_c[i] - x_2[j]
-                coeff_4 = y_c[i] - y_2[j]
-                coeff_5 = np.sqrt(coeff_1 ** 2 + coeff_2 ** 2)
-                coeff_6 = np.sqrt(coeff_3 ** 2 + coeff_4 ** 2)
-                coeff_7 = x_2[j] - x_1[j]
-                coeff_8 = y_2[j] - y_1[j]
-                coeff_10 = (coeff_7 * coeff_1 + coeff_8 * coeff_2) / coeff_5 - (
-                    coeff_7 * coeff_3 + coeff_8 * coeff_4
-                ) / coeff_6
-                coeff_11 = (1 + coeff_3 / coeff_6) / coeff_4 - (1 + coeff_1 / coeff_5) / coeff_2
-                if coeff_1 * coeff_4 - coeff_2 * coeff_3 != 0:
-                    aic[i, j] = (coeff_10 / (coeff_1 * coeff_4 - coeff_2 * coeff_3)) / (4 * np.pi)
-                aic_wake[i, j] = coeff_11 / (4 * np.pi)
-                aic[i, j] = aic[i, j] + coeff_11 / (4 * np.pi)
-        # Aerodynamic coefficients computation (Left side)
-        for i in range(self.n_x * self.n_y):
-            for j in range(self.n_x * self.n_y):
-                # Left wing
-                coeff_1 = x_c[i] - x_1[self.n_x * self.n_y + j]
-                coeff_2 = y_c[i] - y_1[self.n_x * self.n_y + j]
-                coeff_3 = x_c[i] - x_2[self.n_x * self.n_y + j]
-                coeff_4 = y_c[i] - y_2[self.n_x * self.n_y + j]
-                coeff_5 = np.sqrt(coeff_1 ** 2 + coeff_2 ** 2)
-                coeff_6 = np.sqrt(coeff_3 ** 2 + coeff_4 ** 2)
-                coeff_7 = x_2[self.n_x * self.n_y + j] - x_1[self.n_x * self.n_y + j]
-                coeff_8 = y_2[self.n_x * self.n_y + j] - y_1[self.n_x * self.n_y + j]
-                coeff_9 = (coeff_7 * coeff_1 + coeff_8 * coeff_2) / coeff_5 - (
-                    coeff_7 * coeff_3 + coeff_8 * coeff_4
-                ) / coeff_6
-                coeff_10 = (1 + coeff_3 / coeff_6) / coeff_4 - (1 + coeff_1 / coeff_5) / coeff_2
-                if coeff_1 * coeff_4 - coeff_2 * coeff_3 != 0:
-                    aic[i, j] = aic[i, j] + (coeff_9 / (coeff_1 * coeff_4 - coeff_2 * coeff_3)) / (
-                        4 * np.pi
-                    )
-                aic_wake[i, j] = aic_wake[i, j] + coeff_10 / (4 * np.pi)
-                aic[i, j] = aic[i, j] + coeff_10 / (4 * np.pi)
+        # Aerodynamic coefficients computation (Right and left side), the influence of every
+        # horseshoe vortex on every control point is computed at once
+        n_panels = self.n_x * self.n_y
+        aic_right, aic_wake_right = self._compute_influence_coefficients(
+            x_c[:n_panels],
+            y_c[:n_panels],
+            x_1[:n_panels],
+            y_1[:n_panels],
+            x_2[:n_panels],
+            y_2[:n_panels],
+        )
+        aic_left, aic_wake_left = self._compute_influence_coefficients(
+            x_c[:n_panels],
+            y_c[:n_panels],
+            x_1[n_panels:],
+            y_1[n_panels:],
+            x_2[n_panels:],
+            y_2[n_panels:],
+        )
+        aic = aic + aic_right + aic_left
+        aic_wake = aic_wake + aic_wake_right + aic_wake_left
         # Save data
         dictionary["x_panel"] = x_panel
         dictionary["panel_span"] = panelspan
@@ -911,8 +1019,44 @@ class VLMSimpleGeometry(om.ExplicitComponent):
         dictionary["x2"] = x_2
         dictionary["y2"] = y_2
         dictionary["aic"] = aic
+        dictionary["aic_lu"] = lu_factor(aic)
         dictionary["aic_wake"] = aic_wake
 
+    @staticmethod
+    def _compute_influence_coefficients(x_c, y_c, x_1, y_1, x_2, y_2):
+        """
+        Computes the influence of a set of horseshoe vortices on a set of control points. Rows of
+        the returned matrices correspond to the control points and columns to the vortices.
+
+        :param x_c: x coordinates of the control points
+        :param y_c: y coordinates of the control points
+        :param x_1: x coordinates of the first point of the bound vortices
+        :param y_1: y coordinates of the first point of the bound vortices
+        :param x_2: x coordinates of the second point of the bound vortices
+        :param y_2: y coordinates of the second point of the bound vortices
+        :return: the aic matrix (bound vortices and wake) and the aic_wake matrix (wake only)
+        """
+        coeff_1 = x_c[:, np.newaxis] - x_1[np.newaxis, :]
+        coeff_2 = y_c[:, np.newaxis] - y_1[np.newaxis, :]
+        coeff_3 = x_c[:, np.newaxis] - x_2[np.newaxis, :]
+        coeff_4 = y_c[:, np.newaxis] - y_2[np.newaxis, :]
+        coeff_5 = np.sqrt(coeff_1 ** 2 + coeff_2 ** 2)
+        coeff_6 = np.sqrt(coeff_3 ** 2 + coeff_4 ** 2)
+        coeff_7 = (x_2 - x_1)[np.newaxis, :]
+        coeff_8 = (y_2 - y_1)[np.newaxis, :]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            coeff_9 = (coeff_7 * coeff_1 + coeff_8 * coeff_2) / coeff_5 - (
+                coeff_7 * coeff_3 + coeff_8 * coeff_4
+            ) / coeff_6
+            coeff_10 = (1 + coeff_3 / coeff_6) / coeff_4 - (1 + coeff_1 / coeff_5) / coeff_2
+            denominator = coeff_1 * coeff_4 - coeff_2 * coeff_3
+            # Bound vortex contribution is ignored when control point is aligned with it
+            bound_vortex = np.where(denominator != 0, coeff_9 / denominator, 0.0)
+        aic_wake = coeff_10 / (4 * np.pi)
+        aic = bound_vortex / (4 * np.pi) + aic_wake
+
+        return aic, aic_wake
+
     def generate_twist(self, dictionary, twist, y_start, y_end):
         """
         Add the twist on the lifting surface assuming a linear variation between y_start and y_end.
@@ -1033,110 +1177,21 @@ class VLMSimpleGeometry(om.ExplicitComponent):
         _LOGGER.warning("CL not in range. Linear extrapolation of CDp value %f", cdp)
         return cdp
 
-    @staticmethod
-    def search_results(result_folder_path, geometry_set):
-        """Search the results folder to see if the geometry has already been calculated."""
-        if os.path.exists(result_folder_path):
-            geometry_set_labels = [
-                "sweep25_wing",
-                "taper_ratio_wing",
-                "aspect_ratio_wing",
-                "dihedral_angle_wing",
-                "twist_angle_wing",
-                "sweep25_htp",
-                "taper_ratio_htp",
-                "aspect_ratio_htp",
-                "mach",
-                "area_ratio",
-            ]
-            # If some results already stored search for corresponding geometry
-            if pth.exists(pth.join(result_folder_path, "geometry_0.csv")):
-                idx = 0
-                while pth.exists(pth.join(result_folder_path, "geometry_" + str(idx) + ".csv")):
-                    if pth.exists(pth.join(result_folder_path, "vlm_" + str(idx) + ".csv")):
-                        data = pd.read_csv(
-                            pth.join(result_folder_path, "geometry_" + str(idx) + ".csv")
-                        )
-                        values = data.to_numpy()[:, 1].tolist()
-                        labels = data.to_numpy()[:, 0].tolist()
-                        data = pd.DataFrame(values, index=labels)
-                        # noinspection PyBroadException
-                        try:
-                            if (
-                                np.size(data.loc[geometry_set_labels[0:-1], 0].to_numpy())
-                                == len(geometry_set_labels) - 1
-                            ):
-                                saved_set = np.around(
-                                    data.loc[geometry_set_labels[0:-1], 0].to_numpy(), decimals=6
-                                )
-                                if (
-                                    np.sum(saved_set == geometry_set[0:-1])
-                                    == len(geometry_set_labels) - 1
-                                ):
-                                    result_file_path = pth.join(
-                                        result_folder_path, "vlm_" + str(idx) + ".csv"
-                                    )
-                                    saved_area_ratio = data.loc["area_ratio", 0]
-                                    return result_file_path, saved_area_ratio
-                        except Exception:
-                            break
-                    idx += 1
-
-        return None, 1.0
-
-    @staticmethod
-    def save_geometry(result_folder_path, geometry_set):
-        """Save geometry if not already computed by finding first available index."""
-        geometry_set_labels = [
-            "sweep25_wing",
-            "taper_ratio_wing",
-            "aspect_ratio_wing",
-            "dihedral_angle_wing",
-            "twist_angle_wing",
-            "sweep25_htp",
-            "taper_ratio_htp",
-            "aspect_ratio_htp",
-            "mach",
-            "area_ratio",
-        ]
-        data = pd.DataFrame(geometry_set, index=geometry_set_labels)
-        idx = 0
-        while pth.exists(pth.join(result_folder_path, "geometry_" + str(idx) + ".csv")):
-            idx += 1
-        data.to_csv(pth.join(result_folder_path, "geometry_" + str(idx) + ".csv"))
-        result_file_path = pth.join(result_folder_path, "vlm_" + str(idx) + ".csv")
-
-        return result_file_path
-
-    @staticmethod
-    def save_results(result_file_path, results):
-        """Reads saved results."""
-        labels = [
-            "cl_0_wing",
-            "cl_X_wing",
-            "cl_alpha_wing",
-            "cm_0_wing",
-            "y_vector_wing",
-            "cl_vector_wing",
-            "chord_vector_wing",
-            "coef_k_wing",
-            "cl_0_htp",
-            "cl_X_htp",
-            "cl_alpha_htp",
-            "cl_alpha_htp_isolated",
-            "y_vector_htp",
-            "cl_vector_htp",
-            "coef_k_htp",
-            "saved_ref_area",
-        ]
-        data = pd.DataFrame(results, index=labels)
-        data.to_csv(result_file_path)
-
-    @staticmethod
-    def read_results(result_file_path):
-
-        data = pd.read_csv(result_file_path)
-        values = data.to_numpy()[:, 1].tolist()
-        labels = data.to_numpy()[:, 0].tolist()
+    def _get_result_store(self) -> AeroResultStore:
+        """
+        Returns the store of the results computed with the mesh defined in the options. Results
+        obtained with a non-default mesh are kept in a separate store.
+        """
+        mesh = (
+            self.options["chordwise_panel_count"],
+            self.options["inner_spanwise_panel_count"],
+            self.options["outer_spanwise_panel_count"],
+        )
+        if mesh == (DEFAULT_NX, DEFAULT_NY1, DEFAULT_NY2):
+            return AeroResultStore(
+                self.options["result_folder_path"], "vlm", RESULT_LABELS, legacy_prefix="vlm"
+            )
 
-        return pd.DataFrame(values, index=labels)
+        return AeroResultStore(
+            self.options["result_folder_path"], "vlm_%i_%i_%i" % mesh, RESULT_LABELS
+        )
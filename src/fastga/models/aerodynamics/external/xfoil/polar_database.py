@@ -0,0 +1,467 @@
+"""Database of the airfoil polars saved in the XFOIL resources."""
+#  This file is part of FAST-OAD_CS23 : A framework for rapid Overall Aircraft Design
+#  Copyright (C) 2022  ONERA & ISAE-SUPAERO
+#  FAST is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import logging
+import os
+import os.path as pth
+import struct
+import zlib
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from fastga.utils.file_lock import file_lock, get_file_stamp
+
+_LOGGER = logging.getLogger(__name__)
+
+SCALAR_LABELS = ["mach", "reynolds", "cl_max_2d", "cl_min_2d"]
+POLAR_LABELS = ["alpha", "cl", "cd", "cdp", "cm"]
+
+POLAR_FILE_EXTENSION = ".bin"
+LEGACY_FILE_EXTENSION = ".csv"
+
+# Tolerance on the mach number for a saved polar to be used
+MACH_TOLERANCE = 0.03
+
+# Each polar is saved as a record made of this header (size in bytes of the compressed data,
+# number of alpha values) followed by the zlib-compressed little-endian float64 values of mach,
+# reynolds, cl_max_2d and cl_min_2d, then of the alpha, cl, cd, cdp and cm vectors
+_RECORD_HEADER = struct.Struct("<II")
+_DTYPE = np.dtype("<f8")
+
+
+class PolarDatabase:
+    """
+    Polars of an airfoil parsed into numeric arrays.
+
+    Resource files are parsed once, so that the polar at a given (mach, reynolds) is then found
+    without reading the file again. A database is not modified once read: a new one is read when
+    a polar is saved.
+    """
+
+    def __init__(self):
+        self.mach = np.array([])
+        self.reynolds = np.array([])
+        self.cl_max_2d = np.array([])
+        self.cl_min_2d = np.array([])
+        self.polars: List[Dict[str, np.ndarray]] = []
+        self._interpolators: Dict[float, Optional[PolarInterpolator]] = {}
+
+    @classmethod
+    def from_file(cls, file_path: str) -> "PolarDatabase":
+        """
+        Reads the polars saved in a binary resource file. An incomplete record at the end of the
+        file, e.g. left by an interrupted write, is ignored.
+
+        :param file_path: path of the binary file
+        :return: the database of the file
+        """
+        with open(file_path, "rb") as file:
+            content = file.read()
+
+        database = cls()
+        scalars = []
+        records, complete_size = _split_records(content)
+        if complete_size < len(content):
+            _LOGGER.warning("Incomplete polar record ignored at the end of %s!", file_path)
+        for alpha_count, data in records:
+            values = np.frombuffer(zlib.decompress(data), dtype=_DTYPE)
+            scalars.append(values[: len(SCALAR_LABELS)])
+            vectors = values[len(SCALAR_LABELS) :].reshape(len(POLAR_LABELS), alpha_count)
+            database.polars.append(dict(zip(POLAR_LABELS, vectors)))
+
+        if scalars:
+            database.mach, database.reynolds, database.cl_max_2d, database.cl_min_2d = np.array(
+                scalars
+            ).T
+
+        return database
+
+    @classmethod
+    def from_csv(cls, file_path: str) -> "PolarDatabase":
+        """
+        Reads the polars saved in a .csv resource file, one column per polar, as written by the
+        former versions.
+
+        :param file_path: path of the .csv file
+        :return: the database of the file
+        """
+        data = pd.read_csv(file_path).to_numpy()
+        labels = data[:, 0].tolist()
+        rows = {label: data[labels.index(label), 1:] for label in SCALAR_LABELS + POLAR_LABELS}
+        database = cls()
+        database.mach = rows["mach"].astype(float)
+        database.reynolds = rows["reynolds"].astype(float)
+        database.cl_max_2d = rows["cl_max_2d"].astype(float)
+        database.cl_min_2d = rows["cl_min_2d"].astype(float)
+        database.polars = [
+            {label: _parse_list(rows[label][idx]) for label in POLAR_LABELS}
+            for idx in range(len(database.mach))
+        ]
+
+        return database
+
+    def to_bytes(self) -> bytes:
+        """Returns the content of the binary file of the database."""
+        return b"".join(
+            _encode_record(
+                self.mach[idx], self.reynolds[idx], self.cl_max_2d[idx], self.cl_min_2d[idx], polar
+            )
+            for idx, polar in enumerate(self.polars)
+        )
+
+    def get_polar(self, mach: float, reynolds: float) -> Optional[Dict[str, np.ndarray]]:
+        """
+        Returns the polar saved for the given mach and reynolds numbers. If it has not been
+        computed, the polar is interpolated in (reynolds, mach) by a PolarInterpolator and only
+        the angles of attack computed in all the interpolated polars are kept.
+
+        :param mach: mach number
+        :param reynolds: reynolds number
+        :return: dictionary of the cl_max_2d, cl_min_2d, alpha, cl, cd, cdp and cm arrays, None
+                 if the polar is not available
+        """
+        index_saved = np.where((self.mach == mach) & (self.reynolds == reynolds))[0]
+        if len(index_saved) > 0:
+            return self._get_saved_polar(index_saved[0])
+
+        interpolator = self.get_interpolator(mach)
+        if interpolator is None:
+            return None
+        interpolated_polars = interpolator.interpolate(reynolds)
+        if np.isnan(interpolated_polars["cl_max_2d"][0]):
+            return None
+        index_alpha = np.where(
+            np.all([~np.isnan(interpolated_polars[label][0]) for label in POLAR_LABELS[1:]], axis=0)
+        )[0]
+        if len(index_alpha) == 0:
+            return None
+
+        interpolated_result = {
+            "cl_max_2d": interpolated_polars["cl_max_2d"],
+            "cl_min_2d": interpolated_polars["cl_min_2d"],
+            "alpha": interpolator.alpha[index_alpha],
+        }
+        for label in POLAR_LABELS[1:]:
+            interpolated_result[label] = interpolated_polars[label][0, index_alpha]
+
+        return interpolated_result
+
+    def get_interpolator(self, mach: float) -> Optional["PolarInterpolator"]:
+        """
+        :param mach: mach number
+        :return: interpolator of the polars at the given mach number, None if no polar has been
+                 saved for a mach number within MACH_TOLERANCE
+        """
+        if mach not in self._interpolators:
+            mach_numbers, mach_weights = _get_mach_weights(self.mach, mach)
+            if mach_numbers:
+                self._interpolators[mach] = PolarInterpolator(self, mach_numbers, mach_weights)
+            else:
+                self._interpolators[mach] = None
+
+        return self._interpolators[mach]
+
+    def _get_saved_polar(self, index: int) -> Dict[str, np.ndarray]:
+        """Returns the polar saved at the given index."""
+        saved_polar = {
+            "cl_max_2d": np.array([self.cl_max_2d[index]]),
+            "cl_min_2d": np.array([self.cl_min_2d[index]]),
+        }
+        saved_polar.update(self.polars[index])
+
+        return saved_polar
+
+
+class PolarInterpolator:
+    """
+    Bilinear interpolation in (reynolds, mach) of the polars saved in a database.
+
+    Polars are interpolated between the saved mach numbers bracketing the requested one, and for
+    each of them between the saved reynolds numbers bracketing the requested ones. All the polars
+    are resampled once on a common alpha grid, so that any number of reynolds numbers is then
+    interpolated in one vectorized call.
+
+    :param database: the polar database
+    :param mach_numbers: saved mach numbers used for the interpolation
+    :param mach_weights: weight of each saved mach number, their sum is 1
+    """
+
+    def __init__(
+        self, database: PolarDatabase, mach_numbers: List[float], mach_weights: List[float]
+    ):
+        self.mach_weights = np.array(mach_weights)
+        index_polars = [np.where(database.mach == mach)[0] for mach in mach_numbers]
+
+        # Common alpha grid: every angle of attack computed in one of the polars, sorted
+        self.alpha = np.unique(
+            np.concatenate([database.polars[idx]["alpha"] for idx in np.concatenate(index_polars)])
+        )
+        self._mach_polars = [_MachPolars(database, index, self.alpha) for index in index_polars]
+
+    def interpolate(self, reynolds) -> Dict[str, np.ndarray]:
+        """
+        Interpolates the polars at the given reynolds numbers.
+
+        Values are NaN for the angles of attack that were not computed in one of the
+        interpolated polars, and for the reynolds numbers out of the range of the saved ones.
+
+        :param reynolds: reynolds number or array of reynolds numbers
+        :return: dictionary of the cl_max_2d and cl_min_2d arrays (one value per reynolds
+                 number) and of the cl, cd, cdp and cm arrays (one row per reynolds number, one
+                 column per angle of attack of the alpha attribute)
+        """
+        reynolds = np.atleast_1d(np.asarray(reynolds, dtype=float))
+        total_weight = np.zeros(len(reynolds))
+        results = {label: np.zeros(len(reynolds)) for label in ["cl_max_2d", "cl_min_2d"]}
+        for label in POLAR_LABELS[1:]:
+            results[label] = np.zeros((len(reynolds), len(self.alpha)))
+
+        for mach_polars, mach_weight in zip(self._mach_polars, self.mach_weights):
+            index_lower, index_upper, ratio, valid = mach_polars.get_brackets(reynolds)
+            # Reynolds numbers out of range for a mach number are taken from the other one
+            weight = np.where(valid, mach_weight, 0.0)
+            total_weight += weight
+            for label, values in mach_polars.values.items():
+                lower_values = values[index_lower] * _broadcast(ratio, values)
+                upper_values = values[index_upper] * _broadcast(1.0 - ratio, values)
+                results[label] += np.where(
+                    _broadcast(valid, values),
+                    (lower_values + upper_values) * _broadcast(weight, values),
+                    0.0,
+                )
+
+        for label, values in results.items():
+            with np.errstate(invalid="ignore", divide="ignore"):
+                results[label] = np.where(
+                    _broadcast(total_weight > 0.0, values),
+                    values / _broadcast(total_weight, values),
+                    np.nan,
+                )
+
+        return results
+
+
+class _MachPolars:
+    """Polars saved for one mach number, resampled on the alpha grid of the interpolator."""
+
+    def __init__(self, database: PolarDatabase, index_polars: np.ndarray, alpha: np.ndarray):
+        # First saved polar of each reynolds number, sorted by reynolds number
+        self.reynolds, index_unique = np.unique(database.reynolds[index_polars], return_index=True)
+        index_polars = index_polars[index_unique]
+
+        self.values = {
+            "cl_max_2d": database.cl_max_2d[index_polars],
+            "cl_min_2d": database.cl_min_2d[index_polars],
+        }
+        for label in POLAR_LABELS[1:]:
+            self.values[label] = np.empty((len(index_polars), len(alpha)))
+        for row, idx in enumerate(index_polars):
+            polar = database.polars[idx]
+            order = np.argsort(polar["alpha"])
+            polar_alpha = polar["alpha"][order]
+            out_of_range = (alpha < polar_alpha[0]) | (alpha > polar_alpha[-1])
+            for label in POLAR_LABELS[1:]:
+                values = np.interp(alpha, polar_alpha, polar[label][order])
+                values[out_of_range] = np.nan
+                self.values[label][row] = values
+
+    def get_brackets(self, reynolds: np.ndarray) -> Tuple[np.ndarray, ...]:
+        """
+        :param reynolds: array of reynolds numbers
+        :return: indices of the lower and upper saved reynolds numbers, weight of the lower one
+                 and whether the reynolds numbers are in the range of the saved ones
+        """
+        index_upper = np.searchsorted(self.reynolds, reynolds)
+        index_upper = np.minimum(index_upper, len(self.reynolds) - 1)
+        exact = self.reynolds[index_upper] == reynolds
+        index_lower = np.where(exact, index_upper, np.maximum(index_upper - 1, 0))
+        valid = exact | (
+            (self.reynolds[index_lower] < reynolds) & (reynolds < self.reynolds[index_upper])
+        )
+        # Reynolds numbers out of range get the lower value, they are not used anyway
+        reynolds_delta = self.reynolds[index_upper] - self.reynolds[index_lower]
+        ratio = np.ones(len(reynolds))
+        interpolated = valid & ~exact
+        ratio[interpolated] = (
+            self.reynolds[index_upper][interpolated] - reynolds[interpolated]
+        ) / reynolds_delta[interpolated]
+
+        return index_lower, index_upper, ratio, valid
+
+
+# Process-wide cache of the polar databases already read, so that files are parsed only once.
+# Databases are stored with the stamp of the file they were read from.
+_POLAR_DATABASES: Dict[str, Tuple[Optional[tuple], PolarDatabase]] = {}
+
+
+def get_polar_database(file_path: str) -> PolarDatabase:
+    """
+    Returns the polar database of a binary resource file, the file is read again only if it
+    has been modified, moved or deleted since last call.
+
+    If the binary file does not exist yet, the polars of the .csv file with the same name are
+    read and migrated to the binary file.
+
+    :param file_path: path of the binary file
+    :return: the polar database
+    """
+    file_path = pth.abspath(file_path)
+    legacy_file_path = pth.splitext(file_path)[0] + LEGACY_FILE_EXTENSION
+    file_stamp = get_file_stamp(file_path)
+    use_legacy_file = file_stamp is None
+    if use_legacy_file:
+        file_stamp = get_file_stamp(legacy_file_path)
+
+    if file_path in _POLAR_DATABASES and _POLAR_DATABASES[file_path][0] == file_stamp:
+        return _POLAR_DATABASES[file_path][1]
+
+    database = PolarDatabase()
+    # noinspection PyBroadException
+    try:
+        if file_stamp is None:
+            pass
+        elif use_legacy_file:
+            database = PolarDatabase.from_csv(legacy_file_path)
+            if _write_migrated_file(file_path, database):
+                file_stamp = get_file_stamp(file_path)
+        else:
+            database = PolarDatabase.from_file(file_path)
+    except Exception:
+        _LOGGER.warning("Unable to read polars from %s file, file is ignored!", file_path)
+    _POLAR_DATABASES[file_path] = (file_stamp, database)
+
+    return database
+
+
+def save_polar(
+    file_path: str,
+    mach: float,
+    reynolds: float,
+    cl_max_2d: float,
+    cl_min_2d: float,
+    polar: Dict[str, np.ndarray],
+):
+    """
+    Appends a polar to a binary resource file, the polars already saved are not rewritten.
+
+    :param file_path: path of the binary file
+    :param mach: mach number of the polar
+    :param reynolds: reynolds number of the polar
+    :param cl_max_2d: maximum lift coefficient of the airfoil
+    :param cl_min_2d: minimum lift coefficient of the airfoil
+    :param polar: dictionary of the alpha, cl, cd, cdp and cm vectors
+    """
+    file_path = pth.abspath(file_path)
+    # Polars of the legacy .csv file must be migrated before the first append
+    get_polar_database(file_path)
+    with file_lock(file_path):
+        with open(file_path, "ab") as file:
+            # An incomplete record left by an interrupted write would corrupt the new one
+            if pth.exists(file_path):
+                with open(file_path, "rb") as saved_file:
+                    file.truncate(_split_records(saved_file.read())[1])
+            file.write(_encode_record(mach, reynolds, cl_max_2d, cl_min_2d, polar))
+
+    # Forces next reading, so that polars saved in the meantime by other processes are known
+    _POLAR_DATABASES.pop(file_path, None)
+
+
+def _get_mach_weights(saved_mach: np.ndarray, mach: float) -> Tuple[List[float], List[float]]:
+    """
+    Returns the saved mach numbers used to interpolate the polars at the given mach number and
+    their weights: the saved mach numbers bracketing it if both are within MACH_TOLERANCE, the
+    nearest one otherwise.
+    """
+    near_mach = np.unique(saved_mach[np.abs(saved_mach - mach) < MACH_TOLERANCE])
+    if len(near_mach) == 0:
+        return [], []
+
+    lower_mach = near_mach[near_mach <= mach]
+    upper_mach = near_mach[near_mach >= mach]
+    if len(lower_mach) == 0 or len(upper_mach) == 0:
+        return [near_mach[np.argmin(np.abs(near_mach - mach))]], [1.0]
+    if max(lower_mach) == min(upper_mach):
+        return [max(lower_mach)], [1.0]
+
+    ratio = (min(upper_mach) - mach) / (min(upper_mach) - max(lower_mach))
+
+    return [max(lower_mach), min(upper_mach)], [ratio, 1.0 - ratio]
+
+
+def _broadcast(vector: np.ndarray, values: np.ndarray) -> np.ndarray:
+    """Reshapes a vector with one value per reynolds number to be multiplied with values."""
+    return vector.reshape((-1,) + (1,) * (np.ndim(values) - 1))
+
+
+def _write_migrated_file(file_path: str, database: PolarDatabase) -> bool:
+    """
+    Writes the polars read from a legacy .csv file in the binary file, unless another process
+    did it first.
+
+    :return: False if the binary file can't be written, e.g. in a read-only installation
+    """
+    tmp_file_path = file_path + ".tmp"
+    try:
+        with file_lock(file_path):
+            if not pth.exists(file_path):
+                with open(tmp_file_path, "wb") as file:
+                    file.write(database.to_bytes())
+                os.replace(tmp_file_path, file_path)
+    except OSError:
+        _LOGGER.info("Unable to write migrated polars to %s file!", file_path)
+        return False
+
+    return True
+
+
+def _split_records(content: bytes) -> Tuple[List[Tuple[int, bytes]], int]:
+    """
+    Splits the content of a binary file into records.
+
+    :return: list of the number of alpha values and compressed data of each complete record, and
+             size of the content made of complete records
+    """
+    records = []
+    offset = 0
+    while offset + _RECORD_HEADER.size <= len(content):
+        data_size, alpha_count = _RECORD_HEADER.unpack_from(content, offset)
+        if offset + _RECORD_HEADER.size + data_size > len(content):
+            break
+        offset += _RECORD_HEADER.size
+        records.append((alpha_count, content[offset : offset + data_size]))
+        offset += data_size
+
+    return records, offset
+
+
+def _encode_record(
+    mach: float,
+    reynolds: float,
+    cl_max_2d: float,
+    cl_min_2d: float,
+    polar: Dict[str, np.ndarray],
+) -> bytes:
+    """Returns the binary record of a polar."""
+    vectors = np.array([np.asarray(polar[label], dtype=_DTYPE) for label in POLAR_LABELS])
+    values = np.concatenate(([mach, reynolds, cl_max_2d, cl_min_2d], vectors.ravel()))
+    data = zlib.compress(values.astype(_DTYPE).tobytes())
+
+    return _RECORD_HEADER.pack(len(data), vectors.shape[1]) + data
+
+
+def _parse_list(value) -> np.ndarray:
+    """Parses a vector saved as a string, e.g. '[0.0, 0.5, 1.0]'."""
+    return np.array([float(x) for x in str(value).strip("[]").split(",")])
@@ -0,0 +1,150 @@
+"""Concurrent computation of several airfoil polars with Xfoil."""
+#  This file is part of FAST-OAD_CS23 : A framework for rapid Overall Aircraft Design
+#  Copyright (C) 2022  ONERA & ISAE-SUPAERO
+#  FAST is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Tuple
+
+import numpy as np
+import openmdao.api as om
+
+from .polar_database import get_polar_database
+from .xfoil_polar import (
+    OPTION_ALPHA_END,
+    OPTION_ALPHA_START,
+    OPTION_COMP_NEG_AIR_SYM,
+    OPTION_ITER_LIMIT,
+    OPTION_RESULT_FOLDER_PATH,
+    OPTION_XFOIL_EXE_PATH,
+    XfoilPolar,
+    get_result_file_path,
+    run_xfoil_polar,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+# Options of XfoilPolar that change the computed polar
+_POLAR_OPTION_NAMES = [
+    OPTION_XFOIL_EXE_PATH,
+    "airfoil_folder_path",
+    "airfoil_file",
+    OPTION_ALPHA_START,
+    OPTION_ALPHA_END,
+    OPTION_ITER_LIMIT,
+    OPTION_COMP_NEG_AIR_SYM,
+]
+
+
+def compute_polars(
+    polar_requests: List[Tuple[dict, float, float]], max_workers: Optional[int] = None
+) -> List[dict]:
+    """
+    Computes with Xfoil the polars that are not yet in the polar resource files and saves them,
+    so that the XfoilPolar components with the same options find them without running Xfoil.
+
+    Requests that lead to the same polar are computed once. Each Xfoil run has its own
+    temporary directory and runs in its own process, max_workers of them at the same time.
+    Requests with single_AoA option or with a result folder are ignored, their XfoilPolar
+    component runs Xfoil itself. A failed computation is only logged: the XfoilPolar component
+    will run it again and report the error.
+
+    :param polar_requests: list of (options, mach, reynolds) with options the keyword arguments
+                           of the XfoilPolar component
+    :param max_workers: maximum number of concurrent Xfoil runs, number of CPUs if None
+    :return: list of the computed polars as returned by run_xfoil_polar
+    """
+    pending_requests = {}
+    for polar_options, mach, reynolds in polar_requests:
+        options = XfoilPolar(**polar_options).options
+        if options["single_AoA"] or options[OPTION_RESULT_FOLDER_PATH] != "":
+            continue
+        # Same rounding as XfoilPolar
+        mach = round(float(mach) * 1e4) / 1e4
+        reynolds = round(float(reynolds))
+        key = tuple(options[name] for name in _POLAR_OPTION_NAMES) + (mach, reynolds)
+        if key in pending_requests:
+            continue
+        if get_polar_database(get_result_file_path(options)).get_polar(mach, reynolds) is None:
+            pending_requests[key] = (options, mach, reynolds)
+
+    if not pending_requests:
+        return []
+
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    max_workers = min(max_workers, len(pending_requests))
+    _LOGGER.info("Running %i Xfoil polar computations", len(pending_requests))
+
+    # Threads are enough since each of them waits for its own Xfoil process
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(run_xfoil_polar, options, mach, reynolds)
+            for options, mach, reynolds in pending_requests.values()
+        ]
+
+    polars = []
+    for future, (options, mach, reynolds) in zip(futures, pending_requests.values()):
+        # noinspection PyBroadException
+        try:
+            polars.append(future.result())
+        except Exception as error:
+            _LOGGER.warning(
+                "Xfoil polar computation failed for %s airfoil at mach %f and reynolds %i: %s",
+                options["airfoil_file"],
+                mach,
+                reynolds,
+                error,
+            )
+
+    return polars
+
+
+class XfoilPolarBatch(om.ExplicitComponent):
+    """
+    Computes concurrently the polars needed by several XfoilPolar components of a model.
+
+    To be placed before the XfoilPolar components, with the same mach and reynolds numbers
+    connected to its name:xfoil:mach and name:xfoil:reynolds inputs. The polars are saved in the
+    polar resource files where the XfoilPolar components then read them.
+    """
+
+    def initialize(self):
+
+        self.options.declare(
+            "polars",
+            default={},
+            types=dict,
+            desc="XfoilPolar options (as a dictionary of keyword arguments) of each polar to "
+            "compute, by name",
+        )
+        self.options.declare("max_workers", default=None, types=int, allow_none=True)
+
+    def setup(self):
+
+        for name in self.options["polars"]:
+            self.add_input(name + ":xfoil:mach", val=np.nan)
+            self.add_input(name + ":xfoil:reynolds", val=np.nan)
+
+    def compute(self, inputs, outputs):
+
+        polar_requests = [
+            (
+                polar_options,
+                float(inputs[name + ":xfoil:mach"]),
+                float(inputs[name + ":xfoil:reynolds"]),
+            )
+            for name, polar_options in self.options["polars"].items()
+        ]
+        compute_polars(polar_requests, max_workers=self.options["max_workers"])
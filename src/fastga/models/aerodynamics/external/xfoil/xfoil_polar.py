@@ -16,15 +16,16 @@ import logging
 import os
 import os.path as pth
 import shutil
+import subprocess
 import sys
 import warnings
+from functools import partial
 from importlib.resources import path
 from pathlib import Path
 from tempfile import TemporaryDirectory
-from typing import Tuple
+from typing import Callable, List, Optional, Tuple
 
 import numpy as np
-import pandas as pd
 
 # noinspection PyProtectedMember
 from fastoad._utils.resource_management.copy import copy_resource
@@ -34,6 +35,7 @@ from openmdao.utils.file_wrap import InputFileGenerator
 from fastga.models.aerodynamics.external.xfoil import xfoil699
 from fastga.models.geometry.profiles.get_profile import get_profile
 from . import resources as local_resources
+from .polar_database import POLAR_FILE_EXTENSION, get_polar_database, save_polar
 from ...constants import POLAR_POINT_COUNT
 
 OPTION_RESULT_POLAR_FILENAME = "result_polar_filename"
@@ -54,6 +56,7 @@ _DEFAULT_AIRFOIL_FILE = "naca23012.af"
 _TMP_PROFILE_FILE_NAME = "in"  # as short as possible to avoid problems of path length
 _TMP_RESULT_FILE_NAME = "out"  # as short as possible to avoid problems of path length
 XFOIL_EXE_NAME = "xfoil.exe"  # name of embedded XFoil executable
+XFOIL_TIMEOUT = 15.0  # in seconds, for each run of XFoil
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -119,7 +122,7 @@ class XfoilPolar(ExternalCodeComp):
     def compute(self, inputs, outputs):
 
         # Define timeout for the function
-        self.options["timeout"] = 15.0
+        self.options["timeout"] = XFOIL_TIMEOUT
 
         # Get inputs and initialise outputs
         mach = round(float(inputs["xfoil:mach"]) * 1e4) / 1e4
@@ -127,350 +130,37 @@ class XfoilPolar(ExternalCodeComp):
 
         # Search if data already stored for this profile and mach with reynolds values bounding
         # current value. If so, use linear interpolation with the nearest upper/lower reynolds
-        no_file = True
-        data_saved = None
         interpolated_result = None
-        if self.options[OPTION_COMP_NEG_AIR_SYM]:
-            result_file = pth.join(
-                pth.split(os.path.realpath(__file__))[0],
-                "resources",
-                self.options["airfoil_file"].replace(
-                    ".af", "_" + str(int(np.ceil(self.options[OPTION_ALPHA_END])))
-                )
-                + "S.csv",
-            )
-        else:
-            result_file = pth.join(
-                pth.split(os.path.realpath(__file__))[0],
-                "resources",
-                self.options["airfoil_file"].replace(".af", "") + ".csv",
-            )
-        if pth.exists(result_file) and not self.options["single_AoA"]:
-            no_file = False
-            data_saved = pd.read_csv(result_file)
-            values = data_saved.to_numpy()[:, 1 : len(data_saved.to_numpy()[0])]
-            labels = data_saved.to_numpy()[:, 0].tolist()
-            data_saved = pd.DataFrame(values, index=labels)
-            saved_mach_list = data_saved.loc["mach", :].to_numpy().astype(float)
-            index_near_mach = np.where(abs(saved_mach_list - mach) < 0.03)[0]
-            near_mach = []
-            distance_to_mach = []
-            for index in index_near_mach:
-                if not (saved_mach_list[index] in near_mach):
-                    near_mach.append(saved_mach_list[index])
-                    distance_to_mach.append(abs(saved_mach_list[index] - mach))
-            if not near_mach:
-                index_mach = np.where(data_saved.loc["mach", :].to_numpy() == str(mach))[0]
-            else:
-                selected_mach_index = distance_to_mach.index(min(distance_to_mach))
-                index_mach = np.where(saved_mach_list == near_mach[selected_mach_index])[0]
-            data_reduced = data_saved.loc[labels, index_mach]
-            # Search if this exact reynolds has been computed and save results
-            reynolds_vect = np.array(
-                [float(x) for x in list(data_reduced.loc["reynolds", :].to_numpy())]
+        if not self.options["single_AoA"]:
+            interpolated_result = get_polar_database(get_result_file_path(self.options)).get_polar(
+                mach, reynolds
             )
-            index_reynolds = index_mach[np.where(reynolds_vect == reynolds)[0]]
-            if len(index_reynolds) == 1:
-                interpolated_result = data_reduced.loc[labels, index_reynolds]
-            # Else search for lower/upper Reynolds
-            else:
-                lower_reynolds = reynolds_vect[np.where(reynolds_vect < reynolds)[0]]
-                upper_reynolds = reynolds_vect[np.where(reynolds_vect > reynolds)[0]]
-                if not (len(lower_reynolds) == 0 or len(upper_reynolds) == 0):
-                    index_lower_reynolds = index_mach[
-                        np.where(reynolds_vect == max(lower_reynolds))[0]
-                    ]
-                    index_upper_reynolds = index_mach[
-                        np.where(reynolds_vect == min(upper_reynolds))[0]
-                    ]
-                    lower_values = data_reduced.loc[labels, index_lower_reynolds]
-                    upper_values = data_reduced.loc[labels, index_upper_reynolds]
-                    # Initialise values with lower reynolds
-                    interpolated_result = lower_values
-                    # Calculate reynolds ratio split for linear interpolation
-                    x_ratio = (min(upper_reynolds) - reynolds) / (
-                        min(upper_reynolds) - max(lower_reynolds)
-                    )
-                    # Search for common alpha range for linear interpolation
-                    alpha_lower = (
-                        np.array(
-                            np.matrix(lower_values.loc["alpha", index_lower_reynolds].to_numpy()[0])
-                        )
-                        .ravel()
-                        .tolist()
-                    )
-                    alpha_upper = (
-                        np.array(
-                            np.matrix(upper_values.loc["alpha", index_upper_reynolds].to_numpy()[0])
-                        )
-                        .ravel()
-                        .tolist()
-                    )
-                    alpha_shared = np.array(list(set(alpha_upper).intersection(alpha_lower)))
-                    interpolated_result.loc["alpha", index_lower_reynolds] = str(
-                        alpha_shared.tolist()
-                    )
-                    labels.remove("alpha")
-                    # Calculate average values (cd, cl...) with linear interpolation
-                    for label in labels:
-                        lower_value = np.array(
-                            np.matrix(lower_values.loc[label, index_lower_reynolds].to_numpy()[0])
-                        ).ravel()
-                        upper_value = np.array(
-                            np.matrix(upper_values.loc[label, index_upper_reynolds].to_numpy()[0])
-                        ).ravel()
-                        # If values relative to alpha vector, performs interpolation with shared
-                        # vector
-                        if np.size(lower_value) == len(alpha_lower):
-                            lower_value = np.interp(
-                                alpha_shared, np.array(alpha_lower), lower_value
-                            )
-                            upper_value = np.interp(
-                                alpha_shared, np.array(alpha_upper), upper_value
-                            )
-                        value = (lower_value * x_ratio + upper_value * (1 - x_ratio)).tolist()
-                        interpolated_result.loc[label, index_lower_reynolds] = str(value)
 
         if interpolated_result is None:
-            # Create result folder first (if it must fail, let it fail as soon as possible)
-            result_folder_path = self.options[OPTION_RESULT_FOLDER_PATH]
-            if result_folder_path != "":
-                os.makedirs(result_folder_path, exist_ok=True)
-
-            # Pre-processing (populating temp directory)
-            # XFoil exe
-            tmp_directory = self._create_tmp_directory()
-            if self.options[OPTION_XFOIL_EXE_PATH]:
-                # if a path for Xfoil has been provided, simply use it
-                self.options["command"] = [self.options[OPTION_XFOIL_EXE_PATH]]
-            else:
-                # otherwise, copy the embedded resource in tmp dir
-                # noinspection PyTypeChecker
-                copy_resource(xfoil699, XFOIL_EXE_NAME, tmp_directory.name)
-                self.options["command"] = [pth.join(tmp_directory.name, XFOIL_EXE_NAME)]
-
-            # I/O files
-            self.stdin = pth.join(tmp_directory.name, _INPUT_FILE_NAME)
-            self.stdout = pth.join(tmp_directory.name, _STDOUT_FILE_NAME)
-            self.stderr = pth.join(tmp_directory.name, _STDERR_FILE_NAME)
-
-            # profile file
-            tmp_profile_file_path = pth.join(tmp_directory.name, _TMP_PROFILE_FILE_NAME)
-            profile = get_profile(
-                airfoil_folder_path=self.options["airfoil_folder_path"],
-                file_name=self.options["airfoil_file"],
-            ).get_sides()
-            # noinspection PyTypeChecker
-            np.savetxt(
-                tmp_profile_file_path,
-                profile.to_numpy(),
-                fmt="%.15f",
-                delimiter=" ",
-                header="Wing",
-                comments="",
-            )
-
-            # standard input file
-            tmp_result_file_path = pth.join(tmp_directory.name, _TMP_RESULT_FILE_NAME)
-            self._write_script_file(
-                reynolds,
+            polar = run_xfoil_polar(
+                self.options,
                 mach,
-                tmp_profile_file_path,
-                tmp_result_file_path,
-                self.options[OPTION_ALPHA_START],
-                self.options[OPTION_ALPHA_END],
-                ALPHA_STEP,
+                reynolds,
+                run_command=partial(self._run_external_code, inputs, outputs),
             )
-
-            # Run XFOIL
-            self.options["external_input_files"] = [self.stdin, tmp_profile_file_path]
-            self.options["external_output_files"] = [tmp_result_file_path]
-            # noinspection PyBroadException
-            try:
-                super().compute(inputs, outputs)
-                result_array_p = self._read_polar(tmp_result_file_path)
-            except:
-                # catch the error and try to read result file for non-convergence on higher angles
-                error = sys.exc_info()[1]
-                try:
-                    result_array_p = self._read_polar(tmp_result_file_path)
-                except:
-                    raise TimeoutError("<p>Error: %s</p>" % error)
-
-            if self.options[OPTION_COMP_NEG_AIR_SYM]:
-                os.remove(self.stdin)
-                os.remove(self.stdout)
-                os.remove(self.stderr)
-                os.remove(tmp_result_file_path)
-                alpha_start = min(-1 * self.options[OPTION_ALPHA_START], -ALPHA_STEP)
-                self._write_script_file(
-                    reynolds,
-                    mach,
-                    tmp_profile_file_path,
-                    tmp_result_file_path,
-                    alpha_start,
-                    -1 * self.options[OPTION_ALPHA_END],
-                    -ALPHA_STEP,
-                )
-                # noinspection PyBroadException
-                try:
-                    super().compute(inputs, outputs)
-                    result_array_n = self._read_polar(tmp_result_file_path)
-                except:
-                    # catch the error and try to read result file for non-convergence on higher
-                    # angles
-                    e = sys.exc_info()[1]
-                    try:
-                        result_array_n = self._read_polar(tmp_result_file_path)
-                    except:
-                        raise TimeoutError("<p>Error: %s</p>" % e)
-
-            # Post-processing
-            if self.options["single_AoA"]:
-                alpha = result_array_p["alpha"].tolist()
-                cl = result_array_p["CL"].tolist()
-                cd = result_array_p["CD"].tolist()
-                cdp = result_array_p["CDp"].tolist()
-                cm = result_array_p["CM"].tolist()
-            elif self.options[OPTION_COMP_NEG_AIR_SYM]:
-                cl_max_2d, error = self._get_max_cl(result_array_p["alpha"], result_array_p["CL"])
-                # noinspection PyUnboundLocalVariable
-                cl_min_2d, _ = self._get_min_cl(result_array_n["alpha"], result_array_n["CL"])
-                alpha = result_array_n["alpha"].tolist()
-                alpha.reverse()
-                alpha.extend(result_array_p["alpha"].tolist())
-                cl = result_array_n["CL"].tolist()
-                cl.reverse()
-                cl.extend(result_array_p["CL"].tolist())
-                cd = result_array_n["CD"].tolist()
-                cd.reverse()
-                cd.extend(result_array_p["CD"].tolist())
-                cdp = result_array_n["CDp"].tolist()
-                cdp.reverse()
-                cdp.extend(result_array_p["CDp"].tolist())
-                cm = result_array_n["CM"].tolist()
-                cm.reverse()
-                cm.extend(result_array_p["CM"].tolist())
-            else:
-                cl_max_2d, error = self._get_max_cl(result_array_p["alpha"], result_array_p["CL"])
-                cl_min_2d, _ = self._get_min_cl(result_array_p["alpha"], result_array_p["CL"])
-                alpha = result_array_p["alpha"].tolist()
-                cl = result_array_p["CL"].tolist()
-                cd = result_array_p["CD"].tolist()
-                cdp = result_array_p["CDp"].tolist()
-                cm = result_array_p["CM"].tolist()
-
+            alpha = polar["alpha"]
+            cl = polar["cl"]
+            cd = polar["cd"]
+            cdp = polar["cdp"]
+            cm = polar["cm"]
             if not self.options["single_AoA"]:
-                if POLAR_POINT_COUNT < len(alpha):
-                    alpha_interp = np.linspace(alpha[0], alpha[-1], POLAR_POINT_COUNT)
-                    cl = np.interp(alpha_interp, alpha, cl)
-                    cd = np.interp(alpha_interp, alpha, cd)
-                    cdp = np.interp(alpha_interp, alpha, cdp)
-                    cm = np.interp(alpha_interp, alpha, cm)
-                    alpha = alpha_interp
-                    warnings.warn(
-                        "Defined polar point in fast aerodynamics\\constants.py exceeded!"
-                    )
-                else:
-                    additional_zeros = list(np.zeros(POLAR_POINT_COUNT - len(alpha)))
-                    alpha.extend(additional_zeros)
-                    alpha = np.array(alpha)
-                    cl.extend(additional_zeros)
-                    cl = np.array(cl)
-                    cd.extend(additional_zeros)
-                    cd = np.array(cd)
-                    cdp.extend(additional_zeros)
-                    cdp = np.array(cdp)
-                    cm.extend(additional_zeros)
-                    cm = np.array(cm)
-
-                # Save results to defined path
-                if not error:
-                    results = [
-                        np.array(mach),
-                        np.array(reynolds),
-                        np.array(cl_max_2d),
-                        np.array(cl_min_2d),
-                        str(self._reshape(alpha, alpha).tolist()),
-                        str(self._reshape(alpha, cl).tolist()),
-                        str(self._reshape(alpha, cd).tolist()),
-                        str(self._reshape(alpha, cdp).tolist()),
-                        str(self._reshape(alpha, cm).tolist()),
-                    ]
-                    labels = [
-                        "mach",
-                        "reynolds",
-                        "cl_max_2d",
-                        "cl_min_2d",
-                        "alpha",
-                        "cl",
-                        "cd",
-                        "cdp",
-                        "cm",
-                    ]
-                    if no_file or (data_saved is None):
-                        data = pd.DataFrame(results, index=labels)
-                    else:
-                        data = pd.DataFrame(np.c_[data_saved, results], index=labels)
-                    # noinspection PyBroadException
-                    try:
-                        data.to_csv(result_file)
-                    except:
-                        warnings.warn(
-                            "Unable to save XFoil results to *.csv file: writing permission denied for "
-                            "%s folder!" % local_resources.__path__[0]
-                        )
-
-            # Getting output files if needed
-            if self.options[OPTION_RESULT_FOLDER_PATH] != "":
-                if pth.exists(tmp_result_file_path):
-                    polar_file_path = pth.join(
-                        result_folder_path, self.options[OPTION_RESULT_POLAR_FILENAME]
-                    )
-                    shutil.move(tmp_result_file_path, polar_file_path)
-
-                if pth.exists(self.stdout):
-                    stdout_file_path = pth.join(result_folder_path, _STDOUT_FILE_NAME)
-                    shutil.move(self.stdout, stdout_file_path)
-
-                if pth.exists(self.stderr):
-                    stderr_file_path = pth.join(result_folder_path, _STDERR_FILE_NAME)
-                    shutil.move(self.stderr, stderr_file_path)
-            # Try to delete the temp directory, if process not finished correctly try to
-            # close files before removing directory for second attempt
-            # noinspection PyBroadException
-            try:
-                tmp_directory.cleanup()
-            except:
-                for file_path in os.listdir(tmp_directory.name):
-                    if os.path.isfile(file_path):
-                        # noinspection PyBroadException
-                        try:
-                            file = os.open(file_path, os.O_WRONLY)
-                            os.close(file)
-                        except:
-                            _LOGGER.info("Error while trying to close %s file!", file_path)
-                # noinspection PyBroadException
-                try:
-                    tmp_directory.cleanup()
-                except:
-                    _LOGGER.info(
-                        "Error while trying to erase %s temporary directory!", tmp_directory.name
-                    )
+                cl_max_2d = polar["cl_max_2d"]
+                cl_min_2d = polar["cl_min_2d"]
 
         else:
             # Extract results
-            cl_max_2d = np.array(
-                np.matrix(interpolated_result.loc["cl_max_2d", :].to_numpy()[0])
-            ).ravel()
-            cl_min_2d = np.array(
-                np.matrix(interpolated_result.loc["cl_min_2d", :].to_numpy()[0])
-            ).ravel()
-            ALPHA = np.array(np.matrix(interpolated_result.loc["alpha", :].to_numpy()[0])).ravel()
-            CL = np.array(np.matrix(interpolated_result.loc["cl", :].to_numpy()[0])).ravel()
-            CD = np.array(np.matrix(interpolated_result.loc["cd", :].to_numpy()[0])).ravel()
-            CDP = np.array(np.matrix(interpolated_result.loc["cdp", :].to_numpy()[0])).ravel()
-            CM = np.array(np.matrix(interpolated_result.loc["cm", :].to_numpy()[0])).ravel()
+            cl_max_2d = interpolated_result["cl_max_2d"]
+            cl_min_2d = interpolated_result["cl_min_2d"]
+            ALPHA = interpolated_result["alpha"]
+            CL = interpolated_result["cl"]
+            CD = interpolated_result["cd"]
+            CDP = interpolated_result["cdp"]
+            CM = interpolated_result["cm"]
 
             # Modify vector length if necessary
             if POLAR_POINT_COUNT < len(ALPHA):
@@ -512,36 +202,24 @@ class XfoilPolar(ExternalCodeComp):
             outputs["xfoil:CL_max_2D"] = cl_max_2d
             outputs["xfoil:CL_min_2D"] = cl_min_2d
 
-    def _write_script_file(
-        self,
-        reynolds,
-        mach,
-        tmp_profile_file_path,
-        tmp_result_file_path,
-        alpha_start,
-        alpha_end,
-        step,
-    ):
-        parser = InputFileGenerator()
-        with path(local_resources, _INPUT_FILE_NAME) as input_template_path:
-            parser.set_template_file(str(input_template_path))
-            parser.set_generated_file(self.stdin)
-            parser.mark_anchor("RE")
-            parser.transfer_var(float(reynolds), 1, 1)
-            parser.mark_anchor("M")
-            parser.transfer_var(float(mach), 1, 1)
-            parser.mark_anchor("ITER")
-            parser.transfer_var(self.options[OPTION_ITER_LIMIT], 1, 1)
-            parser.mark_anchor("ASEQ")
-            parser.transfer_var(alpha_start, 1, 1)
-            parser.transfer_var(alpha_end, 2, 1)
-            parser.transfer_var(step, 3, 1)
-            parser.reset_anchor()
-            parser.mark_anchor("/profile")
-            parser.transfer_var(tmp_profile_file_path, 0, 1)
-            parser.mark_anchor("/polar_result")
-            parser.transfer_var(tmp_result_file_path, 0, 1)
-            parser.generate()
+    def _run_external_code(self, inputs, outputs, command, stdin, stdout, stderr):
+        """
+        Runs XFOIL through the ExternalCodeComp machinery, so that the options of the component
+        (timeout, allowed_return_codes...) apply.
+        """
+        tmp_directory_path = pth.dirname(stdin)
+        self.options["command"] = command
+        self.stdin = stdin
+        self.stdout = stdout
+        self.stderr = stderr
+        self.options["external_input_files"] = [
+            stdin,
+            pth.join(tmp_directory_path, _TMP_PROFILE_FILE_NAME),
+        ]
+        self.options["external_output_files"] = [
+            pth.join(tmp_directory_path, _TMP_RESULT_FILE_NAME)
+        ]
+        super().compute(inputs, outputs)
 
     @staticmethod
     def _read_polar(xfoil_result_file_path: str) -> np.ndarray:
@@ -557,60 +235,6 @@ class XfoilPolar(ExternalCodeComp):
         _LOGGER.error("XFOIL results file not found")
         return np.array([])
 
-    def _get_max_cl(self, alpha: np.ndarray, lift_coeff: np.ndarray) -> Tuple[float, bool]:
-        """
-
-        :param alpha:
-        :param lift_coeff: CL
-        :return: max CL within +/- 0.3 around linear zone if enough alpha computed, or default value
-        otherwise
-        """
-        alpha_range = self.options[OPTION_ALPHA_END] - self.options[OPTION_ALPHA_START]
-        if len(alpha) > 2:
-            covered_range = max(alpha) - min(alpha)
-            if np.abs(covered_range / alpha_range) >= 0.4:
-                lift_fct = (
-                    lambda x: (lift_coeff[1] - lift_coeff[0])
-                    / (alpha[1] - alpha[0])
-                    * (x - alpha[0])
-                    + lift_coeff[0]
-                )
-                delta = np.abs(lift_coeff - lift_fct(alpha))
-                return max(lift_coeff[delta <= 0.3]), False
-
-        _LOGGER.warning(
-            "2D CL max not found, less than 40%% of angle range computed: using default value %f",
-            DEFAULT_2D_CL_MAX,
-        )
-        return DEFAULT_2D_CL_MAX, True
-
-    def _get_min_cl(self, alpha: np.ndarray, lift_coeff: np.ndarray) -> Tuple[float, bool]:
-        """
-        :param alpha:
-        :param lift_coeff: CL
-
-        :return: min CL +/- 0.3 around linear zone if enough alpha computed, or default value
-        otherwise
-        """
-        alpha_range = self.options[OPTION_ALPHA_END] - self.options[OPTION_ALPHA_START]
-        if len(alpha) > 2:
-            covered_range = max(alpha) - min(alpha)
-            if covered_range / alpha_range >= 0.4:
-                lift_fct = (
-                    lambda x: (lift_coeff[1] - lift_coeff[0])
-                    / (alpha[1] - alpha[0])
-                    * (x - alpha[0])
-                    + lift_coeff[0]
-                )
-                delta = np.abs(lift_coeff - lift_fct(alpha))
-                return min(lift_coeff[delta <= 0.3]), False
-
-        _LOGGER.warning(
-            "2D CL min not found, less than 40%% of angle range computed: using default value %f",
-            DEFAULT_2D_CL_MIN,
-        )
-        return DEFAULT_2D_CL_MIN, True
-
     @staticmethod
     def _reshape(x: np.ndarray, y: np.ndarray) -> np.ndarray:
         # Delete ending 0.0 values
@@ -651,3 +275,394 @@ class XfoilPolar(ExternalCodeComp):
             )
 
         return tmp_directory
+
+
+def get_result_file_path(options) -> str:
+    """
+    Returns the path of the resource file where the polars computed with a set of XfoilPolar
+    options are saved.
+
+    :param options: options of the XfoilPolar component
+    :return: path of the polar resource file
+    """
+    if options[OPTION_COMP_NEG_AIR_SYM]:
+        file_name = (
+            options["airfoil_file"].replace(
+                ".af", "_" + str(int(np.ceil(options[OPTION_ALPHA_END])))
+            )
+            + "S"
+            + POLAR_FILE_EXTENSION
+        )
+    else:
+        file_name = options["airfoil_file"].replace(".af", "") + POLAR_FILE_EXTENSION
+
+    return pth.join(pth.split(os.path.realpath(__file__))[0], "resources", file_name)
+
+
+def run_xfoil_polar(
+    options, mach: float, reynolds: float, run_command: Optional[Callable] = None
+) -> dict:
+    """
+    Runs XFOIL in its own temporary directory to compute the polar of the airfoil, then saves it
+    in the polar resource file (unless only one angle of attack is computed or the 2D max lift
+    coefficient was not found).
+
+    This function does not depend on any component instance, so that several polars can be
+    computed concurrently (see xfoil_batch module).
+
+    :param options: options of the XfoilPolar component
+    :param mach: mach number, rounded as in XfoilPolar
+    :param reynolds: reynolds number, rounded as in XfoilPolar
+    :param run_command: function called with the command and the paths of the standard input,
+                        output and error files to run XFOIL, XFOIL is run as a subprocess with
+                        XFOIL_TIMEOUT if None
+    :return: dictionary with the alpha, cl, cd, cdp and cm vectors of the polar padded to
+             POLAR_POINT_COUNT, and the cl_max_2d and cl_min_2d values if single_AoA option is
+             False
+    """
+    # Create result folder first (if it must fail, let it fail as soon as possible)
+    result_folder_path = options[OPTION_RESULT_FOLDER_PATH]
+    if result_folder_path != "":
+        os.makedirs(result_folder_path, exist_ok=True)
+
+    # Pre-processing (populating temp directory)
+    # XFoil exe
+    tmp_directory = XfoilPolar._create_tmp_directory()
+    command = _get_command(options[OPTION_XFOIL_EXE_PATH], tmp_directory.name)
+    if run_command is None:
+        run_command = _run_command
+
+    # I/O files
+    stdin = pth.join(tmp_directory.name, _INPUT_FILE_NAME)
+    stdout = pth.join(tmp_directory.name, _STDOUT_FILE_NAME)
+    stderr = pth.join(tmp_directory.name, _STDERR_FILE_NAME)
+
+    # profile file
+    tmp_profile_file_path = pth.join(tmp_directory.name, _TMP_PROFILE_FILE_NAME)
+    profile = get_profile(
+        airfoil_folder_path=options["airfoil_folder_path"],
+        file_name=options["airfoil_file"],
+    ).get_sides()
+    # noinspection PyTypeChecker
+    np.savetxt(
+        tmp_profile_file_path,
+        profile.to_numpy(),
+        fmt="%.15f",
+        delimiter=" ",
+        header="Wing",
+        comments="",
+    )
+
+    # standard input file
+    tmp_result_file_path = pth.join(tmp_directory.name, _TMP_RESULT_FILE_NAME)
+    _write_script_file(
+        stdin,
+        reynolds,
+        mach,
+        options[OPTION_ITER_LIMIT],
+        tmp_profile_file_path,
+        tmp_result_file_path,
+        options[OPTION_ALPHA_START],
+        options[OPTION_ALPHA_END],
+        ALPHA_STEP,
+    )
+
+    # Run XFOIL
+    # noinspection PyBroadException
+    try:
+        run_command(command, stdin, stdout, stderr)
+        result_array_p = XfoilPolar._read_polar(tmp_result_file_path)
+    except:
+        # catch the error and try to read result file for non-convergence on higher angles
+        error = sys.exc_info()[1]
+        try:
+            result_array_p = XfoilPolar._read_polar(tmp_result_file_path)
+        except:
+            raise TimeoutError("<p>Error: %s</p>" % error)
+
+    if options[OPTION_COMP_NEG_AIR_SYM]:
+        os.remove(stdin)
+        os.remove(stdout)
+        os.remove(stderr)
+        os.remove(tmp_result_file_path)
+        alpha_start = min(-1 * options[OPTION_ALPHA_START], -ALPHA_STEP)
+        _write_script_file(
+            stdin,
+            reynolds,
+            mach,
+            options[OPTION_ITER_LIMIT],
+            tmp_profile_file_path,
+            tmp_result_file_path,
+            alpha_start,
+            -1 * options[OPTION_ALPHA_END],
+            -ALPHA_STEP,
+        )
+        # noinspection PyBroadException
+        try:
+            run_command(command, stdin, stdout, stderr)
+            result_array_n = XfoilPolar._read_polar(tmp_result_file_path)
+        except:
+            # catch the error and try to read result file for non-convergence on higher
+            # angles
+            e = sys.exc_info()[1]
+            try:
+                result_array_n = XfoilPolar._read_polar(tmp_result_file_path)
+            except:
+                raise TimeoutError("<p>Error: %s</p>" % e)
+
+    # Post-processing
+    alpha_range = options[OPTION_ALPHA_END] - options[OPTION_ALPHA_START]
+    if options["single_AoA"]:
+        alpha = result_array_p["alpha"].tolist()
+        cl = result_array_p["CL"].tolist()
+        cd = result_array_p["CD"].tolist()
+        cdp = result_array_p["CDp"].tolist()
+        cm = result_array_p["CM"].tolist()
+    elif options[OPTION_COMP_NEG_AIR_SYM]:
+        cl_max_2d, error = _get_max_cl(result_array_p["alpha"], result_array_p["CL"], alpha_range)
+        # noinspection PyUnboundLocalVariable
+        cl_min_2d, _ = _get_min_cl(result_array_n["alpha"], result_array_n["CL"], alpha_range)
+        alpha = result_array_n["alpha"].tolist()
+        alpha.reverse()
+        alpha.extend(result_array_p["alpha"].tolist())
+        cl = result_array_n["CL"].tolist()
+        cl.reverse()
+        cl.extend(result_array_p["CL"].tolist())
+        cd = result_array_n["CD"].tolist()
+        cd.reverse()
+        cd.extend(result_array_p["CD"].tolist())
+        cdp = result_array_n["CDp"].tolist()
+        cdp.reverse()
+        cdp.extend(result_array_p["CDp"].tolist())
+        cm = result_array_n["CM"].tolist()
+        cm.reverse()
+        cm.extend(result_array_p["CM"].tolist())
+    else:
+        cl_max_2d, error = _get_max_cl(result_array_p["alpha"], result_array_p["CL"], alpha_range)
+        cl_min_2d, _ = _get_min_cl(result_array_p["alpha"], result_array_p["CL"], alpha_range)
+        alpha = result_array_p["alpha"].tolist()
+        cl = result_array_p["CL"].tolist()
+        cd = result_array_p["CD"].tolist()
+        cdp = result_array_p["CDp"].tolist()
+        cm = result_array_p["CM"].tolist()
+
+    polar = {}
+    if not options["single_AoA"]:
+        if POLAR_POINT_COUNT < len(alpha):
+            alpha_interp = np.linspace(alpha[0], alpha[-1], POLAR_POINT_COUNT)
+            cl = np.interp(alpha_interp, alpha, cl)
+            cd = np.interp(alpha_interp, alpha, cd)
+            cdp = np.interp(alpha_interp, alpha, cdp)
+            cm = np.interp(alpha_interp, alpha, cm)
+            alpha = alpha_interp
+            warnings.warn("Defined polar point in fast aerodynamics\\constants.py exceeded!")
+        else:
+            additional_zeros = list(np.zeros(POLAR_POINT_COUNT - len(alpha)))
+            alpha.extend(additional_zeros)
+            alpha = np.array(alpha)
+            cl.extend(additional_zeros)
+            cl = np.array(cl)
+            cd.extend(additional_zeros)
+            cd = np.array(cd)
+            cdp.extend(additional_zeros)
+            cdp = np.array(cdp)
+            cm.extend(additional_zeros)
+            cm = np.array(cm)
+
+        # Save results to defined path
+        if not error:
+            saved_polar = {
+                "alpha": XfoilPolar._reshape(alpha, alpha),
+                "cl": XfoilPolar._reshape(alpha, cl),
+                "cd": XfoilPolar._reshape(alpha, cd),
+                "cdp": XfoilPolar._reshape(alpha, cdp),
+                "cm": XfoilPolar._reshape(alpha, cm),
+            }
+            # noinspection PyBroadException
+            try:
+                save_polar(
+                    get_result_file_path(options),
+                    mach,
+                    reynolds,
+                    cl_max_2d,
+                    cl_min_2d,
+                    saved_polar,
+                )
+            except:
+                warnings.warn(
+                    "Unable to save XFoil results to *%s file: writing permission denied for "
+                    "%s folder!" % (POLAR_FILE_EXTENSION, local_resources.__path__[0])
+                )
+
+        polar["cl_max_2d"] = cl_max_2d
+        polar["cl_min_2d"] = cl_min_2d
+
+    # Getting output files if needed
+    if result_folder_path != "":
+        if pth.exists(tmp_result_file_path):
+            polar_file_path = pth.join(result_folder_path, options[OPTION_RESULT_POLAR_FILENAME])
+            shutil.move(tmp_result_file_path, polar_file_path)
+
+        if pth.exists(stdout):
+            stdout_file_path = pth.join(result_folder_path, _STDOUT_FILE_NAME)
+            shutil.move(stdout, stdout_file_path)
+
+        if pth.exists(stderr):
+            stderr_file_path = pth.join(result_folder_path, _STDERR_FILE_NAME)
+            shutil.move(stderr, stderr_file_path)
+    # Try to delete the temp directory, if process not finished correctly try to
+    # close files before removing directory for second attempt
+    # noinspection PyBroadException
+    try:
+        tmp_directory.cleanup()
+    except:
+        for file_path in os.listdir(tmp_directory.name):
+            if os.path.isfile(file_path):
+                # noinspection PyBroadException
+                try:
+                    file = os.open(file_path, os.O_WRONLY)
+                    os.close(file)
+                except:
+                    _LOGGER.info("Error while trying to close %s file!", file_path)
+        # noinspection PyBroadException
+        try:
+            tmp_directory.cleanup()
+        except:
+            _LOGGER.info("Error while trying to erase %s temporary directory!", tmp_directory.name)
+
+    polar["alpha"] = alpha
+    polar["cl"] = cl
+    polar["cd"] = cd
+    polar["cdp"] = cdp
+    polar["cm"] = cm
+
+    return polar
+
+
+def _get_command(xfoil_exe_path: str, tmp_directory_path: str) -> List[str]:
+    """
+    Returns the command that runs XFOIL.
+
+    :param xfoil_exe_path: path of the XFOIL executable to use, the embedded one is copied in
+                           the temporary directory if empty. A python script (.py) can be given
+                           as a stand-in for XFOIL, it is run with the current interpreter
+    :param tmp_directory_path: temporary directory of the computation
+    :return: the command as a list of arguments
+    """
+    if xfoil_exe_path:
+        # if a path for Xfoil has been provided, simply use it
+        if xfoil_exe_path.endswith(".py"):
+            return [sys.executable, xfoil_exe_path]
+        return [xfoil_exe_path]
+
+    # otherwise, copy the embedded resource in tmp dir
+    # noinspection PyTypeChecker
+    copy_resource(xfoil699, XFOIL_EXE_NAME, tmp_directory_path)
+    return [pth.join(tmp_directory_path, XFOIL_EXE_NAME)]
+
+
+def _run_command(command: List[str], stdin: str, stdout: str, stderr: str):
+    """
+    Runs the command with the given files as standard input and outputs, raises an error if it
+    fails or exceeds XFOIL_TIMEOUT.
+    """
+    with open(stdin, "r") as stdin_file, open(stdout, "w") as stdout_file, open(
+        stderr, "w"
+    ) as stderr_file:
+        subprocess.run(
+            command,
+            stdin=stdin_file,
+            stdout=stdout_file,
+            stderr=stderr_file,
+            timeout=XFOIL_TIMEOUT,
+            check=True,
+        )
+
+
+def _write_script_file(
+    stdin,
+    reynolds,
+    mach,
+    iter_limit,
+    tmp_profile_file_path,
+    tmp_result_file_path,
+    alpha_start,
+    alpha_end,
+    step,
+):
+    parser = InputFileGenerator()
+    with path(local_resources, _INPUT_FILE_NAME) as input_template_path:
+        parser.set_template_file(str(input_template_path))
+        parser.set_generated_file(stdin)
+        parser.mark_anchor("RE")
+        parser.transfer_var(float(reynolds), 1, 1)
+        parser.mark_anchor("M")
+        parser.transfer_var(float(mach), 1, 1)
+        parser.mark_anchor("ITER")
+        parser.transfer_var(iter_limit, 1, 1)
+        parser.mark_anchor("ASEQ")
+        parser.transfer_var(alpha_start, 1, 1)
+        parser.transfer_var(alpha_end, 2, 1)
+        parser.transfer_var(step, 3, 1)
+        parser.reset_anchor()
+        parser.mark_anchor("/profile")
+        parser.transfer_var(tmp_profile_file_path, 0, 1)
+        parser.mark_anchor("/polar_result")
+        parser.transfer_var(tmp_result_file_path, 0, 1)
+        parser.generate()
+
+
+def _get_max_cl(
+    alpha: np.ndarray, lift_coeff: np.ndarray, alpha_range: float
+) -> Tuple[float, bool]:
+    """
+
+    :param alpha:
+    :param lift_coeff: CL
+    :param alpha_range: angle range requested for the computation
+    :return: max CL within +/- 0.3 around linear zone if enough alpha computed, or default value
+    otherwise
+    """
+    if len(alpha) > 2:
+        covered_range = max(alpha) - min(alpha)
+        if np.abs(covered_range / alpha_range) >= 0.4:
+            lift_fct = (
+                lambda x: (lift_coeff[1] - lift_coeff[0]) / (alpha[1] - alpha[0]) * (x - alpha[0])
+                + lift_coeff[0]
+            )
+            delta = np.abs(lift_coeff - lift_fct(alpha))
+            return max(lift_coeff[delta <= 0.3]), False
+
+    _LOGGER.warning(
+        "2D CL max not found, less than 40%% of angle range computed: using default value %f",
+        DEFAULT_2D_CL_MAX,
+    )
+    return DEFAULT_2D_CL_MAX, True
+
+
+def _get_min_cl(
+    alpha: np.ndarray, lift_coeff: np.ndarray, alpha_range: float
+) -> Tuple[float, bool]:
+    """
+    :param alpha:
+    :param lift_coeff: CL
+    :param alpha_range: angle range requested for the computation
+
+    :return: min CL +/- 0.3 around linear zone if enough alpha computed, or default value
+    otherwise
+    """
+    if len(alpha) > 2:
+        covered_range = max(alpha) - min(alpha)
+        if covered_range / alpha_range >= 0.4:
+            lift_fct = (
+                lambda x: (lift_coeff[1] - lift_coeff[0]) / (alpha[1] - alpha[0]) * (x - alpha[0])
+                + lift_coeff[0]
+            )
+            delta = np.abs(lift_coeff - lift_fct(alpha))
+            return min(lift_coeff[delta <= 0.3]), False
+
+    _LOGGER.warning(
+        "2D CL min not found, less than 40%% of angle range computed: using default value %f",
+        DEFAULT_2D_CL_MIN,
+    )
+    return DEFAULT_2D_CL_MIN, True
@@ -0,0 +1,75 @@
+"""Dummy XFOIL executable for aerodynamic module tests!"""
+#  This file is part of FAST-OAD_CS23 : A framework for rapid Overall Aircraft Design
+#  Copyright (C) 2022  ONERA & ISAE-SUPAERO
+#  FAST is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# Reads the XFOIL session script on standard input, as the real executable does, and writes a
+# polar result file in the XFOIL format without solving anything: thin airfoil lift slope with a
+# stall above STALL_ANGLE and parabolic drag. Used through the xfoil_exe_path option of XfoilPolar.
+
+import sys
+
+import numpy as np
+
+STALL_ANGLE = 14.0  # in degrees
+_HEADER_LINE_COUNT = 12
+
+
+def read_script(lines):
+    """Returns the reynolds, mach, alpha sequence and result file path of the session script."""
+    lines = [line.strip() for line in lines]
+    reynolds = float(lines[lines.index("RE") + 1])
+    mach = float(lines[lines.index("M") + 1])
+    aseq_idx = lines.index("ASEQ")
+    alpha_start, alpha_end, alpha_step = [
+        float(value) for value in lines[aseq_idx + 1 : aseq_idx + 4]
+    ]
+    result_file_path = lines[lines.index("PACC") + 1]
+
+    return reynolds, mach, (alpha_start, alpha_end, alpha_step), result_file_path
+
+
+def compute_polar(reynolds, mach, alpha_start, alpha_end, alpha_step):
+    """Returns the alpha, CL, CD, CDp and CM vectors of the dummy polar."""
+    alpha = np.arange(alpha_start, alpha_end + alpha_step / 2.0, alpha_step)
+    beta = np.sqrt(1.0 - mach ** 2.0)
+    cl_linear = 2.0 * np.pi * np.radians(alpha) / beta
+    cl_stall = 2.0 * np.pi * np.radians(np.sign(alpha) * STALL_ANGLE) / beta
+    cl = np.where(
+        np.abs(alpha) <= STALL_ANGLE,
+        cl_linear,
+        cl_stall - 0.05 * (alpha - np.sign(alpha) * STALL_ANGLE),
+    )
+    cdp = 0.002 + 0.01 * cl ** 2.0
+    cd = cdp + 0.074 / reynolds ** 0.2
+    cm = -0.02 - 0.01 * cl
+
+    return alpha, cl, cd, cdp, cm
+
+
+def write_polar(result_file_path, reynolds, mach, alpha, cl, cd, cdp, cm):
+    """Writes the polar with the same layout as XFOIL."""
+    header = [""] * _HEADER_LINE_COUNT
+    header[1] = "       XFOIL         Version 6.99 (dummy)"
+    header[3] = " Calculated polar for: Wing"
+    header[8] = " Mach = %7.3f     Re = %9.3f e 6" % (mach, reynolds / 1e6)
+    header[10] = "  alpha    CL        CD       CDp       CM     Top_Xtr  Bot_Xtr"
+    header[11] = "  ------ -------- --------- --------- -------- -------- --------"
+    with open(result_file_path, "w") as file:
+        file.write("\n".join(header) + "\n")
+        for values in zip(alpha, cl, cd, cdp, cm):
+            file.write("  %6.3f %8.4f %9.5f %9.5f %8.4f   1.0000   1.0000\n" % values)
+
+
+if __name__ == "__main__":
+    re, m, alpha_sequence, polar_file_path = read_script(sys.stdin.readlines())
+    write_polar(polar_file_path, re, m, *compute_polar(re, m, *alpha_sequence))
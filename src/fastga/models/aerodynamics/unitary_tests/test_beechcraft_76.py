@@ -52,6 +52,7 @@ from .test_functions import (
     non_equilibrated_cl_cd_polar,
     equilibrated_cl_cd_polar,
     elevator,
+    elevator_sweep,
     cy_beta_fus,
     downwash_gradient,
     lift_aoa_rate_derivative,
@@ -91,6 +92,8 @@ from .test_functions import (
     yaw_moment_yaw_rate_vt,
     yaw_moment_yaw_rate_aircraft,
     polar_ext_folder,
+    polar_batch,
+    polar_interpolation,
 )
 
 XML_FILE = "beechcraft_76.xml"
@@ -176,6 +179,27 @@ def test_polar_with_ext_folder():
     )
 
 
+def test_polar_batch():
+    """Tests concurrent polar execution (dummy XFOIL) @ low speed."""
+    polar_batch(
+        mach=0.1179,
+        reynolds=2746999 * 1.549,
+        wing_airfoil_file="naca63_415.af",
+        htp_airfoil_file="naca0012.af",
+        cl_max_2d=1.5461,
+        cl_min_2d=-1.5461,
+    )
+
+
+def test_polar_interpolation():
+    """Tests the interpolation of saved polars @ several reynolds numbers."""
+    polar_interpolation(
+        "naca63_415_20S",
+        mach=0.1179,
+        reynolds_list=[500000, 1.0e6, 2.2e6, 3.0e6],
+    )
+
+
 @pytest.mark.skipif(
     system() != "Windows" and xfoil_path is None or SKIP_STEPS,
     reason="No XFOIL executable available (or skipped)",
@@ -626,6 +650,11 @@ def test_elevator():
     )
 
 
+def test_elevator_sweep():
+    """Tests elevator contribution computed for several deflection angles at once."""
+    elevator_sweep(XML_FILE, elevator_angles=[-30.0, -25.0, -10.0, 0.0, 5.0, 12.5, 20.0, 25.0])
+
+
 def test_high_lift():
     """Tests high-lift contribution."""
     high_lift(
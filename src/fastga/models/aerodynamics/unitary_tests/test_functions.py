@@ -24,7 +24,9 @@ from platform import system
 from tempfile import TemporaryDirectory
 
 import numpy as np
+import openmdao.api as om
 import pytest
+from openmdao.components.external_code_comp import ExternalCodeComp
 
 from fastga.models.aerodynamics.aerodynamics_high_speed import AerodynamicsHighSpeed
 from fastga.models.aerodynamics.aerodynamics_low_speed import AerodynamicsLowSpeed
@@ -107,6 +109,12 @@ from fastga.models.aerodynamics.external.openvsp.compute_aero_slipstream import
 )
 from fastga.models.aerodynamics.external.vlm import ComputeAEROvlm
 from fastga.models.aerodynamics.external.xfoil import resources
+from fastga.models.aerodynamics.external.xfoil.polar_database import (
+    POLAR_FILE_EXTENSION,
+    PolarDatabase,
+    get_polar_database,
+)
+from fastga.models.aerodynamics.external.xfoil.xfoil_batch import XfoilPolarBatch, compute_polars
 from fastga.models.aerodynamics.external.xfoil.xfoil_polar import XfoilPolar
 from fastga.models.aerodynamics.load_factor import LoadFactor
 from tests.testing_utilities import run_system, get_indep_var_comp, list_inputs
@@ -114,6 +122,7 @@ from tests.xfoil_exe.get_xfoil import get_xfoil_path
 
 RESULTS_FOLDER = pth.join(pth.dirname(__file__), "results")
 DATA_FOLDER = pth.join(pth.dirname(__file__), "data")
+DUMMY_XFOIL_PATH = pth.join(pth.dirname(__file__), "dummy_xfoil.py")
 TMP_SAVE_FOLDER = "test_save"
 xfoil_path = None if system() == "Windows" else get_xfoil_path()
 
@@ -158,7 +167,9 @@ def polar_result_transfer():
 
     tmp_folder = _create_tmp_directory()
 
-    files = glob.iglob(pth.join(resources.__path__[0], "*.csv"))
+    files = glob.glob(pth.join(resources.__path__[0], "*.csv")) + glob.glob(
+        pth.join(resources.__path__[0], "*" + POLAR_FILE_EXTENSION)
+    )
 
     for file in files:
         if os.path.isfile(file):
@@ -176,7 +187,17 @@ def polar_result_retrieve(tmp_folder):
     # Retrieve the polar results set aside during the test duration if there are some [need
     # writing permission]
 
-    files = glob.iglob(pth.join(tmp_folder.name, "*.csv"))
+    # Polar files created during the test would hide the polars of the retrieved .csv files
+    for file in glob.glob(pth.join(resources.__path__[0], "*" + POLAR_FILE_EXTENSION)):
+        # noinspection PyBroadException
+        try:
+            os.remove(file)
+        except:
+            _LOGGER.info("Cannot remove %s file!" % file)
+
+    files = glob.glob(pth.join(tmp_folder.name, "*.csv")) + glob.glob(
+        pth.join(tmp_folder.name, "*" + POLAR_FILE_EXTENSION)
+    )
 
     for file in files:
         if os.path.isfile(file):
@@ -471,6 +492,145 @@ def polar_ext_folder(
     assert np.interp(1.0, cl, cdp) == pytest.approx(cdp_1_low_speed, abs=1e-4)
 
 
+def polar_batch(
+    mach: float,
+    reynolds: float,
+    wing_airfoil_file: str,
+    htp_airfoil_file: str,
+    cl_max_2d: float,
+    cl_min_2d: float,
+):
+    """Tests the concurrent polar computation with the dummy XFOIL executable!"""
+    # Transfer saved polar results to temporary folder
+    tmp_folder = polar_result_transfer()
+
+    polar_options = {
+        "wing_polar": dict(
+            airfoil_file=wing_airfoil_file,
+            alpha_end=20.0,
+            activate_negative_angle=True,
+            xfoil_exe_path=DUMMY_XFOIL_PATH,
+        ),
+        "htp_polar": dict(
+            airfoil_file=htp_airfoil_file,
+            alpha_end=20.0,
+            activate_negative_angle=True,
+            xfoil_exe_path=DUMMY_XFOIL_PATH,
+        ),
+    }
+
+    # Compute the polars with the same polar requested twice
+    polars = compute_polars(
+        [
+            (polar_options["wing_polar"], mach, reynolds),
+            (polar_options["htp_polar"], mach, reynolds),
+            (polar_options["wing_polar"], mach, reynolds),
+        ]
+    )
+    # Polars already computed are not computed again
+    polars_recomputed = compute_polars([(polar_options["wing_polar"], mach, reynolds)])
+
+    # The XfoilPolar components read the polars computed by the batch
+    conditions = ["mach", "reynolds"]
+    ivc = om.IndepVarComp()
+    ivc.add_output("mach", mach)
+    ivc.add_output("reynolds", reynolds)
+    model = om.Group()
+    model.add_subsystem(
+        "polars_computation",
+        XfoilPolarBatch(polars=polar_options),
+        promotes=[(name + ":xfoil:" + var, var) for name in polar_options for var in conditions],
+    )
+    for name, options in polar_options.items():
+        model.add_subsystem(
+            name, XfoilPolar(**options), promotes=[("xfoil:" + var, var) for var in conditions]
+        )
+    problem = run_system(model, ivc)
+
+    # A polar not computed by the batch is computed by the component through the
+    # ExternalCodeComp machinery
+    ivc = om.IndepVarComp()
+    ivc.add_output("xfoil:mach", mach)
+    ivc.add_output("xfoil:reynolds", 2.0 * reynolds)
+    component = XfoilPolar(**polar_options["wing_polar"])
+    problem_component = run_system(component, ivc)
+
+    # Retrieve polar results from temporary folder
+    polar_result_retrieve(tmp_folder)
+
+    # Check obtained value(s) is/(are) correct
+    assert isinstance(component, ExternalCodeComp)
+    assert component.options["command"][-1] == DUMMY_XFOIL_PATH
+    assert component.return_code == 0
+    assert problem_component["xfoil:CL_max_2D"] == pytest.approx(cl_max_2d, abs=1e-4)
+    assert len(polars) == 2
+    assert polars_recomputed == []
+    assert problem["wing_polar.xfoil:CL_max_2D"] == pytest.approx(cl_max_2d, abs=1e-4)
+    assert problem["wing_polar.xfoil:CL_min_2D"] == pytest.approx(cl_min_2d, abs=1e-4)
+    assert problem["htp_polar.xfoil:CL"] == pytest.approx(polars[1]["cl"], abs=1e-4)
+
+
+def polar_interpolation(polar_file_name: str, mach: float, reynolds_list: list):
+    """Tests the interpolation of the saved polars at several reynolds numbers at once!"""
+    database = get_polar_database(
+        pth.join(resources.__path__[0], polar_file_name + POLAR_FILE_EXTENSION)
+    )
+    interpolator = database.get_interpolator(mach)
+    polars = interpolator.interpolate(reynolds_list)
+    assert np.all(np.diff(interpolator.alpha) > 0.0)
+    assert np.shape(polars["cl"]) == (len(reynolds_list), len(interpolator.alpha))
+
+    # A saved (mach, reynolds) returns the saved polar unchanged
+    polar = database.get_polar(database.mach[0], database.reynolds[0])
+    assert polar["cl_max_2d"] == pytest.approx(database.cl_max_2d[0], abs=1e-12)
+    for label in ["alpha", "cl", "cd", "cdp", "cm"]:
+        assert np.array_equal(polar[label], database.polars[0][label])
+
+    # Bilinear interpolation between polars saved at two mach and two reynolds numbers, with
+    # cl = cl_0 + 0.1 * alpha and a constant cd
+    database = PolarDatabase()
+    database.mach = np.array([0.10, 0.10, 0.12, 0.12])
+    database.reynolds = np.array([1.0e6, 2.0e6, 1.0e6, 2.0e6])
+    database.cl_max_2d = np.array([1.0, 1.2, 1.4, 1.8])
+    database.cl_min_2d = -database.cl_max_2d
+    for cl_0, cd, alpha_end in zip(
+        [0.0, 0.2, 0.4, 0.8], [0.010, 0.008, 0.012, 0.009], [4, 4, 4, 5]
+    ):
+        alpha = np.arange(0.0, alpha_end + 1.0)
+        database.polars.append(
+            {
+                "alpha": alpha,
+                "cl": cl_0 + 0.1 * alpha,
+                "cd": np.full_like(alpha, cd),
+                "cdp": np.full_like(alpha, cd / 2.0),
+                "cm": np.full_like(alpha, -0.05),
+            }
+        )
+
+    # At mach 0.105 and reynolds 1.25e6 the lower mach and reynolds numbers both weight 0.75
+    polar = database.get_polar(0.105, 1.25e6)
+    assert polar["cl_max_2d"] == pytest.approx(1.1625, abs=1e-12)
+    assert polar["cl_min_2d"] == pytest.approx(-1.1625, abs=1e-12)
+    # Angle of attack 5° has only been computed in one of the polars
+    assert polar["alpha"] == pytest.approx([0.0, 1.0, 2.0, 3.0, 4.0], abs=1e-12)
+    assert polar["cl"] == pytest.approx(0.1625 + 0.1 * polar["alpha"], abs=1e-12)
+    assert polar["cd"] == pytest.approx(np.full(5, 0.0099375), abs=1e-12)
+    assert polar["cm"] == pytest.approx(np.full(5, -0.05), abs=1e-12)
+
+    # Several reynolds numbers at once, out of range ones are not available
+    polars = database.get_interpolator(0.105).interpolate([1.25e6, 2.0e6, 3.0e6])
+    assert polars["cl_max_2d"][:2] == pytest.approx([1.1625, 1.35], abs=1e-12)
+    assert np.isnan(polars["cl_max_2d"][2])
+    assert polars["cl"][1, :5] == pytest.approx(0.35 + 0.1 * np.arange(5.0), abs=1e-12)
+    assert np.isnan(polars["cl"][1, 5])
+
+    # A saved (mach, reynolds) is not interpolated, even with angles missing in the others
+    polar = database.get_polar(0.12, 2.0e6)
+    assert polar["cl_max_2d"] == pytest.approx(1.8, abs=1e-12)
+    assert np.array_equal(polar["alpha"], np.arange(0.0, 6.0))
+    assert np.array_equal(polar["cl"], 0.8 + 0.1 * np.arange(0.0, 6.0))
+
+
 def airfoil_slope_wt_xfoil(
     XML_FILE: str,
     wing_airfoil_file: str,
@@ -821,6 +981,24 @@ def elevator(
     ) == pytest.approx(cd_delta_elev, abs=1e-4)
 
 
+def elevator_sweep(XML_FILE: str, elevator_angles: list):
+    """Tests the elevator lift increment computed for several deflection angles at once!"""
+    ivc = get_indep_var_comp(list_inputs(ComputeDeltaElevator()), __file__, XML_FILE)
+    problem = run_system(ComputeDeltaElevator(), ivc)
+    inputs = {name: problem.get_val(name) for name in list_inputs(ComputeDeltaElevator())}
+
+    # noinspection PyProtectedMember
+    cl_delta_elev = ComputeDeltaElevator()._get_elevator_delta_cl(inputs, np.array(elevator_angles))
+    assert np.shape(cl_delta_elev) == (len(elevator_angles),)
+
+    # Same values as when computed angle by angle
+    for idx, elevator_angle in enumerate(elevator_angles):
+        # noinspection PyProtectedMember
+        assert ComputeDeltaElevator()._get_elevator_delta_cl(
+            inputs, elevator_angle
+        ) == pytest.approx(cl_delta_elev[idx], rel=1e-9)
+
+
 def high_lift(
     XML_FILE: str,
     delta_cl0_landing: float,
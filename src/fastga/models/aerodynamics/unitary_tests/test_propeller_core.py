@@ -0,0 +1,159 @@
+"""Test module for the blade element resolution of the propeller performance"""
+#  This file is part of FAST-OAD_CS23 : A framework for rapid Overall Aircraft Design
+#  Copyright (C) 2022  ONERA & ISAE-SUPAERO
+#  FAST is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import numpy as np
+import openmdao.api as om
+import pytest
+
+from tests.testing_utilities import run_system
+from ..constants import POLAR_POINT_COUNT
+from ..external.propeller_code.compute_propeller_aero import _ComputePropellerPerformance
+from ..external.propeller_code.propeller_core import PropellerCoreModule, _solve_element_speeds
+
+ELEMENTS_NUMBER = 5
+GEOMETRY_INPUTS = {
+    "reference_reynolds": np.array([1.0e6]),
+    "data:geometry:propeller:diameter": np.array([1.98]),
+    "data:geometry:propeller:hub_diameter": np.array([0.4]),
+    "data:geometry:propeller:blades_number": np.array([3.0]),
+    "data:geometry:propeller:sweep_vect": np.zeros(4),
+    "data:geometry:propeller:chord_vect": np.array([0.11, 0.16, 0.16, 0.09]),
+    "data:geometry:propeller:twist_vect": np.array([20.0, 15.0, 10.0, 5.0]),
+    "data:geometry:propeller:radius_ratio_vect": np.array([0.2, 0.5, 0.75, 1.0]),
+}
+
+
+def _get_blade_elements():
+    """Returns the radius and polars of the blade elements, with a thin airfoil polar."""
+    radius_min = GEOMETRY_INPUTS["data:geometry:propeller:hub_diameter"][0] / 2.0
+    radius_max = GEOMETRY_INPUTS["data:geometry:propeller:diameter"][0] / 2.0
+    element_length = (radius_max - radius_min) / ELEMENTS_NUMBER
+    radius = radius_min + (np.arange(ELEMENTS_NUMBER) + 0.5) * element_length
+
+    alpha = np.linspace(-20.0, 20.0, 81)
+    cl = np.clip(2.0 * np.pi * np.radians(alpha), -1.4, 1.4)
+    cd = 0.008 + 0.01 * cl ** 2.0
+    alpha_list = np.tile(alpha, (ELEMENTS_NUMBER, 1))
+    cl_list = np.tile(cl, (ELEMENTS_NUMBER, 1))
+    cd_list = np.tile(cd, (ELEMENTS_NUMBER, 1))
+
+    return radius, alpha_list, cl_list, cd_list
+
+
+def test_pitch_performance_batch():
+    """Tests that the performance of several conditions at once match the one by one results."""
+    propeller = PropellerCoreModule(
+        sections_profile_position_list=[],
+        sections_profile_name_list=[],
+        elements_number=ELEMENTS_NUMBER,
+    )
+    radius, alpha_list, cl_list, cd_list = _get_blade_elements()
+    theta_75 = np.array([15.0, 20.0, 25.0, 30.0, 35.0, 25.0])
+    v_inf = np.array([20.0, 40.0, 50.0, 60.0, 80.0, 5.0])
+
+    thrust, eta, torque = propeller.compute_pitch_performance(
+        GEOMETRY_INPUTS, theta_75, v_inf, 1000.0, 2500.0, radius, alpha_list, cl_list, cd_list
+    )
+
+    assert np.shape(thrust) == (len(theta_75),)
+    assert np.all(np.isfinite(thrust))
+    for idx, (local_theta_75, local_v_inf) in enumerate(zip(theta_75, v_inf)):
+        local_thrust, local_eta, local_torque = propeller.compute_pitch_performance(
+            GEOMETRY_INPUTS,
+            local_theta_75,
+            local_v_inf,
+            1000.0,
+            2500.0,
+            radius,
+            alpha_list,
+            cl_list,
+            cd_list,
+        )
+        assert isinstance(local_thrust, float)
+        assert thrust[idx] == pytest.approx(local_thrust, rel=1e-6)
+        assert eta[idx] == pytest.approx(local_eta, rel=1e-6)
+        assert torque[idx] == pytest.approx(local_torque, rel=1e-6)
+
+
+def test_solve_element_speeds():
+    """Tests the batched Newton method with converging, non-converging and stalled elements."""
+    # x_0 ** 2 = a and x_1 = x_0, without solution for a < 0. The first residual of the third
+    # element does not depend on the speeds, so that its jacobian is singular
+    square = np.array([4.0, -1.0, np.nan, 9.0])
+    evaluated_points = []
+
+    def function(speed_vect, points):
+        evaluated_points.append(points.copy())
+        return np.array(
+            [
+                np.where(np.isnan(square[points]), 1.0, speed_vect[0] ** 2.0 - square[points]),
+                speed_vect[1] - speed_vect[0],
+            ]
+        )
+
+    x_0 = np.array([[1.0, 1.0, 0.0, 3.5], [1.0, 1.0, 0.0, 0.0]])
+    speed_vect = _solve_element_speeds(function, x_0, xtol=1e-8)
+
+    assert speed_vect[:, 0] == pytest.approx([2.0, 2.0], rel=1e-8)
+    assert speed_vect[:, 3] == pytest.approx([3.0, 3.0], rel=1e-8)
+    # Stalled element keeps its initial point and is no longer evaluated after the first step
+    assert np.array_equal(speed_vect[:, 2], [0.0, 0.0])
+    assert sum(2 in points for points in evaluated_points) <= 4
+    # Non-converging element returns the last iterate, which reduced the residuals
+    assert np.all(np.isfinite(speed_vect[:, 1]))
+    residuals = function(speed_vect, np.arange(4))
+    assert np.sum(residuals[:, 1] ** 2.0) < np.sum(function(x_0, np.arange(4))[:, 1] ** 2.0)
+
+    # Iterations are bounded when some elements never converge
+    evaluated_points.clear()
+    _solve_element_speeds(function, x_0, xtol=1e-8, max_iter=5)
+    assert len(evaluated_points) <= 1 + 5 * (3 + 20)
+
+
+def test_tables_worker_count():
+    """Tests that the propeller tables do not depend on the number of processes."""
+    ivc = om.IndepVarComp()
+    for name, value in GEOMETRY_INPUTS.items():
+        ivc.add_output(name, val=value)
+    ivc.add_output("data:geometry:propeller:average_rpm", val=2500.0, units="rpm")
+    ivc.add_output("data:mission:sizing:main_route:cruise:altitude", val=2400.0, units="m")
+    ivc.add_output("data:TLAR:v_cruise", val=80.0, units="m/s")
+    _, alpha_list, cl_list, cd_list = _get_blade_elements()
+    alpha = np.zeros(POLAR_POINT_COUNT)
+    alpha[: len(alpha_list[0])] = alpha_list[0]
+    ivc.add_output("thin_polar:alpha", val=alpha, units="deg")
+    ivc.add_output("thin_polar:CL", val=np.resize(cl_list[0], POLAR_POINT_COUNT))
+    ivc.add_output("thin_polar:CD", val=np.resize(cd_list[0], POLAR_POINT_COUNT))
+
+    tables = []
+    for max_workers in [1, 3]:
+        problem = run_system(
+            _ComputePropellerPerformance(
+                sections_profile_position_list=[0.0],
+                sections_profile_name_list=["thin"],
+                elements_number=ELEMENTS_NUMBER,
+                max_workers=max_workers,
+            ),
+            ivc,
+        )
+        tables.append(
+            {
+                name: problem.get_val(name).copy()
+                for name, _ in problem.model.component.list_outputs(out_stream=None)
+            }
+        )
+
+    assert np.all(np.isfinite(tables[0]["data:aerodynamics:propeller:cruise_level:efficiency"]))
+    for name, value in tables[0].items():
+        assert np.array_equal(value, tables[1][name]), name
@@ -0,0 +1,106 @@
+"""Test module for the storage of VLM and OpenVSP results"""
+#  This file is part of FAST-OAD_CS23 : A framework for rapid Overall Aircraft Design
+#  Copyright (C) 2022  ONERA & ISAE-SUPAERO
+#  FAST is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import multiprocessing
+import os
+import os.path as pth
+from tempfile import TemporaryDirectory
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from ..external import result_store
+from ..external.result_store import AeroResultStore, GEOMETRY_SET_LABELS
+
+LABELS = ["cl_0_wing", "y_vector_wing"]
+
+
+def _geometry_set(idx: int, area_ratio: float = 0.2) -> np.ndarray:
+    return np.array([0.0, 0.5, 8.0 + idx, 0.0, 0.0, 0.0, 0.6, 4.5, 0.2, area_ratio])
+
+
+def _results(idx: int) -> dict:
+    return {"cl_0_wing": np.array(0.1 * idx), "y_vector_wing": np.linspace(0.0, 5.0, 4) + idx}
+
+
+def _save_results(folder_path: str, first_idx: int, count: int):
+    """Saves results for count geometries, used as the target of a writer process."""
+    store = AeroResultStore(folder_path, "vlm", LABELS)
+    for idx in range(first_idx, first_idx + count):
+        store.save(_geometry_set(idx), _results(idx))
+
+
+def test_legacy_import():
+    """Tests that results saved with the former one-file-per-geometry format are imported."""
+    with TemporaryDirectory() as folder_path:
+        # Legacy files are written the way the former VLM code did
+        for idx in range(2):
+            pd.DataFrame(_geometry_set(idx), index=GEOMETRY_SET_LABELS).to_csv(
+                pth.join(folder_path, "geometry_" + str(idx) + ".csv")
+            )
+            results = _results(idx)
+            pd.DataFrame(
+                [float(results["cl_0_wing"]), results["y_vector_wing"].tolist()], index=LABELS
+            ).to_csv(pth.join(folder_path, "vlm_" + str(idx) + ".csv"))
+        # Geometry whose computation was interrupted before its results were saved
+        pd.DataFrame(_geometry_set(2), index=GEOMETRY_SET_LABELS).to_csv(
+            pth.join(folder_path, "geometry_2.csv")
+        )
+
+        result_store._LOADED_STORES.clear()  # pylint: disable=protected-access
+        store = AeroResultStore(folder_path, "vlm", LABELS, legacy_prefix="vlm")
+
+        # Area ratio is not part of the key, the saved one is returned for scaling
+        saved_results, saved_area_ratio = store.search(_geometry_set(1, area_ratio=0.3))
+        assert saved_area_ratio == pytest.approx(0.2, abs=1e-12)
+        assert saved_results["cl_0_wing"] == pytest.approx(0.1, abs=1e-12)
+        assert saved_results["y_vector_wing"] == pytest.approx(
+            _results(1)["y_vector_wing"], abs=1e-12
+        )
+        assert store.search(_geometry_set(2))[0] is None
+        assert pth.exists(store.file_path)
+
+        # Imported results are now read from the store file only
+        for file_name in os.listdir(folder_path):
+            if file_name.endswith(".csv"):
+                os.remove(pth.join(folder_path, file_name))
+        result_store._LOADED_STORES.clear()  # pylint: disable=protected-access
+        store = AeroResultStore(folder_path, "vlm", LABELS, legacy_prefix="vlm")
+        saved_results, _ = store.search(_geometry_set(0))
+        assert saved_results["cl_0_wing"] == pytest.approx(0.0, abs=1e-12)
+        assert store.search(_geometry_set(1))[0] is not None
+
+
+def test_concurrent_writers():
+    """Tests that results saved by several processes in the same folder are all kept."""
+    with TemporaryDirectory() as folder_path:
+        result_store._LOADED_STORES.clear()  # pylint: disable=protected-access
+        writers = [
+            multiprocessing.Process(target=_save_results, args=(folder_path, 20 * idx, 20))
+            for idx in range(2)
+        ]
+        for writer in writers:
+            writer.start()
+        for writer in writers:
+            writer.join()
+        assert [writer.exitcode for writer in writers] == [0, 0]
+
+        store = AeroResultStore(folder_path, "vlm", LABELS)
+        for idx in range(40):
+            saved_results, _ = store.search(_geometry_set(idx))
+            assert saved_results is not None
+            assert saved_results["y_vector_wing"] == pytest.approx(
+                _results(idx)["y_vector_wing"], abs=1e-12
+            )
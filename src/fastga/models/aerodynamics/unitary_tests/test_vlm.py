@@ -0,0 +1,96 @@
+"""Test module for the VLM mesh and influence coefficients"""
+#  This file is part of FAST-OAD_CS23 : A framework for rapid Overall Aircraft Design
+#  Copyright (C) 2022  ONERA & ISAE-SUPAERO
+#  FAST is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import numpy as np
+import pytest
+
+from ..external.vlm.vlm import VLMSimpleGeometry
+
+GEOMETRY_INPUTS = {
+    "data:geometry:wing:kink:span_ratio": np.array([0.0]),
+    "data:geometry:wing:root:y": np.array([0.6]),
+    "data:geometry:wing:span": np.array([11.0]),
+    "data:geometry:wing:root:chord": np.array([1.5]),
+    "data:geometry:wing:tip:chord": np.array([0.9]),
+    "data:geometry:flap:span_ratio": np.array([0.6]),
+    "data:geometry:horizontal_tail:span": np.array([3.8]),
+    "data:geometry:horizontal_tail:root:chord": np.array([0.9]),
+    "data:geometry:horizontal_tail:tip:chord": np.array([0.6]),
+}
+
+
+def _loop_influence_coefficients(dictionary, n_panels):
+    """Reference aic matrices computed panel by panel, as done before vectorization."""
+    x_c = dictionary["x_c"]
+    y_c = dictionary["yc"]
+    x_1 = dictionary["x1"]
+    y_1 = dictionary["y1"]
+    x_2 = dictionary["x2"]
+    y_2 = dictionary["y2"]
+    aic = np.zeros((n_panels, n_panels))
+    aic_wake = np.zeros((n_panels, n_panels))
+    # Right side vortices then left side vortices
+    for offset in [0, n_panels]:
+        for i in range(n_panels):
+            for j in range(n_panels):
+                coeff_1 = x_c[i] - x_1[offset + j]
+                coeff_2 = y_c[i] - y_1[offset + j]
+                coeff_3 = x_c[i] - x_2[offset + j]
+                coeff_4 = y_c[i] - y_2[offset + j]
+                coeff_5 = np.sqrt(coeff_1 ** 2 + coeff_2 ** 2)
+                coeff_6 = np.sqrt(coeff_3 ** 2 + coeff_4 ** 2)
+                coeff_7 = x_2[offset + j] - x_1[offset + j]
+                coeff_8 = y_2[offset + j] - y_1[offset + j]
+                coeff_9 = (coeff_7 * coeff_1 + coeff_8 * coeff_2) / coeff_5 - (
+                    coeff_7 * coeff_3 + coeff_8 * coeff_4
+                ) / coeff_6
+                coeff_10 = (1 + coeff_3 / coeff_6) / coeff_4 - (1 + coeff_1 / coeff_5) / coeff_2
+                if coeff_1 * coeff_4 - coeff_2 * coeff_3 != 0:
+                    aic[i, j] += (coeff_9 / (coeff_1 * coeff_4 - coeff_2 * coeff_3)) / (4 * np.pi)
+                aic_wake[i, j] += coeff_10 / (4 * np.pi)
+                aic[i, j] += coeff_10 / (4 * np.pi)
+
+    return aic, aic_wake
+
+
+@pytest.mark.parametrize("kink_span_ratio", [0.0, 0.3])
+def test_influence_coefficients(kink_span_ratio):
+    """Tests the vectorized aic matrices against the panel by panel computation."""
+    component = VLMSimpleGeometry(
+        chordwise_panel_count=3, inner_spanwise_panel_count=2, outer_spanwise_panel_count=8
+    )
+    inputs = dict(GEOMETRY_INPUTS)
+    inputs["data:geometry:wing:kink:span_ratio"] = np.array([kink_span_ratio])
+    component._run(inputs)  # pylint: disable=protected-access
+
+    n_panels = component.n_x * component.n_y
+    for dictionary in [component.wing, component.htp]:
+        aic_ref, aic_wake_ref = _loop_influence_coefficients(dictionary, n_panels)
+        assert dictionary["aic"] == pytest.approx(aic_ref, rel=1e-12, abs=1e-12)
+        assert dictionary["aic_wake"] == pytest.approx(aic_wake_ref, rel=1e-12, abs=1e-12)
+
+
+def test_panel_count_bounds():
+    """Tests that meshes too coarse to be generated are rejected."""
+    with pytest.raises(ValueError):
+        VLMSimpleGeometry(chordwise_panel_count=0)
+    with pytest.raises(ValueError):
+        VLMSimpleGeometry(outer_spanwise_panel_count=1)
+
+    # The kinked wing moves 5 of the outer panels to the straight section
+    component = VLMSimpleGeometry(outer_spanwise_panel_count=6)
+    inputs = dict(GEOMETRY_INPUTS)
+    inputs["data:geometry:wing:kink:span_ratio"] = np.array([0.3])
+    with pytest.raises(ValueError):
+        component._run(inputs)  # pylint: disable=protected-access
@@ -0,0 +1,93 @@
+"""
+Test the shear and bending moment diagrams integration of the load_analysis module.
+"""
+#  This file is part of FAST-OAD_CS23 : A framework for rapid Overall Aircraft Design
+#  Copyright (C) 2022  ONERA & ISAE-SUPAERO
+#  FAST is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import numpy as np
+from scipy.integrate import trapz
+
+from ..wing.aerostructural_loads import AerostructuralLoad
+
+# Unevenly spaced stations with a repeated one, as the added point masses create
+Y_VECTOR = np.array([0.0, 0.3, 0.9, 1.5, 1.5, 2.2, 3.1, 4.0, 5.2])
+FORCE_ARRAYS = np.array(
+    [
+        np.linspace(600.0, 150.0, len(Y_VECTOR)),
+        np.sin(Y_VECTOR) * 300.0 - 120.0,
+        np.array([-80.0, -75.0, -70.0, -900.0, -900.0, -60.0, -50.0, -40.0, -30.0]),
+    ]
+)
+
+
+def _trapz_shear_diagram(y_vector, force_array):
+    return np.array([trapz(force_array[i:], y_vector[i:]) for i in range(len(y_vector))])
+
+
+def _trapz_bending_moment_diagram(y_vector, force_array):
+    return np.array(
+        [
+            trapz(force_array[i:] * (y_vector[i:] - y_vector[i]), y_vector[i:])
+            for i in range(len(y_vector))
+        ]
+    )
+
+
+def test_reverse_cumulative_sum():
+    segment_array = np.array([[1.0, 2.0, 3.0], [-1.0, 0.5, 4.0]])
+
+    np.testing.assert_allclose(
+        AerostructuralLoad.reverse_cumulative_sum(segment_array[0]), [6.0, 5.0, 3.0, 0.0]
+    )
+    np.testing.assert_allclose(
+        AerostructuralLoad.reverse_cumulative_sum(segment_array),
+        [[6.0, 5.0, 3.0, 0.0], [3.5, 4.5, 4.0, 0.0]],
+    )
+
+
+def test_diagrams_match_station_integrals():
+    # The diagrams of one distribution and of stacked distributions must match the integral of
+    # the forces on the subsequent stations computed station by station
+    for force_array in FORCE_ARRAYS:
+        np.testing.assert_allclose(
+            AerostructuralLoad.compute_shear_diagram(Y_VECTOR, force_array),
+            _trapz_shear_diagram(Y_VECTOR, force_array),
+            rtol=1e-12,
+            atol=1e-9,
+        )
+        np.testing.assert_allclose(
+            AerostructuralLoad.compute_bending_moment_diagram(Y_VECTOR, force_array),
+            _trapz_bending_moment_diagram(Y_VECTOR, force_array),
+            rtol=1e-12,
+            atol=1e-9,
+        )
+
+    np.testing.assert_allclose(
+        AerostructuralLoad.compute_shear_diagram(Y_VECTOR, FORCE_ARRAYS),
+        [_trapz_shear_diagram(Y_VECTOR, force_array) for force_array in FORCE_ARRAYS],
+        rtol=1e-12,
+        atol=1e-9,
+    )
+    np.testing.assert_allclose(
+        AerostructuralLoad.compute_bending_moment_diagram(Y_VECTOR, FORCE_ARRAYS),
+        [_trapz_bending_moment_diagram(Y_VECTOR, force_array) for force_array in FORCE_ARRAYS],
+        rtol=1e-12,
+        atol=1e-9,
+    )
+
+
+def test_find_max_case():
+    # The first of the cases with the largest absolute root value is kept, whatever their sign
+    assert AerostructuralLoad.find_max_case(np.array([100.0, -250.0, 250.0, 30.0])) == 1
+    assert AerostructuralLoad.find_max_case(np.array([250.0, 100.0, -250.0])) == 0
+    assert AerostructuralLoad.find_max_case(np.array([10.0, 20.0, 20.0, 20.0])) == 1
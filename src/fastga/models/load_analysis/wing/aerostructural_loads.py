@@ -210,14 +210,9 @@ class AerostructuralLoad(om.ExplicitComponent):
         v_c = inputs["data:mission:sizing:cs23:characteristic_speed:vc"]
 
         factor_of_safety = float(inputs["data:mission:sizing:cs23:safety_factor"])
-        shear_max_conditions = []
-        rbm_max_conditions = []
 
         atm = Atmosphere(cruise_alt)
 
-        shear_max = 0.0
-        rbm_max = 0.0
-
         # STEP 2/XX - DELETE THE ADDITIONAL ZEROS WE HAD TO PUT TO FIT OPENMDAO AND ADD A POINT
         # AT THE ROOT (Y=0) AND AT THE VERY TIP (Y=SPAN/2) TO GET THE WHOLE SPAN OF THE WING IN
         # THE INTERPOLATION WE WILL DO LATER
@@ -254,15 +249,13 @@ class AerostructuralLoad(om.ExplicitComponent):
             y_vector_slip_orig, y_vector_orig, y_vector, cl_vector_slip, chord_vector
         )
 
-        lift_shear_diagram = np.full(len(y_vector), 0.0)
-        lift_bending_diagram = np.full(len(y_vector), 0.0)
-        weight_shear_diagram = np.full(len(y_vector), 0.0)
-        weight_bending_diagram = np.full(len(y_vector), 0.0)
-
         # STEP 4/XX - WE INITIALIZE THE LOOPS ON THE DIFFERENT SIZING CASE THAT WE DEFINED AND
-        # THEN LAUNCH THEM
+        # COMPUTE THE LIFT AND WEIGHT OF EACH OF THEM
 
         mass_tag_array = ["mtow", "mzfw"]
+        conditions = []
+        lift_sections = []
+        weight_arrays = []
 
         for mass_tag in mass_tag_array:
 
@@ -310,38 +303,33 @@ class AerostructuralLoad(om.ExplicitComponent):
                 )
                 weight_array = weight_array_orig * factor_of_safety * load_factor
 
-                # STEP 4.3/XX - WE COMPUTE THE SHEAR AND WEIGHT DIAGRAM WITH THE APPROPRIATE
-                # FUNCTION, IDENTIFY THE MOST EXTREME CONSTRAINTS AND SAVE THE CONDITIONS IN
-                # WHICH THEY ARE EXPERIENCED FOR LATER USE IN THE POST-PROCESSING PHASE
+                conditions.append([mass, load_factor])
+                lift_sections.append(lift_section)
+                weight_arrays.append(weight_array)
+
+        # STEP 4.3/XX - WE COMPUTE THE SHEAR AND WEIGHT DIAGRAM OF ALL CASES AT ONCE WITH THE
+        # APPROPRIATE FUNCTION, IDENTIFY THE MOST EXTREME CONSTRAINTS AND SAVE THE CONDITIONS IN
+        # WHICH THEY ARE EXPERIENCED FOR LATER USE IN THE POST-PROCESSING PHASE
+
+        # Lines are the total forces, the lift and the weight of each case
+        cases_number = len(conditions)
+        lift_sections = np.array(lift_sections)
+        weight_arrays = np.array(weight_arrays)
+        force_arrays = np.concatenate((weight_arrays + lift_sections, lift_sections, weight_arrays))
+        shear_diagrams = AerostructuralLoad.compute_shear_diagram(y_vector, force_arrays)
+        bending_moment_diagrams = AerostructuralLoad.compute_bending_moment_diagram(
+            y_vector, force_arrays
+        )
+
+        shear_max_idx = AerostructuralLoad.find_max_case(shear_diagrams[:cases_number, 0])
+        shear_max_conditions = conditions[shear_max_idx]
+        lift_shear_diagram = shear_diagrams[cases_number + shear_max_idx]
+        weight_shear_diagram = shear_diagrams[2 * cases_number + shear_max_idx]
 
-                tot_shear_diagram = AerostructuralLoad.compute_shear_diagram(
-                    y_vector, weight_array + lift_section
-                )
-                tot_bending_moment_diagram = AerostructuralLoad.compute_bending_moment_diagram(
-                    y_vector, weight_array + lift_section
-                )
-                root_shear_force = tot_shear_diagram[0]
-                root_bending_moment = tot_bending_moment_diagram[0]
-
-                if abs(root_shear_force) > shear_max:
-                    shear_max_conditions = [mass, load_factor]
-                    lift_shear_diagram = AerostructuralLoad.compute_shear_diagram(
-                        y_vector, lift_section
-                    )
-                    weight_shear_diagram = AerostructuralLoad.compute_shear_diagram(
-                        y_vector, weight_array
-                    )
-                    shear_max = abs(root_shear_force)
-
-                if abs(root_bending_moment) > rbm_max:
-                    rbm_max_conditions = [mass, load_factor]
-                    lift_bending_diagram = AerostructuralLoad.compute_bending_moment_diagram(
-                        y_vector, lift_section
-                    )
-                    weight_bending_diagram = AerostructuralLoad.compute_bending_moment_diagram(
-                        y_vector, weight_array
-                    )
-                    rbm_max = abs(root_bending_moment)
+        rbm_max_idx = AerostructuralLoad.find_max_case(bending_moment_diagrams[:cases_number, 0])
+        rbm_max_conditions = conditions[rbm_max_idx]
+        lift_bending_diagram = bending_moment_diagrams[cases_number + rbm_max_idx]
+        weight_bending_diagram = bending_moment_diagrams[2 * cases_number + rbm_max_idx]
 
         # STEP 5/XX - WE ADD ZEROS TO THE RESULTS ARRAYS TO MAKE THEM FIT THE OPENMDAO FORMAT
 
@@ -372,20 +360,18 @@ class AerostructuralLoad(om.ExplicitComponent):
 
         @param y_vector: an array containing the position of the different station at which the
         linear forces are given
-        @param force_array: an array containing the linear forces
+        @param force_array: an array containing the linear forces, or a 2D array containing
+        several of them as lines
         @return: shear_force_diagram an array representing the shear diagram of the linear forces
-        given in input
+        given in input, with the same shape as force_array
         """
 
-        # We first create the array to fill
-        shear_force_diagram = np.zeros(len(y_vector))
-
         # Each station of the shear diagram is equal to the integral of the forces on all
-        # subsequent station
-        for i, _ in enumerate(y_vector):
-            shear_force_diagram[i] = trapz(force_array[i:], y_vector[i:])
+        # subsequent station, that is to say the sum of the trapezoids of the subsequent intervals
+        force_array = np.asarray(force_array, dtype=float)
+        segment_shear = 0.5 * (force_array[..., 1:] + force_array[..., :-1]) * np.diff(y_vector)
 
-        return shear_force_diagram
+        return AerostructuralLoad.reverse_cumulative_sum(segment_shear)
 
     @staticmethod
     def compute_bending_moment_diagram(y_vector, force_array):
@@ -394,22 +380,52 @@ class AerostructuralLoad(om.ExplicitComponent):
 
         @param y_vector: an array containing the position of the different station at which the
         linear forces are given
-        @param force_array: an array containing the linear forces
+        @param force_array: an array containing the linear forces, or a 2D array containing
+        several of them as lines
         @return: bending_moment_diagram an array representing the root bending diagram of the
-        linear forces given in
-        input
+        linear forces given in input, with the same shape as force_array
         """
 
-        # We first create the array to fill
-        bending_moment_diagram = np.zeros(len(y_vector))
-
         # Each station of the shear diagram is equal to the root bending moment created by all
-        # subsequent stations
-        for i, _ in enumerate(y_vector):
-            lever_arm = y_vector - y_vector[i]
-            bending_moment_diagram[i] = trapz(force_array[i:] * lever_arm[i:], y_vector[i:])
+        # subsequent stations. Since the lever arm of station i is y - y[i], this moment is the
+        # integral of the moments of the forces around the root minus y[i] times the shear force
+        force_array = np.asarray(force_array, dtype=float)
+        moment_array = force_array * y_vector
+        segment_moment = 0.5 * (moment_array[..., 1:] + moment_array[..., :-1]) * np.diff(y_vector)
+
+        return AerostructuralLoad.reverse_cumulative_sum(
+            segment_moment
+        ) - y_vector * AerostructuralLoad.compute_shear_diagram(y_vector, force_array)
+
+    @staticmethod
+    def find_max_case(root_values):
+        """
+        Function that finds the case with the largest root value in absolute value
+
+        @param root_values: an array containing the root value of each case
+        @return: the index of the first case with the largest absolute value, so that a later case
+        has to be strictly larger to be kept
+        """
+
+        return int(np.argmax(np.abs(root_values)))
+
+    @staticmethod
+    def reverse_cumulative_sum(segment_array):
+        """
+        Function that sums the values of the intervals that follow each station
+
+        @param segment_array: an array containing the value of each interval between two stations,
+        along its last dimension
+        @return: an array with one more value along its last dimension, the sum of the intervals
+        after each station, which is 0 at the last station
+        """
+
+        cumulative_array = np.zeros(
+            np.shape(segment_array)[:-1] + (np.shape(segment_array)[-1] + 1,)
+        )
+        cumulative_array[..., :-1] = np.cumsum(segment_array[..., ::-1], axis=-1)[..., ::-1]
 
-        return bending_moment_diagram
+        return cumulative_array
 
     @staticmethod
     def compute_cl_s(y_vector_cl_orig, y_vector_chord_orig, y_vector, cl_list, chord_list):
@@ -198,15 +198,15 @@ class StructuralLoads(om.ExplicitComponent):
             "data:loads:structure:ultimate:force_distribution:point_mass"
         ] = point_mass_array_outputs
 
-        point_shear_array = AerostructuralLoad.compute_shear_diagram(
-            y_vector, load_factor_shear * point_mass_array_orig
-        )
-        wing_shear_array = AerostructuralLoad.compute_shear_diagram(
-            y_vector, load_factor_shear * wing_mass_array_orig
-        )
-        fuel_shear_array = AerostructuralLoad.compute_shear_diagram(
-            y_vector, load_factor_shear * fuel_mass_array_orig
+        # The diagrams of the point masses, the wing and the fuel are computed at once
+        mass_arrays_orig = np.array(
+            [point_mass_array_orig, wing_mass_array_orig, fuel_mass_array_orig]
         )
+        (
+            point_shear_array,
+            wing_shear_array,
+            fuel_shear_array,
+        ) = AerostructuralLoad.compute_shear_diagram(y_vector, load_factor_shear * mass_arrays_orig)
 
         # STEP 4/XX - WE ADD ZEROS AT THE END OF THE RESULT LIFT DISTRIBUTION TO FIT THE FORMAT
         # IMPOSED BY OPENMDAO
@@ -219,14 +219,12 @@ class StructuralLoads(om.ExplicitComponent):
         outputs["data:loads:structure:ultimate:shear:fuel"] = fuel_shear_array
         outputs["data:loads:structure:ultimate:shear:point_mass"] = point_shear_array
 
-        point_root_bending_array = AerostructuralLoad.compute_bending_moment_diagram(
-            y_vector, load_factor_rbm * point_mass_array_orig
-        )
-        wing_root_bending_array = AerostructuralLoad.compute_bending_moment_diagram(
-            y_vector, load_factor_rbm * wing_mass_array_orig
-        )
-        fuel_root_bending_array = AerostructuralLoad.compute_bending_moment_diagram(
-            y_vector, load_factor_rbm * fuel_mass_array_orig
+        (
+            point_root_bending_array,
+            wing_root_bending_array,
+            fuel_root_bending_array,
+        ) = AerostructuralLoad.compute_bending_moment_diagram(
+            y_vector, load_factor_rbm * mass_arrays_orig
         )
 
         # STEP 4/XX - WE ADD ZEROS AT THE END OF THE RESULT LIFT DISTRIBUTION TO FIT THE FORMAT
@@ -254,6 +254,42 @@ def test_advanced_cl():
     )
 
 
+def test_advanced_cl_oversized_start():
+
+    xml_file = "beechcraft_76.xml"
+
+    inputs_list = list_inputs(
+        UpdateWingAreaLiftEquilibrium(propulsion_id="fastga.wrapper.propulsion.basicIC_engine")
+    )
+    # Research independent input value in .xml file
+    ivc_loop = get_indep_var_comp(
+        inputs_list,
+        __file__,
+        xml_file,
+    )
+    ivc_loop.add_output("data:mission:sizing:taxi_in:thrust", val=1500, units="N")
+    ivc_loop.add_output("data:mission:sizing:taxi_out:thrust", val=1500, units="N")
+
+    problem_loop = run_system(
+        UpdateWingAreaLiftEquilibrium(propulsion_id="fastga.wrapper.propulsion.basicIC_engine"),
+        ivc_loop,
+    )
+    # With a lower max lift coefficient, the largest area searched gives a negative angle of
+    # attack at the equilibrium
+    problem_loop["data:aerodynamics:aircraft:landing:CL_max"] *= 0.6
+    wing_area_solver = problem_loop.model.component.wing_area_solver
+    wing_area_solver.wing_area = None
+    problem_loop.run_model()
+    wing_area = problem_loop.get_val("wing_area", units="m**2")
+    assert_allclose(wing_area, 29.81, atol=1e-2)
+
+    # Starting from an oversized wing area, the same minimum area is found
+    wing_area_solver.wing_area = 1000.0
+    problem_loop.run_model()
+    assert_allclose(problem_loop.get_val("wing_area", units="m**2"), wing_area, atol=1e-3)
+    assert_allclose(wing_area_solver.wing_area, wing_area, atol=1e-3)
+
+
 def test_update_wing_area():
 
     ivc_geom = om.IndepVarComp()
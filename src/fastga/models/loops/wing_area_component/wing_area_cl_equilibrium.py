@@ -46,11 +46,17 @@ class UpdateWingAreaLiftEquilibrium(om.ExplicitComponent):
     Computes needed wing area to reach an equilibrium at required approach speed.
     """
 
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.wing_area_solver = None
+
     def initialize(self):
         self.options.declare("propulsion_id", default=None, types=str, allow_none=True)
 
     def setup(self):
 
+        self.wing_area_solver = WingAreaLiftEquilibriumSolver(self.options["propulsion_id"])
+
         self.add_input("data:TLAR:v_approach", val=np.nan, units="m/s")
         self.add_input("data:weight:aircraft:MLW", val=np.nan, units="kg")
         self.add_input("data:weight:aircraft:CG:aft:x", val=np.nan, units="m")
@@ -97,14 +103,15 @@ class UpdateWingAreaLiftEquilibrium(om.ExplicitComponent):
 
         wing_area_landing_init_guess = 2 * mlw * g / (stall_speed ** 2) / (1.225 * max_cl)
 
-        wing_area_approach = compute_wing_area(inputs, self.options["propulsion_id"])
+        wing_area_approach = self.wing_area_solver.compute_wing_area(inputs)
 
         if wing_area_approach > 1.2 * wing_area_landing_init_guess:
-            print("Vrai valeur", wing_area_approach)
-            wing_area_approach = wing_area_landing_init_guess
             _LOGGER.info(
-                "Wing area too far from potential data, taking backup value for this iteration"
+                "Wing area too far from potential data (%f m**2), taking backup value for this "
+                "iteration",
+                wing_area_approach,
             )
+            wing_area_approach = wing_area_landing_init_guess
 
         outputs["wing_area"] = wing_area_approach
 
@@ -120,11 +127,17 @@ class ConstraintWingAreaLiftEquilibrium(om.ExplicitComponent):
     computed based on the lift equation.
     """
 
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.wing_area_solver = None
+
     def initialize(self):
         self.options.declare("propulsion_id", default=None, types=str, allow_none=True)
 
     def setup(self):
 
+        self.wing_area_solver = WingAreaLiftEquilibriumSolver(self.options["propulsion_id"])
+
         self.add_input("data:TLAR:v_approach", val=np.nan, units="m/s")
         self.add_input("data:weight:aircraft:MLW", val=np.nan, units="kg")
         self.add_input("data:weight:aircraft:CG:aft:x", val=np.nan, units="m")
@@ -165,7 +178,7 @@ class ConstraintWingAreaLiftEquilibrium(om.ExplicitComponent):
         mlw = inputs["data:weight:aircraft:MLW"]
         wing_area_actual = inputs["data:geometry:wing:area"]
 
-        wing_area_constraint = compute_wing_area(inputs, self.options["propulsion_id"])
+        wing_area_constraint = self.wing_area_solver.compute_wing_area(inputs)
 
         additional_cl = (
             (2.0 * mlw * g)
@@ -185,110 +198,202 @@ class _IDThrustRate(om.ExplicitComponent):
         outputs["thrust_rate"] = inputs["thrust_rate_t_econ"][0:2]
 
 
-def compute_wing_area(inputs, propulsion_id):
-
-    # First, setup an initial guess
-    stall_speed = inputs["data:TLAR:v_approach"] / 1.3
-    mlw = inputs["data:weight:aircraft:MLW"]
-    cg_max_aft = float(inputs["data:weight:aircraft:CG:aft:x"])
-    cg_max_fwd = float(inputs["data:weight:aircraft:CG:fwd:x"])
-    delta_cl_flaps = inputs["data:aerodynamics:flaps:landing:CL"]
-    cl_alpha = inputs["data:aerodynamics:wing:cruise:CL_alpha"]
-    cl_0_wing = inputs["data:aerodynamics:wing:cruise:CL0_clean"]
-    max_cl = inputs["data:aerodynamics:aircraft:landing:CL_max"]
-    min_elevator_angle = min(
-        inputs["data:mission:sizing:landing:elevator_angle"],
-        inputs["data:mission:sizing:takeoff:elevator_angle"],
-    )
-    wing_area_landing_init_guess = 2 * mlw * g / (stall_speed ** 2) / (1.225 * max_cl)
-
-    alpha_max = (max_cl - delta_cl_flaps - cl_0_wing) / cl_alpha * 180.0 / np.pi
+class WingAreaLiftEquilibriumSolver:
+    """
+    Computes the minimum wing area for which the aircraft, at MLW and stall speed in landing
+    configuration, can be trimmed at both the max forward and max aft CG with an angle of attack
+    below the one of max lift coefficient, a thrust rate between 0 and 1 and an elevator angle
+    within its limits.
+
+    The equilibrium problem is set up at the first call and only its inputs are changed
+    afterwards. The minimum area is the root of the largest violation of the constraints that
+    limit it from below (maximum angle of attack, maximum thrust rate and minimum elevator angle),
+    which decreases with the wing area. The other bounds can only be reached by wings larger than
+    the minimum one and are left out, so that an oversized area is never taken for a too small
+    one. The root is found with a secant method kept within a bracket of the root, each call
+    starting from the wing area found by the previous one.
+    """
 
-    input_zip = zip_equilibrium_input(propulsion_id)
+    def __init__(self, propulsion_id):
+        self.propulsion_id = propulsion_id
+        self.problem = None
+        self.input_names = []
+        self.wing_area = None
+
+    def compute_wing_area(self, inputs, max_iter: int = 50, tol: float = 1e-4) -> float:
+        """
+        :param inputs: inputs of the component, with the inputs of the equilibrium
+        :param max_iter: maximum number of equilibrium computations
+        :param tol: tolerance on the largest constraint violation, which is relative to the
+        bounds of the constraints
+        :return: the minimum wing area, in m**2
+        """
+        stall_speed = inputs["data:TLAR:v_approach"] / 1.3
+        mlw = inputs["data:weight:aircraft:MLW"]
+        cg_max_aft = float(inputs["data:weight:aircraft:CG:aft:x"])
+        cg_max_fwd = float(inputs["data:weight:aircraft:CG:fwd:x"])
+        delta_cl_flaps = inputs["data:aerodynamics:flaps:landing:CL"]
+        cl_alpha = inputs["data:aerodynamics:wing:cruise:CL_alpha"]
+        cl_0_wing = inputs["data:aerodynamics:wing:cruise:CL0_clean"]
+        max_cl = inputs["data:aerodynamics:aircraft:landing:CL_max"]
+        min_elevator_angle = float(
+            min(
+                inputs["data:mission:sizing:landing:elevator_angle"],
+                inputs["data:mission:sizing:takeoff:elevator_angle"],
+            )
+        )
+        wing_area_landing_init_guess = float(2 * mlw * g / (stall_speed ** 2) / (1.225 * max_cl))
+
+        alpha_max = float((max_cl - delta_cl_flaps - cl_0_wing) / cl_alpha * 180.0 / np.pi)
+
+        if self.problem is None:
+            self.problem = self._setup_problem(inputs)
+            self.problem.set_val("delta_m", np.full(2, 0.9 * min_elevator_angle), units="deg")
+            self.problem.set_val("alpha", np.full(2, 0.9 * alpha_max), units="deg")
+
+        problem = self.problem
+        for var_name in self.input_names:
+            problem.set_val(var_name, inputs[var_name])
+        problem.set_val("mass", np.array([mlw, mlw]).flatten(), units="kg")
+        # x_cg should be evaluated at the worst case scenario so either max aft or max fwd
+        problem.set_val("x_cg", np.array([cg_max_fwd, cg_max_aft]), units="m")
+        problem.set_val(
+            "true_airspeed", np.array([stall_speed, stall_speed]).flatten(), units="m/s"
+        )
 
-    ivc = om.IndepVarComp()
-    for var_names, var_unit, _, _, _ in input_zip:
-        if var_names[:5] == "data:" and var_names != "data:geometry:wing:area":
-            ivc.add_output(
-                name=var_names,
-                val=inputs[var_names],
-                units=var_unit,
-                shape=np.shape(inputs[var_names]),
+        def constraint_violation(wing_area):
+            problem.set_val("data:geometry:wing:area", wing_area, units="m**2")
+            problem.run_model()
+            alpha = problem.get_val("alpha", units="deg")
+            thrust_rate = problem.get_val("thrust_rate")
+            delta_m = problem.get_val("delta_m", units="deg")
+            # Angle of attack, thrust rate and elevator deflection all decrease in absolute value
+            # with the wing area, only their upper bounds are kept
+            return np.max(
+                np.concatenate(
+                    (
+                        (alpha - alpha_max) / abs(alpha_max),
+                        thrust_rate - 1.0,
+                        (min_elevator_angle - delta_m) / abs(min_elevator_angle),
+                    )
+                )
             )
 
-    ivc.add_output(name="d_vx_dt", val=np.array([0.0, 0.0]), units="m/s**2")
-    ivc.add_output(name="mass", val=np.array([mlw, mlw]), units="kg")
-    # x_cg should be evaluated at the worst case scenario so either max aft or max fwd
-    ivc.add_output(name="x_cg", val=np.array([cg_max_fwd, cg_max_aft]), units="m")
-    ivc.add_output(name="gamma", val=np.array([0.0, 0.0]), units=None)
-    ivc.add_output(name="altitude", val=np.array([0.0, 0.0]), units="m")
-    # Time step is not important since we don't care about the fuel consumption
-    ivc.add_output(name="time_step", val=np.array([0.0, 0.0]), units="s")
-    ivc.add_output(name="true_airspeed", val=np.array([stall_speed, stall_speed]), units="m/s")
-    ivc.add_output(name="engine_setting", val=np.full(2, EngineSetting.TAKEOFF))
-
-    problem = om.Problem()
-    model = problem.model
-
-    model.add_subsystem("ivc", ivc, promotes_outputs=["*"])
-    model.add_subsystem(
-        "Equilibrium",
-        DEPEquilibrium(
-            number_of_points=2,
-            promotes_all_variables=True,
-            propulsion_id=propulsion_id,
-            flaps_position="landing",
-        ),
-        promotes=["*"],
-    )
-    model.add_subsystem("thrust_rate_id", _IDThrustRate(), promotes=["*"])
-
-    model.nonlinear_solver = om.NewtonSolver(solve_subsystems=True)
-    model.nonlinear_solver.options["iprint"] = 2
-    model.nonlinear_solver.options["maxiter"] = 100
-    model.nonlinear_solver.options["rtol"] = 1e-4
-    model.linear_solver = om.DirectSolver()
-
-    problem.driver = om.ScipyOptimizeDriver()
-    problem.driver.options["optimizer"] = "SLSQP"
-    problem.driver.options["maxiter"] = 100
-    problem.driver.options["tol"] = 1e-4
-
-    problem.model.add_design_var(
-        name="data:geometry:wing:area",
-        units="m**2",
-        lower=1.0,
-        upper=2.0 * wing_area_landing_init_guess,
-    )
+        # The root is kept between the largest area known to be too small and the smallest area
+        # known to be large enough
+        lower_area = 1.0
+        upper_area = 2.0 * wing_area_landing_init_guess
+        if self.wing_area is None:
+            wing_area = wing_area_landing_init_guess
+        else:
+            wing_area = self.wing_area
+        wing_area = float(np.clip(wing_area, lower_area, upper_area))
+        previous_point = None
+
+        for _ in range(max_iter):
+            violation = constraint_violation(wing_area)
+            if not violation <= 0.0:
+                lower_area = wing_area
+            else:
+                upper_area = wing_area
+            if abs(violation) <= tol:
+                break
+
+            if not np.isfinite(violation):
+                new_wing_area = 0.5 * (lower_area + upper_area)
+            elif previous_point is None or violation == previous_point[1]:
+                new_wing_area = wing_area * (1.0 + 0.05 * np.sign(violation))
+            else:
+                new_wing_area = wing_area - violation * (wing_area - previous_point[0]) / (
+                    violation - previous_point[1]
+                )
+            if np.isfinite(violation):
+                previous_point = (wing_area, violation)
+            if not lower_area < new_wing_area < upper_area:
+                new_wing_area = 0.5 * (lower_area + upper_area)
+            if upper_area - lower_area <= tol * upper_area:
+                wing_area = upper_area
+                break
+            wing_area = new_wing_area
+        else:
+            _LOGGER.warning("Wing area for the lift equilibrium did not converge")
+
+        _LOGGER.debug(
+            "Lift equilibrium reached with alpha = %s deg and delta_m = %s deg",
+            problem.get_val("alpha", units="deg"),
+            problem.get_val("delta_m", units="deg"),
+        )
 
-    problem.model.add_objective(name="data:geometry:wing:area", units="m**2")
+        self.wing_area = wing_area
 
-    problem.model.add_constraint(
-        name="alpha", units="deg", lower=[0.0, 0.0], upper=[alpha_max, alpha_max]
-    )
-    problem.model.add_constraint(name="thrust_rate", lower=[0.0, 0.0], upper=[1.0, 1.0])
-    problem.model.add_constraint(
-        name="delta_m",
-        lower=[min_elevator_angle, min_elevator_angle],
-        upper=[abs(min_elevator_angle), abs(min_elevator_angle)],
-    )
+        return wing_area
+
+    def _setup_problem(self, inputs) -> om.Problem:
+        """
+        Sets up the problem computing the equilibrium of the aircraft at two points, for a wing
+        area given as input.
 
-    problem.model.approx_totals()
+        :param inputs: inputs of the component, which give the shape of the equilibrium inputs
+        :return: the problem, ready to be run once its inputs are set
+        """
+        input_zip = zip_equilibrium_input(self.propulsion_id)
 
-    problem.setup()
+        ivc = om.IndepVarComp()
+        self.input_names = []
+        for var_names, var_unit, _, _, _ in input_zip:
+            if var_names[:5] == "data:" and var_names != "data:geometry:wing:area":
+                ivc.add_output(
+                    name=var_names,
+                    val=inputs[var_names],
+                    units=var_unit,
+                    shape=np.shape(inputs[var_names]),
+                )
+                self.input_names.append(var_names)
+
+        ivc.add_output(name="data:geometry:wing:area", val=10.0, units="m**2")
+        ivc.add_output(name="d_vx_dt", val=np.array([0.0, 0.0]), units="m/s**2")
+        ivc.add_output(name="mass", val=np.array([1500.0, 1500.0]), units="kg")
+        ivc.add_output(name="x_cg", val=np.array([5.0, 5.0]), units="m")
+        ivc.add_output(name="gamma", val=np.array([0.0, 0.0]), units=None)
+        ivc.add_output(name="altitude", val=np.array([0.0, 0.0]), units="m")
+        # Time step is not important since we don't care about the fuel consumption
+        ivc.add_output(name="time_step", val=np.array([0.0, 0.0]), units="s")
+        ivc.add_output(name="true_airspeed", val=np.array([50.0, 50.0]), units="m/s")
+        ivc.add_output(name="engine_setting", val=np.full(2, EngineSetting.TAKEOFF))
+
+        problem = om.Problem()
+        model = problem.model
+
+        model.add_subsystem("ivc", ivc, promotes_outputs=["*"])
+        model.add_subsystem(
+            "Equilibrium",
+            DEPEquilibrium(
+                number_of_points=2,
+                promotes_all_variables=True,
+                propulsion_id=self.propulsion_id,
+                flaps_position="landing",
+            ),
+            promotes=["*"],
+        )
+        model.add_subsystem("thrust_rate_id", _IDThrustRate(), promotes=["*"])
 
-    problem["data:geometry:wing:area"] = wing_area_landing_init_guess
-    problem["delta_m"] = np.array([0.9 * min_elevator_angle, 0.9 * min_elevator_angle])
-    problem["alpha"] = np.array([0.9 * alpha_max, 0.9 * alpha_max])
+        model.nonlinear_solver = om.NewtonSolver(solve_subsystems=True)
+        model.nonlinear_solver.options["iprint"] = 0
+        model.nonlinear_solver.options["maxiter"] = 100
+        model.nonlinear_solver.options["rtol"] = 1e-4
+        model.linear_solver = om.DirectSolver()
 
-    problem.run_driver()
+        problem.setup()
 
-    print(problem["delta_m"])
-    print(problem["alpha"])
+        return problem
 
-    wing_area_approach = problem.get_val("data:geometry:wing:area", units="m**2")
 
-    return wing_area_approach
+def compute_wing_area(inputs, propulsion_id):
+    """
+    Computes the minimum wing area for the lift equilibrium with a new
+    :class:`WingAreaLiftEquilibriumSolver`, components should rather keep a solver to reuse it.
+    """
+    return WingAreaLiftEquilibriumSolver(propulsion_id).compute_wing_area(inputs)
 
 
 def zip_equilibrium_input(propulsion_id):
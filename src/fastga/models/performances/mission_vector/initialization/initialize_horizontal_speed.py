@@ -42,7 +42,15 @@ class InitializeHorizontalSpeed(om.ExplicitComponent):
 
     def setup_partials(self):
 
-        self.declare_partials(of="*", wrt="*", method="exact")
+        number_of_points = self.options["number_of_points"]
+
+        self.declare_partials(
+            of="*",
+            wrt="*",
+            method="exact",
+            rows=np.arange(number_of_points),
+            cols=np.arange(number_of_points),
+        )
 
     def compute(self, inputs, outputs, discrete_inputs=None, discrete_outputs=None):
 
@@ -56,7 +64,5 @@ class InitializeHorizontalSpeed(om.ExplicitComponent):
         true_airspeed = inputs["true_airspeed"]
         gamma = inputs["gamma"] * np.pi / 180.0
 
-        partials["horizontal_speed", "gamma"] = (
-            -np.diag(true_airspeed * np.sin(gamma)) * np.pi / 180.0
-        )
-        partials["horizontal_speed", "true_airspeed"] = np.diag(np.cos(gamma))
+        partials["horizontal_speed", "gamma"] = -true_airspeed * np.sin(gamma) * np.pi / 180.0
+        partials["horizontal_speed", "true_airspeed"] = np.cos(gamma)
@@ -0,0 +1,51 @@
+"""Derivatives of the atmosphere properties used in the vectorized mission."""
+#  This file is part of FAST-OAD_CS23 : A framework for rapid Overall Aircraft Design
+#  Copyright (C) 2022  ONERA & ISAE-SUPAERO
+#  FAST is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import numpy as np
+from stdatm import Atmosphere
+
+# Constants of the temperature and pressure models of stdatm 0.2.0 (stdatm/atmosphere.py), which
+# are not exposed by the package and must be updated along with it
+TROPOPAUSE_ALTITUDE = 11000.0  # m
+TROPOSPHERE_LAPSE_RATE = 0.0065  # K/m
+TROPOSPHERE_PRESSURE_EXPONENT = 5.25587611
+TROPOSPHERE_PRESSURE_HEIGHT = 44330.78  # m
+STRATOSPHERE_PRESSURE_DECAY = 0.0001576883 * np.log(2.718281)  # 1/m
+
+
+def density_derivative(altitude, delta_t=0.0) -> np.ndarray:
+    """
+    Computes the derivative of the air density with respect to the altitude, consistent with the
+    pressure and temperature models of stdatm Atmosphere.
+
+    :param altitude: altitude, in m
+    :param delta_t: temperature increment applied to whole temperature profile, in K
+    :return: derivative of the density with respect to the altitude, in kg/m**4
+    """
+
+    altitude = np.asarray(altitude, dtype=float)
+    atm = Atmosphere(altitude, delta_t, altitude_in_feet=False)
+    density = np.asarray(atm.density)
+    temperature = np.asarray(atm.temperature)
+
+    # Logarithmic derivatives of the pressure and of the temperature, the density being
+    # pressure / (R * temperature)
+    d_ln_rho_d_altitude = np.where(
+        altitude < TROPOPAUSE_ALTITUDE,
+        -TROPOSPHERE_PRESSURE_EXPONENT / (TROPOSPHERE_PRESSURE_HEIGHT - altitude)
+        + TROPOSPHERE_LAPSE_RATE / temperature,
+        -STRATOSPHERE_PRESSURE_DECAY,
+    )
+
+    return density * d_ln_rho_d_altitude
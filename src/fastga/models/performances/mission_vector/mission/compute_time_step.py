@@ -36,7 +36,25 @@ class ComputeTimeStep(om.ExplicitComponent):
 
     def setup_partials(self):
 
-        self.declare_partials(of="time_step", wrt="time", method="exact")
+        number_of_points = self.options["number_of_points"]
+
+        # Each time step depends on the time of its point and of the next one, except for the
+        # last one which is a copy of the previous time step
+        rows = np.concatenate(
+            (
+                np.arange(number_of_points - 1),
+                np.arange(number_of_points - 1),
+                [number_of_points - 1] * 2,
+            )
+        )
+        cols = np.concatenate(
+            (
+                np.arange(number_of_points - 1),
+                np.arange(1, number_of_points),
+                [number_of_points - 1, number_of_points - 2],
+            )
+        )
+        self.declare_partials(of="time_step", wrt="time", method="exact", rows=rows, cols=cols)
 
     def compute(self, inputs, outputs, discrete_inputs=None, discrete_outputs=None):
 
@@ -51,9 +69,6 @@ class ComputeTimeStep(om.ExplicitComponent):
 
         number_of_points = self.options["number_of_points"]
 
-        middle_diagonal = -np.eye(number_of_points)
-        upper_diagonal = np.diagflat(np.full(number_of_points - 1, 1), 1)
-        d_ts_dt = middle_diagonal + upper_diagonal
-        d_ts_dt[-1, -1] = 1.0
-        d_ts_dt[-1, -2] = -1.0
-        partials["time_step", "time"] = d_ts_dt
+        partials["time_step", "time"] = np.concatenate(
+            (np.full(number_of_points - 1, -1.0), np.full(number_of_points - 1, 1.0), [1.0, -1.0])
+        )
@@ -75,43 +75,67 @@ class PrepareForEnergyConsumption(om.ExplicitComponent):
 
     def setup_partials(self):
 
-        self.declare_partials(
-            of="thrust_econ",
-            wrt=[
-                "thrust",
-                "data:mission:sizing:taxi_out:thrust",
-                "data:mission:sizing:taxi_in:thrust",
-            ],
-            method="exact",
-        )
+        number_of_points = self.options["number_of_points"]
 
+        # The econ vectors are the flight vectors followed by the taxi out and taxi in values
+        diagonal = np.arange(number_of_points)
+        taxi_out_row = np.array([number_of_points])
+        taxi_in_row = np.array([number_of_points + 1])
+        taxi_col = np.array([0])
+
+        for output_name, input_name in [
+            ("thrust_econ", "thrust"),
+            ("altitude_econ", "altitude"),
+            ("true_airspeed_econ", "true_airspeed"),
+            ("engine_setting_econ", "engine_setting"),
+        ]:
+            self.declare_partials(
+                of=output_name, wrt=input_name, method="exact", rows=diagonal, cols=diagonal
+            )
+
+        # The last time step of climb is replaced by the previous one, see compute
+        time_step_cols = np.copy(diagonal)
+        if number_of_points == POINTS_NB_CLIMB + POINTS_NB_CRUISE + POINTS_NB_DESCENT:
+            time_step_cols[POINTS_NB_CLIMB - 1] = POINTS_NB_CLIMB - 2
         self.declare_partials(
-            of="altitude_econ",
-            wrt=[
-                "altitude",
-            ],
+            of="time_step_econ",
+            wrt="time_step",
             method="exact",
+            rows=diagonal,
+            cols=time_step_cols,
         )
 
-        self.declare_partials(
-            of="time_step_econ",
-            wrt=[
-                "time_step",
+        for output_name, taxi_out_name, taxi_in_name in [
+            (
+                "thrust_econ",
+                "data:mission:sizing:taxi_out:thrust",
+                "data:mission:sizing:taxi_in:thrust",
+            ),
+            (
+                "time_step_econ",
                 "data:mission:sizing:taxi_out:duration",
                 "data:mission:sizing:taxi_in:duration",
-            ],
-            method="exact",
-        )
-
-        self.declare_partials(
-            of="true_airspeed_econ",
-            wrt=[
-                "true_airspeed",
+            ),
+            (
+                "true_airspeed_econ",
                 "data:mission:sizing:taxi_out:speed",
                 "data:mission:sizing:taxi_in:speed",
-            ],
-            method="exact",
-        )
+            ),
+        ]:
+            self.declare_partials(
+                of=output_name,
+                wrt=taxi_out_name,
+                method="exact",
+                rows=taxi_out_row,
+                cols=taxi_col,
+            )
+            self.declare_partials(
+                of=output_name,
+                wrt=taxi_in_name,
+                method="exact",
+                rows=taxi_in_row,
+                cols=taxi_col,
+            )
 
     def compute(self, inputs, outputs, discrete_inputs=None, discrete_outputs=None):
         number_of_points = self.options["number_of_points"]
@@ -157,45 +181,18 @@ class PrepareForEnergyConsumption(om.ExplicitComponent):
 
         number_of_points = self.options["number_of_points"]
 
-        d_thrust_econ_d_thrust = np.zeros((number_of_points + 2, number_of_points))
-        d_thrust_econ_d_thrust[:number_of_points, :] = np.eye(number_of_points)
-        partials["thrust_econ", "thrust"] = d_thrust_econ_d_thrust
-
-        d_thrust_econ_d_thrust_to = np.zeros(number_of_points + 2)
-        d_thrust_econ_d_thrust_to[-2] = 1.0
-        partials["thrust_econ", "data:mission:sizing:taxi_out:thrust"] = d_thrust_econ_d_thrust_to
-
-        d_thrust_econ_d_thrust_ti = np.zeros(number_of_points + 2)
-        d_thrust_econ_d_thrust_ti[-1] = 1.0
-        partials["thrust_econ", "data:mission:sizing:taxi_in:thrust"] = d_thrust_econ_d_thrust_ti
-
-        d_altitude_econ_d_altitude = np.zeros((number_of_points + 2, number_of_points))
-        d_altitude_econ_d_altitude[:number_of_points, :] = np.eye(number_of_points)
-        partials["altitude_econ", "altitude"] = d_altitude_econ_d_altitude
-
-        d_ts_econ_d_ts = np.zeros((number_of_points + 2, number_of_points))
-        d_ts_econ_d_ts[:number_of_points, :] = np.eye(number_of_points)
-        if number_of_points == POINTS_NB_CLIMB + POINTS_NB_CRUISE + POINTS_NB_DESCENT:
-            d_ts_econ_d_ts[POINTS_NB_CLIMB - 1, POINTS_NB_CLIMB - 1] = 0.0
-            d_ts_econ_d_ts[POINTS_NB_CLIMB - 1, POINTS_NB_CLIMB - 2] = 0.0
-        partials["time_step_econ", "time_step"] = d_ts_econ_d_ts
-
-        d_ts_econ_d_ts_to = np.zeros(number_of_points + 2)
-        d_ts_econ_d_ts_to[-2] = 1.0
-        partials["time_step_econ", "data:mission:sizing:taxi_out:duration"] = d_ts_econ_d_ts_to
+        partials["thrust_econ", "thrust"] = np.ones(number_of_points)
+        partials["thrust_econ", "data:mission:sizing:taxi_out:thrust"] = 1.0
+        partials["thrust_econ", "data:mission:sizing:taxi_in:thrust"] = 1.0
 
-        d_ts_econ_d_ts_ti = np.zeros(number_of_points + 2)
-        d_ts_econ_d_ts_ti[-1] = 1.0
-        partials["time_step_econ", "data:mission:sizing:taxi_in:duration"] = d_ts_econ_d_ts_ti
+        partials["altitude_econ", "altitude"] = np.ones(number_of_points)
 
-        d_tas_econ_d_tas = np.zeros((number_of_points + 2, number_of_points))
-        d_tas_econ_d_tas[:number_of_points, :] = np.eye(number_of_points)
-        partials["true_airspeed_econ", "true_airspeed"] = d_tas_econ_d_tas
+        partials["time_step_econ", "time_step"] = np.ones(number_of_points)
+        partials["time_step_econ", "data:mission:sizing:taxi_out:duration"] = 1.0
+        partials["time_step_econ", "data:mission:sizing:taxi_in:duration"] = 1.0
 
-        d_tas_econ_d_tas_to = np.zeros(number_of_points + 2)
-        d_tas_econ_d_tas_to[-2] = 1.0
-        partials["true_airspeed_econ", "data:mission:sizing:taxi_out:speed"] = d_tas_econ_d_tas_to
+        partials["true_airspeed_econ", "true_airspeed"] = np.ones(number_of_points)
+        partials["true_airspeed_econ", "data:mission:sizing:taxi_out:speed"] = 1.0
+        partials["true_airspeed_econ", "data:mission:sizing:taxi_in:speed"] = 1.0
 
-        d_tas_econ_d_tas_ti = np.zeros(number_of_points + 2)
-        d_tas_econ_d_tas_ti[-1] = 1.0
-        partials["true_airspeed_econ", "data:mission:sizing:taxi_in:speed"] = d_tas_econ_d_tas_ti
+        partials["engine_setting_econ", "engine_setting"] = np.ones(number_of_points)
@@ -16,6 +16,8 @@ import openmdao.api as om
 from scipy.constants import g
 from stdatm import Atmosphere
 
+from .atmosphere_derivatives import density_derivative
+
 
 class Equilibrium(om.ImplicitComponent):
     """Find the conditions necessary for the aircraft equilibrium."""
@@ -79,50 +81,61 @@ class Equilibrium(om.ImplicitComponent):
         self.add_output("thrust", val=np.full(number_of_points, 1000.0), units="N")
         self.add_output("delta_m", val=np.full(number_of_points, -5.0), units="deg")
 
+        # The residuals of each point only depend on the conditions of that point, the
+        # aircraft data are shared by all points
+        diagonal = np.arange(number_of_points)
+        shared = np.zeros(number_of_points, dtype=int)
+
         self.declare_partials(
             of="alpha",
             wrt=[
                 "altitude",
+                "mass",
+                "gamma",
+                "true_airspeed",
+                "delta_Cl",
+                "thrust",
+                "alpha",
+                "delta_m",
             ],
-            method="fd",
-            form="central",
-            step=1.0e2,
+            method="exact",
+            rows=diagonal,
+            cols=diagonal,
         )
         self.declare_partials(
             of="alpha",
             wrt=[
-                "mass",
-                "gamma",
-                "true_airspeed",
                 "data:geometry:wing:area",
                 "data:aerodynamics:wing:cruise:CL0_clean",
                 "data:aerodynamics:wing:cruise:CL_alpha",
                 "data:aerodynamics:horizontal_tail:cruise:CL0",
                 "data:aerodynamics:horizontal_tail:cruise:CL_alpha",
-                "delta_Cl",
                 "data:aerodynamics:elevator:low_speed:CL_delta",
-                "thrust",
-                "alpha",
-                "delta_m",
             ],
             method="exact",
+            rows=diagonal,
+            cols=shared,
         )
         self.declare_partials(
             of="thrust",
             wrt=[
                 "altitude",
+                "gamma",
+                "d_vx_dt",
+                "mass",
+                "true_airspeed",
+                "delta_Cd",
+                "alpha",
+                "thrust",
+                "delta_m",
             ],
-            method="fd",
-            form="central",
-            step=1.0e2,
+            method="exact",
+            rows=diagonal,
+            cols=diagonal,
         )
         self.declare_partials(
             of="thrust",
             wrt=[
-                "gamma",
-                "d_vx_dt",
-                "mass",
-                "true_airspeed",
                 "data:geometry:wing:area",
                 "data:aerodynamics:aircraft:cruise:CD0",
                 "data:aerodynamics:wing:cruise:CL0_clean",
@@ -133,17 +146,27 @@ class Equilibrium(om.ImplicitComponent):
                 "data:aerodynamics:horizontal_tail:cruise:induced_drag_coefficient",
                 "data:aerodynamics:elevator:low_speed:CD_delta",
                 "data:aerodynamics:elevator:low_speed:CL_delta",
-                "delta_Cd",
+            ],
+            method="exact",
+            rows=diagonal,
+            cols=shared,
+        )
+        self.declare_partials(
+            of="delta_m",
+            wrt=[
+                "x_cg",
+                "delta_Cl",
+                "delta_Cm",
                 "alpha",
-                "thrust",
                 "delta_m",
             ],
             method="exact",
+            rows=diagonal,
+            cols=diagonal,
         )
         self.declare_partials(
             of="delta_m",
             wrt=[
-                "x_cg",
                 "data:geometry:wing:MAC:length",
                 "data:geometry:wing:MAC:at25percent:x",
                 "data:geometry:horizontal_tail:MAC:at25percent:x:from_wingMAC25",
@@ -154,32 +177,36 @@ class Equilibrium(om.ImplicitComponent):
                 "data:aerodynamics:horizontal_tail:cruise:CL0",
                 "data:aerodynamics:horizontal_tail:cruise:CL_alpha",
                 "data:aerodynamics:elevator:low_speed:CL_delta",
-                "delta_Cl",
-                "delta_Cm",
-                "alpha",
-                "delta_m",
             ],
             method="exact",
+            rows=diagonal,
+            cols=shared,
         )
-        if self.options["flaps_position"] == "takeoff":
-            self.declare_partials(
-                of="alpha", wrt="data:aerodynamics:flaps:takeoff:CL", method="exact"
-            )
+        flaps_position = self.options["flaps_position"]
+        if flaps_position in ("takeoff", "landing"):
             self.declare_partials(
-                of="thrust", wrt="data:aerodynamics:flaps:takeoff:CD", method="exact"
+                of="alpha",
+                wrt="data:aerodynamics:flaps:" + flaps_position + ":CL",
+                method="exact",
+                rows=diagonal,
+                cols=shared,
             )
             self.declare_partials(
-                of="delta_m", wrt="data:aerodynamics:flaps:takeoff:CM", method="exact"
-            )
-        if self.options["flaps_position"] == "landing":
-            self.declare_partials(
-                of="alpha", wrt="data:aerodynamics:flaps:landing:CL", method="exact"
+                of="thrust",
+                wrt=[
+                    "data:aerodynamics:flaps:" + flaps_position + ":CL",
+                    "data:aerodynamics:flaps:" + flaps_position + ":CD",
+                ],
+                method="exact",
+                rows=diagonal,
+                cols=shared,
             )
             self.declare_partials(
-                of="thrust", wrt="data:aerodynamics:flaps:landing:CD", method="exact"
-            )
-            self.declare_partials(
-                of="delta_m", wrt="data:aerodynamics:flaps:landing:CM", method="exact"
+                of="delta_m",
+                wrt="data:aerodynamics:flaps:" + flaps_position + ":CM",
+                method="exact",
+                rows=diagonal,
+                cols=shared,
             )
 
     def linearize(self, inputs, outputs, partials):
@@ -236,18 +263,23 @@ class Equilibrium(om.ImplicitComponent):
         dynamic_pressure = 1.0 / 2.0 * rho * np.square(true_airspeed)
 
         cl_wing = cl0_wing + cl_alpha_wing * alpha + delta_cl + delta_cl_flaps
+        # As in the residuals, the slipstream lift does not create induced drag and the flaps
+        # lift does not create pitching moment
+        cl_wing_flaps = cl0_wing + cl_alpha_wing * alpha + delta_cl_flaps
+        cl_wing_slip = cl0_wing + cl_alpha_wing * alpha + delta_cl
         cl_htp = cl0_htp + cl_alpha_htp * alpha + cl_delta_m * delta_m
 
         cd_tot = (
             cd0
             + delta_cd
             + delta_cd_flaps
-            + coeff_k_wing * cl_wing ** 2
+            + coeff_k_wing * cl_wing_flaps ** 2
             + coeff_k_htp * cl_htp ** 2
             + (cd_delta_m * delta_m ** 2.0)
         )
 
         d_q_d_airspeed = rho * true_airspeed
+        d_q_d_altitude = 1.0 / 2.0 * density_derivative(altitude) * np.square(true_airspeed)
 
         # ------------------ Derivatives wrt alpha residuals ------------------ #
 
@@ -257,18 +289,19 @@ class Equilibrium(om.ImplicitComponent):
             number_of_points
         )
         partials["alpha", "data:aerodynamics:horizontal_tail:cruise:CL_alpha"] = alpha
-        partials["alpha", "delta_Cl"] = np.identity(number_of_points)
+        partials["alpha", "delta_Cl"] = np.ones(number_of_points)
         partials["alpha", "data:aerodynamics:elevator:low_speed:CL_delta"] = delta_m
         d_alpha_d_mass_vector = -g * np.cos(gamma) / (dynamic_pressure * wing_area)
-        partials["alpha", "mass"] = np.diag(d_alpha_d_mass_vector)
+        partials["alpha", "mass"] = d_alpha_d_mass_vector
         d_alpha_d_thrust_vector = np.sin(alpha) / (dynamic_pressure * wing_area)
-        partials["alpha", "thrust"] = np.diag(d_alpha_d_thrust_vector)
+        partials["alpha", "thrust"] = d_alpha_d_thrust_vector
         d_alpha_d_gamma_vector = mass * g * np.sin(gamma) / (dynamic_pressure * wing_area)
-        partials["alpha", "gamma"] = np.diag(d_alpha_d_gamma_vector)
+        partials["alpha", "gamma"] = d_alpha_d_gamma_vector * np.pi / 180.0
         d_alpha_d_q_vector = -(thrust * np.sin(alpha) - mass * g * np.cos(gamma)) / (
             wing_area * dynamic_pressure ** 2.0
         )
-        partials["alpha", "true_airspeed"] = np.diag(d_alpha_d_q_vector * d_q_d_airspeed)
+        partials["alpha", "true_airspeed"] = d_alpha_d_q_vector * d_q_d_airspeed
+        partials["alpha", "altitude"] = d_alpha_d_q_vector * d_q_d_altitude
         d_alpha_d_s_vector = -(thrust * np.sin(alpha) - mass * g * np.cos(gamma)) / (
             dynamic_pressure * wing_area ** 2.0
         )
@@ -276,8 +309,8 @@ class Equilibrium(om.ImplicitComponent):
         d_alpha_d_alpha_vector = (
             cl_alpha_wing + cl_alpha_htp + thrust * np.cos(alpha) / (dynamic_pressure * wing_area)
         )
-        partials["alpha", "alpha"] = np.diag(d_alpha_d_alpha_vector) * np.pi / 180.0
-        partials["alpha", "delta_m"] = np.identity(number_of_points) * cl_delta_m * np.pi / 180.0
+        partials["alpha", "alpha"] = d_alpha_d_alpha_vector * np.pi / 180.0
+        partials["alpha", "delta_m"] = np.ones(number_of_points) * cl_delta_m * np.pi / 180.0
         if self.options["flaps_position"] == "takeoff":
             partials["alpha", "data:aerodynamics:flaps:takeoff:CL"] = np.ones(number_of_points)
         if self.options["flaps_position"] == "landing":
@@ -285,26 +318,27 @@ class Equilibrium(om.ImplicitComponent):
 
         # ------------------ Derivatives wrt thrust residuals ------------------ #
 
-        d_thrust_d_cl_w = -2.0 * dynamic_pressure * wing_area * coeff_k_wing * cl_wing
+        d_thrust_d_cl_w = -2.0 * dynamic_pressure * wing_area * coeff_k_wing * cl_wing_flaps
         d_thrust_d_cl_h = -2.0 * dynamic_pressure * wing_area * coeff_k_htp * cl_htp
 
         d_cl_w_d_cl_alpha_w = alpha
         d_cl_h_d_cl_alpha_h = alpha
         d_cl_h_d_cl_delta = delta_m
 
-        partials["thrust", "d_vx_dt"] = np.diag(-mass)
-        partials["thrust", "gamma"] = np.diag(-mass * g * np.cos(gamma) * np.pi / 180.0)
-        partials["thrust", "mass"] = np.diag(-d_vx_dt - g * np.sin(gamma))
-        partials["thrust", "true_airspeed"] = -np.diag(wing_area * cd_tot * d_q_d_airspeed)
+        partials["thrust", "d_vx_dt"] = -mass
+        partials["thrust", "gamma"] = -mass * g * np.cos(gamma) * np.pi / 180.0
+        partials["thrust", "mass"] = -d_vx_dt - g * np.sin(gamma)
+        partials["thrust", "true_airspeed"] = -wing_area * cd_tot * d_q_d_airspeed
+        partials["thrust", "altitude"] = -wing_area * cd_tot * d_q_d_altitude
         partials["thrust", "data:geometry:wing:area"] = -dynamic_pressure * cd_tot
         partials["thrust", "data:aerodynamics:aircraft:cruise:CD0"] = -dynamic_pressure * wing_area
         partials["thrust", "data:aerodynamics:horizontal_tail:cruise:induced_drag_coefficient"] = (
             -dynamic_pressure * wing_area * cl_htp ** 2.0
         )
         partials["thrust", "data:aerodynamics:wing:cruise:induced_drag_coefficient"] = (
-            -dynamic_pressure * wing_area * cl_wing ** 2.0
+            -dynamic_pressure * wing_area * cl_wing_flaps ** 2.0
         )
-        partials["thrust", "delta_Cd"] = -np.diag(dynamic_pressure * wing_area)
+        partials["thrust", "delta_Cd"] = -dynamic_pressure * wing_area
         partials["thrust", "data:aerodynamics:elevator:low_speed:CD_delta"] = (
             -dynamic_pressure * wing_area * delta_m ** 2.0
         )
@@ -319,7 +353,7 @@ class Equilibrium(om.ImplicitComponent):
         partials["thrust", "data:aerodynamics:horizontal_tail:cruise:CL_alpha"] = (
             d_thrust_d_cl_h * d_cl_h_d_cl_alpha_h
         )
-        partials["thrust", "thrust"] = np.diag(np.cos(alpha))
+        partials["thrust", "thrust"] = np.cos(alpha)
         d_thrust_d_alpha_vector = (
             (
                 -thrust * np.sin(alpha)
@@ -329,7 +363,7 @@ class Equilibrium(om.ImplicitComponent):
             * np.pi
             / 180.0
         )
-        partials["thrust", "alpha"] = np.diag(d_thrust_d_alpha_vector)
+        partials["thrust", "alpha"] = d_thrust_d_alpha_vector
         d_thrust_d_delta_m_vector = (
             (
                 d_thrust_d_cl_h * cl_delta_m
@@ -338,10 +372,12 @@ class Equilibrium(om.ImplicitComponent):
             * np.pi
             / 180.0
         )
-        partials["thrust", "delta_m"] = np.diag(d_thrust_d_delta_m_vector)
+        partials["thrust", "delta_m"] = d_thrust_d_delta_m_vector
         if self.options["flaps_position"] == "takeoff":
+            partials["thrust", "data:aerodynamics:flaps:takeoff:CL"] = d_thrust_d_cl_w
             partials["thrust", "data:aerodynamics:flaps:takeoff:CD"] = -dynamic_pressure * wing_area
         if self.options["flaps_position"] == "landing":
+            partials["thrust", "data:aerodynamics:flaps:landing:CL"] = d_thrust_d_cl_w
             partials["thrust", "data:aerodynamics:flaps:landing:CD"] = -dynamic_pressure * wing_area
 
         # ------------------ Derivatives wrt delta_m residuals ------------------ #
@@ -357,12 +393,12 @@ class Equilibrium(om.ImplicitComponent):
         partials["delta_m", "data:aerodynamics:horizontal_tail:cruise:CL0"] = (
             x_cg - x_htp
         ) * np.ones(number_of_points)
-        partials["delta_m", "delta_Cl"] = np.diag(x_cg - x_wing)
-        partials["delta_m", "delta_Cm"] = np.diag(l0_wing)
+        partials["delta_m", "delta_Cl"] = x_cg - x_wing
+        partials["delta_m", "delta_Cm"] = l0_wing * np.ones(number_of_points)
         d_delta_m_d_alpha = (
-            (x_cg - x_wing) * cl_alpha_wing + (x_cg - x_htp) * cl_alpha_htp + cm_alpha_fus
+            (x_cg - x_wing) * cl_alpha_wing + (x_cg - x_htp) * cl_alpha_htp + cm_alpha_fus * l0_wing
         )
-        partials["delta_m", "alpha"] = np.diag(d_delta_m_d_alpha) * np.pi / 180.0
+        partials["delta_m", "alpha"] = d_delta_m_d_alpha * np.pi / 180.0
         partials["delta_m", "data:aerodynamics:horizontal_tail:cruise:CL_alpha"] = alpha * (
             x_cg - x_htp
         )
@@ -370,12 +406,10 @@ class Equilibrium(om.ImplicitComponent):
             x_cg - x_htp
         ) * delta_m
         partials["delta_m", "delta_m"] = (
-            np.identity(number_of_points) * (x_cg - x_htp) * cl_delta_m * np.pi / 180.0
-        )
-        partials["delta_m", "x_cg"] = (cl_wing + cl_htp) * np.identity(number_of_points)
-        partials["delta_m", "data:geometry:wing:MAC:at25percent:x"] = -(cl_wing + cl_htp) * np.ones(
-            number_of_points
+            np.ones(number_of_points) * (x_cg - x_htp) * cl_delta_m * np.pi / 180.0
         )
+        partials["delta_m", "x_cg"] = cl_wing_slip + cl_htp
+        partials["delta_m", "data:geometry:wing:MAC:at25percent:x"] = -(cl_wing_slip + cl_htp)
         partials[
             "delta_m", "data:geometry:horizontal_tail:MAC:at25percent:x:from_wingMAC25"
         ] = -cl_htp
@@ -17,7 +17,6 @@ import openmdao.api as om
 from fastga.models.performances.mission.mission_components import (
     POINTS_NB_CRUISE,
     POINTS_NB_CLIMB,
-    POINTS_NB_DESCENT,
 )
 
 
@@ -87,79 +86,87 @@ class PerformancePerPhase(om.ExplicitComponent):
 
     def setup_partials(self):
 
-        self.declare_partials(
-            of="data:mission:sizing:main_route:climb:fuel",
-            wrt="fuel_consumed_t_econ",
-            method="exact",
-        )
-        self.declare_partials(
-            of="data:mission:sizing:main_route:cruise:fuel",
-            wrt="fuel_consumed_t_econ",
-            method="exact",
-        )
-        self.declare_partials(
-            of="data:mission:sizing:main_route:descent:fuel",
-            wrt="fuel_consumed_t_econ",
-            method="exact",
-        )
-        self.declare_partials(
-            of="data:mission:sizing:taxi_out:fuel", wrt="fuel_consumed_t_econ", method="exact"
-        )
-        self.declare_partials(
-            of="data:mission:sizing:taxi_in:fuel", wrt="fuel_consumed_t_econ", method="exact"
-        )
-        self.declare_partials(of="fuel_consumed_t", wrt="fuel_consumed_t_econ", method="exact")
+        number_of_points = self.options["number_of_points"]
 
-        self.declare_partials(
-            of="data:mission:sizing:main_route:climb:energy",
-            wrt="non_consumable_energy_t_econ",
-            method="exact",
-        )
-        self.declare_partials(
-            of="data:mission:sizing:main_route:cruise:energy",
-            wrt="non_consumable_energy_t_econ",
-            method="exact",
-        )
-        self.declare_partials(
-            of="data:mission:sizing:main_route:descent:energy",
-            wrt="non_consumable_energy_t_econ",
-            method="exact",
-        )
-        self.declare_partials(
-            of="data:mission:sizing:taxi_out:energy",
-            wrt="non_consumable_energy_t_econ",
-            method="exact",
-        )
-        self.declare_partials(
-            of="data:mission:sizing:taxi_in:energy",
-            wrt="non_consumable_energy_t_econ",
-            method="exact",
-        )
-        self.declare_partials(
-            of="non_consumable_energy_t", wrt="non_consumable_energy_t_econ", method="exact"
-        )
+        climb_points = np.arange(POINTS_NB_CLIMB)
+        cruise_points = np.arange(POINTS_NB_CLIMB, POINTS_NB_CLIMB + POINTS_NB_CRUISE)
+        descent_points = np.arange(POINTS_NB_CLIMB + POINTS_NB_CRUISE, number_of_points)
+        # Indices of the last point of climb and of cruise, the phase distances and durations are
+        # computed based on them
+        climb_end = POINTS_NB_CLIMB - 1
+        cruise_end = POINTS_NB_CLIMB + POINTS_NB_CRUISE - 1
+
+        for phase_name, phase_points in [
+            ("climb", climb_points),
+            ("cruise", cruise_points),
+            ("descent", descent_points),
+        ]:
+            self.declare_partials(
+                of="data:mission:sizing:main_route:" + phase_name + ":fuel",
+                wrt="fuel_consumed_t_econ",
+                method="exact",
+                rows=np.zeros_like(phase_points),
+                cols=phase_points,
+            )
+            self.declare_partials(
+                of="data:mission:sizing:main_route:" + phase_name + ":energy",
+                wrt="non_consumable_energy_t_econ",
+                method="exact",
+                rows=np.zeros_like(phase_points),
+                cols=phase_points,
+            )
 
-        self.declare_partials(of="thrust_rate_t", wrt="thrust_rate_t_econ", method="exact")
+        for taxi_name, taxi_point in [
+            ("taxi_out", number_of_points),
+            ("taxi_in", number_of_points + 1),
+        ]:
+            self.declare_partials(
+                of="data:mission:sizing:" + taxi_name + ":fuel",
+                wrt="fuel_consumed_t_econ",
+                method="exact",
+                rows=np.array([0]),
+                cols=np.array([taxi_point]),
+            )
+            self.declare_partials(
+                of="data:mission:sizing:" + taxi_name + ":energy",
+                wrt="non_consumable_energy_t_econ",
+                method="exact",
+                rows=np.array([0]),
+                cols=np.array([taxi_point]),
+            )
 
-        self.declare_partials(
-            of="data:mission:sizing:main_route:climb:distance", wrt="position", method="exact"
-        )
-        self.declare_partials(
-            of="data:mission:sizing:main_route:cruise:distance", wrt="position", method="exact"
-        )
-        self.declare_partials(
-            of="data:mission:sizing:main_route:descent:distance", wrt="position", method="exact"
-        )
+        # The flight vectors are the econ vectors without the taxi points
+        for output_name in ["fuel_consumed_t", "non_consumable_energy_t", "thrust_rate_t"]:
+            self.declare_partials(
+                of=output_name,
+                wrt=output_name + "_econ",
+                method="exact",
+                rows=np.arange(number_of_points),
+                cols=np.arange(number_of_points),
+            )
 
-        self.declare_partials(
-            of="data:mission:sizing:main_route:climb:duration", wrt="time", method="exact"
-        )
-        self.declare_partials(
-            of="data:mission:sizing:main_route:cruise:duration", wrt="time", method="exact"
-        )
-        self.declare_partials(
-            of="data:mission:sizing:main_route:descent:duration", wrt="time", method="exact"
-        )
+        for input_name, output_suffix in [("position", ":distance"), ("time", ":duration")]:
+            self.declare_partials(
+                of="data:mission:sizing:main_route:climb" + output_suffix,
+                wrt=input_name,
+                method="exact",
+                rows=np.array([0]),
+                cols=np.array([climb_end]),
+            )
+            self.declare_partials(
+                of="data:mission:sizing:main_route:cruise" + output_suffix,
+                wrt=input_name,
+                method="exact",
+                rows=np.array([0, 0]),
+                cols=np.array([cruise_end, climb_end]),
+            )
+            self.declare_partials(
+                of="data:mission:sizing:main_route:descent" + output_suffix,
+                wrt=input_name,
+                method="exact",
+                rows=np.array([0, 0]),
+                cols=np.array([number_of_points - 1, cruise_end]),
+            )
 
     def compute(self, inputs, outputs, discrete_inputs=None, discrete_outputs=None):
 
@@ -219,94 +226,47 @@ class PerformancePerPhase(om.ExplicitComponent):
 
         number_of_points = self.options["number_of_points"]
 
-        partials[
-            "data:mission:sizing:main_route:climb:fuel", "fuel_consumed_t_econ"
-        ] = np.concatenate(
-            (np.full(POINTS_NB_CLIMB, 1), np.zeros(POINTS_NB_CRUISE + POINTS_NB_DESCENT + 2))
+        partials["data:mission:sizing:main_route:climb:fuel", "fuel_consumed_t_econ"] = np.ones(
+            POINTS_NB_CLIMB
         )
         partials[
             "data:mission:sizing:main_route:climb:energy", "non_consumable_energy_t_econ"
-        ] = np.concatenate(
-            (np.full(POINTS_NB_CLIMB, 1), np.zeros(POINTS_NB_CRUISE + POINTS_NB_DESCENT + 2))
-        )
+        ] = np.ones(POINTS_NB_CLIMB)
 
-        partials[
-            "data:mission:sizing:main_route:cruise:fuel", "fuel_consumed_t_econ"
-        ] = np.concatenate(
-            (
-                np.zeros(POINTS_NB_CLIMB),
-                np.full(POINTS_NB_CRUISE, 1.0),
-                np.zeros(POINTS_NB_DESCENT + 2),
-            )
+        partials["data:mission:sizing:main_route:cruise:fuel", "fuel_consumed_t_econ"] = np.ones(
+            POINTS_NB_CRUISE
         )
         partials[
             "data:mission:sizing:main_route:cruise:energy", "non_consumable_energy_t_econ"
-        ] = np.concatenate(
-            (
-                np.zeros(POINTS_NB_CLIMB),
-                np.full(POINTS_NB_CRUISE, 1.0),
-                np.zeros(POINTS_NB_DESCENT + 2),
-            )
-        )
+        ] = np.ones(POINTS_NB_CRUISE)
 
-        partials[
-            "data:mission:sizing:main_route:cruise:fuel", "fuel_consumed_t_econ"
-        ] = np.concatenate(
-            (
-                np.zeros(POINTS_NB_CLIMB + POINTS_NB_CRUISE),
-                np.full(POINTS_NB_DESCENT, 1.0),
-                np.zeros(2),
-            )
+        partials["data:mission:sizing:main_route:descent:fuel", "fuel_consumed_t_econ"] = np.ones(
+            number_of_points - POINTS_NB_CLIMB - POINTS_NB_CRUISE
         )
         partials[
-            "data:mission:sizing:main_route:cruise:energy", "non_consumable_energy_t_econ"
-        ] = np.concatenate(
-            (
-                np.zeros(POINTS_NB_CLIMB + POINTS_NB_CRUISE),
-                np.full(POINTS_NB_DESCENT, 1.0),
-                np.zeros(2),
-            )
-        )
-
-        d_taxi_out_d_fuel = np.zeros(number_of_points + 2)
-        d_taxi_out_d_fuel[-2] = 1
-        partials["data:mission:sizing:taxi_out:fuel", "fuel_consumed_t_econ"] = d_taxi_out_d_fuel
-        partials[
-            "data:mission:sizing:taxi_out:energy", "non_consumable_energy_t_econ"
-        ] = d_taxi_out_d_fuel
-
-        d_taxi_in_d_fuel = np.zeros(number_of_points + 2)
-        d_taxi_in_d_fuel[-1] = 1
-        partials["data:mission:sizing:taxi_in:fuel", "fuel_consumed_t_econ"] = d_taxi_in_d_fuel
-        partials[
-            "data:mission:sizing:taxi_in:energy", "non_consumable_energy_t_econ"
-        ] = d_taxi_in_d_fuel
-
-        d_fc_d_fc_t = np.zeros((number_of_points, number_of_points + 2))
-        d_fc_d_fc_t[:, :number_of_points] = np.eye(number_of_points)
-        partials["fuel_consumed_t", "fuel_consumed_t_econ"] = d_fc_d_fc_t
-        partials["non_consumable_energy_t", "non_consumable_energy_t_econ"] = d_fc_d_fc_t
+            "data:mission:sizing:main_route:descent:energy", "non_consumable_energy_t_econ"
+        ] = np.ones(number_of_points - POINTS_NB_CLIMB - POINTS_NB_CRUISE)
 
-        d_tr_d_tr_t = np.zeros((number_of_points, number_of_points + 2))
-        d_tr_d_tr_t[:, :number_of_points] = np.eye(number_of_points)
-        partials["thrust_rate_t", "thrust_rate_t_econ"] = d_tr_d_tr_t
+        partials["data:mission:sizing:taxi_out:fuel", "fuel_consumed_t_econ"] = 1.0
+        partials["data:mission:sizing:taxi_out:energy", "non_consumable_energy_t_econ"] = 1.0
 
-        d_climb_d_d_pos = np.zeros(number_of_points)
-        d_climb_d_d_pos[POINTS_NB_CLIMB - 1] = 1.0
-        partials["data:mission:sizing:main_route:climb:distance", "position"] = d_climb_d_d_pos
+        partials["data:mission:sizing:taxi_in:fuel", "fuel_consumed_t_econ"] = 1.0
+        partials["data:mission:sizing:taxi_in:energy", "non_consumable_energy_t_econ"] = 1.0
 
-        d_cruise_d_d_pos = np.zeros(number_of_points)
-        d_cruise_d_d_pos[POINTS_NB_CLIMB + POINTS_NB_CRUISE - 1] = 1.0
-        d_cruise_d_d_pos[POINTS_NB_CLIMB - 1] = -1.0
-        partials["data:mission:sizing:main_route:cruise:distance", "position"] = d_cruise_d_d_pos
-
-        d_descent_d_d_pos = np.zeros(number_of_points)
-        d_descent_d_d_pos[-1] = 1.0
-        d_cruise_d_d_pos[POINTS_NB_CLIMB + POINTS_NB_CRUISE - 1] = -1.0
-        partials["data:mission:sizing:main_route:descent:distance", "position"] = d_descent_d_d_pos
-
-        partials["data:mission:sizing:main_route:climb:duration", "time"] = d_climb_d_d_pos
+        partials["fuel_consumed_t", "fuel_consumed_t_econ"] = np.ones(number_of_points)
+        partials["non_consumable_energy_t", "non_consumable_energy_t_econ"] = np.ones(
+            number_of_points
+        )
+        partials["thrust_rate_t", "thrust_rate_t_econ"] = np.ones(number_of_points)
 
-        partials["data:mission:sizing:main_route:cruise:duration", "time"] = d_cruise_d_d_pos
+        partials["data:mission:sizing:main_route:climb:distance", "position"] = 1.0
+        partials["data:mission:sizing:main_route:cruise:distance", "position"] = np.array(
+            [1.0, -1.0]
+        )
+        partials["data:mission:sizing:main_route:descent:distance", "position"] = np.array(
+            [1.0, -1.0]
+        )
 
-        partials["data:mission:sizing:main_route:descent:duration", "time"] = d_descent_d_d_pos
+        partials["data:mission:sizing:main_route:climb:duration", "time"] = 1.0
+        partials["data:mission:sizing:main_route:cruise:duration", "time"] = np.array([1.0, -1.0])
+        partials["data:mission:sizing:main_route:descent:duration", "time"] = np.array([1.0, -1.0])
@@ -44,7 +44,26 @@ class UpdateMass(om.ExplicitComponent):
         )
 
     def setup_partials(self):
-        self.declare_partials("*", "*", method="exact")
+
+        number_of_points = self.options["number_of_points"]
+
+        self.declare_partials(
+            of="mass",
+            wrt=[
+                "data:weight:aircraft:MTOW",
+                "data:mission:sizing:taxi_out:fuel",
+                "data:mission:sizing:initial_climb:fuel",
+                "data:mission:sizing:takeoff:fuel",
+            ],
+            method="exact",
+            rows=np.arange(number_of_points),
+            cols=np.zeros(number_of_points, dtype=int),
+        )
+        # The mass at each point depends on the fuel consumed at all the previous points
+        rows, cols = np.tril_indices(number_of_points, -1)
+        self.declare_partials(
+            of="mass", wrt="fuel_consumed_t", method="exact", rows=rows, cols=cols
+        )
 
     def compute(self, inputs, outputs, discrete_inputs=None, discrete_outputs=None):
 
@@ -74,6 +93,6 @@ class UpdateMass(om.ExplicitComponent):
         partials["mass", "data:mission:sizing:taxi_out:fuel"] = np.full(number_of_points, -1.0)
         partials["mass", "data:mission:sizing:initial_climb:fuel"] = np.full(number_of_points, -1.0)
         partials["mass", "data:mission:sizing:takeoff:fuel"] = np.full(number_of_points, -1.0)
-        partials["mass", "fuel_consumed_t"] = -(
-            np.tri(number_of_points, number_of_points) - np.eye(number_of_points)
+        partials["mass", "fuel_consumed_t"] = np.full(
+            number_of_points * (number_of_points - 1) // 2, -1.0
         )
@@ -35,7 +35,10 @@ class MissionVector(om.Group):
         self.nonlinear_solver.options["iprint"] = 0
         self.nonlinear_solver.options["maxiter"] = 50
         self.nonlinear_solver.options["rtol"] = 1e-5
-        self.linear_solver = om.DirectSolver()
+        # The partials of the mission components are declared sparse, the Jacobian is assembled
+        # in a sparse matrix so that the linear solve scales with the number of points
+        self.linear_solver = om.DirectSolver(assemble_jac=True)
+        self.options["assembled_jac_type"] = "csc"
 
     def initialize(self):
 
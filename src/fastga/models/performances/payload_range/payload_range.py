@@ -14,6 +14,10 @@
 #  along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+
 import numpy as np
 import openmdao.api as om
 
@@ -22,7 +26,6 @@ from scipy.optimize import fsolve
 
 import fastoad.api as oad
 from fastoad.module_management.constants import ModelDomain
-from fastoad.openmdao.problem import AutoUnitsDefaultGroup
 
 from fastga.command import api as api_cs23
 from fastga.models.performances.mission.mission import Mission
@@ -36,15 +39,42 @@ class ComputePayloadRange(om.ExplicitComponent):
     Payload Range. The minimal payload which defines point E is taken as two pilots. This class
     uses a blank xml file for the execution of the mission class. All the input quantities of the
     mission are created in a dict. generate_block_analysis still needs a xml file to be processed.
+
+    A dense payload-range curve going through points A, B, D and E can also be computed, its
+    points can be computed concurrently by a pool of processes.
     """
 
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.mission_inputs = []
+        self.mission_problem = None
+
     def initialize(self):
         self.options.declare("propulsion_id", default="", types=str)
+        self.options.declare(
+            "dense_points_number",
+            default=0,
+            types=int,
+            desc="Number of points of the dense payload-range curve, at least 4 since it goes "
+            "through points A, B, D and E. The curve is not computed if 0",
+        )
+        self.options.declare(
+            "max_workers",
+            default=1,
+            types=int,
+            allow_none=True,
+            desc="Number of processes that compute the points of the dense curve, number of CPUs "
+            "if None. The points are computed in the current process by default",
+        )
 
     def setup(self):
         variables = api_cs23.list_variables(Mission(propulsion_id=self.options["propulsion_id"]))
 
         inputs_mission = [var for var in variables if var.is_input]
+        self.mission_inputs = [
+            (var.name, var.metadata["units"], var.metadata["shape"]) for var in inputs_mission
+        ]
+        self.mission_problem = None
 
         for comp_input in inputs_mission:
             self.add_input(
@@ -63,6 +93,25 @@ class ComputePayloadRange(om.ExplicitComponent):
         self.add_output("data:payload_range:range_array", units="NM", shape=5)
         self.add_output("data:payload_range:specific_range_array", units="NM/kg", shape=5)
 
+        dense_points_number = self.options["dense_points_number"]
+        if dense_points_number:
+            if dense_points_number < 4:
+                raise ValueError(
+                    "The dense payload-range curve needs at least 4 points, got %i"
+                    % dense_points_number
+                )
+            self.add_output(
+                "data:payload_range:dense:payload_array", units="kg", shape=dense_points_number
+            )
+            self.add_output(
+                "data:payload_range:dense:range_array", units="NM", shape=dense_points_number
+            )
+            self.add_output(
+                "data:payload_range:dense:specific_range_array",
+                units="NM/kg",
+                shape=dense_points_number,
+            )
+
         self.declare_partials("*", "*", method="fd")
 
     def compute(self, inputs, outputs, discrete_inputs=None, discrete_outputs=None):
@@ -76,6 +125,10 @@ class ComputePayloadRange(om.ExplicitComponent):
         owe = inputs["data:weight:aircraft:OWE"]
         mass_pilot = inputs["settings:weight:aircraft:payload:design_mass_per_passenger"]
 
+        # The mission problem is set up once, only its inputs change between the evaluations
+        # and each evaluation starts from the state of the previous one
+        problem = self.get_mission_problem(inputs)
+
         payload_array = []
         range_array = []
         sr_array = []
@@ -90,7 +143,7 @@ class ComputePayloadRange(om.ExplicitComponent):
         range_b, _, ier, message = fsolve(
             self.fuel_function,
             range_mission / 2,
-            args=(fuel_target_b, mtow, inputs, self.options["propulsion_id"]),
+            args=(fuel_target_b, mtow, problem),
             xtol=0.01,
             full_output=True,
         )
@@ -101,11 +154,13 @@ class ComputePayloadRange(om.ExplicitComponent):
         range_array.append(range_b[0])
         sr_array.append(range_b[0] / fuel_target_b)
 
+        # Point C : design payload and fuel, the next points start from the range of the previous
+        # one at the same specific range
         fuel_target_c = fuel_mission
         range_c, _, ier, message = fsolve(
             self.fuel_function,
-            range_mission / 2,
-            args=(fuel_target_c, mtow, inputs, self.options["propulsion_id"]),
+            range_b * fuel_target_c / fuel_target_b,
+            args=(fuel_target_c, mtow, problem),
             xtol=0.01,
             full_output=True,
         )
@@ -122,8 +177,8 @@ class ComputePayloadRange(om.ExplicitComponent):
 
         range_d, _, ier, message = fsolve(
             self.fuel_function,
-            range_mission,
-            args=(fuel_target_d, mtow, inputs, self.options["propulsion_id"]),
+            range_c * fuel_target_d / fuel_target_c,
+            args=(fuel_target_d, mtow, problem),
             xtol=0.01,
             full_output=True,
         )
@@ -145,8 +200,8 @@ class ComputePayloadRange(om.ExplicitComponent):
         mass_aircraft = owe + mfw + payload_e
         range_e, _, ier, message = fsolve(
             self.fuel_function,
-            range_mission,
-            args=(fuel_target_e, mass_aircraft, inputs, self.options["propulsion_id"]),
+            range_d,
+            args=(fuel_target_e, mass_aircraft, problem),
             xtol=0.01,
             full_output=True,
         )
@@ -165,52 +220,227 @@ class ComputePayloadRange(om.ExplicitComponent):
         outputs["data:payload_range:range_array"] = range_array
         outputs["data:payload_range:specific_range_array"] = sr_array
 
-    @staticmethod
-    def fuel_function(range_parameter, fuel_target, mass, inputs, prop_id):
-
-        mission_component = AutoUnitsDefaultGroup()
-        mission_component.add_subsystem(
-            "system",
-            Mission(propulsion_id=prop_id),
-            promotes=["*"],
-        )
-        variables = api_cs23.list_variables(mission_component)
-        var_inputs = [var.name for var in variables if var.is_input]
-        var_units = [var.units for var in variables if var.is_input]
-        var_shapes = [np.shape(var.val) for var in variables if var.is_input]
-
-        input_zip = zip(var_inputs, var_units, var_shapes)
-
-        ivc = om.IndepVarComp()
-        for var_names, var_unit, var_shape in input_zip:
-            if var_names != "data:TLAR:range" and var_names != "data:weight:aircraft:MTOW":
-                ivc.add_output(
-                    name=var_names, val=inputs[var_names], units=var_unit, shape=var_shape
-                )
-
-        ivc.add_output(name="data:TLAR:range", val=range_parameter, units="m")
-        ivc.add_output(name="data:weight:aircraft:MTOW", val=mass, units="kg")
+        if self.options["dense_points_number"]:
+            payload_dense, fuel_dense, mass_dense = dense_curve_points(
+                self.options["dense_points_number"], max_payload, mtow, mzfw, mfw, owe
+            )
+            range_dense = self.compute_dense_ranges(
+                inputs, fuel_dense, mass_dense, range_mission * fuel_dense / fuel_mission
+            )
+            sr_dense = np.divide(
+                range_dense, fuel_dense, out=np.zeros_like(range_dense), where=fuel_dense > 0.0
+            )
 
-        problem = oad.FASTOADProblem()
-        model = problem.model
+            outputs["data:payload_range:dense:payload_array"] = payload_dense
+            outputs["data:payload_range:dense:range_array"] = range_dense / 1852
+            outputs["data:payload_range:dense:specific_range_array"] = sr_dense / 1852
+
+    def get_mission_problem(self, inputs) -> oad.FASTOADProblem:
+        """
+        Gives the problem used to compute the mission fuel. It is set up at the first call only,
+        afterwards the inputs of the mission are only updated.
+
+        :param inputs: inputs of the component, from which the mission inputs are taken
+        :return: the mission problem, ready to be run
+        """
+        if self.mission_problem is None:
+            self.mission_problem = build_mission_problem(
+                self.options["propulsion_id"], self.mission_inputs
+            )
 
-        model.add_subsystem("ivc", ivc, promotes_outputs=["*"])
-        model.add_subsystem("mission", Mission(propulsion_id=prop_id), promotes=["*"])
+        for var_name, var_units, _ in self.mission_inputs:
+            self.mission_problem.set_val(var_name, inputs[var_name], units=var_units)
+
+        return self.mission_problem
+
+    def compute_dense_ranges(self, inputs, fuel_targets, masses, initial_ranges) -> np.ndarray:
+        """
+        Computes the range of the points of the dense curve. The points are split in contiguous
+        chunks computed by max_workers processes, each with its own mission problem.
+
+        :param inputs: inputs of the component, from which the mission inputs are taken
+        :param fuel_targets: mission fuel of the points, in kg
+        :param masses: take-off weight of the points, in kg
+        :param initial_ranges: initial guess of the range of the points, in m
+        :return: the range of the points, in m
+        """
+        max_workers = self.options["max_workers"]
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+        max_workers = max(min(max_workers, np.size(fuel_targets)), 1)
+
+        if max_workers == 1:
+            return compute_ranges(
+                self.get_mission_problem(inputs), fuel_targets, masses, initial_ranges
+            )
 
-        model.nonlinear_solver = om.NonlinearBlockGS()
-        model.nonlinear_solver.options["iprint"] = 0
-        model.nonlinear_solver.options["maxiter"] = 10
-        model.nonlinear_solver.options["rtol"] = 1e-3
+        # OpenMDAO views are copied so that the inputs can be sent to the processes
+        mission_values = {
+            var_name: np.array(inputs[var_name]) for var_name, _, _ in self.mission_inputs
+        }
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            range_chunks = executor.map(
+                _compute_ranges_chunk,
+                repeat(self.options["propulsion_id"]),
+                repeat(self.mission_inputs),
+                repeat(mission_values),
+                np.array_split(fuel_targets, max_workers),
+                np.array_split(masses, max_workers),
+                np.array_split(initial_ranges, max_workers),
+            )
 
-        model.linear_solver = om.LinearBlockGS()
-        model.linear_solver.options["iprint"] = 0
-        model.linear_solver.options["maxiter"] = 10
-        model.linear_solver.options["rtol"] = 1e-3
+        return np.concatenate(list(range_chunks))
 
-        problem.setup()
+    @staticmethod
+    def fuel_function(range_parameter, fuel_target, mass, problem):
+        """
+        Computes the difference between the fuel of the mission and the target fuel.
+
+        :param range_parameter: range of the mission, in m
+        :param fuel_target: target fuel, in kg
+        :param mass: take-off weight of the aircraft, in kg
+        :param problem: the mission problem, as given by get_mission_problem
+        :return: the fuel difference, in kg
+        """
+        problem.set_val("data:TLAR:range", range_parameter, units="m")
+        problem.set_val("data:weight:aircraft:MTOW", mass, units="kg")
 
         problem.run_model()
 
         fuel = problem.get_val("data:mission:sizing:fuel", units="kg")
 
         return fuel - fuel_target
+
+
+def build_mission_problem(propulsion_id: str, mission_inputs: list) -> oad.FASTOADProblem:
+    """
+    Builds and sets up a problem computing the mission, all its inputs are given by an
+    IndepVarComp.
+
+    :param propulsion_id: identifier of the propulsion wrapper
+    :param mission_inputs: name, units and shape of each input of the mission
+    :return: the mission problem, its inputs still have to be set
+    """
+    ivc = om.IndepVarComp()
+    for var_name, var_units, var_shape in mission_inputs:
+        ivc.add_output(name=var_name, val=np.nan, units=var_units, shape=var_shape)
+
+    problem = oad.FASTOADProblem()
+    model = problem.model
+
+    model.add_subsystem("ivc", ivc, promotes_outputs=["*"])
+    model.add_subsystem("mission", Mission(propulsion_id=propulsion_id), promotes=["*"])
+
+    model.nonlinear_solver = om.NonlinearBlockGS()
+    model.nonlinear_solver.options["iprint"] = 0
+    model.nonlinear_solver.options["maxiter"] = 10
+    model.nonlinear_solver.options["rtol"] = 1e-3
+
+    model.linear_solver = om.LinearBlockGS()
+    model.linear_solver.options["iprint"] = 0
+    model.linear_solver.options["maxiter"] = 10
+    model.linear_solver.options["rtol"] = 1e-3
+
+    problem.setup()
+
+    return problem
+
+
+def dense_curve_points(points_number: int, max_payload, mtow, mzfw, mfw, owe) -> tuple:
+    """
+    Gives the payload, fuel and take-off weight of the points of the dense payload-range curve.
+    The points are spread over the segments A-B (max payload), B-D (MTOW) and D-E (MFW), each
+    segment having a third of the intervals.
+
+    :param points_number: number of points of the curve, at least 4
+    :param max_payload: max payload, in kg
+    :param mtow: max take-off weight, in kg
+    :param mzfw: max zero fuel weight, in kg
+    :param mfw: max fuel weight, in kg
+    :param owe: operating weight empty, in kg
+    :return: the payload, fuel and take-off weight arrays, in kg
+    """
+    max_payload, mtow, mzfw, mfw, owe = [
+        float(value) for value in (max_payload, mtow, mzfw, mfw, owe)
+    ]
+    fuel_b = mtow - mzfw
+    payload_d = max_payload - (mfw - fuel_b)
+
+    intervals_number = points_number - 1
+    segment_intervals = [intervals_number // 3 + (idx < intervals_number % 3) for idx in range(3)]
+    ratios = [np.linspace(0.0, 1.0, segment_intervals[idx] + 1)[(idx > 0) :] for idx in range(3)]
+
+    payload = np.concatenate(
+        (
+            np.full(np.size(ratios[0]), max_payload),
+            max_payload - ratios[1] * (mfw - fuel_b),
+            payload_d * (1.0 - ratios[2]),
+        )
+    )
+    fuel = np.concatenate(
+        (ratios[0] * fuel_b, fuel_b + ratios[1] * (mfw - fuel_b), np.full(np.size(ratios[2]), mfw))
+    )
+    mass = np.concatenate(
+        (
+            mzfw + ratios[0] * fuel_b,
+            np.full(np.size(ratios[1]), mtow),
+            mtow + ratios[2] * (owe + mfw - mtow),
+        )
+    )
+
+    return payload, fuel, mass
+
+
+def compute_ranges(problem, fuel_targets, masses, initial_ranges) -> np.ndarray:
+    """
+    Computes, one after the other, the range at which the mission needs the target fuel. Each
+    point starts from the range of the previous one at the same specific range, the points
+    without fuel have no range.
+
+    :param problem: the mission problem, with its inputs set
+    :param fuel_targets: mission fuel of the points, in kg
+    :param masses: take-off weight of the points, in kg
+    :param initial_ranges: initial guess of the range of the points, used for the first point
+    and after the points without fuel, in m
+    :return: the range of the points, in m
+    """
+    ranges = np.zeros(np.size(fuel_targets))
+    for idx, (fuel_target, mass) in enumerate(zip(fuel_targets, masses)):
+        if fuel_target <= 0.0:
+            continue
+        if idx > 0 and ranges[idx - 1] > 0.0:
+            initial_range = ranges[idx - 1] * fuel_target / fuel_targets[idx - 1]
+        else:
+            initial_range = initial_ranges[idx]
+        range_point, _, ier, message = fsolve(
+            ComputePayloadRange.fuel_function,
+            initial_range,
+            args=(fuel_target, mass, problem),
+            xtol=0.01,
+            full_output=True,
+        )
+        if ier != 1:
+            _LOGGER.warning(
+                "Computation of a point of the dense payload-range curve failed. Error message : "
+                "%s",
+                message,
+            )
+        ranges[idx] = range_point[0]
+
+    return ranges
+
+
+def _compute_ranges_chunk(
+    propulsion_id: str,
+    mission_inputs: list,
+    mission_values: dict,
+    fuel_targets,
+    masses,
+    initial_ranges,
+) -> np.ndarray:
+    """Same as :func:`compute_ranges`, with a mission problem built in the process."""
+    problem = build_mission_problem(propulsion_id, mission_inputs)
+    for var_name, var_units, _ in mission_inputs:
+        problem.set_val(var_name, mission_values[var_name], units=var_units)
+
+    return compute_ranges(problem, fuel_targets, masses, initial_ranges)
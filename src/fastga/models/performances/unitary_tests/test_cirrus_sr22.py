@@ -368,3 +368,33 @@ def test_payload_range():
     specific_range_array = problem.get_val("data:payload_range:specific_range_array", units="NM/kg")
     specific_range_result = np.array([0.0, 6.24, 6.47, 6.58, 7.45])
     assert np.max(np.abs(specific_range_array - specific_range_result)) <= 1e-1
+
+
+def test_payload_range_dense():
+    """Tests the dense payload range curve computed by several processes. With 4 points, the
+    curve is made of points A, B, D and E of the payload range diagram."""
+
+    # Research independent input value in .xml file
+    ivc = get_indep_var_comp(
+        list_inputs(ComputePayloadRange(propulsion_id=ENGINE_WRAPPER)), __file__, XML_FILE
+    )
+    # Run problem and check obtained value(s) is/(are) correct
+    # noinspection PyTypeChecker
+    problem = run_system(
+        ComputePayloadRange(propulsion_id=ENGINE_WRAPPER, dense_points_number=4, max_workers=2), ivc
+    )
+    payload_array = problem.get_val("data:payload_range:dense:payload_array", units="kg")
+    payload_result = np.array([420, 420, 310.697, 0])
+    assert np.max(np.abs(payload_array - payload_result)) <= 1e-1
+    range_array = problem.get_val("data:payload_range:dense:range_array", units="NM")
+    range_result = np.array([0.0, 1172.88, 1958.44, 2214.56])
+    assert np.max(np.abs(range_array - range_result)) <= 1
+    specific_range_array = problem.get_val(
+        "data:payload_range:dense:specific_range_array", units="NM/kg"
+    )
+    specific_range_result = np.array([0.0, 6.24, 6.58, 7.45])
+    assert np.max(np.abs(specific_range_array - specific_range_result)) <= 1e-1
+
+    # Corner points are unchanged by the dense curve
+    corner_range_array = problem.get_val("data:payload_range:range_array", units="NM")
+    assert np.max(np.abs(corner_range_array[[0, 1, 3, 4]] - range_result)) <= 1
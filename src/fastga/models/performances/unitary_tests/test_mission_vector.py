@@ -0,0 +1,212 @@
+"""Test module for the partial derivatives of the vectorized mission components"""
+#  This file is part of FAST-OAD_CS23 : A framework for rapid Overall Aircraft Design
+#  Copyright (C) 2022  ONERA & ISAE-SUPAERO
+#  FAST is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import numpy as np
+import openmdao.api as om
+import pytest
+from stdatm import Atmosphere
+
+from fastga.models.performances.mission.mission_components import (
+    POINTS_NB_CLIMB,
+    POINTS_NB_CRUISE,
+    POINTS_NB_DESCENT,
+)
+from fastga.models.performances.mission_vector.mission.atmosphere_derivatives import (
+    density_derivative,
+    TROPOPAUSE_ALTITUDE,
+)
+from fastga.models.performances.mission_vector.mission.compute_time_step import ComputeTimeStep
+from fastga.models.performances.mission_vector.mission.energy_consumption_preparation import (
+    PrepareForEnergyConsumption,
+)
+from fastga.models.performances.mission_vector.mission.equilibrium import Equilibrium
+from fastga.models.performances.mission_vector.mission.performance_per_phase import (
+    PerformancePerPhase,
+)
+from fastga.models.performances.mission_vector.mission.update_mass import UpdateMass
+
+from tests.testing_utilities import run_system, get_indep_var_comp, list_inputs
+
+XML_FILE = "cirrus_sr22.xml"
+
+# Points on both sides of the tropopause, with slipstream effects
+ALTITUDES = np.array([0.0, 2500.0, TROPOPAUSE_ALTITUDE - 10.0, TROPOPAUSE_ALTITUDE + 10.0, 14000.0])
+POINTS_NB = len(ALTITUDES)
+# Number of points of the whole mission, on which the phases are split
+MISSION_POINTS_NB = POINTS_NB_CLIMB + POINTS_NB_CRUISE + POINTS_NB_DESCENT
+
+
+def _get_equilibrium_problem(flaps_position: str):
+    """Returns the problem of an equilibrium on the cirrus data, at conditions of ALTITUDES."""
+
+    equilibrium = Equilibrium(number_of_points=POINTS_NB, flaps_position=flaps_position)
+    ivc = get_indep_var_comp(list_inputs(equilibrium), __file__, XML_FILE)
+    ivc.add_output("d_vx_dt", val=np.linspace(-0.2, 0.4, POINTS_NB), units="m/s**2")
+    ivc.add_output("mass", val=np.linspace(1600.0, 1400.0, POINTS_NB), units="kg")
+    ivc.add_output("x_cg", val=np.linspace(2.9, 3.1, POINTS_NB), units="m")
+    ivc.add_output("gamma", val=np.linspace(-3.0, 5.0, POINTS_NB), units="deg")
+    ivc.add_output("altitude", val=ALTITUDES, units="m")
+    ivc.add_output("true_airspeed", val=np.linspace(40.0, 90.0, POINTS_NB), units="m/s")
+    ivc.add_output("delta_Cl", val=np.linspace(0.02, 0.1, POINTS_NB))
+    ivc.add_output("delta_Cd", val=np.linspace(0.001, 0.003, POINTS_NB))
+    ivc.add_output("delta_Cm", val=np.linspace(-0.01, -0.03, POINTS_NB))
+
+    problem = run_system(
+        Equilibrium(number_of_points=POINTS_NB, flaps_position=flaps_position), ivc
+    )
+    # Partials are checked away from the initial guesses, at the same point for all the tests
+    problem.set_val("alpha", np.linspace(2.0, 8.0, POINTS_NB), units="deg")
+    problem.set_val("thrust", np.linspace(2500.0, 1500.0, POINTS_NB), units="N")
+    problem.set_val("delta_m", np.linspace(-6.0, -2.0, POINTS_NB), units="deg")
+
+    return problem
+
+
+def _assert_partials(data, rel: float = 1e-5, abs_tol: float = 1e-6):
+    """Checks that all the analytic partials of check_partials data match the finite ones."""
+    for component_data in data.values():
+        for (of_name, wrt_name), partial in component_data.items():
+            assert partial["J_fwd"] == pytest.approx(
+                partial["J_fd"], rel=rel, abs=abs_tol
+            ), "%s wrt %s" % (of_name, wrt_name)
+
+
+def test_density_derivative():
+    """Tests the density derivative against central differences of stdatm density, on both
+    sides of the tropopause and with temperature increments."""
+
+    altitudes = np.array(
+        [
+            0.0,
+            3000.0,
+            TROPOPAUSE_ALTITUDE - 500.0,
+            TROPOPAUSE_ALTITUDE - 1.0,
+            TROPOPAUSE_ALTITUDE + 1.0,
+            15000.0,
+        ]
+    )
+    step = 0.1
+    for delta_t in [0.0, 15.0, -10.0]:
+        density_plus = Atmosphere(altitudes + step, delta_t, altitude_in_feet=False).density
+        density_minus = Atmosphere(altitudes - step, delta_t, altitude_in_feet=False).density
+        finite_differences = (density_plus - density_minus) / (2.0 * step)
+        assert density_derivative(altitudes, delta_t) == pytest.approx(finite_differences, rel=1e-6)
+
+    assert np.shape(density_derivative(1000.0)) == ()
+
+
+@pytest.mark.parametrize("flaps_position", ["cruise", "takeoff", "landing"])
+def test_equilibrium_altitude_partials(flaps_position):
+    """Tests the analytic altitude partials of the equilibrium, in the troposphere and the
+    stratosphere."""
+
+    problem = _get_equilibrium_problem(flaps_position)
+    data = problem.check_partials(out_stream=None, form="central")
+
+    for of_name in ["alpha", "thrust"]:
+        partial = data["component"][(of_name, "altitude")]
+        assert np.any(partial["J_fwd"] != 0.0)
+        assert partial["J_fwd"] == pytest.approx(partial["J_fd"], rel=1e-5)
+
+
+def test_equilibrium_slipstream_drag_partials():
+    """Tests the thrust partials of the equilibrium, whose induced drag comes from the wing lift
+    with flaps but without the slipstream contribution."""
+
+    problem = _get_equilibrium_problem("landing")
+    data = problem.check_partials(out_stream=None, form="central")
+
+    for wrt_name in [
+        "alpha",
+        "true_airspeed",
+        "altitude",
+        "data:aerodynamics:wing:cruise:CL0_clean",
+        "data:aerodynamics:wing:cruise:CL_alpha",
+        "data:aerodynamics:wing:cruise:induced_drag_coefficient",
+        "data:aerodynamics:flaps:landing:CL",
+    ]:
+        partial = data["component"][("thrust", wrt_name)]
+        assert partial["J_fwd"] == pytest.approx(partial["J_fd"], rel=1e-5, abs=1e-6)
+
+
+@pytest.mark.parametrize("flaps_position", ["cruise", "takeoff", "landing"])
+def test_equilibrium_partials(flaps_position):
+
+    problem = _get_equilibrium_problem(flaps_position)
+
+    _assert_partials(problem.check_partials(out_stream=None, form="central"))
+
+
+def test_performance_per_phase_partials():
+
+    ivc = om.IndepVarComp()
+    ivc.add_output("time", val=np.linspace(0.0, 15000.0, MISSION_POINTS_NB), units="s")
+    ivc.add_output("position", val=np.linspace(0.0, 2.0e6, MISSION_POINTS_NB), units="m")
+    ivc.add_output(
+        "fuel_consumed_t_econ", val=np.linspace(0.3, 0.1, MISSION_POINTS_NB + 2), units="kg"
+    )
+    ivc.add_output("non_consumable_energy_t_econ", val=np.zeros(MISSION_POINTS_NB + 2), units="W*h")
+    ivc.add_output("thrust_rate_t_econ", val=np.linspace(0.9, 0.3, MISSION_POINTS_NB + 2))
+
+    problem = run_system(PerformancePerPhase(number_of_points=MISSION_POINTS_NB), ivc)
+    climb_fuel = problem.get_val("data:mission:sizing:main_route:climb:fuel", units="kg")
+    assert climb_fuel == pytest.approx(
+        np.sum(np.linspace(0.3, 0.1, MISSION_POINTS_NB + 2)[:POINTS_NB_CLIMB]), rel=1e-10
+    )
+
+    _assert_partials(problem.check_partials(out_stream=None, form="central"))
+
+
+def test_prepare_for_energy_consumption_partials():
+
+    ivc = get_indep_var_comp(
+        list_inputs(PrepareForEnergyConsumption(number_of_points=MISSION_POINTS_NB)),
+        __file__,
+        XML_FILE,
+    )
+    ivc.add_output("thrust", val=np.linspace(2500.0, 500.0, MISSION_POINTS_NB), units="N")
+    ivc.add_output("altitude", val=np.linspace(0.0, 2400.0, MISSION_POINTS_NB), units="m")
+    ivc.add_output("time_step", val=np.linspace(20.0, 80.0, MISSION_POINTS_NB), units="s")
+    ivc.add_output("true_airspeed", val=np.linspace(40.0, 80.0, MISSION_POINTS_NB), units="m/s")
+    ivc.add_output("engine_setting", val=np.full(MISSION_POINTS_NB, 2.0))
+
+    problem = run_system(PrepareForEnergyConsumption(number_of_points=MISSION_POINTS_NB), ivc)
+    time_step_econ = problem.get_val("time_step_econ", units="s")
+    assert time_step_econ[-2:] == pytest.approx([300.0, 300.0], rel=1e-10)
+
+    _assert_partials(problem.check_partials(out_stream=None, form="central"))
+
+
+def test_compute_time_step_partials():
+
+    ivc = om.IndepVarComp()
+    ivc.add_output("time", val=np.linspace(0.0, 100.0, 11) ** 1.5, units="s")
+
+    problem = run_system(ComputeTimeStep(number_of_points=11), ivc)
+    time_step = problem.get_val("time_step", units="s")
+    assert time_step[-1] == pytest.approx(time_step[-2], rel=1e-10)
+
+    _assert_partials(problem.check_partials(out_stream=None, form="central"))
+
+
+def test_update_mass_partials():
+
+    ivc = get_indep_var_comp(list_inputs(UpdateMass(number_of_points=11)), __file__, XML_FILE)
+    ivc.add_output("fuel_consumed_t", val=np.linspace(0.5, 0.2, 11), units="kg")
+
+    problem = run_system(UpdateMass(number_of_points=11), ivc)
+    mass = problem.get_val("mass", units="kg")
+    assert mass[0] - mass[-1] == pytest.approx(np.sum(np.linspace(0.5, 0.2, 11)[:-1]), rel=1e-10)
+
+    _assert_partials(problem.check_partials(out_stream=None, form="central"))
@@ -0,0 +1,89 @@
+"""Test module for the computation of the dense payload range curve"""
+#  This file is part of FAST-OAD_CS23 : A framework for rapid Overall Aircraft Design
+#  Copyright (C) 2022  ONERA & ISAE-SUPAERO
+#  FAST is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import numpy as np
+import openmdao.api as om
+import pytest
+
+from ..payload_range import payload_range
+from ..payload_range.payload_range import compute_ranges, _compute_ranges_chunk
+
+MISSION_INPUTS = [("data:mission:dummy:fuel_rate", None, (1,))]
+
+
+class _DummyMission(om.ExplicitComponent):
+    """Mission whose fuel is proportional to the range and to the take-off weight."""
+
+    def setup(self):
+        self.add_input("data:TLAR:range", val=np.nan, units="m")
+        self.add_input("data:weight:aircraft:MTOW", val=np.nan, units="kg")
+        self.add_input("data:mission:dummy:fuel_rate", val=np.nan)
+
+        self.add_output("data:mission:sizing:fuel", units="kg")
+
+    def compute(self, inputs, outputs, discrete_inputs=None, discrete_outputs=None):
+        outputs["data:mission:sizing:fuel"] = (
+            inputs["data:mission:dummy:fuel_rate"]
+            * inputs["data:TLAR:range"]
+            * inputs["data:weight:aircraft:MTOW"]
+        )
+
+
+def _build_dummy_mission_problem(propulsion_id: str, mission_inputs: list) -> om.Problem:
+    ivc = om.IndepVarComp()
+    for var_name, var_units, var_shape in mission_inputs:
+        ivc.add_output(name=var_name, val=np.nan, units=var_units, shape=var_shape)
+    ivc.add_output("data:TLAR:range", val=1.0e6, units="m")
+    ivc.add_output("data:weight:aircraft:MTOW", val=1500.0, units="kg")
+
+    problem = om.Problem()
+    problem.model.add_subsystem("ivc", ivc, promotes=["*"])
+    problem.model.add_subsystem("mission", _DummyMission(), promotes=["*"])
+    problem.setup()
+
+    return problem
+
+
+def test_compute_ranges():
+    """Tests the ranges at which the mission needs the target fuel, with a point without fuel."""
+
+    problem = _build_dummy_mission_problem("", MISSION_INPUTS)
+    problem.set_val("data:mission:dummy:fuel_rate", 1.0e-10)
+    fuel_targets = np.array([0.0, 100.0, 150.0, 200.0])
+    masses = np.array([1200.0, 1300.0, 1400.0, 1400.0])
+
+    ranges = compute_ranges(problem, fuel_targets, masses, np.full(4, 1.0e6))
+
+    assert ranges[0] == 0.0
+    assert ranges[1:] == pytest.approx(fuel_targets[1:] / (1.0e-10 * masses[1:]), rel=1e-6)
+
+
+def test_compute_ranges_chunk(monkeypatch):
+    """Tests that a chunk of points is computed on its own mission problem with the given
+    inputs."""
+
+    monkeypatch.setattr(payload_range, "build_mission_problem", _build_dummy_mission_problem)
+    fuel_targets = np.array([100.0, 200.0])
+    masses = np.array([1300.0, 1400.0])
+
+    ranges = _compute_ranges_chunk(
+        "",
+        MISSION_INPUTS,
+        {"data:mission:dummy:fuel_rate": np.array([2.0e-10])},
+        fuel_targets,
+        masses,
+        np.full(2, 1.0e6),
+    )
+
+    assert ranges == pytest.approx(fuel_targets / (2.0e-10 * masses), rel=1e-6)
@@ -12,15 +12,26 @@
 #  You should have received a copy of the GNU General Public License
 #  along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
+import threading
 from abc import ABC, abstractmethod
-from typing import Union
+from collections import OrderedDict
+from typing import Callable, Union
 
+import numpy as np
 import pandas as pd
+from scipy.interpolate import RectBivariateSpline
 
 import fastoad.api as oad
+from stdatm import Atmosphere
 
 from fastga.models.propulsion.propulsion import IPropulsionCS23
 
+# Maximum number of engine instances kept by get_engine
+ENGINE_CACHE_SIZE = 16
+
+_ENGINE_CACHE = OrderedDict()
+_ENGINE_CACHE_LOCK = threading.Lock()
+
 
 class AbstractFuelPropulsion(IPropulsionCS23, ABC):
     """
@@ -75,3 +86,168 @@ class FuelEngineSet(AbstractFuelPropulsion):
     def compute_drag(self, mach, unit_reynolds, wing_mac):
 
         return self.engine.compute_drag(mach, unit_reynolds, wing_mac)
+
+
+def get_engine(engine_class: type, **engine_params) -> IPropulsionCS23:
+    """
+    Returns an instance of engine_class built with the given parameters.
+
+    The last built instances are kept, so that an engine is not built again as long as its
+    parameters do not change, e.g. between the iterations of a solver. The cached instance is
+    shared by all the callers.
+
+    :param engine_class: class of the engine
+    :param engine_params: keyword arguments of the engine class constructor
+    :return: an engine_class instance
+    """
+    # Parameters are copied as they can be views on OpenMDAO vectors that change afterwards
+    engine_params = {
+        name: value.copy() if isinstance(value, np.ndarray) else value
+        for name, value in engine_params.items()
+    }
+    key = (engine_class,) + tuple(
+        (name, _get_hashable_value(value)) for name, value in sorted(engine_params.items())
+    )
+
+    with _ENGINE_CACHE_LOCK:
+        engine = _ENGINE_CACHE.get(key)
+        if engine is not None:
+            _ENGINE_CACHE.move_to_end(key)
+            return engine
+
+    engine = engine_class(**engine_params)
+
+    with _ENGINE_CACHE_LOCK:
+        _ENGINE_CACHE[key] = engine
+        while len(_ENGINE_CACHE) > ENGINE_CACHE_SIZE:
+            _ENGINE_CACHE.popitem(last=False)
+
+    return engine
+
+
+def _get_hashable_value(value) -> tuple:
+    """Returns a hashable form of a parameter value, that is equal only for equal values."""
+    value = np.asarray(value)
+
+    return value.dtype.str, value.shape, value.tobytes()
+
+
+def cubic_interpolator(x, y, z) -> RectBivariateSpline:
+    """
+    Builds the bicubic spline of values defined on a rectangular grid, same spline as
+    scipy interp2d with kind="cubic", but that evaluates point-wise on arrays with its ev method.
+    Outside of the grid, the value at the closest point of the grid boundary is used.
+
+    :param x: abscissas of the grid
+    :param y: ordinates of the grid
+    :param z: values on the grid, of shape (len(y), len(x))
+    :return: the spline of z(x, y)
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    z = np.asarray(z, dtype=float)
+    # Same sorting of the grid as interp2d
+    x_order = np.argsort(x)
+    y_order = np.argsort(y)
+
+    return RectBivariateSpline(x[x_order], y[y_order], z[y_order][:, x_order].T, kx=3, ky=3, s=0)
+
+
+def propeller_thrust_at_power(
+    propeller_efficiency: Callable[[np.ndarray, Atmosphere], np.ndarray],
+    power,
+    thrust_min: float,
+    thrust_max_propeller,
+    atmosphere: Atmosphere,
+) -> np.ndarray:
+    """
+    Computes the thrust of a propeller driven at a given shaft power, for all the flight points
+    at once.
+
+    The shaft power is computed on 10 thrusts between thrust_min and the propeller thrust limit,
+    and the thrust is interpolated at the given power, so that it is limited by the propeller. When
+    even thrust_min requires more power, the thrust is found by a fixed-point iteration on the
+    propeller efficiency, run for all those flight points at once until each of them converged.
+
+    :param propeller_efficiency: propeller efficiency as a function of thrust and atmosphere
+    :param power: shaft power at each flight point (in W)
+    :param thrust_min: lowest thrust of the propeller table (in N)
+    :param thrust_max_propeller: propeller thrust limit at each flight point (in N)
+    :param atmosphere: Atmosphere instance of the flight points
+    :return: thrust at each flight point (in N), as a 1D array
+    """
+    altitude = np.atleast_1d(atmosphere.get_altitude(altitude_in_feet=False))
+    points_count = np.size(altitude)
+    mach = np.broadcast_to(atmosphere.mach, altitude.shape)
+    true_airspeed = np.broadcast_to(atmosphere.true_airspeed, altitude.shape)
+    power = np.broadcast_to(power, altitude.shape)
+
+    # Shaft power on the thrust interpolation vector of each flight point, all computed at once
+    thrust_interp = np.linspace(
+        thrust_min * np.ones(points_count),
+        np.broadcast_to(thrust_max_propeller, altitude.shape),
+        10,
+    ).transpose()
+    local_atmosphere = Atmosphere(np.repeat(altitude, 10), altitude_in_feet=False)
+    local_atmosphere.mach = np.repeat(mach, 10)
+    propeller_efficiency_interp = np.reshape(
+        propeller_efficiency(thrust_interp.flatten(), local_atmosphere), thrust_interp.shape
+    )
+    mechanical_power = thrust_interp * true_airspeed[:, np.newaxis] / propeller_efficiency_interp
+    thrust = _interpolate_rows(power, mechanical_power, thrust_interp)
+
+    # Take the lower bound efficiency for calculation where the power is too low
+    is_limited = np.min(mechanical_power, axis=1) > power
+    if np.any(is_limited):
+        thrust[is_limited] = _fixed_point_thrust(
+            propeller_efficiency,
+            power[is_limited],
+            propeller_efficiency_interp[is_limited, 0],
+            altitude[is_limited],
+            mach[is_limited],
+            true_airspeed[is_limited],
+        )
+
+    return thrust
+
+
+def _fixed_point_thrust(
+    propeller_efficiency, power, initial_efficiency, altitude, mach, true_airspeed
+) -> np.ndarray:
+    """
+    Fixed-point iteration of the thrust given by a propeller at a given power, each flight point
+    is iterated until its own convergence.
+    """
+    thrust = np.zeros_like(power)
+    efficiency = np.array(initial_efficiency, dtype=float)
+    efficiency_relative_error = np.ones_like(power)
+    not_converged = efficiency_relative_error > 1e-2
+    while np.any(not_converged):
+        thrust[not_converged] = (
+            power[not_converged] * efficiency[not_converged] / true_airspeed[not_converged]
+        )
+        local_atmosphere = Atmosphere(altitude[not_converged], altitude_in_feet=False)
+        local_atmosphere.mach = mach[not_converged]
+        efficiency_new = propeller_efficiency(thrust[not_converged], local_atmosphere)
+        efficiency_relative_error[not_converged] = np.abs(
+            (efficiency_new - efficiency[not_converged]) / efficiency_relative_error[not_converged]
+        )
+        efficiency[not_converged] = efficiency_new
+        not_converged = efficiency_relative_error > 1e-2
+
+    return thrust
+
+
+def _interpolate_rows(x, xp, fp) -> np.ndarray:
+    """
+    Same as np.interp applied to each row: x[i] is interpolated in the increasing abscissas xp[i]
+    of values fp[i], with the values at the ends of the rows outside of their range.
+    """
+    points_count, interp_count = np.shape(xp)
+    rows = np.arange(points_count)
+    idx_high = np.minimum(np.maximum(np.sum(xp <= x[:, np.newaxis], axis=1), 1), interp_count - 1)
+    idx_low = idx_high - 1
+    slope = (fp[rows, idx_high] - fp[rows, idx_low]) / (xp[rows, idx_high] - xp[rows, idx_low])
+    result = slope * (x - xp[rows, idx_low]) + fp[rows, idx_low]
+
+    return np.where(x >= xp[:, -1], fp[:, -1], np.where(x <= xp[:, 0], fp[:, 0], result))
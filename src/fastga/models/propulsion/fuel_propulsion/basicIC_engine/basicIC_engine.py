@@ -16,7 +16,6 @@
 import logging
 import pandas as pd
 from typing import Union, Sequence, Tuple, Optional
-from scipy.interpolate import interp2d
 import os.path as pth
 import numpy as np
 
@@ -25,7 +24,11 @@ from fastoad.constants import EngineSetting
 from fastoad.exceptions import FastUnknownEngineSettingError
 from stdatm import Atmosphere
 
-from fastga.models.propulsion.fuel_propulsion.base import AbstractFuelPropulsion
+from fastga.models.propulsion.fuel_propulsion.base import (
+    AbstractFuelPropulsion,
+    cubic_interpolator,
+    propeller_thrust_at_power,
+)
 from fastga.models.propulsion.dict import DynamicAttributeDict, AddKeyAttributes
 
 from .exceptions import FastBasicICEngineInconsistentInputParametersError
@@ -135,6 +138,23 @@ class BasicICEngine(AbstractFuelPropulsion):
         )  # conversion rpm to rad/s included
         self.volume = volume
 
+        # The interpolations of the engine map and of the propeller tables do not depend on the
+        # flight point, so they are built once and evaluated on whole arrays of flight points
+        torque_vect = pme_vect * 1e5 * volume / (8.0 * np.pi)
+        self._sfc_interpolator = cubic_interpolator(torque_vect, rpm_vect, sfc_matrix)
+        self._propeller_efficiency_SL = cubic_interpolator(
+            self.thrust_SL,
+            self.speed_SL,
+            np.asarray(self.efficiency_SL) * self.effective_efficiency_ls,  # Include the
+            # efficiency loss in here
+        )
+        self._propeller_efficiency_CL = cubic_interpolator(
+            self.thrust_CL,
+            self.speed_CL,
+            np.asarray(self.efficiency_CL) * self.effective_efficiency_cruise,  # Include the
+            # efficiency loss in here
+        )
+
         # Declare sub-components attribute
         self.engine = Engine(power_SL=max_power)
         self.engine.mass = None
@@ -407,61 +427,26 @@ class BasicICEngine(AbstractFuelPropulsion):
         # the change in advance ration is equal to a change in velocity
         installed_airspeed = atmosphere.true_airspeed * self.effective_J
 
-        propeller_efficiency_SL = interp2d(
-            self.thrust_SL,
-            self.speed_SL,
-            self.efficiency_SL * self.effective_efficiency_ls,  # Include the efficiency loss
-            # in here
-            kind="cubic",
+        thrust_interp_SL = np.minimum(
+            np.maximum(np.min(self.thrust_SL), thrust),
+            np.interp(installed_airspeed, self.speed_SL, self.thrust_limit_SL),
         )
-        propeller_efficiency_CL = interp2d(
-            self.thrust_CL,
-            self.speed_CL,
-            self.efficiency_CL * self.effective_efficiency_cruise,  # Include the efficiency loss
-            # in here
-            kind="cubic",
+        thrust_interp_CL = np.minimum(
+            np.maximum(np.min(self.thrust_CL), thrust),
+            np.interp(installed_airspeed, self.speed_CL, self.thrust_limit_CL),
+        )
+        lower_bound = self._propeller_efficiency_SL.ev(thrust_interp_SL, installed_airspeed)
+        upper_bound = self._propeller_efficiency_CL.ev(thrust_interp_CL, installed_airspeed)
+        altitude = atmosphere.get_altitude(altitude_in_feet=False)
+        propeller_efficiency = (
+            lower_bound
+            + (upper_bound - lower_bound)
+            * np.minimum(altitude, self.cruise_altitude_propeller)
+            / self.cruise_altitude_propeller
         )
-        if isinstance(atmosphere.true_airspeed, float):
-            thrust_interp_SL = np.minimum(
-                np.maximum(np.min(self.thrust_SL), thrust),
-                np.interp(installed_airspeed, self.speed_SL, self.thrust_limit_SL),
-            )
-            thrust_interp_CL = np.minimum(
-                np.maximum(np.min(self.thrust_CL), thrust),
-                np.interp(installed_airspeed, self.speed_CL, self.thrust_limit_CL),
-            )
-        else:
-            thrust_interp_SL = np.minimum(
-                np.maximum(np.min(self.thrust_SL), thrust),
-                np.interp(list(installed_airspeed), self.speed_SL, self.thrust_limit_SL),
-            )
-            thrust_interp_CL = np.minimum(
-                np.maximum(np.min(self.thrust_CL), thrust),
-                np.interp(list(installed_airspeed), self.speed_CL, self.thrust_limit_CL),
-            )
-        if np.size(thrust) == 1:  # calculate for float
-            lower_bound = float(propeller_efficiency_SL(thrust_interp_SL, installed_airspeed))
-            upper_bound = float(propeller_efficiency_CL(thrust_interp_CL, installed_airspeed))
-            altitude = atmosphere.get_altitude(altitude_in_feet=False)
-            propeller_efficiency = np.interp(
-                altitude, [0, self.cruise_altitude_propeller], [lower_bound, upper_bound]
-            )
-        else:  # calculate for array
-            propeller_efficiency = np.zeros(np.size(thrust))
-            for idx in range(np.size(thrust)):
-                lower_bound = propeller_efficiency_SL(
-                    thrust_interp_SL[idx], installed_airspeed[idx]
-                )
-                upper_bound = propeller_efficiency_CL(
-                    thrust_interp_CL[idx], installed_airspeed[idx]
-                )
-                altitude = atmosphere.get_altitude(altitude_in_feet=False)[idx]
-                propeller_efficiency[idx] = (
-                    lower_bound
-                    + (upper_bound - lower_bound)
-                    * np.minimum(altitude, self.cruise_altitude_propeller)
-                    / self.cruise_altitude_propeller
-                )
+
+        if np.size(propeller_efficiency) == 1:
+            return float(propeller_efficiency)
 
         return propeller_efficiency
 
@@ -492,52 +477,36 @@ class BasicICEngine(AbstractFuelPropulsion):
         :param atmosphere: Atmosphere instance at intended altitude
         :return: SFC (in g/kw) and Power (in W)
         """
-        # Load engine map and save interpolation formula
-        rpm_vect = self.rpm_vect_ref
-        pme_vect = self.pme_vect_ref
-        sfc_matrix = self.sfc_matrix_ref
-        torque_vect = pme_vect * 1e5 * self.volume / (8.0 * np.pi)
-        ICE_sfc = interp2d(torque_vect, rpm_vect, sfc_matrix, kind="cubic")
-
         # Define RPM & mixture using engine settings
-        if np.size(engine_setting) == 1:
-            rpm_values = self.rpm_values[int(engine_setting)]
-            mixture_values = self.mixture_values[int(engine_setting)]
-        else:
-            rpm_values = np.array(
-                [self.rpm_values[engine_setting[idx]] for idx in range(np.size(engine_setting))]
-            )
-            mixture_values = np.array(
-                [self.mixture_values[engine_setting[idx]] for idx in range(np.size(engine_setting))]
-            )
+        rpm_values = self._get_engine_setting_values(self.rpm_values, engine_setting)
+        mixture_values = self._get_engine_setting_values(self.mixture_values, engine_setting)
+
+        # Compute sfc @ given RPM
+        real_power = (
+            thrust * atmosphere.true_airspeed / self.propeller_efficiency(thrust, atmosphere)
+        )
+        torque = real_power / (rpm_values * np.pi / 30.0)
+        sfc = self._sfc_interpolator.ev(torque, rpm_values) * mixture_values * self.k_factor_sfc
 
-        # Compute sfc @ 2500RPM
-        real_power = np.zeros(np.size(thrust))
-        torque = np.zeros(np.size(thrust))
-        sfc = np.zeros(np.size(thrust))
-        if np.size(thrust) == 1:
-            real_power = (
-                thrust * atmosphere.true_airspeed / self.propeller_efficiency(thrust, atmosphere)
-            )
-            torque = real_power / (rpm_values * np.pi / 30.0)
-            sfc = ICE_sfc(torque, rpm_values) * mixture_values * self.k_factor_sfc
-        else:
-            for idx in range(np.size(thrust)):
-                local_atmosphere = Atmosphere(
-                    atmosphere.get_altitude()[idx], altitude_in_feet=False
-                )
-                local_atmosphere.mach = atmosphere.mach[idx]
-                real_power[idx] = (
-                    thrust[idx]
-                    * atmosphere.true_airspeed[idx]
-                    / self.propeller_efficiency(thrust[idx], local_atmosphere)
-                )
-                torque[idx] = real_power[idx] / (rpm_values[idx] * np.pi / 30.0)
-                sfc[idx] = (
-                    ICE_sfc(torque[idx], rpm_values[idx]) * mixture_values[idx] * self.k_factor_sfc
-                )
         return sfc, real_power
 
+    @staticmethod
+    def _get_engine_setting_values(
+        values: dict, engine_setting: Union[float, Sequence[float]]
+    ) -> np.ndarray:
+        """
+        Gets the value associated to each engine setting.
+
+        :param values: dictionary of the values with EngineSetting as keys
+        :param engine_setting: Engine settings (climb, cruise,... )
+        :return: array of the values, with the shape of engine_setting
+        """
+        engine_setting = np.asarray(engine_setting)
+
+        return np.array(
+            [values[int(setting)] for setting in engine_setting.flatten()], dtype=float
+        ).reshape(engine_setting.shape)
+
     def max_thrust(
         self,
         engine_setting: Union[float, Sequence[float]],
@@ -551,16 +520,8 @@ class BasicICEngine(AbstractFuelPropulsion):
         :return: maximum thrust (in N)
         """
         # Calculate maximum propeller thrust @ given altitude and speed
-        if isinstance(atmosphere.true_airspeed, float):
-            lower_bound = np.interp(atmosphere.true_airspeed, self.speed_SL, self.thrust_limit_SL)
-            upper_bound = np.interp(atmosphere.true_airspeed, self.speed_CL, self.thrust_limit_CL)
-        else:
-            lower_bound = np.interp(
-                list(atmosphere.true_airspeed), self.speed_SL, self.thrust_limit_SL
-            )
-            upper_bound = np.interp(
-                list(atmosphere.true_airspeed), self.speed_CL, self.thrust_limit_CL
-            )
+        lower_bound = np.interp(atmosphere.true_airspeed, self.speed_SL, self.thrust_limit_SL)
+        upper_bound = np.interp(atmosphere.true_airspeed, self.speed_CL, self.thrust_limit_CL)
         altitude = atmosphere.get_altitude(altitude_in_feet=False)
         thrust_max_propeller = (
             lower_bound
@@ -574,85 +535,22 @@ class BasicICEngine(AbstractFuelPropulsion):
         pme_limit_vect = self.pme_limit_vect_ref
         torque_vect = pme_limit_vect * 1e5 * self.volume / (8.0 * np.pi)
         power_max_vect = torque_vect * rpm_vect * (np.pi / 30.0)
-        if np.size(engine_setting) == 1:
-            rpm_values = np.array(self.rpm_values[int(engine_setting)])
-            max_power_SL = np.interp(rpm_values, rpm_vect, power_max_vect)
-        else:
-            rpm_values = np.array(
-                [self.rpm_values[engine_setting[idx]] for idx in range(np.size(engine_setting))]
-            )
-            max_power_SL = np.interp(list(rpm_values), rpm_vect, power_max_vect)
+        rpm_values = self._get_engine_setting_values(self.rpm_values, engine_setting)
+        max_power_SL = np.interp(rpm_values, rpm_vect, power_max_vect)
         sigma = atmosphere.density / Atmosphere(0.0).density
         max_power = max_power_SL * (sigma - (1 - sigma) / 7.55)
 
-        # Found thrust relative to ICE maximum power @ given altitude and speed: calculates first
-        # thrust interpolation vector (between min and max of propeller table) and associated
-        # efficiency, then calculates power and found thrust (interpolation limits to max
-        # propeller thrust)
-        thrust_interp = np.linspace(
-            np.min(self.thrust_SL) * np.ones(np.size(thrust_max_propeller)),
+        # Found thrust relative to ICE maximum power @ given altitude and speed, for all flight
+        # points at once (interpolation limits to max propeller thrust)
+        thrust_max_global = propeller_thrust_at_power(
+            self.propeller_efficiency,
+            max_power,
+            np.min(self.thrust_SL),
             thrust_max_propeller,
-            10,
-        ).transpose()
-        if np.size(altitude) == 1:  # Calculate for float
-            thrust_max_global = 0.0
-            local_atmosphere = Atmosphere(
-                altitude * np.ones(np.size(thrust_interp)), altitude_in_feet=False
-            )
-            local_atmosphere.mach = atmosphere.mach * np.ones(np.size(thrust_interp))
-            propeller_efficiency = self.propeller_efficiency(thrust_interp[0], local_atmosphere)
-            mechanical_power = thrust_interp[0] * atmosphere.true_airspeed / propeller_efficiency
-            if np.min(mechanical_power) > max_power:
-                efficiency_relative_error = 1
-                propeller_efficiency = propeller_efficiency[0]
-                while efficiency_relative_error > 1e-2:
-                    thrust_max_global = max_power * propeller_efficiency / atmosphere.true_airspeed
-                    propeller_efficiency_new = self.propeller_efficiency(
-                        thrust_max_global, atmosphere
-                    )
-                    efficiency_relative_error = np.abs(
-                        (propeller_efficiency_new - propeller_efficiency)
-                        / efficiency_relative_error
-                    )
-                    propeller_efficiency = propeller_efficiency_new
-            else:
-                thrust_max_global = np.interp(max_power, mechanical_power, thrust_interp[0])
-        else:  # Calculate for array
-            thrust_max_global = np.zeros(np.size(altitude))
-            for idx in range(np.size(altitude)):
-                local_atmosphere = Atmosphere(
-                    altitude[idx] * np.ones(np.size(thrust_interp[idx])), altitude_in_feet=False
-                )
-                local_atmosphere.mach = atmosphere.mach[idx] * np.ones(np.size(thrust_interp[idx]))
-                propeller_efficiency = self.propeller_efficiency(
-                    thrust_interp[idx], local_atmosphere
-                )
-                mechanical_power = (
-                    thrust_interp[idx] * atmosphere.true_airspeed[idx] / propeller_efficiency
-                )
-                if (
-                    np.min(mechanical_power) > max_power[idx]
-                ):  # take the lower bound efficiency for calculation
-                    efficiency_relative_error = 1
-                    local_atmosphere = Atmosphere(altitude[idx], altitude_in_feet=False)
-                    local_atmosphere.mach = atmosphere.mach[idx]
-                    propeller_efficiency = propeller_efficiency[0]
-                    while efficiency_relative_error > 1e-2:
-                        thrust_max_global[idx] = (
-                            max_power[idx] * propeller_efficiency / atmosphere.true_airspeed[idx]
-                        )
-                        propeller_efficiency_new = self.propeller_efficiency(
-                            thrust_max_global[idx], local_atmosphere
-                        )
-                        efficiency_relative_error = np.abs(
-                            (propeller_efficiency_new - propeller_efficiency)
-                            / efficiency_relative_error
-                        )
-                        propeller_efficiency = propeller_efficiency_new
-                else:
-                    thrust_max_global[idx] = np.interp(
-                        max_power[idx], mechanical_power, thrust_interp[idx]
-                    )
+            atmosphere,
+        )
+        if np.size(altitude) == 1:  # Return a float for a single flight point
+            thrust_max_global = thrust_max_global[0]
 
         return thrust_max_global
 
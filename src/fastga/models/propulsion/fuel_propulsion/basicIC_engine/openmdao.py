@@ -19,7 +19,7 @@ import fastoad.api as oad
 
 from fastga.models.propulsion.propulsion import IPropulsion, BaseOMPropulsionComponent
 from fastga.models.propulsion.fuel_propulsion.basicIC_engine.basicIC_engine import BasicICEngine
-from fastga.models.propulsion.fuel_propulsion.base import FuelEngineSet
+from fastga.models.propulsion.fuel_propulsion.base import FuelEngineSet, get_engine
 from fastga.models.aerodynamics.external.propeller_code.compute_propeller_aero import (
     THRUST_PTS_NB,
     SPEED_PTS_NB,
@@ -162,7 +162,8 @@ class OMBasicICEngineWrapper(oad.IOMPropulsionWrapper):
         }
 
         return FuelEngineSet(
-            BasicICEngine(**engine_params), inputs["data:geometry:propulsion:engine:count"]
+            get_engine(BasicICEngine, **engine_params),
+            inputs["data:geometry:propulsion:engine:count"],
         )
 
 
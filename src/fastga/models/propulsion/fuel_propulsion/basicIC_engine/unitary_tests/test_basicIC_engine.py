@@ -16,6 +16,7 @@ import numpy as np
 
 import fastoad.api as oad
 from fastoad.constants import EngineSetting
+from stdatm import Atmosphere
 
 from ..basicIC_engine import BasicICEngine
 
@@ -836,7 +837,7 @@ def test_compute_flight_points():
         EngineSetting.IDLE,
         EngineSetting.CRUISE,
     ]  # mix EngineSetting with integers
-    expected_sfc = [2.488831e-16, 1.398174e-05, 1.398174e-05, 2.040742e-05, 1.553841e-05]
+    expected_sfc = [2.488831e-16, 1.398174e-05, 1.398174e-05, 2.145666e-05, 1.553841e-05]
 
     flight_points = oad.FlightPoint(
         mach=machs + machs,
@@ -851,6 +852,20 @@ def test_compute_flight_points():
     np.testing.assert_allclose(flight_points.thrust_rate, thrust_rates + thrust_rates, rtol=1e-4)
     np.testing.assert_allclose(flight_points.thrust, thrusts + thrusts, rtol=1e-4)
 
+    # Array computation should give the same results as the computation of each point
+    for idx, (mach, altitude, engine_setting, thrust) in enumerate(
+        zip(machs, altitudes, engine_settings, thrusts)
+    ):
+        flight_point = oad.FlightPoint(
+            mach=float(mach),
+            altitude=float(altitude),
+            engine_setting=engine_setting,
+            thrust_is_regulated=True,
+            thrust=thrust,
+        )
+        engine.compute_flight_points(flight_point)
+        np.testing.assert_allclose(flight_point.sfc, flight_points.sfc[5 + idx], rtol=1e-10)
+
 
 def test_engine_weight():
     # BasicICEngine(max_power(W), design_altitude(m), design_speed(m/s), fuel_type, strokes_nb, prop_layout)
@@ -965,3 +980,49 @@ def test_engine_dim():
     np.testing.assert_allclose(
         _250kw_engine.compute_dimensions(), [0.77, 1.15, 2.05, 7.92], atol=1e-2
     )
+
+
+def test_max_thrust():
+    # A low power engine so that some points are limited by the engine power below the lowest
+    # thrust of the propeller table
+    _15kw_engine = BasicICEngine(
+        15000.0,
+        2400.0,
+        1.0,
+        4.0,
+        1.0,
+        1.0,
+        SPEED,
+        THRUST_SL,
+        THRUST_SL_LIMIT,
+        EFFICIENCY_SL,
+        SPEED,
+        THRUST_CL,
+        THRUST_CL_LIMIT,
+        EFFICIENCY_CL,
+        0.95,  # Effective advance ratio factor
+        0.97,  # Effective efficiency in low speed conditions
+        0.98,  # Effective efficiency in cruise conditions
+    )
+    machs = np.array([0.05, 0.1, 0.2, 0.3, 0.3])
+    altitudes = np.array([0.0, 500.0, 1000.0, 2400.0, 4000.0])
+    engine_settings = np.array(
+        [
+            EngineSetting.TAKEOFF,
+            EngineSetting.CLIMB,
+            EngineSetting.CLIMB,
+            EngineSetting.CRUISE,
+            EngineSetting.IDLE,
+        ]
+    )
+    atmosphere = Atmosphere(altitudes, altitude_in_feet=False)
+    atmosphere.mach = machs
+    max_thrust = _15kw_engine.max_thrust(engine_settings, atmosphere)
+
+    # Array computation should give the same results as the computation of each point
+    for idx, (mach, altitude, engine_setting) in enumerate(zip(machs, altitudes, engine_settings)):
+        atmosphere = Atmosphere(altitude, altitude_in_feet=False)
+        atmosphere.mach = mach
+        np.testing.assert_allclose(
+            _15kw_engine.max_thrust(engine_setting, atmosphere), max_thrust[idx], rtol=1e-10
+        )
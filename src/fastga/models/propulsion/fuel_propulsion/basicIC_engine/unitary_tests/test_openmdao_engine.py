@@ -18,7 +18,7 @@ import numpy as np
 import openmdao.api as om
 from fastoad.constants import EngineSetting
 
-from ..openmdao import OMBasicICEngineComponent
+from ..openmdao import OMBasicICEngineComponent, OMBasicICEngineWrapper
 
 from tests.testing_utilities import run_system
 
@@ -799,7 +799,7 @@ def test_OMBasicICEngineComponent():
         EngineSetting.IDLE,
         EngineSetting.CRUISE,
     ]  # mix EngineSetting with integers
-    expected_sfc = [2.488831e-16, 1.398174e-05, 1.398174e-05, 3.069944e-05, 2.250824e-05]
+    expected_sfc = [2.488831e-16, 1.398174e-05, 1.398174e-05, 3.108261e-05, 2.250824e-05]
 
     ivc = om.IndepVarComp()
     ivc.add_output("data:propulsion:IC_engine:max_power", 130000, units="W")
@@ -844,3 +844,40 @@ def test_OMBasicICEngineComponent():
         problem["data:propulsion:thrust_rate"], [thrust_rates, thrust_rates], rtol=1e-2
     )
     np.testing.assert_allclose(problem["data:propulsion:thrust"], [thrusts, thrusts], rtol=1e-2)
+
+
+def test_engine_model_cache():
+    """Tests that the engine is not built again when its parameters do not change."""
+    inputs = {
+        "data:propulsion:IC_engine:max_power": np.array([130000.0]),
+        "data:propulsion:fuel_type": np.array([1.0]),
+        "data:propulsion:IC_engine:strokes_nb": np.array([4.0]),
+        "data:geometry:propulsion:engine:layout": np.array([1.0]),
+        "settings:propulsion:IC_engine:k_factor_sfc": np.array([1.0]),
+        "data:aerodynamics:propeller:sea_level:speed": SPEED.copy(),
+        "data:aerodynamics:propeller:sea_level:thrust": THRUST_SL.copy(),
+        "data:aerodynamics:propeller:sea_level:thrust_limit": THRUST_SL_LIMIT.copy(),
+        "data:aerodynamics:propeller:sea_level:efficiency": EFFICIENCY_SL.copy(),
+        "data:aerodynamics:propeller:cruise_level:speed": SPEED.copy(),
+        "data:aerodynamics:propeller:cruise_level:thrust": THRUST_CL.copy(),
+        "data:aerodynamics:propeller:cruise_level:thrust_limit": THRUST_CL_LIMIT.copy(),
+        "data:aerodynamics:propeller:cruise_level:efficiency": EFFICIENCY_CL.copy(),
+        "data:aerodynamics:propeller:cruise_level:altitude": np.array([2438.4]),
+        "data:geometry:propulsion:engine:count": np.array([1.0]),
+        "data:aerodynamics:propeller:installation_effect:effective_efficiency:low_speed": (
+            np.array([0.97])
+        ),
+        "data:aerodynamics:propeller:installation_effect:effective_efficiency:cruise": np.array(
+            [0.98]
+        ),
+        "data:aerodynamics:propeller:installation_effect:effective_advance_ratio": np.array([0.95]),
+    }
+    engine = OMBasicICEngineWrapper.get_model(inputs).engine
+    assert OMBasicICEngineWrapper.get_model(inputs).engine is engine
+
+    # Inputs modified in place, as OpenMDAO does, lead to a new engine
+    inputs["data:propulsion:IC_engine:max_power"][0] = 150000.0
+    new_engine = OMBasicICEngineWrapper.get_model(inputs).engine
+    assert new_engine is not engine
+    np.testing.assert_allclose(engine.max_power, 130000.0)
+    np.testing.assert_allclose(new_engine.max_power, 150000.0)
@@ -16,7 +16,7 @@
 import os.path as pth
 import logging
 from typing import Union, Sequence, Tuple, Optional
-from scipy.interpolate import interp2d, interp1d
+from scipy.interpolate import interp1d
 from scipy.optimize import fsolve
 from pandas import read_csv
 import numpy as np
@@ -32,7 +32,11 @@ from fastga.models.propulsion.fuel_propulsion.basicTurbo_prop.exceptions import
     FastBasicTPEngineImpossibleTurbopropGeometry,
     FastBasicTPEngineUnknownLimit,
 )
-from fastga.models.propulsion.fuel_propulsion.base import AbstractFuelPropulsion
+from fastga.models.propulsion.fuel_propulsion.base import (
+    AbstractFuelPropulsion,
+    cubic_interpolator,
+    propeller_thrust_at_power,
+)
 from fastga.models.propulsion.dict import DynamicAttributeDict, AddKeyAttributes
 
 # Logger for this module
@@ -152,6 +156,7 @@ class BasicTPEngine(AbstractFuelPropulsion):
 
         self.cv_c = cv_c
         self.cp_c = cp_c
+        self.cp_cv_c = np.stack((cp_c, cv_c), axis=-1)
 
         # Load the value of the cabin pressure
         self.cabin_pressure = self.air_renewal_coefficients()
@@ -222,6 +227,21 @@ class BasicTPEngine(AbstractFuelPropulsion):
         self.effective_efficiency_cruise = float(effective_efficiency_cruise)
         self.specific_shape = None
 
+        # The interpolations of the propeller tables do not depend on the flight point, so they
+        # are built once and evaluated on whole arrays of flight points
+        self._propeller_efficiency_SL = cubic_interpolator(
+            self.thrust_SL,
+            self.speed_SL,
+            np.asarray(self.efficiency_SL) * self.effective_efficiency_ls,  # Include the
+            # efficiency loss in here
+        )
+        self._propeller_efficiency_CL = cubic_interpolator(
+            self.thrust_CL,
+            self.speed_CL,
+            np.asarray(self.efficiency_CL) * self.effective_efficiency_cruise,  # Include the
+            # efficiency loss in here
+        )
+
         # Declare sub-components attribute
         self.engine = Engine(power_SL=power_design)
         self.engine.mass = None
@@ -276,25 +296,6 @@ class BasicTPEngine(AbstractFuelPropulsion):
             opr_2_opr_1  # Compression ratio relationship between the second and first stages
         )
 
-        # Here some internal attributes are defined.
-
-        self.t_4t_int = 0.0
-        self.t_41t_int = 0.0
-        self.t_45t_int = 0.0
-        self.p_41t_int = 0.0
-        self.opr_int = 0.0
-        self.mach_8_int = 0.0
-        self.g_int = 0.0
-        self.f_fuel_ratio_int = 0.0
-        self.m_int = 0.0
-
-        # Here is where we we store the results of our computations, they are overwritten after
-        # each computation
-        self.t_45t_sol = 0.0
-        self.opr_sol = 0.0
-        self.power_sol = [0.0]
-        self.thrust_sol = [0.0]
-
     @staticmethod
     def air_coefficients_reader():
 
@@ -322,18 +323,21 @@ class BasicTPEngine(AbstractFuelPropulsion):
 
         It evaluates the polynomial interpolation functions for Cp and Cv, shortening code:
 
-        :param temperature: the actual Temperature in Kelvin [K]
+        :param temperature: the actual Temperature in Kelvin [K], can be an array
 
         :return cp_out: The actual Cp value for the given Temperature
         :return cv_out: The actual Cv value for the given Temperature
         :return gamma: The actual gamma value for the given Temperature
         """
 
-        cp_coefficient = self.cp_c
-        cv_coefficient = self.cv_c
-
-        cp_out = np.polyval(cp_coefficient, temperature)
-        cv_out = np.polyval(cv_coefficient, temperature)
+        # Horner scheme as in np.polyval, for Cp and Cv at once and without the overhead of
+        # np.polyval since this is called for every evaluation of the off-design equations
+        temperature = np.asarray(temperature)[..., np.newaxis]
+        cp_cv = 0.0
+        for coefficients in self.cp_cv_c:
+            cp_cv = cp_cv * temperature + coefficients
+        cp_out = cp_cv[..., 0]
+        cv_out = cp_cv[..., 1]
         gamma = cp_out / cv_out
         return cp_out, cv_out, gamma
 
@@ -672,7 +676,8 @@ class BasicTPEngine(AbstractFuelPropulsion):
         """
 
         Solver for an off-design point. Finds the engine properties for which the thermodynamic
-        equations leads to the required performances
+        equations leads to the required performances. Works element-wise on arrays of points, in
+        which case var_to_solve has one column per point.
 
         :param var_to_solve: an array containing the values used to solve the system of
         thermodynamic equation, contains:
@@ -691,6 +696,21 @@ class BasicTPEngine(AbstractFuelPropulsion):
 
         """
 
+        return_array, _ = self._gas_generator_equations(var_to_solve, m_c, p_2t, t_2t, m_air)
+
+        return return_array
+
+    def _gas_generator_equations(self, var_to_solve, m_c, p_2t, t_2t, m_air) -> tuple:
+        """
+        Same as :meth:`turboshaft_performance_solver_real_gas`, but also returns the state of
+        the gas generator.
+
+        :return f: an array containing the application of the thermodynamic equation written as
+        differences to set to 0
+        :return state: dictionary with t_4t, t_41t, t_45t, p_41t, opr, g_r, f_fuel_ratio and
+        air_mass_flow
+        """
+
         t_25t = var_to_solve[0]
         t_3t = var_to_solve[1]
         t_41t = var_to_solve[2]
@@ -698,28 +718,21 @@ class BasicTPEngine(AbstractFuelPropulsion):
         p_3t = var_to_solve[4]
         t_45t = t_41t * self.alfa
 
-        self.t_41t_int = t_41t
-        self.m_int = air_mass_flow
-        self.t_45t_int = t_45t
-
         r_g = 287.0
         g_r = m_air / air_mass_flow
 
-        self.g_int = g_r
-
         f_fuel_ratio = m_c / air_mass_flow
         icb = self.inter_compressor_bleed / air_mass_flow
 
-        self.f_fuel_ratio_int = f_fuel_ratio
-
-        cp_2, _, gamma2 = self.compute_cp_cv_gamma(t_2t)
+        # Properties at all the stations at once
+        cp_stations, _, gamma_stations = self.compute_cp_cv_gamma(
+            np.stack(np.broadcast_arrays(t_2t, t_25t, t_3t, t_41t, t_45t))
+        )
+        cp_2, cp_25, cp_3, cp_41, cp_45 = cp_stations
+        gamma2, gamma25, _, gamma41, _ = gamma_stations
         f1_2, _, _ = self.compute_gamma_functions(gamma2)
-        cp_25, _, gamma25 = self.compute_cp_cv_gamma(t_25t)
         f1_25, _, _ = self.compute_gamma_functions(gamma25)
-        cp_3, _, _ = self.compute_cp_cv_gamma(t_3t)
-        cp_41, _, gamma41 = self.compute_cp_cv_gamma(t_41t)
         _, _, f_gamma_41 = self.compute_gamma_functions(gamma41)
-        cp_45, _, _ = self.compute_cp_cv_gamma(t_45t)
 
         p_25t = p_2t * (t_25t / t_2t) ** (f1_2 * self.eta_225)
         opr_2 = p_3t / p_25t
@@ -734,7 +747,7 @@ class BasicTPEngine(AbstractFuelPropulsion):
 
         p_41t = p_3t * self.pi_cc
 
-        return_array = np.zeros(5)
+        return_array = np.zeros(np.shape(var_to_solve))
         # Temperature change through the combustion chamber
         return_array[0] = 1.0 - air_mass_flow * (
             1 + f_fuel_ratio - g_r - self.cooling_ratio - icb
@@ -772,20 +785,25 @@ class BasicTPEngine(AbstractFuelPropulsion):
             / t_3t
         )
 
-        self.t_4t_int = t_4t
-        self.t_41t_int = t_41t
-        self.t_45t_int = t_45t
-        self.p_41t_int = p_41t
-        self.opr_int = opr
+        state = {
+            "t_4t": t_4t,
+            "t_41t": t_41t,
+            "t_45t": t_45t,
+            "p_41t": p_41t,
+            "opr": opr,
+            "g_r": g_r,
+            "f_fuel_ratio": f_fuel_ratio,
+            "air_mass_flow": air_mass_flow,
+        }
 
-        return return_array
+        return return_array, state
 
     def exhaust_mach_solver_real_gas(self, t_5t, t_45t, p_45t, p_0):
 
         """
 
         Solver for the off-design point exhaust thrust. Finds the total temperature after the
-        power turbine that gives an adapted nozzle
+        power turbine that gives an adapted nozzle. Works element-wise on arrays of points.
 
         :param t_5t: the total temperature after the power turbine, in K
         :param t_45t: the total temperature between the turbines, in K
@@ -797,6 +815,19 @@ class BasicTPEngine(AbstractFuelPropulsion):
 
         """
 
+        function_minimize, _ = self._exhaust_equation(t_5t, t_45t, p_45t, p_0)
+
+        return function_minimize
+
+    def _exhaust_equation(self, t_5t, t_45t, p_45t, p_0) -> tuple:
+        """
+        Same as :meth:`exhaust_mach_solver_real_gas`, but also returns the exhaust mach number.
+
+        :return function_minimize: the expansion equation of the power turbine written as a
+        difference to equate to 0
+        :return mach_8: the exhaust mach number
+        """
+
         _, _, gamma5 = self.compute_cp_cv_gamma(t_5t)
         f1_5, _, f_gamma_5 = self.compute_gamma_functions(gamma5)
         _, _, gamma45 = self.compute_cp_cv_gamma(t_45t)
@@ -815,15 +846,13 @@ class BasicTPEngine(AbstractFuelPropulsion):
         # Temperature change in the power turbine
         function_minimize = 1.0 - t_45t / t_5t * (p_5t / p_45t) ** (f2_45 * self.eta_455)
 
-        self.mach_8_int = mach_8
-
-        return function_minimize
+        return function_minimize, mach_8
 
     def turboshaft_performance_real_gas(self, altitude, flight_mach, m_c):
 
         """
         Computes the characteristics of the engine when a certain fuel flow is injected into the
-        turboprop in certain flight conditions.
+        turboprop in certain flight conditions. Works element-wise on arrays of flight conditions.
 
         :param altitude: the flight altitude, in m
         :param flight_mach: the flight mach
@@ -840,6 +869,38 @@ class BasicTPEngine(AbstractFuelPropulsion):
         :return m: the air flow, in m/s.
         """
 
+        performance = self._turboshaft_performance(altitude, flight_mach, m_c)
+
+        return (
+            performance["t_4t"],
+            performance["air_mass_flow"],
+            performance["power"],
+            performance["f_fuel_ratio"],
+            performance["p_41t"],
+            performance["opr"],
+            performance["t_41t"],
+            performance["t_45t"],
+        )
+
+    def _turboshaft_performance(self, altitude, flight_mach, m_c, initial_values=None) -> dict:
+        """
+        Same as :meth:`turboshaft_performance_real_gas`, for arrays of flight conditions that
+        are solved all at once.
+
+        :param initial_values: starting point of the gas generator solver, as returned in the
+        performance dictionary of a previous call, default start is used if None
+
+        :return performance: dictionary with the gas generator state (see
+        :meth:`_gas_generator_equations`), the power output in kW, the exhaust thrust in N and
+        the solution of the gas generator equations
+        """
+
+        altitude, flight_mach, m_c = np.broadcast_arrays(
+            np.asarray(altitude, dtype=float),
+            np.asarray(flight_mach, dtype=float),
+            np.asarray(m_c, dtype=float),
+        )
+
         performance_atmosphere = Atmosphere(altitude, altitude_in_feet=False)
 
         p_0 = performance_atmosphere.pressure
@@ -860,34 +921,28 @@ class BasicTPEngine(AbstractFuelPropulsion):
         t_2t = t_0t
 
         # Solving the gas generator equation
-        initial_values = np.array([300, 500, 1200, 3, 400000])
-        fsolve(
+        if initial_values is None:
+            initial_values = np.array([300.0, 500.0, 1200.0, 3.0, 400000.0])
+        var_solved = _solve_newton(
             self.turboshaft_performance_solver_real_gas,
             initial_values,
             (m_c, p_2t, t_2t, m_air),
             xtol=1e-8,
         )
+        _, performance = self._gas_generator_equations(var_solved, m_c, p_2t, t_2t, m_air)
 
-        t_4t = self.t_4t_int
-        t_41t = self.t_41t_int
-        t_45t = self.t_45t_int
-        p_41t = self.p_41t_int
-        opr = self.opr_int
-        g_r = self.g_int
-        f_fuel_ratio = self.f_fuel_ratio_int
-        air_mass_flow = self.m_int
-
-        p_45t = p_41t * self.alfa_p
+        t_45t = performance["t_45t"]
+        p_45t = performance["p_41t"] * self.alfa_p
+        air_mass_flow = performance["air_mass_flow"]
+        g_r = performance["g_r"]
+        f_fuel_ratio = performance["f_fuel_ratio"]
         icb = self.inter_compressor_bleed / air_mass_flow
 
         # Solving the exhaust equation
-        t_5t_0 = np.array([[900]])
-        z_minimize = np.array(
-            fsolve(self.exhaust_mach_solver_real_gas, t_5t_0, (t_45t, p_45t, p_0))
-        )
-        t_5t = z_minimize
-
-        mach_8 = self.mach_8_int
+        t_5t = _solve_newton(
+            self.exhaust_mach_solver_real_gas, np.array([900.0]), (t_45t, p_45t, p_0)
+        )[0]
+        _, mach_8 = self._exhaust_equation(t_5t, t_45t, p_45t, p_0)
 
         cp_45, _, _ = self.compute_cp_cv_gamma(t_45t)
         cp_5, _, gamma5 = self.compute_cp_cv_gamma(t_5t)
@@ -910,20 +965,18 @@ class BasicTPEngine(AbstractFuelPropulsion):
             * (v_8 - flight_mach * np.sqrt(t_0 * 287.0 * 1.4))
         )
 
-        power_sol = power / 1000.0
-
-        self.t_45t_sol = t_45t
-        self.opr_sol = opr
-        self.power_sol = power_sol
-        self.thrust_sol = thrust_exhaust
+        performance["power"] = power / 1000.0
+        performance["thrust_exhaust"] = thrust_exhaust
+        performance["var_solved"] = var_solved
 
-        return t_4t, air_mass_flow, power_sol, f_fuel_ratio, p_41t, opr, t_41t, t_45t
+        return performance
 
     def turboshaft_performance_envelope_solver_real_gas(
         self, fuel_flow, limit_name, limit_value, altitude, mach_vol
     ):
         """
-        Function that computes the turboprop performance when one of the engine limits is reached
+        Function that computes the turboprop performance when one of the engine limits is reached.
+        Works element-wise on arrays of flight conditions.
 
         :param fuel_flow: the fuel flow, in kg/s
         :param limit_name: the name of the limit for which we want to find the performance,
@@ -936,53 +989,14 @@ class BasicTPEngine(AbstractFuelPropulsion):
         :return f_value: for the given fuel flow, the difference between the limit and the
         computed value
         """
-        m_c = fuel_flow[0]
 
-        if limit_name == "opr":
-            (
-                _,
-                _,
-                power,
-                _,
-                _,
-                opr,
-                _,
-                t_45t,
-            ) = self.turboshaft_performance_real_gas(altitude, mach_vol, m_c)
-            var_2_return = opr
-
-        elif limit_name == "t_45t":
-            (
-                _,
-                _,
-                power,
-                _,
-                _,
-                opr,
-                _,
-                t_45t,
-            ) = self.turboshaft_performance_real_gas(altitude, mach_vol, m_c)
-            var_2_return = t_45t
-
-        elif limit_name == "power":
-            (
-                _,
-                _,
-                power,
-                _,
-                _,
-                opr,
-                _,
-                t_45t,
-            ) = self.turboshaft_performance_real_gas(altitude, mach_vol, m_c)
-            var_2_return = power
-
-        else:
+        if limit_name not in ["opr", "t_45t", "power"]:
             raise FastBasicTPEngineUnknownLimit(
                 "Unknown limit provided, should be opr, t_45t or power"
             )
 
-        f_value = var_2_return - limit_value
+        performance = self._turboshaft_performance(altitude, mach_vol, fuel_flow)
+        f_value = performance[limit_name] - limit_value
 
         return f_value
 
@@ -991,7 +1005,8 @@ class BasicTPEngine(AbstractFuelPropulsion):
     ):
 
         """
-        Function that finds the fuel flow which leads to the desired engine limit
+        Function that finds the fuel flow which leads to the desired engine limit. Works
+        element-wise on arrays of flight conditions.
 
         :param limit_name: the name of the limit for which we want to find the performance, can be
          "opr", "t_45t" or "power"
@@ -1003,17 +1018,64 @@ class BasicTPEngine(AbstractFuelPropulsion):
         :return fuel_flow: the fuel flow that constrains the engine to the desired limit
         """
 
-        fuel_flow_0 = np.array([0.046 * (1 - altitude / 29000)])
+        fuel_flow, _ = self._solve_envelope_limit(limit_name, limit_value, altitude, mach_vol)
 
-        fuel_flow = np.array(
-            fsolve(
-                self.turboshaft_performance_envelope_solver_real_gas,
-                fuel_flow_0,
-                (limit_name, limit_value, altitude, mach_vol),
+        return fuel_flow
+
+    def _solve_envelope_limit(self, limit_name, limit_value, altitude, mach_vol) -> tuple:
+        """
+        Same as :meth:`turboshaft_performance_envelope_limits_real_gas`, for arrays of flight
+        conditions that are solved all at once.
+
+        :return fuel_flow: the fuel flow that constrains the engine to the desired limit
+        :return performance: the engine performance at this fuel flow, see
+        :meth:`_turboshaft_performance`
+        """
+
+        if limit_name not in ["opr", "t_45t", "power"]:
+            raise FastBasicTPEngineUnknownLimit(
+                "Unknown limit provided, should be opr, t_45t or power"
             )
+
+        altitude, mach_vol, limit_value = np.broadcast_arrays(
+            np.asarray(altitude, dtype=float),
+            np.asarray(mach_vol, dtype=float),
+            np.asarray(limit_value, dtype=float),
+        )
+
+        # The last valid gas generator solution of each point is used as starting point of its
+        # next evaluation, which saves most of the iterations of the inner solver
+        last_var_solved = np.array(
+            np.broadcast_to(
+                np.array([300.0, 500.0, 1200.0, 3.0, 400000.0]).reshape(
+                    (5,) + (1,) * altitude.ndim
+                ),
+                (5,) + altitude.shape,
+            )
+        ).reshape(5, -1)
+
+        def limit_function(fuel_flow, altitude_, mach_vol_, limit_value_, point_index_):
+            point_index_ = np.ravel(point_index_).astype(int)
+            performance_ = self._turboshaft_performance(
+                altitude_, mach_vol_, fuel_flow[0], last_var_solved[:, point_index_]
+            )
+            var_solved = np.reshape(performance_["var_solved"], (5, -1))
+            is_solved = np.all(np.isfinite(var_solved), axis=0)
+            last_var_solved[:, point_index_[is_solved]] = var_solved[:, is_solved]
+            return (performance_[limit_name] - limit_value_)[np.newaxis]
+
+        fuel_flow_0 = np.array([0.046 * (1 - altitude / 29000)])
+        point_index = np.arange(altitude.size).reshape(altitude.shape)
+        fuel_flow = _solve_newton(
+            limit_function,
+            fuel_flow_0,
+            (altitude, mach_vol, limit_value, point_index),
+            xtol=1.49012e-8,
         )[0]
 
-        return fuel_flow
+        return fuel_flow, self._turboshaft_performance(
+            altitude, mach_vol, fuel_flow, last_var_solved.reshape((5,) + altitude.shape)
+        )
 
     def turboshaft_compute_within_limits(self, target_power, altitude, mach_vol):
 
@@ -1021,7 +1083,7 @@ class BasicTPEngine(AbstractFuelPropulsion):
         Computes the fuel flow necessary to achieve the target power and checks if it is within
         the capability of the turboprop. If it leads to constraints greater than the one defined
         in the XML, gives the fuel flow corresponding to the highest power achievable within the
-        limits.
+        limits. Works element-wise on arrays of flight conditions, that are solved all at once.
 
         :param target_power: required power, in kW.
         :param altitude: the flight altitude, in m.
@@ -1032,38 +1094,42 @@ class BasicTPEngine(AbstractFuelPropulsion):
         :return thrust_sol: the exhaust thrust, in N.
         """
 
-        # Check if we can get to the target power
-        fuel = self.turboshaft_performance_envelope_limits_real_gas(
-            "power", target_power, altitude, mach_vol
+        target_power, altitude, mach_vol = np.broadcast_arrays(
+            np.asarray(target_power, dtype=float),
+            np.asarray(altitude, dtype=float),
+            np.asarray(mach_vol, dtype=float),
         )
 
-        t_45t_sol = self.t_45t_sol
-        opr_sol = self.opr_sol
-        power_sol = self.power_sol
-        thrust_sol = self.thrust_sol
+        # Check if we can get to the target power
+        fuel, performance = self._solve_envelope_limit("power", target_power, altitude, mach_vol)
+        fuel = np.array(fuel)
+        power_sol = np.array(performance["power"])
+        thrust_sol = np.array(performance["thrust_exhaust"])
+        opr_sol = np.array(performance["opr"])
 
         # If target can't be reached we see which limit we have attained and get the performances
         # corresponding to that limit
-        if t_45t_sol > self.itt_limit:
-            fuel = self.turboshaft_performance_envelope_limits_real_gas(
-                "t_45t", self.itt_limit, altitude, mach_vol
+        t_45t_limited = performance["t_45t"] > self.itt_limit
+        if np.any(t_45t_limited):
+            fuel[t_45t_limited], performance = self._solve_envelope_limit(
+                "t_45t", self.itt_limit, altitude[t_45t_limited], mach_vol[t_45t_limited]
             )
-            # print("t_45t limit processing", t_45t_sol)
-
-            opr_sol = self.opr_sol
-            power_sol = self.power_sol
-            thrust_sol = self.thrust_sol
-
-        if opr_sol > self.opr_limit:
-            fuel = self.turboshaft_performance_envelope_limits_real_gas(
-                "opr", self.opr_limit, altitude, mach_vol
+            opr_sol[t_45t_limited] = performance["opr"]
+            power_sol[t_45t_limited] = performance["power"]
+            thrust_sol[t_45t_limited] = performance["thrust_exhaust"]
+
+        opr_limited = opr_sol > self.opr_limit
+        if np.any(opr_limited):
+            fuel[opr_limited], performance = self._solve_envelope_limit(
+                "opr", self.opr_limit, altitude[opr_limited], mach_vol[opr_limited]
             )
-            # print("opr limit processing", opr_sol)
+            power_sol[opr_limited] = performance["power"]
+            thrust_sol[opr_limited] = performance["thrust_exhaust"]
 
-            power_sol = self.power_sol
-            thrust_sol = self.thrust_sol
+        if np.ndim(fuel) == 0:
+            return float(fuel), float(power_sol), float(thrust_sol)
 
-        return fuel, power_sol[0], thrust_sol[0]
+        return fuel, power_sol, thrust_sol
 
     def compute_flight_points(self, flight_points: oad.FlightPoint):
         # pylint: disable=too-many-arguments
@@ -1275,61 +1341,26 @@ class BasicTPEngine(AbstractFuelPropulsion):
         # the change in advance ration is equal to a change in velocity
         installed_airspeed = atmosphere.true_airspeed * self.effective_J
 
-        propeller_efficiency_SL = interp2d(
-            self.thrust_SL,
-            self.speed_SL,
-            self.efficiency_SL * self.effective_efficiency_ls,  # Include the efficiency loss
-            # in here
-            kind="cubic",
+        thrust_interp_SL = np.minimum(
+            np.maximum(np.min(self.thrust_SL), thrust),
+            np.interp(installed_airspeed, self.speed_SL, self.thrust_limit_SL),
         )
-        propeller_efficiency_CL = interp2d(
-            self.thrust_CL,
-            self.speed_CL,
-            self.efficiency_CL * self.effective_efficiency_cruise,  # Include the efficiency loss
-            # in here
-            kind="cubic",
+        thrust_interp_CL = np.minimum(
+            np.maximum(np.min(self.thrust_CL), thrust),
+            np.interp(installed_airspeed, self.speed_CL, self.thrust_limit_CL),
+        )
+        lower_bound = self._propeller_efficiency_SL.ev(thrust_interp_SL, installed_airspeed)
+        upper_bound = self._propeller_efficiency_CL.ev(thrust_interp_CL, installed_airspeed)
+        altitude = atmosphere.get_altitude(altitude_in_feet=False)
+        propeller_efficiency = (
+            lower_bound
+            + (upper_bound - lower_bound)
+            * np.minimum(altitude, self.cruise_altitude_propeller)
+            / self.cruise_altitude_propeller
         )
-        if isinstance(atmosphere.true_airspeed, float):
-            thrust_interp_SL = np.minimum(
-                np.maximum(np.min(self.thrust_SL), thrust),
-                np.interp(installed_airspeed, self.speed_SL, self.thrust_limit_SL),
-            )
-            thrust_interp_CL = np.minimum(
-                np.maximum(np.min(self.thrust_CL), thrust),
-                np.interp(installed_airspeed, self.speed_CL, self.thrust_limit_CL),
-            )
-        else:
-            thrust_interp_SL = np.minimum(
-                np.maximum(np.min(self.thrust_SL), thrust),
-                np.interp(list(installed_airspeed), self.speed_SL, self.thrust_limit_SL),
-            )
-            thrust_interp_CL = np.minimum(
-                np.maximum(np.min(self.thrust_CL), thrust),
-                np.interp(list(installed_airspeed), self.speed_CL, self.thrust_limit_CL),
-            )
-        if isinstance(thrust, float):  # calculate for float
-            lower_bound = float(propeller_efficiency_SL(thrust_interp_SL, installed_airspeed))
-            upper_bound = float(propeller_efficiency_CL(thrust_interp_CL, installed_airspeed))
-            altitude = atmosphere.get_altitude(altitude_in_feet=False)
-            propeller_efficiency = np.interp(
-                altitude, [0, self.cruise_altitude_propeller], [lower_bound, upper_bound]
-            )
-        else:  # calculate for array
-            propeller_efficiency = np.zeros(np.size(thrust))
-            for idx in range(np.size(thrust)):
-                lower_bound = propeller_efficiency_SL(
-                    thrust_interp_SL[idx], installed_airspeed[idx]
-                )
-                upper_bound = propeller_efficiency_CL(
-                    thrust_interp_CL[idx], installed_airspeed[idx]
-                )
-                altitude = atmosphere.get_altitude(altitude_in_feet=False)[idx]
-                propeller_efficiency[idx] = (
-                    lower_bound
-                    + (upper_bound - lower_bound)
-                    * np.minimum(altitude, self.cruise_altitude_propeller)
-                    / self.cruise_altitude_propeller
-                )
+
+        if np.size(propeller_efficiency) == 1:
+            return float(propeller_efficiency)
 
         return propeller_efficiency
 
@@ -1362,60 +1393,37 @@ class BasicTPEngine(AbstractFuelPropulsion):
         :return: SFC (in kg/s/W) and power (in W)
         """
 
-        # Compute sfc
-        power_shaft = np.zeros(np.size(thrust))
-        # torque = np.zeros(np.size(thrust))
-        sfc = np.zeros(np.size(thrust))
-        if np.size(thrust) == 1:
-            thrust_propeller = thrust
-            while True:
-                power_shaft = (
-                    thrust_propeller
-                    * atmosphere.true_airspeed
-                    / self.propeller_efficiency(thrust_propeller, atmosphere)
-                )
-                h_vol_point = atmosphere.get_altitude(altitude_in_feet=False)
-                mach_vol_point = atmosphere.mach
-
-                power_in_kw = power_shaft / 1000.0
-
-                fuel_point, power_out, thrust_exhaust = self.turboshaft_compute_within_limits(
-                    power_in_kw, h_vol_point, mach_vol_point
-                )
-                power_out_watts = power_out * 1000.0
-
-                sfc = fuel_point / power_out_watts
-                power_shaft = power_out_watts
-                if abs(thrust - thrust_propeller - thrust_exhaust) / thrust < 1e-3:
-                    break
-                else:
-                    thrust_propeller = thrust - thrust_exhaust
-        else:
-            for idx in range(np.size(thrust)):
-                thrust_propeller = thrust[idx]
-                local_atmosphere = Atmosphere(
-                    atmosphere.get_altitude(altitude_in_feet=False)[idx], altitude_in_feet=False
-                )
-                local_atmosphere.mach = atmosphere.mach[idx]
-                while True:
-                    power_shaft[idx] = (
-                        thrust_propeller
-                        * local_atmosphere.true_airspeed
-                        / self.propeller_efficiency(thrust_propeller, local_atmosphere)
-                    )
-                    h_vol = local_atmosphere.get_altitude(altitude_in_feet=False)
-                    mach_vol = local_atmosphere.mach
-                    power_in_kw = power_shaft[idx] / 1000.0
-                    fuel, power_out, thrust_exhaust = self.turboshaft_compute_within_limits(
-                        power_in_kw, h_vol, mach_vol
-                    )
-                    power_out_watts = power_out * 1000.0
-                    sfc[idx] = fuel / power_out_watts
-                    power_shaft[idx] = power_out_watts
-                    if abs(thrust[idx] - thrust_propeller - thrust_exhaust) / thrust[idx] < 1e-3:
-                        break
-                    else:
-                        thrust_propeller = thrust[idx] - thrust_exhaust
+        # Compute sfc for all flight points at once: the power required by the propeller gives
+        # the exhaust thrust, which in turn changes the thrust required from the propeller, until
+        # the convergence of each flight point
+        thrust = np.asarray(thrust, dtype=float)
+        altitude = np.broadcast_to(atmosphere.get_altitude(altitude_in_feet=False), thrust.shape)
+        mach = np.broadcast_to(atmosphere.mach, thrust.shape)
+        thrust_propeller = thrust.copy()
+        power_shaft = np.zeros_like(thrust)
+        sfc = np.zeros_like(thrust)
+        not_converged = np.ones_like(thrust, dtype=bool)
+        while np.any(not_converged):
+            local_atmosphere = Atmosphere(altitude[not_converged], altitude_in_feet=False)
+            local_atmosphere.mach = mach[not_converged]
+            power_in_kw = (
+                thrust_propeller[not_converged]
+                * local_atmosphere.true_airspeed
+                / self.propeller_efficiency(thrust_propeller[not_converged], local_atmosphere)
+                / 1000.0
+            )
+            fuel, power_out, thrust_exhaust = self.turboshaft_compute_within_limits(
+                power_in_kw, altitude[not_converged], mach[not_converged]
+            )
+            power_out_watts = power_out * 1000.0
+            sfc[not_converged] = fuel / power_out_watts
+            power_shaft[not_converged] = power_out_watts
+            thrust_error = (
+                np.abs(thrust[not_converged] - thrust_propeller[not_converged] - thrust_exhaust)
+                / thrust[not_converged]
+            )
+            thrust_propeller[not_converged] = thrust[not_converged] - thrust_exhaust
+            not_converged[not_converged] = np.logical_not(thrust_error < 1e-3)
 
         return sfc, power_shaft
 
@@ -1431,16 +1439,8 @@ class BasicTPEngine(AbstractFuelPropulsion):
         """
 
         # Calculate maximum propeller thrust @ given altitude and speed
-        if isinstance(atmosphere.true_airspeed, float):
-            lower_bound = np.interp(atmosphere.true_airspeed, self.speed_SL, self.thrust_limit_SL)
-            upper_bound = np.interp(atmosphere.true_airspeed, self.speed_CL, self.thrust_limit_CL)
-        else:
-            lower_bound = np.interp(
-                list(atmosphere.true_airspeed), self.speed_SL, self.thrust_limit_SL
-            )
-            upper_bound = np.interp(
-                list(atmosphere.true_airspeed), self.speed_CL, self.thrust_limit_CL
-            )
+        lower_bound = np.interp(atmosphere.true_airspeed, self.speed_SL, self.thrust_limit_SL)
+        upper_bound = np.interp(atmosphere.true_airspeed, self.speed_CL, self.thrust_limit_CL)
         altitude = atmosphere.get_altitude(altitude_in_feet=False)
         thrust_max_propeller = (
             lower_bound
@@ -1449,121 +1449,32 @@ class BasicTPEngine(AbstractFuelPropulsion):
             / self.cruise_altitude_propeller
         )
 
-        altitudes_to_evaluate = atmosphere.get_altitude(altitude_in_feet=False)
-        if np.size(altitudes_to_evaluate) == 1:
-            h_vol = altitudes_to_evaluate
-            mach_vol = atmosphere.mach
-            _, power_out, thrust_exhaust = self.turboshaft_compute_within_limits(
-                self.max_power_avail, h_vol, mach_vol
-            )
-            power_out_watts = power_out * 1000.0
-            max_power = power_out_watts
-            exhaust_thrust_at_max_power = thrust_exhaust
-        else:
-            max_power = np.zeros(len(altitudes_to_evaluate))
-            exhaust_thrust_at_max_power = np.zeros(len(altitudes_to_evaluate))
-            for idx, h_vol in enumerate(altitudes_to_evaluate):
-                mach_vol = atmosphere.mach[idx]
-                _, power_out, thrust_exhaust = self.turboshaft_compute_within_limits(
-                    self.max_power_avail, h_vol, mach_vol
-                )
-                power_out_watts = power_out * 1000.0
-                # max_power = power_out_watts
-                max_power[idx] = power_out_watts
-                exhaust_thrust_at_max_power[idx] = thrust_exhaust
+        _, power_out, exhaust_thrust_at_max_power = self.turboshaft_compute_within_limits(
+            self.max_power_avail, altitude, atmosphere.mach
+        )
+        max_power = power_out * 1000.0
 
         # Max power --> Array containing the maximum available power at the given flight points
         # thrust_max_propeller --> Array containing the maximum available thrust at the given
         # flight points for the propeller
 
-        # Found thrust relative to turboprop maximum power @ given altitude and speed: calculates
-        # first thrust interpolation vector (between min and max of propeller table) and
-        # associated efficiency, then calculates power and found thrust (interpolation limits to
-        # max propeller thrust)
-        thrust_interp = np.linspace(
-            np.min(self.thrust_SL) * np.ones(np.size(thrust_max_propeller)),
-            thrust_max_propeller,
-            10,
-        ).transpose()
-        if np.size(altitude) == 1:  # Calculate for float
-            thrust_max_global = 0.0
-            local_atmosphere = Atmosphere(
-                altitude * np.ones(np.size(thrust_interp)), altitude_in_feet=False
+        # Found thrust relative to turboprop maximum power @ given altitude and speed, for all
+        # flight points at once (interpolation limits to max propeller thrust), the exhaust thrust
+        # is then added
+        # TODO : is there a need to take into account the fact when the turboprop is
+        #  over-sized and the limiting  factor becomes the propeller ? Is it physically
+        #  relevant ? Here it looks like in any case, the  engine is always the  limiting
+        #  factor
+        thrust_max_global = (
+            propeller_thrust_at_power(
+                self.propeller_efficiency,
+                max_power,
+                np.min(self.thrust_SL),
+                thrust_max_propeller,
+                atmosphere,
             )
-            local_atmosphere.mach = atmosphere.mach * np.ones(np.size(thrust_interp))
-            propeller_efficiency = self.propeller_efficiency(thrust_interp[0], local_atmosphere)
-            mechanical_power = thrust_interp[0] * atmosphere.true_airspeed / propeller_efficiency
-            if np.min(mechanical_power) > max_power:
-                efficiency_relative_error = 1
-                propeller_efficiency = propeller_efficiency[0]
-                while efficiency_relative_error > 1e-2:
-                    thrust_max_global = max_power * propeller_efficiency / atmosphere.true_airspeed
-                    propeller_efficiency_new = self.propeller_efficiency(
-                        thrust_max_global, atmosphere
-                    )
-                    efficiency_relative_error = np.abs(
-                        (propeller_efficiency_new - propeller_efficiency)
-                        / efficiency_relative_error
-                    )
-                    propeller_efficiency = propeller_efficiency_new
-                thrust_max_global += exhaust_thrust_at_max_power
-            # TODO : is there a need to take into account the fact when the turboprop is
-            #  over-sized and the limiting  factor becomes the propeller ? Is it physically
-            #  relevant ? Here it looks like in any case, the  engine is always the  limiting
-            #  factor
-            else:
-                thrust_max_global = (
-                    np.interp(max_power, mechanical_power, thrust_interp[0])
-                    + exhaust_thrust_at_max_power
-                )
-            if isinstance(thrust_max_global, float):
-                thrust_max_global = np.array([thrust_max_global])
-        else:  # Calculate for array
-            thrust_max_global = np.zeros(np.size(altitude))
-            for idx in range(np.size(altitude)):
-                local_atmosphere = Atmosphere(
-                    altitude[idx] * np.ones(np.size(thrust_interp[idx])), altitude_in_feet=False
-                )
-                local_atmosphere.mach = atmosphere.mach[idx] * np.ones(np.size(thrust_interp[idx]))
-                propeller_efficiency = self.propeller_efficiency(
-                    thrust_interp[idx], local_atmosphere
-                )
-                mechanical_power = (
-                    thrust_interp[idx] * atmosphere.true_airspeed[idx] / propeller_efficiency
-                )
-                # mechanical power contain the shaft power required to obtain the thrust from
-                # thrust_interp, where thrust_interp[idx] is the thrust interpolation array
-                # corresponding to the flight conditions [idx] Mechanical power is already
-                # limited by the maximum thrust that the propeller can produce so we are sure
-                # that we will never go above our propeller's capacity
-
-                # If the limiting factor is the turboprop, thrust_max_global is computed based on
-                # max_power[idx]
-                if (
-                    np.min(mechanical_power) > max_power[idx]
-                ):  # take the lower bound efficiency for calculation
-                    efficiency_relative_error = 1
-                    local_atmosphere = Atmosphere(altitude[idx], altitude_in_feet=False)
-                    local_atmosphere.mach = atmosphere.mach[idx]
-                    propeller_efficiency = propeller_efficiency[0]
-                    while efficiency_relative_error > 1e-2:
-                        thrust_max_global[idx] = (
-                            max_power[idx] * propeller_efficiency / atmosphere.true_airspeed[idx]
-                        )
-                        propeller_efficiency_new = self.propeller_efficiency(
-                            thrust_max_global[idx], local_atmosphere
-                        )
-                        efficiency_relative_error = np.abs(
-                            (propeller_efficiency_new - propeller_efficiency)
-                            / efficiency_relative_error
-                        )
-                        propeller_efficiency = propeller_efficiency_new
-                    thrust_max_global[idx] += exhaust_thrust_at_max_power[idx]
-                else:
-                    thrust_max_global[idx] = (
-                        np.interp(max_power[idx], mechanical_power, thrust_interp[idx])
-                        + exhaust_thrust_at_max_power[idx]
-                    )
+            + exhaust_thrust_at_max_power
+        )
 
         return thrust_max_global
 
@@ -1694,3 +1605,140 @@ class Nacelle(DynamicAttributeDict):
 
     Similar to :class:`Engine`.
     """
+
+
+def _solve_newton(
+    function, x_0, args: tuple, xtol: float = 1.49012e-8, max_iter: int = 100
+) -> np.ndarray:
+    """
+    Solves function(x, *args) = 0 independently for a set of points, with a quasi-Newton method
+    applied to all the points at once. As in scipy fsolve, the jacobian is first computed by
+    finite differences then updated with the Broyden formula, it is only computed again when
+    the updated one no longer makes the residuals decrease. Each point is iterated until its
+    own convergence, i.e. until its relative step computed with a finite differences jacobian is
+    lower than xtol.
+
+    :param function: residuals of the system, returns an array with the shape of x. x has the
+    variables as first dimension and the points as second dimension, args are given for the same
+    points
+    :param x_0: initial values, either of shape (variables_count,) to be used for all points or
+    of shape (variables_count,) + points shape
+    :param args: extra arguments of the function, either scalars or arrays with the points shape
+    :param xtol: relative tolerance on the variables
+    :param max_iter: maximum number of iterations
+    :return: the solution, of shape (variables_count,) + points shape
+    """
+    args = [np.asarray(arg, dtype=float) for arg in args]
+    shape = np.broadcast(*args).shape if args else ()
+    x_0 = np.asarray(x_0, dtype=float)
+    variables_count = x_0.shape[0]
+    if x_0.ndim == 1:
+        x_0 = x_0.reshape((variables_count,) + (1,) * len(shape))
+    x = np.array(np.broadcast_to(x_0, (variables_count,) + shape)).reshape(variables_count, -1)
+    args = [arg if arg.ndim == 0 else np.broadcast_to(arg, shape).flatten() for arg in args]
+
+    def local_function(local_x, points):
+        return function(local_x, *[arg if arg.ndim == 0 else arg[points] for arg in args])
+
+    active_points = np.arange(np.shape(x)[1])
+    residuals = local_function(x, active_points)
+    jacobian = np.zeros((np.shape(x)[1], variables_count, variables_count))
+    is_finite_difference = np.zeros(np.shape(x)[1], dtype=bool)
+    needs_jacobian = np.ones(np.shape(x)[1], dtype=bool)
+    diverged_count = 0
+    for _ in range(max_iter):
+        if active_points.size == 0:
+            break
+
+        # Jacobian by forward finite differences, one variable at a time for all the points that
+        # need it
+        to_update = active_points[needs_jacobian[active_points]]
+        if to_update.size:
+            update_x = x[:, to_update]
+            update_residuals = residuals[:, to_update]
+            for idx in range(variables_count):
+                # As in MINPACK, the step is relative to the variable unless it is zero
+                step = 1.49012e-8 * np.where(update_x[idx] == 0.0, 1.0, np.abs(update_x[idx]))
+                shifted_x = update_x.copy()
+                shifted_x[idx] += step
+                jacobian[to_update, :, idx] = (
+                    (local_function(shifted_x, to_update) - update_residuals) / step
+                ).T
+            is_finite_difference[to_update] = True
+            needs_jacobian[to_update] = False
+
+        local_x = x[:, active_points]
+        local_residuals = residuals[:, active_points]
+        local_jacobian = jacobian[active_points]
+        local_is_finite_difference = is_finite_difference[active_points]
+        with np.errstate(all="ignore"):
+            try:
+                delta = np.linalg.solve(local_jacobian, -local_residuals.T[:, :, np.newaxis])[
+                    :, :, 0
+                ].T
+            except np.linalg.LinAlgError:
+                delta = np.einsum("kij,jk->ik", np.linalg.pinv(local_jacobian), -local_residuals)
+
+        new_x = local_x + delta
+        with np.errstate(all="ignore"):
+            small_step = np.logical_or(
+                np.max(np.abs(delta) - xtol * np.abs(new_x), axis=0) <= 0.0,
+                np.all(local_residuals == 0.0, axis=0),
+            )
+            norm = np.sum(local_residuals ** 2, axis=0)
+            new_residuals = local_function(new_x, active_points)
+
+            # With an updated jacobian, a step that does not make the residuals decrease is
+            # discarded and the jacobian is computed again. With a finite differences one, the
+            # step is reduced until the residuals decrease, unless it is already within tolerance
+            rejected = np.logical_and(
+                np.logical_not(np.sum(new_residuals ** 2, axis=0) <= norm),
+                np.logical_not(local_is_finite_difference),
+            )
+            step_factor = np.ones(active_points.size)
+            for _ in range(30):
+                not_decreasing = np.logical_not(np.sum(new_residuals ** 2, axis=0) <= norm)
+                not_decreasing &= local_is_finite_difference & np.logical_not(small_step)
+                if not np.any(not_decreasing):
+                    break
+                step_factor[not_decreasing] /= 2.0
+                new_x[:, not_decreasing] = (
+                    local_x[:, not_decreasing]
+                    + step_factor[not_decreasing] * delta[:, not_decreasing]
+                )
+                new_residuals[:, not_decreasing] = local_function(
+                    new_x[:, not_decreasing], active_points[not_decreasing]
+                )
+            new_x[:, rejected] = local_x[:, rejected]
+            new_residuals[:, rejected] = local_residuals[:, rejected]
+
+            # Broyden update of the jacobian of the points that moved
+            step_x = new_x - local_x
+            step_norm = np.sum(step_x ** 2, axis=0)
+            moved = step_norm > 0.0
+            correction = (
+                new_residuals - local_residuals - np.einsum("kij,jk->ik", local_jacobian, step_x)
+            ) / np.where(moved, step_norm, 1.0)
+            local_jacobian += np.einsum("ik,jk->kij", correction * moved, step_x)
+
+        x[:, active_points] = new_x
+        residuals[:, active_points] = new_residuals
+        jacobian[active_points] = local_jacobian
+        is_finite_difference[active_points] = False
+        # Convergence is only accepted for a step computed with a finite differences jacobian,
+        # so that the solution is accurate enough to be differentiated by an outer solver
+        converged = small_step & np.logical_not(rejected) & local_is_finite_difference
+        needs_jacobian[active_points] = rejected | (small_step & np.logical_not(converged))
+
+        # Points for which the equations can no longer be evaluated are given up
+        diverged = np.logical_not(np.all(np.isfinite(new_residuals), axis=0))
+        diverged_count += np.sum(diverged)
+        active_points = active_points[np.logical_not(np.logical_or(converged, diverged))]
+
+    if active_points.size + diverged_count:
+        _LOGGER.warning(
+            "Turboprop off-design solver did not converge for %i point(s)",
+            active_points.size + diverged_count,
+        )
+
+    return x.reshape((variables_count,) + shape)
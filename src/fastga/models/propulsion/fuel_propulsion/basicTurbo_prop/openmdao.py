@@ -19,7 +19,7 @@ import fastoad.api as oad
 
 from fastga.models.propulsion.fuel_propulsion.basicTurbo_prop.basicTP_engine import BasicTPEngine
 from fastga.models.propulsion.propulsion import IPropulsion, BaseOMPropulsionComponent
-from fastga.models.propulsion.fuel_propulsion.base import FuelEngineSet
+from fastga.models.propulsion.fuel_propulsion.base import FuelEngineSet, get_engine
 from fastga.models.aerodynamics.external.propeller_code.compute_propeller_aero import (
     THRUST_PTS_NB,
     SPEED_PTS_NB,
@@ -218,7 +218,8 @@ class OMBasicTurbopropWrapper(oad.IOMPropulsionWrapper):
         }
 
         return FuelEngineSet(
-            BasicTPEngine(**engine_params), inputs["data:geometry:propulsion:engine:count"]
+            get_engine(BasicTPEngine, **engine_params),
+            inputs["data:geometry:propulsion:engine:count"],
         )
 
 
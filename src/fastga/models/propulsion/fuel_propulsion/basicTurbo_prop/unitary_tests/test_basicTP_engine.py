@@ -21,7 +21,7 @@ import fastoad.api as oad
 from fastoad.constants import EngineSetting
 from stdatm import Atmosphere
 
-from ..basicTP_engine import BasicTPEngine
+from ..basicTP_engine import BasicTPEngine, _solve_newton
 
 INVALID_SFC = 0.0
 
@@ -1148,3 +1148,73 @@ def test_compute_max_power():
     # At higher altitude, higher mach
     flight_points = oad.FlightPoint(altitude=9000, mach=0.8)
     np.testing.assert_allclose(_745_kW_engine.compute_max_power(flight_points), 502.70, atol=1)
+
+
+def test_compute_within_limits():
+    _745_kW_engine = BasicTPEngine(
+        power_design=745.7,
+        t_41t_design=1350,
+        opr_design=9.5,
+        cruise_altitude_propeller=9000.0,
+        design_altitude=0.0,
+        design_mach=0.5,
+        prop_layout=1.0,
+        bleed_control=1.0,
+        itt_limit=1100.0,
+        power_limit=521.99,
+        opr_limit=12.0,
+        speed_SL=SPEED,
+        thrust_SL=THRUST_SL,
+        thrust_limit_SL=THRUST_SL_LIMIT,
+        efficiency_SL=EFFICIENCY_SL,
+        speed_CL=SPEED,
+        thrust_CL=THRUST_CL,
+        thrust_limit_CL=THRUST_CL_LIMIT,
+        efficiency_CL=EFFICIENCY_CL,
+        effective_J=0.95,  # Effective advance ratio factor
+        effective_efficiency_ls=0.97,  # Effective efficiency in low speed conditions
+        effective_efficiency_cruise=0.98,  # Effective efficiency in cruise conditions
+    )
+
+    # Points solved all at once must give the same results as points solved one by one and as
+    # the former point by point fsolve implementation, with reachable target power, ITT limited,
+    # ITT then OPR limited and OPR limited points
+    target_power = np.array([100.0, 300.0, 745.7, 700.0, 521.99])
+    altitude = np.array([9000.0, 0.0, 0.0, 6000.0, 9000.0])
+    mach = np.array([0.1, 0.3, 0.1, 0.3, 0.8])
+    fuel, power, thrust_exhaust = _745_kW_engine.turboshaft_compute_within_limits(
+        target_power, altitude, mach
+    )
+    for idx in range(len(target_power)):
+        fuel_point, power_point, thrust_point = _745_kW_engine.turboshaft_compute_within_limits(
+            target_power[idx], altitude[idx], mach[idx]
+        )
+        np.testing.assert_allclose(fuel[idx], fuel_point, rtol=1e-6)
+        np.testing.assert_allclose(power[idx], power_point, rtol=1e-6)
+        np.testing.assert_allclose(thrust_exhaust[idx], thrust_point, rtol=1e-6)
+
+    np.testing.assert_allclose(
+        fuel, [0.01519999, 0.04303651, 0.07700461, 0.04190060, 0.03994019], rtol=1e-5
+    )
+    np.testing.assert_allclose(power, [100.0, 300.0, 729.2434, 434.7437, 502.7057], rtol=1e-5)
+    np.testing.assert_allclose(
+        thrust_exhaust, [98.70314, 126.0995, 614.5273, 268.7735, 141.4086], rtol=1e-5
+    )
+
+
+def test_solve_newton():
+    def function(x, root_0, root_1):
+        return np.array(
+            [
+                np.arctan(x[0] - root_0) + 0.1 * (x[1] - root_1),
+                (x[1] - root_1) ** 3 + x[1] - root_1 + 0.5 * np.sin(x[0] - root_0),
+            ]
+        )
+
+    # Starting from zero, the Broyden update of the jacobian of the first point no longer makes
+    # its residuals decrease and is computed again by finite differences
+    root_0 = np.array([1.2, -0.5, 1.0])
+    root_1 = np.array([2.0, 1.0, -1.5])
+    x = _solve_newton(function, np.array([0.0, 0.0]), (root_0, root_1))
+
+    np.testing.assert_allclose(x, [root_0, root_1], rtol=1e-8)
@@ -13,7 +13,13 @@
 #  You should have received a copy of the GNU General Public License
 #  along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
+import hashlib
 import logging
+import os
+import os.path as pth
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import Dict, Optional
 
 import numpy as np
 import openmdao.api as om
@@ -24,6 +30,7 @@ from fastoad.module_management.constants import ModelDomain
 from stdatm import Atmosphere
 
 from fastga.models.propulsion.fuel_propulsion.basicTurbo_prop.basicTP_engine import BasicTPEngine
+from fastga.models.propulsion.fuel_propulsion.base import get_engine
 from fastga.models.aerodynamics.external.propeller_code.compute_propeller_aero import (
     THRUST_PTS_NB,
     SPEED_PTS_NB,
@@ -36,6 +43,9 @@ INVALID_SFC = -1e-2
 THRUST_PTS_NB_TURBOPROP = 50
 MACH_PTS_NB_TURBOPROP = 10
 
+DECK_LEVELS = ["sea_level", "cruise_level", "intermediate_level"]
+_DECK_FILE_PREFIX = "turboprop_deck_"
+
 # Set of dictionary keys that are mapped to instance attributes.
 ENGINE_LABELS = {
     "power_SL": dict(doc="power at sea level in watts."),
@@ -68,6 +78,21 @@ class ComputeTurbopropMap(om.ExplicitComponent):
             default=None,
             types=float,
         )
+        self.options.declare(
+            "result_folder_path",
+            default="",
+            types=str,
+            desc="Folder where the computed decks are saved, an engine with the same inputs then "
+            "loads its deck instead of computing it again. Decks are not saved if empty",
+        )
+        self.options.declare(
+            "max_workers",
+            default=1,
+            types=int,
+            allow_none=True,
+            desc="Number of processes that compute the deck, number of CPUs if None. The deck is "
+            "computed in the current process by default",
+        )
 
     def setup(self):
         self.add_input("data:propulsion:turboprop:design_point:power", np.nan, units="kW")
@@ -271,70 +296,95 @@ class ComputeTurbopropMap(om.ExplicitComponent):
                 "settings:propulsion:turboprop:design_point:first_stage_pressure_ratio"
             ],
         }
-        engine = BasicTPEngine(**engine_params)
-
         cruise_altitude = inputs["data:aerodynamics:propeller:cruise_level:altitude"]
-
-        (
-            mach_array_sl,
-            thrust_preliminary_intersect_sl,
-            sfc_general_sl,
-            max_thrust_array_sl,
-        ) = self.construct_table(0.0, inputs, engine)
-
-        sfc_general_sl, thrust_preliminary_intersect_sl = format_table(
-            sfc_general_sl, thrust_preliminary_intersect_sl
-        )
-
-        outputs["data:propulsion:turboprop:sea_level:mach"] = mach_array_sl
-        outputs["data:propulsion:turboprop:sea_level:thrust"] = thrust_preliminary_intersect_sl
-        outputs["data:propulsion:turboprop:sea_level:thrust_limit"] = max_thrust_array_sl
-        outputs["data:propulsion:turboprop:sea_level:sfc"] = sfc_general_sl
-
-        (
-            mach_array_cl,
-            thrust_preliminary_intersect_cl,
-            sfc_general_cl,
-            max_thrust_array_cl,
-        ) = self.construct_table(cruise_altitude, inputs, engine)
-
-        sfc_general_cl, thrust_preliminary_intersect_cl = format_table(
-            sfc_general_cl, thrust_preliminary_intersect_cl
-        )
-
-        outputs["data:propulsion:turboprop:cruise_level:mach"] = mach_array_cl
-        outputs["data:propulsion:turboprop:cruise_level:thrust"] = thrust_preliminary_intersect_cl
-        outputs["data:propulsion:turboprop:cruise_level:thrust_limit"] = max_thrust_array_cl
-        outputs["data:propulsion:turboprop:cruise_level:sfc"] = sfc_general_cl
-
         if self.options["intermediate_altitude"] is None:
             intermediate_altitude = cruise_altitude / 2.0
         else:
             intermediate_altitude = self.options["intermediate_altitude"]
+        altitudes = {
+            "sea_level": 0.0,
+            "cruise_level": cruise_altitude,
+            "intermediate_level": intermediate_altitude,
+        }
 
-        (
-            mach_array_il,
-            thrust_preliminary_intersect_il,
-            sfc_general_il,
-            max_thrust_array_il,
-        ) = self.construct_table(intermediate_altitude, inputs, engine)
-
-        sfc_general_il, thrust_preliminary_intersect_il = format_table(
-            sfc_general_il, thrust_preliminary_intersect_il
-        )
-
+        # An engine whose inputs did not change since a previous run loads its deck
+        deck_file_path = None
+        deck = None
+        if self.options["result_folder_path"] != "":
+            deck_file_path = self.get_deck_file_path(inputs)
+            deck = load_deck(deck_file_path)
+
+        if deck is None:
+            deck = self.construct_deck(altitudes, inputs, engine_params)
+            if deck_file_path is not None:
+                save_deck(deck_file_path, deck)
+
+        for level in DECK_LEVELS:
+            for name in ["mach", "thrust", "thrust_limit", "sfc"]:
+                outputs["data:propulsion:turboprop:" + level + ":" + name] = deck[
+                    level + ":" + name
+                ]
         outputs["data:propulsion:turboprop:intermediate_level:altitude"] = intermediate_altitude
-        outputs["data:propulsion:turboprop:intermediate_level:mach"] = mach_array_il
-        outputs[
-            "data:propulsion:turboprop:intermediate_level:thrust"
-        ] = thrust_preliminary_intersect_il
-        outputs["data:propulsion:turboprop:intermediate_level:thrust_limit"] = max_thrust_array_il
-        outputs["data:propulsion:turboprop:intermediate_level:sfc"] = sfc_general_il
 
         _LOGGER.debug("Finishing turboprop computation")
 
-    def construct_table(self, altitude, inputs, engine):
-        """Construct the sfc table for the given engine at the given altitude."""
+    def construct_deck(self, altitudes: dict, inputs, engine_params: dict) -> Dict[str, np.ndarray]:
+        """
+        Constructs the sfc tables of the engine at the sea, cruise and intermediate levels. The
+        sfc of the cells of the three tables can be computed in parallel by max_workers processes.
+
+        :param altitudes: altitude of each level of DECK_LEVELS, in m
+        :param inputs: inputs of the component
+        :param engine_params: keyword arguments of the BasicTPEngine constructor
+        :return: the tables, formatted as the outputs, in a dictionary with level:name keys
+        """
+        engine = get_engine(BasicTPEngine, **engine_params)
+
+        tables = {}
+        altitude_cells = []
+        mach_cells = []
+        thrust_cells = []
+        for level in DECK_LEVELS:
+            mach_array, thrust_array, max_thrust_array = self.construct_thrust_array(
+                altitudes[level], inputs, engine
+            )
+            valid_cells = thrust_array[np.newaxis, :] <= max_thrust_array[:, np.newaxis]
+            mach_idx, thrust_idx = np.nonzero(valid_cells)
+            altitude_cells.append(np.full(np.size(mach_idx), float(altitudes[level])))
+            mach_cells.append(mach_array[mach_idx])
+            thrust_cells.append(thrust_array[thrust_idx])
+            tables[level] = (mach_array, thrust_array, max_thrust_array, valid_cells)
+
+        sfc_cells = compute_sfc_cells(
+            engine_params,
+            np.concatenate(altitude_cells),
+            np.concatenate(mach_cells),
+            np.concatenate(thrust_cells),
+            self.options["max_workers"],
+        )
+
+        deck = {}
+        cell_idx = 0
+        for level in DECK_LEVELS:
+            mach_array, thrust_array, max_thrust_array, valid_cells = tables[level]
+            sfc_general = np.full(np.shape(valid_cells), INVALID_SFC)
+            sfc_general[valid_cells] = sfc_cells[cell_idx : cell_idx + np.sum(valid_cells)]
+            cell_idx += np.sum(valid_cells)
+            sfc_general = complete_sfc_table(sfc_general, thrust_array)
+
+            sfc_general, thrust_array = format_table(sfc_general, thrust_array)
+            deck[level + ":mach"] = mach_array
+            deck[level + ":thrust"] = thrust_array
+            deck[level + ":thrust_limit"] = max_thrust_array
+            deck[level + ":sfc"] = sfc_general
+
+        return deck
+
+    def construct_thrust_array(self, altitude, inputs, engine):
+        """
+        Computes the mach numbers and thrusts at which the sfc table of the given altitude is
+        constructed, as well as the maximum thrust at those mach numbers.
+        """
         nb_of_mach = MACH_PTS_NB_TURBOPROP
         nb_of_thrust = self.options["number_of_thrust_subdivision"]
 
@@ -347,21 +397,13 @@ class ComputeTurbopropMap(om.ExplicitComponent):
 
         # Since the cruise speed gives by construction the highest Mach number we know we will
         # never cross it, hence the following bounds for the mach array
-        mach_array = np.linspace(1e-5, 1.3 * cruise_mach, nb_of_mach)
-        # print("\n", mach_array)
+        mach_array = np.linspace(1e-5, 1.3 * cruise_mach, nb_of_mach).flatten()
 
         # We then compute the maximum thrust for those mach they are gonna be used to define the
         # thrust for which we interpolate the fuel consumption
-        max_thrust_list = []
-
-        for mach in mach_array:
-            atm = Atmosphere(altitude=altitude, altitude_in_feet=False)
-            atm.mach = mach
-            max_thrust = engine.max_thrust(atm)
-            max_thrust_list.append(float(max_thrust))
-
-        max_thrust_array = np.array(max_thrust_list)
-        # print("\n", max_thrust_array)
+        atm = Atmosphere(np.full_like(mach_array, float(altitude)), altitude_in_feet=False)
+        atm.mach = mach_array
+        max_thrust_array = np.asarray(engine.max_thrust(atm), dtype=float)
 
         # thrust_preliminary_intersect will contain the thrust at which we will interpolate our
         # data. To minimize computation time we will try to build it at relevant point while
@@ -371,8 +413,7 @@ class ComputeTurbopropMap(om.ExplicitComponent):
         # to ensure that this point will be kept in the first overlap
         thrust_preliminary_intersect = np.array([min(max_thrust_array) / (nb_of_thrust - 1e-5)])
 
-        for mach in np.flip(mach_array):
-            max_thrust_current_mach = max_thrust_array[np.where(mach_array == mach)[0][0]]
+        for max_thrust_current_mach in np.flip(max_thrust_array):
             # The first element of the linspace
             first_thrust_array = max_thrust_current_mach / nb_of_thrust
 
@@ -393,76 +434,157 @@ class ComputeTurbopropMap(om.ExplicitComponent):
             thrust_preliminary_intersect = np.union1d(thrust_preliminary_intersect, retained_thrust)
 
         thrust_preliminary_intersect = np.union1d(thrust_preliminary_intersect, max_thrust_array)
-        # print("\n", thrust_preliminary_intersect)
-
-        # We now compute the sfc everywhere in the validity domain (thrust < thrust_max(mach))
-        sfc_general = np.zeros((np.size(mach_array), np.size(thrust_preliminary_intersect)))
-
-        for mach in mach_array:
-            atm = Atmosphere(altitude, altitude_in_feet=False)
-            atm.mach = mach
-            for thrust in thrust_preliminary_intersect:
-                thrust = np.array([thrust])
-                flight_points = oad.FlightPoint(
-                    mach=mach,
-                    altitude=altitude,
-                    engine_setting=EngineSetting.CRUISE,
-                    thrust_is_regulated=True,
-                    thrust_rate=0.0,
-                    thrust=thrust,
-                )
-                if thrust > max_thrust_array[np.where(mach_array == mach)[0][0]]:
-                    sfc = INVALID_SFC
-                else:
-                    engine.compute_flight_points(flight_points)
-                    sfc = flight_points.sfc
-                sfc_general[
-                    np.where(mach_array == mach)[0][0],
-                    np.where(thrust_preliminary_intersect == float(thrust))[0][0],
-                ] = sfc
-
-        # sfc_general_before = np.copy(sfc_general)
-        # print("\n", sfc_general_before)
-
-        valid_idx_previous_mach = np.array([])
-        thrust_to_interpolate = np.zeros((1, 1))
-
-        # We now interpolate on the data that are missing but just enough to ensure that we will
-        # be able to do a 2D interpolation with value that are not INVALID_IDX
-        for mach in mach_array:
-            corresponding_sfc_array = sfc_general[np.where(mach_array == mach)[0]][0]
-
-            valid_idx = np.where(corresponding_sfc_array != INVALID_SFC)[0]
-
-            valid_thrust = thrust_preliminary_intersect[valid_idx]
-            valid_sfc = corresponding_sfc_array[valid_idx]
-            valid_fuel_flow = np.multiply(valid_thrust, valid_sfc)
-
-            valid_idx_set = set(valid_idx.tolist())
-            valid_idx_previous_mach_set = set(valid_idx_previous_mach.tolist())
-            idx_to_interpolate = np.array(list(valid_idx_previous_mach_set - valid_idx_set))
-            # print("\n", idx_to_interpolate)
-
-            for idx in idx_to_interpolate:
-                thrust_to_interpolate[0, 0] = thrust_preliminary_intersect[idx]
-                predicted_fuel_flow = valid_fuel_flow[-1]
-                predicted_sfc = np.divide(predicted_fuel_flow, thrust_to_interpolate)
-
-                sfc_general[np.where(mach_array == mach)[0][0], idx] = predicted_sfc
-
-            valid_idx_previous_mach = valid_idx
-
-        # thrust_plot, mach_plot = np.meshgrid(thrust_preliminary_intersect, mach_array)
-        # fig3d = plt.figure()
-        # ax = Axes3D(fig3d)
-        # ax.scatter(thrust_plot, mach_plot, sfc_general, cmap="viridis",
-        #   linewidth=0.25, label="predicted behaviour")
-        # ax.scatter(thrust_plot, mach_plot, sfc_general_before, cmap="viridis",
-        #   linewidth=0.25, label="reference data")
-        # ax.legend()
-        # plt.show()
-
-        return mach_array, thrust_preliminary_intersect, sfc_general, max_thrust_array
+
+        return mach_array, thrust_preliminary_intersect, max_thrust_array
+
+    def get_deck_file_path(self, inputs) -> str:
+        """
+        Returns the path of the file where the deck of the engine defined by the inputs is
+        saved in the result folder, the file name contains a hash of the inputs and options.
+        """
+        hash_function = hashlib.sha256()
+        for name in sorted(inputs.keys()):
+            hash_function.update(name.encode())
+            hash_function.update(np.asarray(inputs[name], dtype=float).tobytes())
+        for name in ["number_of_thrust_subdivision", "intermediate_altitude"]:
+            hash_function.update((name + str(self.options[name])).encode())
+
+        return pth.join(
+            self.options["result_folder_path"],
+            _DECK_FILE_PREFIX + hash_function.hexdigest()[:32] + ".npz",
+        )
+
+
+def compute_sfc(engine: BasicTPEngine, altitude, mach, thrust) -> np.ndarray:
+    """
+    Computes the sfc of the engine in cruise for the given cells.
+
+    :param engine: the engine
+    :param altitude: altitudes of the cells, in m
+    :param mach: mach numbers of the cells
+    :param thrust: thrusts of the cells, in N
+    :return: the sfc of the cells, in kg/s/N
+    """
+    if np.size(thrust) == 0:
+        return np.zeros(0)
+
+    flight_points = oad.FlightPoint(
+        mach=mach,
+        altitude=altitude,
+        engine_setting=[EngineSetting.CRUISE] * np.size(thrust),
+        thrust_is_regulated=np.full(np.size(thrust), True),
+        thrust_rate=np.zeros(np.size(thrust)),
+        thrust=thrust,
+    )
+    engine.compute_flight_points(flight_points)
+
+    return np.asarray(flight_points.sfc, dtype=float)
+
+
+def compute_sfc_cells(
+    engine_params: dict, altitude, mach, thrust, max_workers: Optional[int] = None
+) -> np.ndarray:
+    """
+    Computes the sfc of the engine in cruise for the given cells, which are spread over
+    max_workers processes.
+
+    :param engine_params: keyword arguments of the BasicTPEngine constructor
+    :param altitude: altitudes of the cells, in m
+    :param mach: mach numbers of the cells
+    :param thrust: thrusts of the cells, in N
+    :param max_workers: maximum number of processes, number of CPUs if None
+    :return: the sfc of the cells, in kg/s/N
+    """
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    max_workers = max(min(max_workers, np.size(thrust)), 1)
+
+    if max_workers == 1:
+        return _compute_sfc_chunk(engine_params, altitude, mach, thrust)
+
+    # OpenMDAO views are copied so that the parameters can be sent to the processes
+    engine_params = {name: np.array(value) for name, value in engine_params.items()}
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        sfc_chunks = executor.map(
+            _compute_sfc_chunk,
+            repeat(engine_params),
+            np.array_split(altitude, max_workers),
+            np.array_split(mach, max_workers),
+            np.array_split(thrust, max_workers),
+        )
+
+    return np.concatenate(list(sfc_chunks))
+
+
+def _compute_sfc_chunk(engine_params: dict, altitude, mach, thrust) -> np.ndarray:
+    """Same as :func:`compute_sfc`, with the engine built from its parameters."""
+    return compute_sfc(get_engine(BasicTPEngine, **engine_params), altitude, mach, thrust)
+
+
+def complete_sfc_table(sfc_general: np.ndarray, thrust_array: np.ndarray) -> np.ndarray:
+    """
+    Completes the sfc table where thrust is above the maximum thrust (cells equal to
+    INVALID_SFC), but just enough to ensure that we will be able to do a 2D interpolation with
+    values that are not INVALID_SFC: at each mach, the cells that were valid at the previous mach
+    are given the fuel flow of the highest valid thrust.
+
+    :param sfc_general: the sfc table, with the mach numbers as first dimension
+    :param thrust_array: the thrusts of the table, in N
+    :return: the completed table
+    """
+    valid_idx_previous_mach = np.array([], dtype=int)
+
+    for mach_idx, corresponding_sfc_array in enumerate(sfc_general):
+        valid_idx = np.where(corresponding_sfc_array != INVALID_SFC)[0]
+
+        valid_fuel_flow = np.multiply(thrust_array[valid_idx], corresponding_sfc_array[valid_idx])
+
+        idx_to_interpolate = np.setdiff1d(valid_idx_previous_mach, valid_idx)
+        if np.size(idx_to_interpolate):
+            sfc_general[mach_idx, idx_to_interpolate] = (
+                valid_fuel_flow[-1] / thrust_array[idx_to_interpolate]
+            )
+
+        valid_idx_previous_mach = valid_idx
+
+    return sfc_general
+
+
+def load_deck(deck_file_path: str) -> Optional[Dict[str, np.ndarray]]:
+    """
+    Loads a deck saved by :func:`save_deck`.
+
+    :param deck_file_path: path of the deck file
+    :return: the deck, None if the file does not exist or can't be read
+    """
+    if not pth.exists(deck_file_path):
+        return None
+
+    # noinspection PyBroadException
+    try:
+        with np.load(deck_file_path) as data:
+            deck = {name: data[name] for name in data.files}
+    except Exception:
+        _LOGGER.info("Unable to read turboprop deck from %s file!", deck_file_path)
+        return None
+
+    _LOGGER.debug("Turboprop deck loaded from %s file", deck_file_path)
+
+    return deck
+
+
+def save_deck(deck_file_path: str, deck: Dict[str, np.ndarray]):
+    """
+    Saves a deck in a .npz file, the file is replaced atomically so that a process never reads
+    an incomplete deck.
+
+    :param deck_file_path: path of the deck file
+    :param deck: the deck, in a dictionary of arrays
+    """
+    os.makedirs(pth.dirname(deck_file_path), exist_ok=True)
+    tmp_file_path = deck_file_path + ".%i.tmp.npz" % os.getpid()
+    np.savez(tmp_file_path, **deck)
+    os.replace(tmp_file_path, deck_file_path)
 
 
 def format_table(sfc_table, thrust_table):
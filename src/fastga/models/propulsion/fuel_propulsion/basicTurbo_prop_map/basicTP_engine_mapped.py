@@ -16,7 +16,7 @@
 import logging
 from typing import Union, Sequence, Tuple, Optional
 import numpy as np
-from scipy.interpolate import interp2d, interp1d
+from scipy.interpolate import RectBivariateSpline
 
 import fastoad.api as oad
 from fastoad.constants import EngineSetting
@@ -233,6 +233,37 @@ class BasicTPEngineMapped(AbstractFuelPropulsion):
         self.turbo_sfc_IL = formatted_sfc_IL
         self.intermediate_altitude = float(level_IL)
 
+        # The tables of the sea, intermediate and cruise levels, sorted by altitude, are
+        # converted once into bilinear interpolators on their (mach, thrust) grid
+        self.level_tables = [
+            (
+                np.asarray(turbo_mach, dtype=float),
+                np.asarray(turbo_thrust, dtype=float),
+                np.asarray(turbo_thrust_max, dtype=float),
+                RectBivariateSpline(turbo_mach, turbo_thrust, turbo_sfc, kx=1, ky=1, s=0),
+            )
+            for turbo_mach, turbo_thrust, turbo_thrust_max, turbo_sfc in [
+                (
+                    self.turbo_mach_SL,
+                    self.turbo_thrust_SL,
+                    self.turbo_thrust_max_SL,
+                    self.turbo_sfc_SL,
+                ),
+                (
+                    self.turbo_mach_IL,
+                    self.turbo_thrust_IL,
+                    self.turbo_thrust_max_IL,
+                    self.turbo_sfc_IL,
+                ),
+                (
+                    self.turbo_mach_CL,
+                    self.turbo_thrust_CL,
+                    self.turbo_thrust_max_CL,
+                    self.turbo_sfc_CL,
+                ),
+            ]
+        ]
+
         self.specific_shape = None
 
         # Declare sub-components attribute
@@ -458,52 +489,29 @@ class BasicTPEngineMapped(AbstractFuelPropulsion):
 
         return self.turboprop.compute_max_power(flight_points)
 
-    def read_sfc_table(self, thrust: float, atmosphere: float) -> float:
-        """Reads the turboprop table and gives corresponding sfc."""
-        altitude = atmosphere.get_altitude(altitude_in_feet=False)
-        if altitude > self.intermediate_altitude:
-            mach_il = np.clip(atmosphere.mach, 1e-5, max(self.turbo_mach_IL))
-            mach_cl = np.clip(atmosphere.mach, 1e-5, max(self.turbo_mach_CL))
-            sfc_interp_IL = interp2d(self.turbo_thrust_IL, self.turbo_mach_IL, self.turbo_sfc_IL)
-            max_thrust_interp_IL = interp1d(self.turbo_mach_IL, self.turbo_thrust_max_IL)
-            sfc_interp_CL = interp2d(self.turbo_thrust_CL, self.turbo_mach_CL, self.turbo_sfc_CL)
-            max_thrust_interp_CL = interp1d(self.turbo_mach_CL, self.turbo_thrust_max_CL)
-            thrust_interp_IL = np.clip(
-                thrust, min(self.turbo_thrust_IL), max_thrust_interp_IL(mach_il)
-            )
-            thrust_interp_CL = np.clip(
-                thrust, min(self.turbo_thrust_CL), max_thrust_interp_CL(mach_cl)
-            )
-            lower_bound = float(sfc_interp_IL(thrust_interp_IL, mach_il))
-            upper_bound = float(sfc_interp_CL(thrust_interp_CL, mach_cl))
-            sfc = float(
-                interp1d(
-                    [self.intermediate_altitude, self.cruise_altitude_propeller],
-                    [lower_bound, upper_bound],
-                )(max(float(altitude), 0.0))
-            )
-        else:
-            mach_sl = np.clip(atmosphere.mach, 1e-5, max(self.turbo_mach_SL))
-            mach_il = np.clip(atmosphere.mach, 1e-5, max(self.turbo_mach_IL))
-            sfc_interp_SL = interp2d(self.turbo_thrust_SL, self.turbo_mach_SL, self.turbo_sfc_SL)
-            max_thrust_interp_SL = interp1d(self.turbo_mach_SL, self.turbo_thrust_max_SL)
-            sfc_interp_IL = interp2d(self.turbo_thrust_IL, self.turbo_mach_IL, self.turbo_sfc_IL)
-            max_thrust_interp_IL = interp1d(self.turbo_mach_IL, self.turbo_thrust_max_IL)
-            thrust_interp_SL = np.clip(
-                thrust, min(self.turbo_thrust_SL), max_thrust_interp_SL(mach_sl)
-            )
-            thrust_interp_IL = np.clip(
-                thrust, min(self.turbo_thrust_IL), max_thrust_interp_IL(mach_il)
-            )
-            lower_bound = float(sfc_interp_SL(thrust_interp_SL, mach_sl))
-            upper_bound = float(sfc_interp_IL(thrust_interp_IL, mach_il))
-            sfc = float(
-                interp1d([0.0, self.intermediate_altitude], [lower_bound, upper_bound])(
-                    max(float(altitude), 0.0)
-                )
+    def read_sfc_table(self, thrust, atmosphere: Atmosphere) -> np.ndarray:
+        """
+        Reads the turboprop tables and gives corresponding sfc, for all the points at once.
+
+        :param thrust: thrust, in N
+        :param atmosphere: Atmosphere instance of the points
+        :return: the sfc, in kg/s/N, as a 1D array
+        """
+        altitude = np.atleast_1d(atmosphere.get_altitude(altitude_in_feet=False)).astype(float)
+        mach = np.broadcast_to(atmosphere.mach, altitude.shape)
+        thrust = np.broadcast_to(thrust, altitude.shape)
+
+        sfc_levels = []
+        for turbo_mach, turbo_thrust, turbo_thrust_max, sfc_interp in self.level_tables:
+            level_mach = np.clip(mach, 1e-5, max(turbo_mach))
+            level_thrust = np.clip(
+                thrust, min(turbo_thrust), np.interp(level_mach, turbo_mach, turbo_thrust_max)
             )
+            sfc_levels.append(sfc_interp.ev(level_mach, level_thrust))
 
-        return sfc
+        sfc_SL, sfc_IL, sfc_CL = sfc_levels
+
+        return self._interpolate_altitude(altitude, sfc_SL, sfc_IL, sfc_IL, sfc_CL)
 
     def sfc(
         self,
@@ -518,17 +526,9 @@ class BasicTPEngineMapped(AbstractFuelPropulsion):
         :return: SFC (in kg/s/N)
         """
 
-        # torque = np.zeros(np.size(thrust))
-        sfc = np.zeros(np.size(thrust))
+        sfc = self.read_sfc_table(thrust, atmosphere)
         if np.size(thrust) == 1:
-            sfc = self.read_sfc_table(thrust, atmosphere)
-        else:
-            for idx in range(np.size(thrust)):
-                local_atmosphere = Atmosphere(
-                    atmosphere.get_altitude(altitude_in_feet=False)[idx], altitude_in_feet=False
-                )
-                local_atmosphere.mach = atmosphere.mach[idx]
-                sfc[idx] = self.read_sfc_table(thrust[idx], local_atmosphere)
+            sfc = float(sfc[0])
 
         return sfc
 
@@ -543,53 +543,59 @@ class BasicTPEngineMapped(AbstractFuelPropulsion):
         :return: maximum thrust (in N)
         """
 
-        altitude = atmosphere.get_altitude(altitude_in_feet=False)
-        if np.size(altitude) == 1:
-            mach = atmosphere.mach
-            max_thrust = self._max_thrust(altitude, mach)
-            if isinstance(max_thrust, float):
-                max_thrust = np.array([max_thrust])
-        else:
-            max_thrust = np.zeros(np.size(altitude))
-            mach_array = atmosphere.mach
-            for idx in range(np.size(altitude)):
-                max_thrust[idx] = self._max_thrust(altitude[idx], mach_array[idx])
+        altitude = np.atleast_1d(atmosphere.get_altitude(altitude_in_feet=False)).astype(float)
+        mach = np.broadcast_to(atmosphere.mach, altitude.shape)
+
+        max_thrust_SL, max_thrust_IL, max_thrust_CL = [
+            np.interp(np.clip(mach, 1e-5, max(turbo_mach)), turbo_mach, turbo_thrust_max)
+            for turbo_mach, _, turbo_thrust_max, _ in self.level_tables
+        ]
+        # Below the intermediate level, the upper bound has always been read in the cruise
+        # level table, with the mach number limited to the intermediate level table
+        turbo_mach_IL = self.level_tables[1][0]
+        turbo_mach_CL, _, turbo_thrust_max_CL, _ = self.level_tables[2]
+        max_thrust_IL_below = np.interp(
+            np.clip(mach, 1e-5, max(turbo_mach_IL)), turbo_mach_CL, turbo_thrust_max_CL
+        )
 
-        return max_thrust
+        return self._interpolate_altitude(
+            altitude, max_thrust_SL, max_thrust_IL_below, max_thrust_IL, max_thrust_CL
+        )
 
-    def _max_thrust(self, altitude: float, mach: float) -> np.ndarray:
+    def _interpolate_altitude(
+        self,
+        altitude: np.ndarray,
+        value_SL: np.ndarray,
+        value_IL_below: np.ndarray,
+        value_IL_above: np.ndarray,
+        value_CL: np.ndarray,
+    ) -> np.ndarray:
+        """
+        Linearly interpolates in altitude the values read in the tables of each level, between
+        the sea and intermediate levels or between the intermediate and cruise levels.
+
+        :param altitude: altitude of the points, in m
+        :param value_SL: values at the sea level
+        :param value_IL_below: values at the intermediate level, for points below that level
+        :param value_IL_above: values at the intermediate level, for points above that level
+        :param value_CL: values at the cruise level
+        :return: the values at the altitude of the points
+        """
+        altitude = np.maximum(altitude, 0.0)
+        if np.any(altitude > max(self.intermediate_altitude, self.cruise_altitude_propeller)):
+            raise ValueError("A value in x_new is above the interpolation range.")
+
+        is_above_il = altitude > self.intermediate_altitude
+        altitude_low = np.where(is_above_il, self.intermediate_altitude, 0.0)
+        altitude_high = np.where(
+            is_above_il, self.cruise_altitude_propeller, self.intermediate_altitude
+        )
+        value_low = np.where(is_above_il, value_IL_above, value_SL)
+        value_high = np.where(is_above_il, value_CL, value_IL_below)
 
-        if altitude > self.intermediate_altitude:
-            max_thrust_interp_IL = interp1d(self.turbo_mach_IL, self.turbo_thrust_max_IL)
-            max_thrust_interp_CL = interp1d(self.turbo_mach_CL, self.turbo_thrust_max_CL)
-            max_thrust_IL = float(
-                max_thrust_interp_IL(np.clip(mach, 1e-5, max(self.turbo_mach_IL)))
-            )
-            max_thrust_CL = float(
-                max_thrust_interp_CL(np.clip(mach, 1e-5, max(self.turbo_mach_CL)))
-            )
-            max_thrust = float(
-                interp1d(
-                    [self.intermediate_altitude, self.cruise_altitude_propeller],
-                    [max_thrust_IL, max_thrust_CL],
-                )(max(float(altitude), 0.0))
-            )
-        else:
-            max_thrust_interp_SL = interp1d(self.turbo_mach_SL, self.turbo_thrust_max_SL)
-            max_thrust_interp_IL = interp1d(self.turbo_mach_CL, self.turbo_thrust_max_CL)
-            max_thrust_SL = float(
-                max_thrust_interp_SL(np.clip(mach, 1e-5, max(self.turbo_mach_SL)))
-            )
-            max_thrust_IL = float(
-                max_thrust_interp_IL(np.clip(mach, 1e-5, max(self.turbo_mach_IL)))
-            )
-            max_thrust = float(
-                interp1d([0.0, self.intermediate_altitude], [max_thrust_SL, max_thrust_IL])(
-                    max(float(altitude), 0.0)
-                )
-            )
+        slope = (value_high - value_low) / (altitude_high - altitude_low)
 
-        return max_thrust
+        return slope * (altitude - altitude_low) + value_low
 
     def propeller_efficiency(
         self, thrust: Union[float, Sequence[float]], atmosphere: Atmosphere
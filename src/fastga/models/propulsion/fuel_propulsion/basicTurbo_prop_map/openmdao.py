@@ -22,7 +22,7 @@ from fastga.models.propulsion.fuel_propulsion.basicTurbo_prop_map.basicTP_engine
 )
 
 from fastga.models.propulsion.propulsion import IPropulsion, BaseOMPropulsionComponent
-from fastga.models.propulsion.fuel_propulsion.base import FuelEngineSet
+from fastga.models.propulsion.fuel_propulsion.base import FuelEngineSet, get_engine
 from fastga.models.aerodynamics.external.propeller_code.compute_propeller_aero import (
     THRUST_PTS_NB,
     SPEED_PTS_NB,
@@ -300,7 +300,8 @@ class OMBasicTurbopropMapWrapper(oad.IOMPropulsionWrapper):
         }
 
         return FuelEngineSet(
-            BasicTPEngineMapped(**engine_params), inputs["data:geometry:propulsion:engine:count"]
+            get_engine(BasicTPEngineMapped, **engine_params),
+            inputs["data:geometry:propulsion:engine:count"],
         )
 
 
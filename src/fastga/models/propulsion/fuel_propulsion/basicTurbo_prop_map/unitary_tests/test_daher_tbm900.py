@@ -15,6 +15,10 @@ Test module for basicTP_engine_constructor.py
 #  You should have received a copy of the GNU General Public License
 #  along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
+import glob
+import os.path as pth
+import tempfile
+
 import pytest
 import numpy as np
 
@@ -154,3 +158,45 @@ def test_table_construction():
         )
         < 1e-2
     )
+
+
+def test_table_saving(monkeypatch):
+    """Tests that the table is written to and read back from the result folder"""
+
+    results_folder = tempfile.TemporaryDirectory()
+    ivc = get_indep_var_comp(list_inputs(ComputeTurbopropMap()), __file__, XML_FILE)
+
+    problem = run_system(
+        ComputeTurbopropMap(result_folder_path=results_folder.name, max_workers=1), ivc
+    )
+    deck_files = glob.glob(pth.join(results_folder.name, "*.npz"))
+    assert len(deck_files) == 1
+    with np.load(deck_files[0]) as data:
+        deck = {name: data[name] for name in data.files}
+    for level in ["sea_level", "cruise_level", "intermediate_level"]:
+        for name in ["mach", "thrust", "thrust_limit", "sfc"]:
+            np.testing.assert_array_equal(
+                deck[level + ":" + name],
+                problem.get_val("data:propulsion:turboprop:" + level + ":" + name),
+            )
+
+    # Second run should read the deck instead of computing it again: the saved file is tampered
+    # with and the deck can't be computed anymore
+    deck["sea_level:sfc"] = 2.0 * deck["sea_level:sfc"]
+    np.savez(deck_files[0], **deck)
+
+    def construct_deck(*_, **__):
+        raise AssertionError("Deck should be read from the result folder")
+
+    monkeypatch.setattr(ComputeTurbopropMap, "construct_deck", construct_deck)
+    problem_from_file = run_system(
+        ComputeTurbopropMap(result_folder_path=results_folder.name, max_workers=1), ivc
+    )
+    for level in ["sea_level", "cruise_level", "intermediate_level"]:
+        for name in ["mach", "thrust", "thrust_limit", "sfc"]:
+            np.testing.assert_array_equal(
+                deck[level + ":" + name],
+                problem_from_file.get_val("data:propulsion:turboprop:" + level + ":" + name),
+            )
+
+    results_folder.cleanup()
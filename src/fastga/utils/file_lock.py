@@ -0,0 +1,80 @@
+"""Inter-process lock and version stamps of files shared between FAST-OAD-GA processes."""
+#  This file is part of FAST-OAD_CS23 : A framework for rapid Overall Aircraft Design
+#  Copyright (C) 2022  ONERA & ISAE-SUPAERO
+#  FAST is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import logging
+import os
+import time
+from contextlib import contextmanager
+from typing import Optional
+
+_LOGGER = logging.getLogger(__name__)
+
+LOCK_FILE_SUFFIX = ".lock"
+DEFAULT_LOCK_TIMEOUT = 60.0  # in seconds
+_POLLING_PERIOD = 0.05  # in seconds
+
+
+@contextmanager
+def file_lock(file_path: str, timeout: float = DEFAULT_LOCK_TIMEOUT):
+    """
+    Context manager that gives exclusive access to file_path among the processes that use it.
+
+    The lock is materialized by a file next to file_path, created atomically, so it works the same
+    way on every OS and file system. If the lock can't be acquired after timeout seconds, it is
+    considered as left by a crashed process and is taken over.
+
+    :param file_path: path of the file to protect, it does not need to exist
+    :param timeout: maximum waiting time in seconds before taking over the lock
+    """
+
+    lock_file_path = file_path + LOCK_FILE_SUFFIX
+    start_time = time.time()
+    while True:
+        try:
+            file_descriptor = os.open(lock_file_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            break
+        except FileExistsError:
+            if time.time() - start_time > timeout:
+                _LOGGER.warning("Lock on %s timed out, lock is taken over!", file_path)
+                try:
+                    os.remove(lock_file_path)
+                except OSError:
+                    pass
+                start_time = time.time()
+            time.sleep(_POLLING_PERIOD)
+
+    try:
+        os.close(file_descriptor)
+        yield
+    finally:
+        try:
+            os.remove(lock_file_path)
+        except OSError:
+            _LOGGER.info("Error while trying to remove %s lock file!", lock_file_path)
+
+
+def get_file_stamp(file_path: str) -> Optional[tuple]:
+    """
+    Returns identifiers of the version of the file on disk, so that a process can tell if another
+    one modified the file since it last read it.
+
+    :param file_path: path of the file
+    :return: inode, modification time and size of the file, None if it does not exist
+    """
+    try:
+        stat = os.stat(file_path)
+    except FileNotFoundError:
+        return None
+
+    return stat.st_ino, stat.st_mtime_ns, stat.st_size
@@ -0,0 +1,90 @@
+"""Test module for the inter-process file lock"""
+#  This file is part of FAST-OAD_CS23 : A framework for rapid Overall Aircraft Design
+#  Copyright (C) 2022  ONERA & ISAE-SUPAERO
+#  FAST is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import multiprocessing
+import os.path as pth
+import time
+from tempfile import TemporaryDirectory
+
+from ..file_lock import file_lock, get_file_stamp, LOCK_FILE_SUFFIX
+
+RECORD_COUNT = 50
+
+
+def _append_records(file_path: str, writer_name: str):
+    """
+    Appends records by rewriting the whole file, so that unprotected concurrent writers would
+    lose some of them.
+    """
+    for idx in range(RECORD_COUNT):
+        with file_lock(file_path):
+            with open(file_path, "r") as file:
+                records = file.read()
+            time.sleep(0.001)
+            with open(file_path, "w") as file:
+                file.write(records + "%s_%i\n" % (writer_name, idx))
+
+
+def test_concurrent_writers():
+    """Tests that no record is lost when two processes write the same file under the lock."""
+    with TemporaryDirectory() as folder_path:
+        file_path = pth.join(folder_path, "records.txt")
+        with open(file_path, "w"):
+            pass
+        writers = [
+            multiprocessing.Process(target=_append_records, args=(file_path, name))
+            for name in ["a", "b"]
+        ]
+        for writer in writers:
+            writer.start()
+        for writer in writers:
+            writer.join()
+        assert [writer.exitcode for writer in writers] == [0, 0]
+
+        with open(file_path, "r") as file:
+            records = file.read().split()
+        assert sorted(records) == sorted(
+            ["%s_%i" % (name, idx) for name in ["a", "b"] for idx in range(RECORD_COUNT)]
+        )
+        assert not pth.exists(file_path + LOCK_FILE_SUFFIX)
+
+
+def test_stale_lock_takeover():
+    """Tests that a lock left by a crashed process is taken over after the timeout."""
+    with TemporaryDirectory() as folder_path:
+        file_path = pth.join(folder_path, "records.txt")
+        with open(file_path + LOCK_FILE_SUFFIX, "w"):
+            pass
+
+        start_time = time.time()
+        with file_lock(file_path, timeout=0.2):
+            assert time.time() - start_time >= 0.2
+            assert pth.exists(file_path + LOCK_FILE_SUFFIX)
+        assert not pth.exists(file_path + LOCK_FILE_SUFFIX)
+
+
+def test_file_stamp():
+    """Tests that the file stamp changes when the file is modified."""
+    with TemporaryDirectory() as folder_path:
+        file_path = pth.join(folder_path, "records.txt")
+        assert get_file_stamp(file_path) is None
+
+        with open(file_path, "w") as file:
+            file.write("a")
+        stamp = get_file_stamp(file_path)
+        assert get_file_stamp(file_path) == stamp
+
+        with open(file_path, "a") as file:
+            file.write("b")
+        assert get_file_stamp(file_path) != stamp